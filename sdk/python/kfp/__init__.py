@@ -35,11 +35,20 @@ if sys.version_info < (3, 9):
 TYPE_CHECK = True
 
 import os
+from typing import Dict, TYPE_CHECKING
 
-# compile-time only dependencies
+from kfp import lazy_import
+
+# compile-time only dependencies, imported on first use (PEP 562) so
+# that `import kfp` does not pay for the client and its dependencies
+# (kfp_server_api, google.auth, requests, protobuf)
+_LAZY_ATTRIBUTES: Dict[str, str] = {}
 if os.environ.get('_KFP_RUNTIME', 'false') != 'true':
-    # make `from kfp import components` and `from kfp import dsl` valid;
-    # related to namespace packaging issue
-    from kfp import components  # noqa: keep unused import
-    from kfp import dsl  # noqa: keep unused import
-    from kfp.client import Client  # noqa: keep unused import
+    _LAZY_ATTRIBUTES['Client'] = 'kfp.client'
+
+if TYPE_CHECKING:
+    from kfp import components
+    from kfp import dsl
+    from kfp.client import Client
+
+__getattr__, __dir__ = lazy_import.lazy_attributes(globals(), _LAZY_ATTRIBUTES)
@@ -14,6 +14,7 @@
 
 import functools
 import itertools
+import json
 import os
 import re
 import subprocess
@@ -197,6 +198,67 @@ class TestSmokeTestAllCommandsWithHelp(parameterized.TestCase):
             self.assertEqual(result.exit_code, 0)
 
 
+class TestRunList(parameterized.TestCase):
+
+    def setUp(self):
+        self.runner = testing.CliRunner()
+        self.client = mock.Mock()
+        self.client.iter_runs.return_value = iter([
+            mock.Mock(
+                **{
+                    'run_id': f'run-{i}',
+                    'display_name': f'my-run-{i}',
+                    'created_at.isoformat.return_value': '2026-01-01T00:00:00',
+                    'state': 'SUCCEEDED',
+                    'storage_state': 'AVAILABLE',
+                    'to_dict.return_value': {
+                        'run_id': f'run-{i}'
+                    },
+                }) for i in range(3)
+        ])
+
+    def invoke(self, *args: str) -> testing.Result:
+        with mock.patch('kfp.cli.cli.client.Client', return_value=self.client):
+            return self.runner.invoke(
+                args=['--output', *args],
+                cli=cli.cli,
+                catch_exceptions=False,
+                obj={})
+
+    def test_all_streams_every_page(self):
+        result = self.invoke('table', 'run', 'list', '--all', '-m', '2',
+                             '--sort-by', 'created_at')
+        self.assertEqual(result.exit_code, 0)
+        self.client.iter_runs.assert_called_once_with(
+            experiment_id=None,
+            page_token='',
+            page_size=2,
+            sort_by='created_at',
+            filter=None)
+        self.client.list_runs.assert_not_called()
+        lines = result.output.splitlines()
+        self.assertEqual(
+            lines[0].split(),
+            ['ID', 'NAME', 'CREATED', 'AT', 'STATE', 'STORAGE', 'STATE'])
+        self.assertEqual([line.split()[0] for line in lines[1:]],
+                         ['run-0', 'run-1', 'run-2'])
+
+    def test_all_json(self):
+        result = self.invoke('json', 'run', 'list', '--all')
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(
+            result.output,
+            json.dumps([{
+                'run_id': f'run-{i}'
+            } for i in range(3)], indent=2) + '\n')
+
+    def test_all_json_no_runs(self):
+        self.client.iter_runs.return_value = iter([])
+        result = self.invoke('json', 'run', 'list', '--all')
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(result.output, '[]\n')
+
+
 class TestKfpDslCompile(unittest.TestCase):
 
     def invoke(self, args):
@@ -13,12 +13,20 @@
 # limitations under the License.
 """KFP SDK compiler CLI tool."""
 
+import concurrent.futures
+import dataclasses
+import glob
+import hashlib
+import importlib
 import json
 import logging
 import os
+import shutil
 import sys
+import tempfile
+import time
 import types
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, List, Optional, Set
 
 import click
 from click_option_group import optgroup
@@ -27,6 +35,7 @@ from kfp.compiler.compiler_utils import KubernetesManifestOptions
 from kfp.dsl import base_component
 from kfp.dsl import graph_component
 from kfp.dsl.pipeline_context import Pipeline
+import tabulate
 
 
 def is_pipeline_func(func: Callable) -> bool:
@@ -99,6 +108,332 @@ def collect_pipeline_or_component_func(
         del sys.path[0]
 
 
+# files that are never scanned for pipelines in batch mode
+_BATCH_EXCLUDED_FILES = ('__init__.py', 'conftest.py')
+
+
+@dataclasses.dataclass
+class BatchCompileResult:
+    """The outcome of compiling one pipeline or component in batch mode.
+
+    Attributes:
+        source: Path of the Python file, relative to the batch root.
+        name: Name of the compiled pipeline or component. Empty if the
+            module could not be imported.
+        output: Path of the compiled file, relative to the output
+            directory. Empty if nothing was compiled.
+        status: ``'written'``, ``'unchanged'`` or ``'failed'``.
+        import_seconds: Time spent importing the module.
+        compile_seconds: Time spent compiling the pipeline.
+        error: The error message if the status is ``'failed'``.
+    """
+    source: str
+    name: str
+    output: str
+    status: str
+    import_seconds: float
+    compile_seconds: float = 0.0
+    error: str = ''
+
+
+def discover_python_files(pattern: str) -> List[str]:
+    """Returns the Python files matched by a glob pattern or found in a
+    directory.
+
+    Args:
+        pattern: A directory, which is searched recursively, or a glob
+            pattern (``**`` matches any number of directories).
+
+    Returns:
+        Sorted absolute paths of the matched ``.py`` files, excluding
+        ``__init__.py``, ``conftest.py`` and test files.
+    """
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, '**', '*.py')
+    files = []
+    for path in glob.glob(pattern, recursive=True):
+        name = os.path.basename(path)
+        if (not path.endswith('.py') or not os.path.isfile(path) or
+                name in _BATCH_EXCLUDED_FILES or name.startswith('test_') or
+                name.endswith('_test.py')):
+            continue
+        files.append(os.path.abspath(path))
+    return sorted(files)
+
+
+def _batch_root(pattern: str, files: List[str]) -> str:
+    """Returns the directory that output paths mirror the sources from."""
+    if os.path.isdir(pattern):
+        return os.path.abspath(pattern)
+    return os.path.commonpath([os.path.dirname(f) for f in files])
+
+
+def _import_module_from_file(python_file: str) -> types.ModuleType:
+    module_name = os.path.splitext(os.path.basename(python_file))[0]
+    sys.path.insert(0, os.path.dirname(python_file))
+    try:
+        return importlib.import_module(module_name)
+    finally:
+        del sys.path[0]
+
+
+def _unload_modules_under(root: str, keep: Set[str]) -> None:
+    """Removes the modules imported from files under root from sys.modules,
+    except those in keep.
+
+    Modules of different directories of a batch may share a name, so the
+    modules a file imported must not be found by the next file.
+    """
+    prefix = os.path.join(root, '')
+    for name, module in list(sys.modules.items()):
+        if name in keep or name == 'kfp' or name.startswith('kfp.'):
+            continue
+        if (getattr(module, '__file__', None) or '').startswith(prefix):
+            del sys.modules[name]
+
+
+def _is_defined_in(obj: base_component.BaseComponent,
+                   module: types.ModuleType) -> bool:
+    func = getattr(obj, 'pipeline_func', None) or getattr(
+        obj, 'python_func', None)
+    return getattr(func, '__module__', None) == module.__name__
+
+
+def collect_pipelines_and_components_defined_in_module(
+        module: types.ModuleType) -> Dict[str, base_component.BaseComponent]:
+    """Returns the pipelines defined in a module or, if there are none, the
+    components defined in it, by attribute name.
+
+    Pipelines and components imported from other modules are left out,
+    so that each one is compiled once per batch.
+    """
+    pipelines = {}
+    components = {}
+    for attr in dir(module):
+        obj = getattr(module, attr)
+        if not isinstance(obj, base_component.BaseComponent):
+            continue
+        if not _is_defined_in(obj, module):
+            continue
+        if is_pipeline_func(obj):
+            pipelines[attr] = obj
+        else:
+            components[attr] = obj
+    return pipelines or components
+
+
+def _file_digest(path: str) -> Optional[str]:
+    try:
+        with open(path, 'rb') as f:
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+            return digest.hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def _write_if_changed(compile_to: Callable[[str], None],
+                      package_path: str) -> bool:
+    """Compiles to a temporary file and moves it to package_path unless
+    package_path already has the same content.
+
+    Returns:
+        Whether package_path was written.
+    """
+    output_dir = os.path.dirname(package_path)
+    os.makedirs(output_dir, exist_ok=True)
+    # compile next to the output so that the final rename is atomic
+    temp_dir = tempfile.mkdtemp(dir=output_dir)
+    try:
+        temp_path = os.path.join(temp_dir, os.path.basename(package_path))
+        compile_to(temp_path)
+        if _file_digest(temp_path) == _file_digest(package_path):
+            return False
+        os.replace(temp_path, package_path)
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _init_batch_worker(disable_execution_caching_by_default: bool) -> None:
+    Pipeline._execution_caching_default = not disable_execution_caching_by_default
+
+
+def compile_module(
+    python_file: str,
+    root: str,
+    output_dir: str,
+    type_check: bool = True,
+    kubernetes_manifest_options: Optional[KubernetesManifestOptions] = None,
+    kubernetes_manifest_format: bool = False,
+    deduplicate_components: bool = False,
+) -> List[BatchCompileResult]:
+    """Compiles every pipeline (or component) defined in a Python file.
+
+    The output of a module that defines a single pipeline is written to
+    ``<output_dir>/<path relative to root without .py>.yaml``. When the
+    module defines several, the attribute name is appended to the file
+    name: ``<module>_<attribute>.yaml``.
+
+    Args:
+        python_file: Absolute path of the Python file.
+        root: Directory that output paths mirror the sources from.
+        output_dir: Directory to write the compiled files to.
+        type_check: Whether to enable type checking.
+        kubernetes_manifest_options: Manifest options for all pipelines.
+        kubernetes_manifest_format: Output Kubernetes manifests.
+        deduplicate_components: Collapse identical components and executors.
+
+    Returns:
+        A result per compiled pipeline or component, or a single failed
+        result if the module could not be imported.
+    """
+    loaded_modules = set(sys.modules)
+    try:
+        return _compile_module(python_file, root, output_dir, type_check,
+                               kubernetes_manifest_options,
+                               kubernetes_manifest_format,
+                               deduplicate_components)
+    finally:
+        _unload_modules_under(root, keep=loaded_modules)
+
+
+def _compile_module(
+    python_file: str,
+    root: str,
+    output_dir: str,
+    type_check: bool,
+    kubernetes_manifest_options: Optional[KubernetesManifestOptions],
+    kubernetes_manifest_format: bool,
+    deduplicate_components: bool,
+) -> List[BatchCompileResult]:
+    source = os.path.relpath(python_file, root)
+    start = time.perf_counter()
+    try:
+        module = _import_module_from_file(python_file)
+        targets = collect_pipelines_and_components_defined_in_module(module)
+    except Exception as e:
+        return [
+            BatchCompileResult(
+                source=source,
+                name='',
+                output='',
+                status='failed',
+                import_seconds=time.perf_counter() - start,
+                error=f'{type(e).__name__}: {e}')
+        ]
+    import_seconds = time.perf_counter() - start
+
+    results = []
+    base = os.path.splitext(source)[0]
+    for attr, target in sorted(targets.items()):
+        relative_output = (f'{base}.yaml'
+                           if len(targets) == 1 else f'{base}_{attr}.yaml')
+        package_path = os.path.join(output_dir, relative_output)
+        start = time.perf_counter()
+        try:
+            written = _write_if_changed(
+                lambda path: compiler.Compiler().compile(
+                    pipeline_func=target,
+                    package_path=path,
+                    type_check=type_check,
+                    kubernetes_manifest_options=kubernetes_manifest_options,
+                    kubernetes_manifest_format=kubernetes_manifest_format,
+                    deduplicate_components=deduplicate_components,
+                ), package_path)
+            status, error = ('written' if written else 'unchanged'), ''
+        except Exception as e:
+            status, error = 'failed', f'{type(e).__name__}: {e}'
+        results.append(
+            BatchCompileResult(
+                source=source,
+                name=target.name,
+                output=relative_output,
+                status=status,
+                import_seconds=import_seconds,
+                compile_seconds=time.perf_counter() - start,
+                error=error))
+    return results
+
+
+def compile_batch(
+    pattern: str,
+    output_dir: str,
+    workers: int,
+    disable_execution_caching_by_default: bool = False,
+    **compile_kwargs,
+) -> List[BatchCompileResult]:
+    """Compiles the pipelines of every Python file matched by pattern.
+
+    Files are distributed over a pool of worker processes, each of which
+    imports kfp once and compiles many files, so the interpreter and
+    import startup is paid once per worker instead of once per file.
+
+    Args:
+        pattern: A directory or a glob pattern of Python files.
+        output_dir: Directory to write the compiled files to.
+        workers: Number of worker processes. ``1`` compiles in this
+            process.
+        disable_execution_caching_by_default: Whether to disable execution
+            caching by default.
+        **compile_kwargs: Arguments passed to compile_module.
+
+    Returns:
+        The results of every file, in file order.
+    """
+    files = discover_python_files(pattern)
+    if not files:
+        return []
+    root = _batch_root(pattern, files)
+    output_dir = os.path.abspath(output_dir)
+
+    if workers == 1:
+        _init_batch_worker(disable_execution_caching_by_default)
+        return [
+            result for python_file in files for result in compile_module(
+                python_file, root, output_dir, **compile_kwargs)
+        ]
+
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(disable_execution_caching_by_default,)) as executor:
+        futures = [
+            executor.submit(compile_module, python_file, root, output_dir,
+                            **compile_kwargs) for python_file in files
+        ]
+        return [result for future in futures for result in future.result()]
+
+
+def print_batch_report(results: List[BatchCompileResult]) -> None:
+    """Prints a timing report with a row per pipeline or component."""
+    # kfp.cli.output imports the API client, which compiling does not need
+    from kfp.cli import output
+    rows = [[
+        result.source, result.name, result.output, result.status,
+        f'{result.import_seconds:.2f}', f'{result.compile_seconds:.2f}'
+    ] for result in results]
+    click.echo(
+        tabulate.tabulate(
+            rows,
+            headers=[
+                'SOURCE', 'NAME', 'OUTPUT', 'STATUS', 'IMPORT (S)',
+                'COMPILE (S)'
+            ],
+            tablefmt=output.KFP_TABLE_FORMAT,
+            disable_numparse=True))
+    counts = {
+        status: sum(result.status == status for result in results)
+        for status in ('written', 'unchanged', 'failed')
+    }
+    click.echo(f'{counts["written"]} written, {counts["unchanged"]} unchanged, '
+               f'{counts["failed"]} failed.')
+    for result in results:
+        if result.status == 'failed':
+            click.echo(f'{result.source}: {result.error}', err=True)
+
+
 def parse_parameters(parameters: Optional[str]) -> Dict:
     try:
         return json.loads(parameters) if parameters is not None else {}
@@ -112,13 +447,32 @@ def parse_parameters(parameters: Optional[str]) -> Dict:
 @click.option(
     '--py',
     type=click.Path(exists=True, dir_okay=False),
-    required=True,
-    help='Local absolute path to a py file.')
+    default=None,
+    help='Local absolute path to a py file. Required unless --batch is set.')
 @click.option(
     '--output',
     type=click.Path(exists=False, dir_okay=False),
-    required=True,
-    help='Path to write the compiled result.')
+    default=None,
+    help='Path to write the compiled result. Required with --py.')
+@click.option(
+    '--batch',
+    'batch_pattern',
+    type=str,
+    default=None,
+    help='A directory or glob pattern (e.g. "pipelines/**/*.py") of py files. Compiles every pipeline (or, in modules without pipelines, every component) defined in them with a pool of worker processes and prints a timing report.'
+)
+@click.option(
+    '--output-dir',
+    type=click.Path(exists=False, file_okay=False),
+    default=None,
+    help='Directory to write the compiled results to in --batch mode, mirroring the source tree. Outputs whose content did not change are not rewritten.'
+)
+@click.option(
+    '--workers',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Number of worker processes in --batch mode. Defaults to the number of CPUs.'
+)
 @click.option(
     '--function',
     'function_name',
@@ -148,6 +502,12 @@ def parse_parameters(parameters: Optional[str]) -> Dict:
     default=False,
     help='Output the compiled pipeline as a Kubernetes PipelineVersion manifest, with the option to include the Kubernetes Pipeline manifest as well when used with --include-pipeline-manifest.'
 )
+@click.option(
+    '--deduplicate-components',
+    is_flag=True,
+    default=False,
+    help='Collapse components and executors that compile to identical specs, such as those of a component used by many tasks, into a single entry.'
+)
 @optgroup.group(
     'Kubernetes Manifest Options',
     help='Options only used when compiling pipelines to Kubernetes native manifest format. These control the metadata of the generated Kubernetes resources. Only relevant if --kubernetes-manifest-format is set.'
@@ -189,13 +549,17 @@ def parse_parameters(parameters: Optional[str]) -> Dict:
     help='Include the Pipeline manifest in the output. Defaults to False. Only relevant if --kubernetes-manifest-format is set.'
 )
 def compile_(
-    py: str,
-    output: str,
+    py: Optional[str] = None,
+    output: Optional[str] = None,
+    batch_pattern: Optional[str] = None,
+    output_dir: Optional[str] = None,
+    workers: Optional[int] = None,
     function_name: Optional[str] = None,
     pipeline_parameters: Optional[str] = None,
     disable_type_check: bool = False,
     disable_execution_caching_by_default: bool = False,
     kubernetes_manifest_format: bool = False,
+    deduplicate_components: bool = False,
     pipeline_name: Optional[str] = None,
     pipeline_display_name: Optional[str] = None,
     pipeline_version_name: Optional[str] = None,
@@ -203,7 +567,33 @@ def compile_(
     namespace: Optional[str] = None,
     include_pipeline_manifest: bool = False,
 ) -> None:
-    """Compiles a pipeline or component written in a .py file."""
+    """Compiles a pipeline or component written in a .py file, or every
+    pipeline in a set of .py files with --batch."""
+    if batch_pattern is not None:
+        _compile_batch_command(
+            batch_pattern=batch_pattern,
+            py=py,
+            output=output,
+            output_dir=output_dir,
+            workers=workers,
+            function_name=function_name,
+            pipeline_parameters=pipeline_parameters,
+            disable_type_check=disable_type_check,
+            disable_execution_caching_by_default=disable_execution_caching_by_default,
+            kubernetes_manifest_format=kubernetes_manifest_format,
+            deduplicate_components=deduplicate_components,
+            per_pipeline_manifest_options=any([
+                pipeline_name, pipeline_display_name, pipeline_version_name,
+                pipeline_version_display_name
+            ]),
+            namespace=namespace,
+            include_pipeline_manifest=include_pipeline_manifest,
+        )
+        return
+    if py is None:
+        raise click.UsageError("Missing option '--py' (or '--batch').")
+    if output is None:
+        raise click.UsageError("Missing option '--output'.")
 
     Pipeline._execution_caching_default = not disable_execution_caching_by_default
     pipeline_func = collect_pipeline_or_component_func(
@@ -238,6 +628,7 @@ def compile_(
         type_check=not disable_type_check,
         kubernetes_manifest_options=kubernetes_manifest_options,
         kubernetes_manifest_format=kubernetes_manifest_format,
+        deduplicate_components=deduplicate_components,
     )
 
     click.echo(
@@ -245,6 +636,60 @@ def compile_(
     )
 
 
+def _compile_batch_command(
+    batch_pattern: str,
+    py: Optional[str],
+    output: Optional[str],
+    output_dir: Optional[str],
+    workers: Optional[int],
+    function_name: Optional[str],
+    pipeline_parameters: Optional[str],
+    disable_type_check: bool,
+    disable_execution_caching_by_default: bool,
+    kubernetes_manifest_format: bool,
+    deduplicate_components: bool,
+    per_pipeline_manifest_options: bool,
+    namespace: Optional[str],
+    include_pipeline_manifest: bool,
+) -> None:
+    if py is not None or output is not None:
+        raise click.UsageError(
+            '--batch cannot be used with --py or --output. Use --output-dir.')
+    if output_dir is None:
+        raise click.UsageError("Missing option '--output-dir'.")
+    if function_name is not None or pipeline_parameters is not None:
+        raise click.UsageError(
+            '--function and --pipeline-parameters cannot be used with --batch.')
+    if per_pipeline_manifest_options:
+        raise click.UsageError(
+            'Pipeline and pipeline version names cannot be used with --batch; '
+            'they are derived from each pipeline.')
+
+    kubernetes_manifest_options = None
+    if kubernetes_manifest_format:
+        kubernetes_manifest_options = KubernetesManifestOptions(
+            namespace=namespace,
+            include_pipeline_manifest=include_pipeline_manifest,
+        )
+
+    results = compile_batch(
+        pattern=batch_pattern,
+        output_dir=output_dir,
+        workers=workers or os.cpu_count() or 1,
+        disable_execution_caching_by_default=disable_execution_caching_by_default,
+        type_check=not disable_type_check,
+        kubernetes_manifest_options=kubernetes_manifest_options,
+        kubernetes_manifest_format=kubernetes_manifest_format,
+        deduplicate_components=deduplicate_components,
+    )
+    if not results:
+        raise click.UsageError(
+            f'No pipelines or components found in {batch_pattern!r}.')
+    print_batch_report(results)
+    if any(result.status == 'failed' for result in results):
+        sys.exit(1)
+
+
 def main():
     logging.basicConfig(format='%(message)s', level=logging.INFO)
     try:
@@ -12,10 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests for `dsl compile` command group in KFP CLI."""
+import os
+import tempfile
+import textwrap
+from typing import List
 import unittest
 
+from absl.testing import parameterized
+from click import testing
 from kfp import dsl
+from kfp.cli import cli
 from kfp.cli import compile_
+import yaml
 
 
 class TestIsPipelineOrComponent(unittest.TestCase):
@@ -73,5 +81,193 @@ class TestIsPipelineOrComponent(unittest.TestCase):
         self.assertFalse(compile_.is_component_func(my_pipeline))
 
 
+PIPELINE_MODULE = textwrap.dedent("""
+    from kfp import dsl
+
+    @dsl.container_component
+    def echo(message: str):
+        return dsl.ContainerSpec(image='alpine', command=['echo', message])
+
+    @dsl.pipeline
+    def {name}(message: str = '{default}'):
+        echo(message=message)
+    """)
+
+COMPONENTS_MODULE = textwrap.dedent("""
+    from kfp import dsl
+
+    @dsl.container_component
+    def first():
+        return dsl.ContainerSpec(image='alpine', command=['echo', '1'])
+
+    @dsl.container_component
+    def second():
+        return dsl.ContainerSpec(image='alpine', command=['echo', '2'])
+    """)
+
+REUSED_COMPONENT_MODULE = textwrap.dedent("""
+    from kfp import dsl
+
+    @dsl.container_component
+    def echo(message: str):
+        return dsl.ContainerSpec(image='alpine', command=['echo', message])
+
+    @dsl.pipeline
+    def reused():
+        echo(message='a')
+        echo(message='b')
+    """)
+
+IMPORTING_MODULE = textwrap.dedent("""
+    from kfp import dsl
+    from pipe import my_pipeline
+
+    @dsl.pipeline
+    def outer():
+        my_pipeline(message='inner')
+    """)
+
+
+class TestBatchCompile(parameterized.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.source_dir = os.path.join(tmpdir.name, 'src')
+        self.output_dir = os.path.join(tmpdir.name, 'out')
+        self.write_source(
+            'a/pipe.py',
+            PIPELINE_MODULE.format(name='my_pipeline', default='a'))
+        self.write_source('b/pipe.py',
+                          PIPELINE_MODULE.format(name='other', default='b'))
+        self.write_source('b/comps.py', COMPONENTS_MODULE)
+
+    def write_source(self, relative_path: str, content: str) -> None:
+        path = os.path.join(self.source_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(content)
+
+    def invoke(self, args: List[str]) -> testing.Result:
+        return testing.CliRunner().invoke(
+            cli=cli.cli, args=['dsl', 'compile'] + args, obj={})
+
+    def invoke_batch(self, workers: int = 1) -> testing.Result:
+        return self.invoke([
+            '--batch', self.source_dir, '--output-dir', self.output_dir,
+            '--workers',
+            str(workers)
+        ])
+
+    def output_files(self) -> List[str]:
+        return sorted(
+            os.path.relpath(os.path.join(root, name), self.output_dir)
+            for root, _, names in os.walk(self.output_dir)
+            for name in names)
+
+    @parameterized.parameters(1, 2)
+    def test_compiles_every_module(self, workers: int):
+        result = self.invoke_batch(workers)
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(self.output_files(), [
+            'a/pipe.yaml', 'b/comps_first.yaml', 'b/comps_second.yaml',
+            'b/pipe.yaml'
+        ])
+        with open(os.path.join(self.output_dir, 'b', 'pipe.yaml')) as f:
+            self.assertIn('pipelineInfo:\n  name: other', f.read())
+        self.assertIn('IMPORT (S)', result.output)
+        self.assertIn('4 written, 0 unchanged, 0 failed.', result.output)
+
+    def test_unchanged_outputs_are_not_rewritten(self):
+        self.invoke_batch()
+        output_path = os.path.join(self.output_dir, 'a', 'pipe.yaml')
+        os.utime(output_path, (0, 0))
+
+        self.write_source('b/pipe.py',
+                          PIPELINE_MODULE.format(name='other', default='new'))
+        result = self.invoke_batch()
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn('1 written, 3 unchanged, 0 failed.', result.output)
+        self.assertEqual(os.stat(output_path).st_mtime, 0)
+        with open(os.path.join(self.output_dir, 'b', 'pipe.yaml')) as f:
+            self.assertIn('new', f.read())
+
+    def test_imported_pipelines_are_compiled_once(self):
+        self.write_source('a/outer.py', IMPORTING_MODULE)
+        result = self.invoke_batch()
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn('a/outer.yaml', self.output_files())
+        self.assertNotIn('a/outer_my_pipeline.yaml', self.output_files())
+
+    def test_failures_are_reported(self):
+        self.write_source('a/broken.py', 'raise RuntimeError("broken module")')
+        result = self.invoke_batch()
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn('4 written, 0 unchanged, 1 failed.', result.output)
+        self.assertIn('RuntimeError: broken module', result.output)
+
+    def test_glob_pattern(self):
+        result = self.invoke([
+            '--batch',
+            os.path.join(self.source_dir, '**', 'pipe.py'), '--output-dir',
+            self.output_dir, '--workers', '1'
+        ])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(self.output_files(), ['a/pipe.yaml', 'b/pipe.yaml'])
+
+    def test_discover_skips_tests_and_packages(self):
+        for name in ('__init__.py', 'conftest.py', 'pipe_test.py',
+                     'test_pipe.py', 'notes.txt'):
+            self.write_source(os.path.join('a', name), '')
+        self.assertEqual([
+            os.path.relpath(path, self.source_dir)
+            for path in compile_.discover_python_files(self.source_dir)
+        ], ['a/pipe.py', 'b/comps.py', 'b/pipe.py'])
+
+    @parameterized.parameters(
+        (['--py', __file__, '--output-dir', 'out'
+         ], r'--batch cannot be used with --py'),
+        ([], r"Missing option '--output-dir'"),
+        (['--output-dir', 'out', '--pipeline-parameters', '{}'
+         ], r'--pipeline-parameters cannot be used with --batch'),
+        (['--output-dir', 'out', '--pipeline-name', 'p'
+         ], r'names cannot be used with --batch'),
+    )
+    def test_batch_usage_errors(self, args: List[str], error: str):
+        result = self.invoke(['--batch', self.source_dir] + args)
+        self.assertEqual(result.exit_code, 2)
+        self.assertRegex(result.output, error)
+
+    @parameterized.parameters(True, False)
+    def test_deduplicate_components(self, batch: bool):
+        self.write_source('c/reused.py', REUSED_COMPONENT_MODULE)
+        output_path = os.path.join(self.output_dir, 'c', 'reused.yaml')
+        if batch:
+            args = [
+                '--batch',
+                os.path.join(self.source_dir, 'c'), '--output-dir',
+                os.path.join(self.output_dir, 'c'), '--workers', '1'
+            ]
+        else:
+            os.makedirs(os.path.dirname(output_path))
+            args = [
+                '--py',
+                os.path.join(self.source_dir, 'c', 'reused.py'), '--output',
+                output_path
+            ]
+        result = self.invoke(args + ['--deduplicate-components'])
+        self.assertEqual(result.exit_code, 0, result.output)
+        with open(output_path) as f:
+            pipeline_spec = yaml.safe_load(f)
+        self.assertEqual(list(pipeline_spec['components']), ['comp-echo'])
+
+    def test_py_or_batch_is_required(self):
+        result = self.invoke(['--output', 'out.yaml'])
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn("Missing option '--py' (or '--batch')", result.output)
+
+
 if __name__ == '__main__':
     unittest.main()
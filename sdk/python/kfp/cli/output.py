@@ -15,8 +15,9 @@
 import dataclasses
 import datetime
 import enum
+import itertools
 import json
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List
 
 import click
 import kfp_server_api
@@ -225,6 +226,70 @@ def print_output(resources: list, model_type: ModelType,
         raise NotImplementedError(f'Unknown output format: {output_format}.')
 
 
+def print_output_stream(resources: Iterable,
+                        model_type: ModelType,
+                        output_format: str,
+                        chunk_size: int = 100) -> None:
+    """Prints resources in tabular or JSON format as they are produced.
+
+    Unlike print_output, the resources are not collected first, so rows
+    are written as soon as each page of a paginated listing arrives. In
+    table format, column widths are fixed by the first chunk_size
+    resources; longer values in later rows are not truncated.
+
+    Args:
+        resources (Iterable): Iterable of same-type resources to print.
+        model_type (ModelType): The type of the resources.
+        output_format (str): One of 'table' or 'json'.
+        chunk_size (int): Number of resources used to size the table columns.
+
+    Raises:
+        NotImplementedError: If the output format is not one of 'table' or 'json'.
+    """
+    resources = iter(resources)
+    if output_format == OutputFormat.table.name:
+        transformer = transformer_map[model_type]
+        output_headers = dataclass_map[  # type: ignore
+            model_type].__dataclass_fields__.keys()
+        headers = [snake_to_header(header) for header in output_headers]
+
+        first_rows = [
+            _table_cells(transformer(r))
+            for r in itertools.islice(resources, chunk_size)
+        ]
+        # matches the column widths of tabulate, which pads headers by two
+        widths = [len(header) + 2 for header in headers]
+        for row in first_rows:
+            widths = [max(width, len(cell)) for width, cell in zip(widths, row)]
+
+        click.echo(_format_table_row(headers, widths))
+        for row in first_rows:
+            click.echo(_format_table_row(row, widths))
+        for resource in resources:
+            click.echo(
+                _format_table_row(_table_cells(transformer(resource)), widths))
+
+    elif output_format == OutputFormat.json.name:
+        first = True
+        for resource in resources:
+            item = json.dumps(resource.to_dict(), indent=2, cls=DatetimeEncoder)
+            item = '\n'.join('  ' + line for line in item.splitlines())
+            click.echo(('[\n' if first else ',\n') + item, nl=False)
+            first = False
+        click.echo('[]' if first else '\n]')
+    else:
+        raise NotImplementedError(f'Unknown output format: {output_format}.')
+
+
+def _table_cells(resource: Dict[str, Any]) -> List[str]:
+    return ['' if value is None else str(value) for value in resource.values()]
+
+
+def _format_table_row(cells: List[str], widths: List[int]) -> str:
+    return '  '.join(
+        cell.ljust(width) for cell, width in zip(cells, widths)).rstrip()
+
+
 def print_deleted_text(resource_type: str, resource_id: str,
                        output_format: str) -> None:
     """Prints a standardized output for deletion actions, using click.echo.
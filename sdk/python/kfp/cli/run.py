@@ -49,12 +49,33 @@ def run():
     help=parsing.get_param_descr(client.Client.list_runs, 'sort_by'))
 @click.option(
     '--filter', help=parsing.get_param_descr(client.Client.list_runs, 'filter'))
+@click.option(
+    '--all',
+    'all_pages',
+    is_flag=True,
+    default=False,
+    help='List runs from all pages, --max-size at a time, writing each page '
+    'as it arrives.')
 @click.pass_context
 def list(ctx: click.Context, experiment_id: str, page_token: str, max_size: int,
-         sort_by: str, filter: str):
+         sort_by: str, filter: str, all_pages: bool):
     """List pipeline runs."""
     client_obj: client.Client = ctx.obj['client']
     output_format = ctx.obj['output']
+    if all_pages:
+        runs = client_obj.iter_runs(
+            experiment_id=experiment_id,
+            page_token=page_token,
+            page_size=max_size,
+            sort_by=sort_by,
+            filter=filter)
+        output.print_output_stream(
+            runs,
+            output.ModelType.RUN,
+            output_format,
+            chunk_size=max_size,
+        )
+        return
     response = client_obj.list_runs(
         experiment_id=experiment_id,
         page_token=page_token,
@@ -24,13 +24,14 @@ import tarfile
 import tempfile
 import time
 from types import ModuleType
-from typing import Any, Dict, List, Optional, TextIO
+from typing import Any, Dict, Iterator, List, Optional, TextIO
 import warnings
 import zipfile
 
 from google.protobuf import json_format
 from kfp import compiler
 from kfp.client import auth
+from kfp.client import pagination
 from kfp.client import set_volume_credentials
 from kfp.client.token_credentials_base import TokenCredentialsBase
 from kfp.dsl import base_component
@@ -555,6 +556,37 @@ class Client:
             namespace=namespace,
         )
 
+    def iter_experiments(
+        self,
+        page_size: int = 100,
+        sort_by: str = '',
+        namespace: Optional[str] = None,
+        filter: Optional[str] = None,
+        prefetch: bool = True,
+    ) -> Iterator[kfp_server_api.V2beta1Experiment]:
+        """Iterates over all experiments, fetching them page by page.
+
+        Args:
+            page_size: Number of experiments to request per page.
+            sort_by: Sort string of format ``'[field_name]', '[field_name] desc'``. For example, ``'display_name desc'``.
+            namespace: Kubernetes namespace to use. Used for multi-user deployments. For single-user deployments, this should be left as ``None``.
+            filter: A url-encoded, JSON-serialized Filter protocol buffer. See ``list_experiments``.
+            prefetch: Whether to request the next page on a background thread while the current page is consumed.
+
+        Returns:
+            Iterator of ``V2beta1Experiment`` objects.
+        """
+        namespace = namespace or self.get_user_namespace()
+        return pagination.iter_items(
+            lambda page_token: self.list_experiments(
+                page_token=page_token,
+                page_size=page_size,
+                sort_by=sort_by,
+                namespace=namespace,
+                filter=filter),
+            'experiments',
+            prefetch=prefetch)
+
     def get_experiment(
         self,
         experiment_id: Optional[str] = None,
@@ -675,6 +707,36 @@ class Client:
             sort_by=sort_by,
             filter=filter)
 
+    def iter_pipelines(
+        self,
+        page_size: int = 100,
+        sort_by: str = '',
+        filter: Optional[str] = None,
+        namespace: Optional[str] = None,
+        prefetch: bool = True,
+    ) -> Iterator[kfp_server_api.V2beta1Pipeline]:
+        """Iterates over all pipelines, fetching them page by page.
+
+        Args:
+            page_size: Number of pipelines to request per page.
+            sort_by: Sort string of format ``'[field_name]', '[field_name] desc'``. For example, ``'display_name desc'``.
+            filter: A url-encoded, JSON-serialized Filter protocol buffer. See ``list_pipelines``.
+            namespace: Kubernetes namespace to use. Used for multi-user deployments. For single-user deployments, this should be left as ``None``.
+            prefetch: Whether to request the next page on a background thread while the current page is consumed.
+
+        Returns:
+            Iterator of ``V2beta1Pipeline`` objects.
+        """
+        return pagination.iter_items(
+            lambda page_token: self.list_pipelines(
+                page_token=page_token,
+                page_size=page_size,
+                sort_by=sort_by,
+                filter=filter,
+                namespace=namespace),
+            'pipelines',
+            prefetch=prefetch)
+
     # TODO: provide default namespace, similar to kubectl default namespaces.
     def run_pipeline(
         self,
@@ -1269,6 +1331,47 @@ class Client:
                 sort_by=sort_by,
                 filter=filter)
 
+    def iter_runs(
+        self,
+        page_size: int = 100,
+        sort_by: str = '',
+        experiment_id: Optional[str] = None,
+        namespace: Optional[str] = None,
+        filter: Optional[str] = None,
+        page_token: str = '',
+        prefetch: bool = True,
+    ) -> Iterator[kfp_server_api.V2beta1Run]:
+        """Iterates over all runs, fetching them page by page.
+
+        Unlike ``list_runs``, which returns a single page, this keeps
+        requesting pages until the last one, holding one page in memory
+        at a time.
+
+        Args:
+            page_size: Number of runs to request per page.
+            sort_by: Sort string of format ``'[field_name]', '[field_name] desc'``. For example, ``'display_name desc'``.
+            experiment_id: Experiment ID to filter upon.
+            namespace: Kubernetes namespace to use. Used for multi-user deployments. For single-user deployments, this should be left as ``None``.
+            filter: A url-encoded, JSON-serialized Filter protocol buffer. See ``list_runs``.
+            page_token: Page token of the first page to fetch.
+            prefetch: Whether to request the next page on a background thread while the current page is consumed.
+
+        Returns:
+            Iterator of ``V2beta1Run`` objects.
+        """
+        namespace = namespace or self.get_user_namespace()
+        return pagination.iter_items(
+            lambda token: self.list_runs(
+                page_token=token,
+                page_size=page_size,
+                sort_by=sort_by,
+                experiment_id=experiment_id,
+                namespace=namespace,
+                filter=filter),
+            'runs',
+            page_token=page_token,
+            prefetch=prefetch)
+
     def list_recurring_runs(
         self,
         page_token: str = '',
@@ -1628,6 +1731,37 @@ class Client:
             pipeline_id=pipeline_id,
             filter=filter)
 
+    def iter_pipeline_versions(
+        self,
+        pipeline_id: str,
+        page_size: int = 100,
+        sort_by: str = '',
+        filter: Optional[str] = None,
+        prefetch: bool = True,
+    ) -> Iterator[kfp_server_api.V2beta1PipelineVersion]:
+        """Iterates over all versions of a pipeline, fetching them page by
+        page.
+
+        Args:
+            pipeline_id: ID of the pipeline for which to list versions.
+            page_size: Number of pipeline versions to request per page.
+            sort_by: Sort string of format ``'[field_name]', '[field_name] desc'``. For example, ``'display_name desc'``.
+            filter: A url-encoded, JSON-serialized Filter protocol buffer. See ``list_pipeline_versions``.
+            prefetch: Whether to request the next page on a background thread while the current page is consumed.
+
+        Returns:
+            Iterator of ``V2beta1PipelineVersion`` objects.
+        """
+        return pagination.iter_items(
+            lambda page_token: self.list_pipeline_versions(
+                pipeline_id=pipeline_id,
+                page_token=page_token,
+                page_size=page_size,
+                sort_by=sort_by,
+                filter=filter),
+            'pipeline_versions',
+            prefetch=prefetch)
+
     def get_pipeline_version(
         self,
         pipeline_id: str,
@@ -547,6 +547,69 @@ class TestClient(parameterized.TestCase):
 
             self.assertEqual(result, expected_result)
 
+    def test_iter_runs_fetches_all_pages(self):
+        pages = [
+            Mock(
+                runs=[Mock(run_id='r-1'),
+                      Mock(run_id='r-2')],
+                next_page_token='t-1'),
+            Mock(runs=[Mock(run_id='r-3')], next_page_token=''),
+        ]
+        with patch.object(
+                self.client._run_api, 'run_service_list_runs',
+                side_effect=pages) as mock_list_runs:
+            runs = list(
+                self.client.iter_runs(
+                    page_size=2, sort_by='created_at desc', filter='f'))
+
+        self.assertEqual([run.run_id for run in runs], ['r-1', 'r-2', 'r-3'])
+        self.assertEqual(
+            [call.kwargs for call in mock_list_runs.call_args_list], [{
+                'page_token': token,
+                'page_size': 2,
+                'sort_by': 'created_at desc',
+                'namespace': 'ns1',
+                'filter': 'f'
+            } for token in ['', 't-1']])
+
+    @parameterized.parameters(
+        ('iter_experiments', '_experiment_api',
+         'experiment_service_list_experiments', 'experiments', {}),
+        ('iter_pipelines', '_pipelines_api', 'pipeline_service_list_pipelines',
+         'pipelines', {}),
+        ('iter_pipeline_versions', '_pipelines_api',
+         'pipeline_service_list_pipeline_versions', 'pipeline_versions', {
+             'pipeline_id': 'p-1'
+         }),
+    )
+    def test_iter_resources_fetches_all_pages(self, method, api, list_method,
+                                              items_attribute, kwargs):
+        pages = [
+            Mock(**{
+                items_attribute: ['a', 'b'],
+                'next_page_token': 't-1'
+            }),
+            Mock(**{
+                items_attribute: None,
+                'next_page_token': 't-2'
+            }),
+            Mock(**{
+                items_attribute: ['c'],
+                'next_page_token': ''
+            }),
+        ]
+        with patch.object(
+                getattr(self.client, api), list_method,
+                side_effect=pages) as mock_list:
+            items = list(
+                getattr(self.client,
+                        method)(page_size=2, prefetch=False, **kwargs))
+
+        self.assertEqual(items, ['a', 'b', 'c'])
+        self.assertEqual(
+            [call.kwargs['page_token'] for call in mock_list.call_args_list],
+            ['', 't-1', 't-2'])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,77 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Iteration over paginated list responses of the KFP API."""
+
+import concurrent.futures
+from typing import Any, Callable, Iterator, List
+
+
+def iter_pages(
+    list_page: Callable[[str], Any],
+    items_attribute: str,
+    page_token: str = '',
+    prefetch: bool = True,
+) -> Iterator[List[Any]]:
+    """Yields the items of each page of a paginated list call.
+
+    Args:
+        list_page: Function that returns the list response for a page token.
+        items_attribute: Name of the response attribute holding the items
+            (e.g. ``'runs'``).
+        page_token: Token of the first page.
+        prefetch: Whether to request the next page on a background thread
+            while the caller consumes the current one.
+
+    Yields:
+        The (possibly empty) list of items of each page, in order.
+    """
+    if not prefetch:
+        while True:
+            response = list_page(page_token)
+            yield getattr(response, items_attribute) or []
+            page_token = response.next_page_token
+            if not page_token:
+                return
+
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix='kfp-list-prefetch')
+    try:
+        next_response = executor.submit(list_page, page_token)
+        while True:
+            response = next_response.result()
+            page_token = response.next_page_token
+            if page_token:
+                next_response = executor.submit(list_page, page_token)
+            yield getattr(response, items_attribute) or []
+            if not page_token:
+                return
+    finally:
+        # if the caller stops early, do not wait for a prefetched page
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_items(
+    list_page: Callable[[str], Any],
+    items_attribute: str,
+    page_token: str = '',
+    prefetch: bool = True,
+) -> Iterator[Any]:
+    """Yields every item of a paginated list call, page by page.
+
+    See iter_pages for the arguments.
+    """
+    for page in iter_pages(
+            list_page, items_attribute, page_token=page_token,
+            prefetch=prefetch):
+        yield from page
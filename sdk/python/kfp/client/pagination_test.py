@@ -0,0 +1,102 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for pagination.py."""
+
+import threading
+import unittest
+from unittest import mock
+
+from absl.testing import parameterized
+from kfp.client import pagination
+
+
+class FakeListCall:
+    """Serves pages of consecutive integers, recording requested tokens."""
+
+    def __init__(self, num_items: int, page_size: int):
+        self.num_items = num_items
+        self.page_size = page_size
+        self.tokens = []
+        self.threads = set()
+        self.requested_second_page = threading.Event()
+
+    def __call__(self, page_token: str):
+        self.tokens.append(page_token)
+        self.threads.add(threading.current_thread().name)
+        if len(self.tokens) == 2:
+            self.requested_second_page.set()
+        start = int(page_token or 0)
+        end = min(start + self.page_size, self.num_items)
+        next_token = str(end) if end < self.num_items else ''
+        return mock.Mock(
+            runs=list(range(start, end)) or None, next_page_token=next_token)
+
+
+class TestIterPages(parameterized.TestCase):
+
+    @parameterized.parameters(True, False)
+    def test_all_pages(self, prefetch: bool):
+        list_call = FakeListCall(num_items=25, page_size=10)
+        pages = list(
+            pagination.iter_pages(list_call, 'runs', prefetch=prefetch))
+        self.assertEqual(
+            pages, [list(range(10)),
+                    list(range(10, 20)),
+                    list(range(20, 25))])
+        self.assertEqual(list_call.tokens, ['', '10', '20'])
+
+    @parameterized.parameters(True, False)
+    def test_empty_response(self, prefetch: bool):
+        list_call = FakeListCall(num_items=0, page_size=10)
+        self.assertEqual(
+            list(pagination.iter_pages(list_call, 'runs', prefetch=prefetch)),
+            [[]])
+
+    def test_starts_from_page_token(self):
+        list_call = FakeListCall(num_items=25, page_size=10)
+        items = list(pagination.iter_items(list_call, 'runs', page_token='20'))
+        self.assertEqual(items, list(range(20, 25)))
+
+    def test_prefetches_next_page_on_background_thread(self):
+        list_call = FakeListCall(num_items=25, page_size=10)
+        pages = pagination.iter_pages(list_call, 'runs')
+        next(pages)
+        # the second page is requested before the first is consumed
+        self.assertTrue(list_call.requested_second_page.wait(timeout=5))
+        self.assertEqual(list_call.tokens, ['', '10'])
+        self.assertNotIn(threading.current_thread().name, list_call.threads)
+        pages.close()
+
+    def test_no_prefetch_requests_pages_on_demand(self):
+        list_call = FakeListCall(num_items=25, page_size=10)
+        pages = pagination.iter_pages(list_call, 'runs', prefetch=False)
+        next(pages)
+        self.assertEqual(list_call.tokens, [''])
+        self.assertEqual(list_call.threads, {threading.current_thread().name})
+
+    def test_error_is_raised_to_caller(self):
+
+        def list_call(page_token: str):
+            if page_token:
+                raise ValueError('boom')
+            return mock.Mock(runs=[1], next_page_token='next')
+
+        items = pagination.iter_items(list_call, 'runs')
+        self.assertEqual(next(items), 1)
+        with self.assertRaisesRegex(ValueError, r'boom'):
+            next(items)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,203 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Content-addressed cache of compiled pipeline YAML.
+
+Compiling the same pipeline twice produces the same YAML, so the
+serialized output is cached under a hash of everything that determines
+it: the PipelineSpec and PlatformSpec bytes, the pipeline description
+and the override arguments of Compiler.compile. Entries are kept in an
+in-process LRU and, when a cache directory is configured, on disk so
+that separate processes (for example the steps of a CI job) share them.
+"""
+
+import collections
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Any, Optional
+
+from kfp import version
+from kfp.pipeline_spec import pipeline_spec_pb2
+
+# environment variable that enables the on-disk tier of the default cache
+CACHE_DIR_ENV_VAR = 'KFP_COMPILE_CACHE_DIR'
+
+DEFAULT_MAX_ENTRIES = 32
+
+
+def cache_key(
+    pipeline_spec: pipeline_spec_pb2.PipelineSpec,
+    platform_spec: pipeline_spec_pb2.PlatformSpec,
+    **overrides: Any,
+) -> str:
+    """Returns the cache key of a compilation.
+
+    Args:
+        pipeline_spec: The PipelineSpec before overrides are applied.
+        platform_spec: The PlatformSpec.
+        **overrides: Every other argument that affects the output, such as
+            the pipeline description, name and parameters.
+
+    Returns:
+        A hex digest that changes whenever the compiled output may change.
+    """
+    digest = hashlib.sha256()
+    # the SDK version is part of the key so that a disk cache shared across
+    # upgrades never serves output of a different serializer
+    digest.update(version.__version__.encode())
+    for spec in (pipeline_spec, platform_spec):
+        data = spec.SerializeToString(deterministic=True)
+        digest.update(len(data).to_bytes(8, 'big'))
+        digest.update(data)
+    digest.update(json.dumps(overrides, sort_keys=True, default=repr).encode())
+    return digest.hexdigest()
+
+
+class CompileCache:
+    """Thread-safe LRU of compiled YAML with an optional on-disk tier.
+
+    Args:
+        max_entries: Number of entries kept in memory. ``0`` disables the
+            in-memory tier.
+        cache_dir: Directory of the on-disk tier. Disabled if ``None``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        cache_dir: Optional[str] = None,
+    ) -> None:
+        if max_entries < 0:
+            raise ValueError(f'max_entries must be >= 0, got {max_entries!r}.')
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'collections.OrderedDict[str, bytes]' = (
+            collections.OrderedDict())
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Returns the cached YAML for key, or None on a miss."""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+
+        data = self._read_from_disk(key)
+        with self._lock:
+            if data is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, data)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Caches the YAML for key."""
+        with self._lock:
+            self._remember(key, data)
+        self._write_to_disk(key, data)
+
+    def clear(self) -> None:
+        """Drops the in-memory entries and resets the counters.
+
+        The on-disk tier is left untouched.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _remember(self, key: str, data: bytes) -> None:
+        if self.max_entries == 0:
+            return
+        self._entries[key] = data
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f'{key}.yaml')
+
+    def _read_from_disk(self, key: str) -> Optional[bytes]:
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self._path(key), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_to_disk(self, key: str, data: bytes) -> None:
+        if self.cache_dir is None:
+            return
+        # the on-disk tier is best effort: a read-only or full cache_dir
+        # must not fail the compilation
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            _write_atomically(self._path(key), data)
+        except OSError as e:
+            logging.warning(
+                f'Could not write to the compile cache at {self.cache_dir!r}, '
+                f'skipping the on-disk tier: {e}')
+
+
+def _write_atomically(path: str, data: bytes) -> None:
+    # write to a temporary file and rename it so that concurrent
+    # compilations never read a partially written entry
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+_default_cache: Optional[CompileCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> CompileCache:
+    """Returns the cache used by Compiler.compile.
+
+    The on-disk tier is enabled by setting the ``KFP_COMPILE_CACHE_DIR``
+    environment variable before the first compilation.
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = CompileCache(
+                cache_dir=os.environ.get(CACHE_DIR_ENV_VAR) or None)
+        return _default_cache
+
+
+def set_default_cache(cache: Optional[CompileCache]) -> None:
+    """Replaces the cache used by Compiler.compile.
+
+    Args:
+        cache: The new cache. ``None`` recreates the default cache from the
+            environment on the next compilation. Pass
+            ``CompileCache(max_entries=0)`` to disable caching.
+    """
+    global _default_cache
+    with _default_cache_lock:
+        _default_cache = cache
@@ -0,0 +1,220 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for compile_cache.py."""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from absl.testing import parameterized
+from kfp import compiler
+from kfp import dsl
+from kfp.compiler import compile_cache
+from kfp.compiler import pipeline_spec_builder
+from kfp.pipeline_spec import pipeline_spec_pb2
+
+
+@dsl.component(base_image='python:3.11')
+def print_op(message: str):
+    print(message)
+
+
+@dsl.pipeline
+def my_pipeline(message: str = 'hello'):
+    """My pipeline."""
+    print_op(message=message)
+
+
+class TestCacheKey(parameterized.TestCase):
+
+    def test_same_inputs_same_key(self):
+        self.assertEqual(
+            compile_cache.cache_key(
+                my_pipeline.pipeline_spec,
+                my_pipeline.platform_spec,
+                pipeline_name='a'),
+            compile_cache.cache_key(
+                my_pipeline.pipeline_spec,
+                my_pipeline.platform_spec,
+                pipeline_name='a'))
+
+    @parameterized.parameters(
+        {'pipeline_name': 'b'},
+        {'pipeline_parameters': {
+            'message': 'bye'
+        }},
+        {'pipeline_description': 'other'},
+    )
+    def test_overrides_change_key(self, **overrides):
+        base = {
+            'pipeline_name': 'a',
+            'pipeline_parameters': None,
+            'pipeline_description': None,
+        }
+        self.assertNotEqual(
+            compile_cache.cache_key(my_pipeline.pipeline_spec,
+                                    my_pipeline.platform_spec, **base),
+            compile_cache.cache_key(my_pipeline.pipeline_spec,
+                                    my_pipeline.platform_spec, **{
+                                        **base,
+                                        **overrides
+                                    }))
+
+    def test_spec_changes_key(self):
+        pipeline_spec = pipeline_spec_pb2.PipelineSpec()
+        pipeline_spec.CopyFrom(my_pipeline.pipeline_spec)
+        original_key = compile_cache.cache_key(pipeline_spec,
+                                               my_pipeline.platform_spec)
+        pipeline_spec.pipeline_info.name = 'changed'
+        self.assertNotEqual(
+            original_key,
+            compile_cache.cache_key(pipeline_spec, my_pipeline.platform_spec))
+
+    def test_platform_spec_changes_key(self):
+        platform_spec = pipeline_spec_pb2.PlatformSpec()
+        platform_spec.platforms['kubernetes'].pipelineConfig.workspace.size = (
+            '1Gi')
+        self.assertNotEqual(
+            compile_cache.cache_key(my_pipeline.pipeline_spec,
+                                    pipeline_spec_pb2.PlatformSpec()),
+            compile_cache.cache_key(my_pipeline.pipeline_spec, platform_spec))
+
+
+class TestCompileCache(unittest.TestCase):
+
+    def test_get_missing_key(self):
+        cache = compile_cache.CompileCache()
+        self.assertIsNone(cache.get('key'))
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+    def test_put_then_get(self):
+        cache = compile_cache.CompileCache()
+        cache.put('key', b'data')
+        self.assertEqual(cache.get('key'), b'data')
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_evicts_least_recently_used(self):
+        cache = compile_cache.CompileCache(max_entries=2)
+        cache.put('a', b'a')
+        cache.put('b', b'b')
+        cache.get('a')
+        cache.put('c', b'c')
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), b'a')
+        self.assertEqual(cache.get('c'), b'c')
+
+    def test_zero_entries_disables_memory_tier(self):
+        cache = compile_cache.CompileCache(max_entries=0)
+        cache.put('key', b'data')
+        self.assertIsNone(cache.get('key'))
+
+    def test_negative_max_entries(self):
+        with self.assertRaisesRegex(ValueError, r'max_entries must be >= 0'):
+            compile_cache.CompileCache(max_entries=-1)
+
+    def test_clear(self):
+        cache = compile_cache.CompileCache()
+        cache.put('key', b'data')
+        cache.get('key')
+        cache.clear()
+        self.assertIsNone(cache.get('key'))
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+    def test_disk_tier_is_shared_between_caches(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = os.path.join(tmpdir, 'cache')
+            compile_cache.CompileCache(cache_dir=cache_dir).put('key', b'data')
+            self.assertEqual(os.listdir(cache_dir), ['key.yaml'])
+
+            other_cache = compile_cache.CompileCache(cache_dir=cache_dir)
+            self.assertEqual(other_cache.get('key'), b'data')
+            self.assertEqual(other_cache.hits, 1)
+
+    def test_disk_write_failure_keeps_memory_tier(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # a file where the cache directory should be
+            cache_dir = os.path.join(tmpdir, 'cache')
+            open(cache_dir, 'w').close()
+            cache = compile_cache.CompileCache(cache_dir=cache_dir)
+            with self.assertLogs(level='WARNING') as logs:
+                cache.put('key', b'data')
+            self.assertIn('Could not write to the compile cache',
+                          logs.output[0])
+            self.assertEqual(cache.get('key'), b'data')
+
+
+class TestCompilerUsesCache(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.cache = compile_cache.CompileCache()
+        compile_cache.set_default_cache(self.cache)
+        self.addCleanup(compile_cache.set_default_cache, None)
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.tmpdir = tmpdir.name
+
+    def compile(self, file_name: str, **kwargs) -> bytes:
+        package_path = os.path.join(self.tmpdir, file_name)
+        compiler.Compiler().compile(my_pipeline, package_path, **kwargs)
+        with open(package_path, 'rb') as f:
+            return f.read()
+
+    def test_second_compilation_is_served_from_cache(self):
+        first = self.compile('first.yaml')
+        with mock.patch.object(pipeline_spec_builder,
+                               'write_pipeline_spec_to_file') as mock_write:
+            second = self.compile('second.yaml')
+        mock_write.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_cached_output_is_identical_to_uncached_output(self):
+        self.compile('a.yaml', pipeline_parameters={'message': 'x'})
+        cached = self.compile('b.yaml', pipeline_parameters={'message': 'x'})
+        compile_cache.set_default_cache(
+            compile_cache.CompileCache(max_entries=0))
+        uncached = self.compile('c.yaml', pipeline_parameters={'message': 'x'})
+        self.assertEqual(cached, uncached)
+
+    def test_overrides_are_not_served_from_other_entries(self):
+        default = self.compile('a.yaml')
+        overridden = self.compile(
+            'b.yaml', pipeline_parameters={'message': 'bye'})
+        self.assertNotEqual(default, overridden)
+        self.assertIn(b'bye', overridden)
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_deduplicate_components_is_not_served_from_other_entries(self):
+        self.compile('a.yaml')
+        self.compile('b.yaml', deduplicate_components=True)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 2))
+
+    def test_json_output_is_not_cached(self):
+        with self.assertWarns(DeprecationWarning):
+            self.compile('pipeline.json')
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+
+    def test_disk_tier_from_environment(self):
+        cache_dir = os.path.join(self.tmpdir, 'cache')
+        compile_cache.set_default_cache(None)
+        with mock.patch.dict(os.environ,
+                             {compile_cache.CACHE_DIR_ENV_VAR: cache_dir}):
+            self.compile('pipeline.yaml')
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
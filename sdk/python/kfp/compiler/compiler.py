@@ -19,10 +19,12 @@ https://docs.google.com/document/d/1PUDuSQ8vmeKSBloli53mp7GIvzekaY7sggg6ywy35Dk/
 
 from typing import Any, Dict, Optional
 
+from kfp.compiler import compile_cache
 from kfp.compiler import pipeline_spec_builder as builder
 from kfp.compiler.compiler_utils import KubernetesManifestOptions
 from kfp.dsl import base_component
 from kfp.dsl.types import type_utils
+from kfp.pipeline_spec import pipeline_spec_pb2
 
 
 class Compiler:
@@ -58,6 +60,7 @@ class Compiler:
         kubernetes_manifest_options: Optional[
             'KubernetesManifestOptions'] = None,
         kubernetes_manifest_format: bool = False,
+        deduplicate_components: bool = False,
     ) -> None:
         """Compiles the pipeline or component function into IR YAML.
 
@@ -70,6 +73,7 @@ class Compiler:
             type_check: Whether to enable type checking of component interfaces during compilation.
             kubernetes_manifest_options: KubernetesManifestOptions object for Kubernetes manifest output during pipeline compilation.
             kubernetes_manifest_format: Output the compiled pipeline as a Kubernetes manifest.
+            deduplicate_components: Whether to collapse components and executors that compile to identical specs, such as those of a component used by many tasks or of a sub-pipeline nested many times, into a single entry. Shrinks the compiled output of large pipelines.
         """
 
         with type_utils.TypeCheckManager(enable=type_check):
@@ -80,17 +84,52 @@ class Compiler:
                     '`Callable` constructed with @dsl.pipeline '
                     f'decorator. Got: {type(pipeline_func)}')
 
+            original_spec = pipeline_func.pipeline_spec
+            platform_spec = pipeline_func.platform_spec
+
+            # only plain YAML output is cached; JSON output is deprecated and
+            # manifest output depends on mutable KubernetesManifestOptions
+            cache = None
+            if not kubernetes_manifest_format and package_path.endswith(
+                ('.yaml', '.yml')):
+                cache = compile_cache.get_default_cache()
+                key = compile_cache.cache_key(
+                    original_spec,
+                    platform_spec,
+                    pipeline_description=pipeline_func.description,
+                    pipeline_name=pipeline_name,
+                    pipeline_display_name=pipeline_display_name,
+                    pipeline_parameters=pipeline_parameters,
+                    type_check=type_check,
+                    deduplicate_components=deduplicate_components,
+                )
+                data = cache.get(key)
+                if data is not None:
+                    with open(package_path, 'wb') as f:
+                        f.write(data)
+                    return
+
             pipeline_spec = builder.modify_pipeline_spec_with_override(
-                pipeline_spec=pipeline_func.pipeline_spec,
+                pipeline_spec=original_spec,
                 pipeline_name=pipeline_name,
                 pipeline_parameters=pipeline_parameters,
                 pipeline_display_name=pipeline_display_name)
+            if deduplicate_components:
+                platform_spec_copy = pipeline_spec_pb2.PlatformSpec()
+                platform_spec_copy.CopyFrom(platform_spec)
+                platform_spec = platform_spec_copy
+                builder.deduplicate_component_specs(pipeline_spec,
+                                                    platform_spec)
 
             builder.write_pipeline_spec_to_file(
                 pipeline_spec=pipeline_spec,
                 pipeline_description=pipeline_func.description,
-                platform_spec=pipeline_func.platform_spec,
+                platform_spec=platform_spec,
                 package_path=package_path,
                 kubernetes_manifest_options=kubernetes_manifest_options,
                 kubernetes_manifest_format=kubernetes_manifest_format,
             )
+
+            if cache is not None:
+                with open(package_path, 'rb') as f:
+                    cache.put(key, f.read())
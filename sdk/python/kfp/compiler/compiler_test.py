@@ -1287,6 +1287,44 @@ class TestCompilePipelineCaching(unittest.TestCase):
             self.assertEqual(caching_options, {})
 
 
+class TestDeduplicateComponents(unittest.TestCase):
+
+    def test_compile_with_deduplicate_components(self):
+
+        @dsl.component
+        def my_component(message: str):
+            print(message)
+
+        @dsl.pipeline(name='tiny-pipeline')
+        def my_pipeline():
+            my_component(message='a')
+            my_component(message='b')
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            output_yaml = os.path.join(tempdir, 'pipeline.yaml')
+            compiler.Compiler().compile(
+                pipeline_func=my_pipeline,
+                package_path=output_yaml,
+                deduplicate_components=True)
+
+            with open(output_yaml, 'r') as f:
+                pipeline_spec = yaml.safe_load(f)
+            loaded = components.load_component_from_file(output_yaml)
+
+        self.assertEqual(
+            list(pipeline_spec['components']), ['comp-my-component'])
+        self.assertEqual(
+            list(pipeline_spec['deploymentSpec']['executors']),
+            ['exec-my-component'])
+        for task_spec in pipeline_spec['root']['dag']['tasks'].values():
+            self.assertEqual(task_spec['componentRef']['name'],
+                             'comp-my-component')
+        self.assertEqual(loaded.pipeline_spec.components.keys(),
+                         {'comp-my-component'})
+        # the pipeline itself is left unchanged
+        self.assertEqual(len(my_pipeline.pipeline_spec.components), 2)
+
+
 class V2NamespaceAliasTest(unittest.TestCase):
     """Test that imports of both modules and objects are aliased (e.g. all
     import path variants work)."""
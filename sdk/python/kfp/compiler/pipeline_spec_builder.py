@@ -16,15 +16,18 @@
 import copy
 import json
 import typing
-from typing import (Any, DefaultDict, Dict, List, Mapping, Optional, Tuple,
-                    Union)
+from typing import (Any, Callable, DefaultDict, Dict, Iterable, List, Mapping,
+                    Optional, Tuple, Union)
 import warnings
 
+from google.protobuf import descriptor
 from google.protobuf import json_format
+from google.protobuf import message as protobuf_message
 from google.protobuf import struct_pb2
 import kfp
 from kfp import dsl
 from kfp.compiler import compiler_utils
+from kfp.compiler import yaml_emitter
 from kfp.compiler.compiler_utils import KubernetesManifestOptions
 from kfp.dsl import component_factory
 from kfp.dsl import for_loop
@@ -39,7 +42,6 @@ from kfp.dsl import utils
 from kfp.dsl.component_task_config import TaskConfigField
 from kfp.dsl.types import type_utils
 from kfp.pipeline_spec import pipeline_spec_pb2
-import yaml
 
 # must be defined here to avoid circular imports
 group_type_to_dsl_class = {
@@ -1371,6 +1373,9 @@ def build_spec_by_group(
 
     # Generate task specs and component specs for the dag.
     subgroups = group.groups + group.tasks
+    tasks_in_current_dag = [
+        utils.sanitize_task_name(subgroup.name) for subgroup in subgroups
+    ]
     for subgroup in subgroups:
 
         subgroup_input_channels = [
@@ -1380,9 +1385,6 @@ def build_spec_by_group(
 
         subgroup_component_name = (utils.sanitize_component_name(subgroup.name))
 
-        tasks_in_current_dag = [
-            utils.sanitize_task_name(subgroup.name) for subgroup in subgroups
-        ]
         is_parent_component_root = (group_component_spec == pipeline_spec.root)
 
         if isinstance(subgroup, pipeline_task.PipelineTask):
@@ -1401,7 +1403,7 @@ def build_spec_by_group(
             if subgroup_component_spec.executor_label:
                 executor_label = utils.make_name_unique_by_adding_index(
                     name=subgroup_component_spec.executor_label,
-                    collection=list(deployment_config.executors.keys()),
+                    collection=deployment_config.executors,
                     delimiter='-')
                 subgroup_component_spec.executor_label = executor_label
 
@@ -1567,7 +1569,7 @@ def build_spec_by_group(
         # Add component spec
         subgroup_component_name = utils.make_name_unique_by_adding_index(
             name=subgroup_component_name,
-            collection=list(pipeline_spec.components.keys()),
+            collection=pipeline_spec.components,
             delimiter='-')
 
         subgroup_task_spec.component_ref.name = subgroup_component_name
@@ -1713,23 +1715,36 @@ def _rewrite_platform_config_input_references(
 def merge_platform_specs(
     main_msg: pipeline_spec_pb2.PlatformSpec,
     sub_msg: pipeline_spec_pb2.PlatformSpec,
+    executor_labels: Optional[Mapping[str, str]] = None,
 ) -> None:
     """Merges a sub_msg PlatformSpec into the main_msg PlatformSpec, leaving
-    the sub_msg unchanged."""
+    the sub_msg unchanged.
+
+    Executor labels of sub_msg found in executor_labels are merged under
+    the label they map to.
+    """
     for platform_key, single_platform_spec in sub_msg.platforms.items():
         merge_platform_deployment_config(
             main_msg.platforms[platform_key].deployment_spec,
             single_platform_spec.deployment_spec,
+            executor_labels=executor_labels,
         )
 
 
 def merge_platform_deployment_config(
     main_msg: pipeline_spec_pb2.PlatformDeploymentConfig,
     sub_msg: pipeline_spec_pb2.PlatformDeploymentConfig,
+    executor_labels: Optional[Mapping[str, str]] = None,
 ) -> None:
     """Merges a sub_msg PlatformDeploymentConfig into the main_msg
-    PlatformDeploymentConfig, leaving the sub_msg unchanged."""
+    PlatformDeploymentConfig, leaving the sub_msg unchanged.
+
+    Executor labels of sub_msg found in executor_labels are merged under
+    the label they map to.
+    """
+    executor_labels = executor_labels or {}
     for executor_label, addtl_body in sub_msg.executors.items():
+        executor_label = executor_labels.get(executor_label, executor_label)
         body = main_msg.executors.get(executor_label, struct_pb2.Struct())
         body.update(addtl_body)
         main_msg.executors[executor_label].CopyFrom(body)
@@ -1771,7 +1786,7 @@ def build_exit_handler_groups_recursively(
                     task=exit_task)
                 executor_label = utils.make_name_unique_by_adding_index(
                     name=exit_task_component_spec.executor_label,
-                    collection=list(deployment_config.executors.keys()),
+                    collection=deployment_config.executors,
                     delimiter='-')
                 exit_task_component_spec.executor_label = executor_label
                 deployment_config.executors[executor_label].container.CopyFrom(
@@ -1806,7 +1821,7 @@ def build_exit_handler_groups_recursively(
             # Add exit task component spec.
             component_name = utils.make_name_unique_by_adding_index(
                 name=exit_task_task_spec.component_ref.name,
-                collection=list(pipeline_spec.components.keys()),
+                collection=pipeline_spec.components,
                 delimiter='-')
             exit_task_task_spec.component_ref.name = component_name
             pipeline_spec.components[component_name].CopyFrom(
@@ -1843,6 +1858,9 @@ def merge_deployment_spec_and_component_spec(
     unchanged--in case the pipeline is reused (instantiated) multiple times,
     the "template" should not carry any "signs of usage".
 
+    The merge is linear in the size of the sub pipeline spec: colliding
+    names are resolved up front into rename maps, which are then applied
+    in a single pass over the components and tasks.
 
     Args:
         main_pipeline_spec: The main PipelineSpec to merge into.
@@ -1856,18 +1874,16 @@ def merge_deployment_spec_and_component_spec(
     Returns:
         The possibly modified version of sub_pipeline_spec and the possibly modified version of the the main_platform_spec. The sub_pipeline_spec is "folded" into the outer pipeline, whereas the main_platform_spec is updated to contain the sub_pipeline_spec's configuration.
     """
-    # Make a copy of the messages of the inner pipeline so that the "template" remains
+    # Make a copy of the inner pipeline so that the "template" remains
     # unchanged and works even the pipeline is reused multiple times.
     sub_pipeline_spec_copy = pipeline_spec_pb2.PipelineSpec()
     sub_pipeline_spec_copy.CopyFrom(sub_pipeline_spec)
-    sub_platform_spec_copy = pipeline_spec_pb2.PlatformSpec()
-    sub_platform_spec_copy.CopyFrom(sub_platform_spec)
 
     _merge_deployment_spec(
         main_deployment_config=main_deployment_config,
         sub_pipeline_spec=sub_pipeline_spec_copy,
         main_platform_spec=main_platform_spec,
-        sub_platform_spec=sub_platform_spec_copy,
+        sub_platform_spec=sub_platform_spec,
     )
     _merge_component_spec(
         main_pipeline_spec=main_pipeline_spec,
@@ -1876,6 +1892,141 @@ def merge_deployment_spec_and_component_spec(
     return sub_pipeline_spec_copy, main_platform_spec
 
 
+def _make_names_unique(
+    names: Iterable[str],
+    collection: typing.Container[str],
+    delimiter: str,
+) -> Dict[str, str]:
+    """Maps each name to a name that is unique in collection and among the
+    names returned for the names before it.
+
+    The result is the same as calling utils.make_name_unique_by_adding_index
+    for each name in turn and adding the unique name to collection, but
+    collection is never copied and the index search of a name resumes where
+    the previous search for the same name stopped.
+
+    Args:
+        names: The names to make unique.
+        collection: The collection of existing names.
+        delimiter: The delimiter to connect a name and an index.
+
+    Returns:
+        A dict mapping each name to its unique name.
+    """
+    unique_names = {}
+    taken = set()
+    next_indexes = {}
+    for name in names:
+        unique_name = name
+        if name in collection or name in taken:
+            index = next_indexes.get(name, 2)
+            unique_name = name + delimiter + str(index)
+            while unique_name in collection or unique_name in taken:
+                index += 1
+                unique_name = name + delimiter + str(index)
+            next_indexes[name] = index + 1
+        taken.add(unique_name)
+        unique_names[name] = unique_name
+    return unique_names
+
+
+def _struct_to_message(
+    struct: struct_pb2.Struct,
+    message: protobuf_message.Message,
+) -> None:
+    """Sets the fields of message from a Struct holding its JSON form.
+
+    Gives the same result as json_format.ParseDict(
+    json_format.MessageToDict(struct), message) for the field types of
+    an ExecutorSpec, without a detour through Python values.
+    """
+    message_descriptor = message.DESCRIPTOR
+    for key, value in struct.fields.items():
+        field = message_descriptor.fields_by_camelcase_name.get(
+            key) or message_descriptor.fields_by_name.get(key)
+        if field is None:
+            raise json_format.ParseError(
+                f'Message type "{message_descriptor.full_name}" has no field named '
+                f'"{key}".')
+        if (value.WhichOneof('kind') == 'null_value' and
+                _message_name(field) != 'google.protobuf.Value'):
+            message.ClearField(field.name)
+            continue
+        target = getattr(message, field.name)
+        if field.message_type is not None and (
+                field.message_type.GetOptions().map_entry):
+            value_field = field.message_type.fields_by_name['value']
+            for map_key, map_value in value.struct_value.fields.items():
+                if value_field.message_type is not None:
+                    _value_to_message(map_value, target[map_key])
+                else:
+                    target[map_key] = _value_to_scalar(map_value, value_field)
+        elif field.is_repeated:
+            for item in value.list_value.values:
+                if field.message_type is not None:
+                    _value_to_message(item, target.add())
+                else:
+                    target.append(_value_to_scalar(item, field))
+        elif field.message_type is not None:
+            _value_to_message(value, target)
+        else:
+            setattr(message, field.name, _value_to_scalar(value, field))
+
+
+def _message_name(field: descriptor.FieldDescriptor) -> str:
+    return field.message_type.full_name if field.message_type else ''
+
+
+def _value_to_message(
+    value: struct_pb2.Value,
+    message: protobuf_message.Message,
+) -> None:
+    message.SetInParent()
+    full_name = message.DESCRIPTOR.full_name
+    if full_name == 'google.protobuf.Value':
+        message.CopyFrom(value)
+    elif full_name == 'google.protobuf.Struct':
+        message.CopyFrom(value.struct_value)
+    elif full_name == 'google.protobuf.ListValue':
+        message.CopyFrom(value.list_value)
+    elif value.WhichOneof('kind') == 'struct_value':
+        _struct_to_message(value.struct_value, message)
+    else:
+        raise json_format.ParseError(
+            f'Expected an object for "{full_name}", got {value}.')
+
+
+def _value_to_scalar(
+    value: struct_pb2.Value,
+    field: descriptor.FieldDescriptor,
+) -> Any:
+    kind = value.WhichOneof('kind')
+    if field.type == field.TYPE_STRING and kind == 'string_value':
+        return value.string_value
+    if field.type == field.TYPE_BOOL and kind == 'bool_value':
+        return value.bool_value
+    if field.cpp_type in (field.CPPTYPE_INT32, field.CPPTYPE_INT64,
+                          field.CPPTYPE_UINT32, field.CPPTYPE_UINT64):
+        # 64-bit integers are written as strings
+        if kind == 'string_value':
+            return int(value.string_value)
+        if kind == 'number_value' and value.number_value.is_integer():
+            return int(value.number_value)
+    if field.cpp_type in (field.CPPTYPE_FLOAT, field.CPPTYPE_DOUBLE):
+        # NaN and infinities are written as strings
+        if kind == 'string_value':
+            return float(value.string_value)
+        if kind == 'number_value':
+            return value.number_value
+    if field.type == field.TYPE_ENUM:
+        if kind == 'string_value':
+            return field.enum_type.values_by_name[value.string_value].number
+        if kind == 'number_value':
+            return int(value.number_value)
+    raise json_format.ParseError(
+        f'Invalid value {value} for field "{field.full_name}".')
+
+
 def _merge_deployment_spec(
     main_deployment_config: pipeline_spec_pb2.PipelineDeploymentConfig,
     sub_pipeline_spec: pipeline_spec_pb2.PipelineSpec,
@@ -1891,63 +2042,44 @@ def _merge_deployment_spec(
     Args:
         main_deployment_config: The main deployment config to merge into.
         sub_pipeline_spec: The pipeline spec of an inner pipeline whose
-            deployment configs need to be merged into the main config.
+            deployment configs need to be merged into the main config. Its
+            executor labels are updated in place.
+        main_platform_spec: The platform spec to merge into.
+        sub_platform_spec: The platform spec of the inner pipeline. It is
+            left unchanged.
     """
-
-    def _rename_executor_labels(
-        pipeline_spec: pipeline_spec_pb2.PipelineSpec,
-        old_executor_label: str,
-        new_executor_label: str,
-    ) -> None:
-        """Renames the old executor_label to the new one in component spec."""
-        for _, component_spec in pipeline_spec.components.items():
-            if component_spec.executor_label == old_executor_label:
-                component_spec.executor_label = new_executor_label
-
-    def _rename_platform_config_executor_labels(
-        sub_platform_spec: pipeline_spec_pb2.PlatformSpec,
-        old_executor_label: str,
-        new_executor_label: str,
-    ) -> None:
-        # make a copy so that map size doesn't change during iteration
-        sub_platform_spec_copy = copy.deepcopy(sub_platform_spec)
-        for platform_key, platform_config in sub_platform_spec_copy.platforms.items(
-        ):
-            for cur_exec_label, task_config in platform_config.deployment_spec.executors.items(
-            ):
-                if cur_exec_label == old_executor_label:
-                    del sub_platform_spec.platforms[
-                        platform_key].deployment_spec.executors[
-                            old_executor_label]
-                    sub_platform_spec.platforms[
-                        platform_key].deployment_spec.executors[
-                            new_executor_label].CopyFrom(task_config)
-
-    sub_deployment_config = pipeline_spec_pb2.PipelineDeploymentConfig()
-    json_format.ParseDict(
-        json_format.MessageToDict(sub_pipeline_spec.deployment_spec),
-        sub_deployment_config)
-
-    for executor_label, executor_spec in sub_deployment_config.executors.items(
-    ):
-        old_executor_label = executor_label
-        executor_label = utils.make_name_unique_by_adding_index(
-            name=executor_label,
-            collection=list(main_deployment_config.executors.keys()),
-            delimiter='-')
-        if executor_label != old_executor_label:
-            _rename_executor_labels(
-                pipeline_spec=sub_pipeline_spec,
-                old_executor_label=old_executor_label,
-                new_executor_label=executor_label)
-            _rename_platform_config_executor_labels(
-                sub_platform_spec,
-                old_executor_label=old_executor_label,
-                new_executor_label=executor_label)
-
+    executors = sub_pipeline_spec.deployment_spec.fields.get('executors')
+    sub_executors = (
+        executors.struct_value.fields if executors is not None else {})
+    new_executor_labels = _make_names_unique(
+        names=sub_executors.keys(),
+        collection=main_deployment_config.executors,
+        delimiter='-')
+
+    for component_spec in sub_pipeline_spec.components.values():
+        executor_label = new_executor_labels.get(component_spec.executor_label)
+        if executor_label is not None:
+            component_spec.executor_label = executor_label
+
+    # a sub-pipeline that calls the same pipeline many times holds many
+    # identical executors, which are converted once per merge
+    converted: Dict[
+        bytes, pipeline_spec_pb2.PipelineDeploymentConfig.ExecutorSpec] = {}
+    for old_executor_label, executor_label in new_executor_labels.items():
+        executor_struct = sub_executors[old_executor_label].struct_value
+        key = executor_struct.SerializeToString(deterministic=True)
+        executor_spec = converted.get(key)
+        if executor_spec is None:
+            executor_spec = pipeline_spec_pb2.PipelineDeploymentConfig.ExecutorSpec(
+            )
+            _struct_to_message(executor_struct, executor_spec)
+            converted[key] = executor_spec
         main_deployment_config.executors[executor_label].CopyFrom(executor_spec)
-        merge_platform_specs(
-            main_msg=main_platform_spec, sub_msg=sub_platform_spec)
+
+    merge_platform_specs(
+        main_msg=main_platform_spec,
+        sub_msg=sub_platform_spec,
+        executor_labels=new_executor_labels)
 
 
 def _merge_component_spec(
@@ -1963,60 +2095,128 @@ def _merge_component_spec(
     Uniqueness is determined by existing component names in main_pipeline_spec
     and sub_pipeline_spec.
 
-    Renaming is first done in place, specifically in a LIFO order. This is to avoid
-    a rename causing a name collision with a later rename. Then, the actual merge
-    of component specs is done in a second pass. This ensures all component specs
-    are in the final state at the time of merging.
+    All new names are chosen before any task is updated, and every task is
+    then updated at most once, so a rename never collides with a later one.
 
     Args:
         main_pipeline_spec: The main pipeline spec to merge into.
         sub_pipeline_spec: The pipeline spec of an inner pipeline whose
             component specs need to be merged into the global config.
     """
-
-    def _rename_component_refs(
-        pipeline_spec: pipeline_spec_pb2.PipelineSpec,
-        old_component_ref: str,
-        new_component_ref: str,
-    ) -> None:
-        """Renames the old component_ref to the new one in task spec."""
-        for _, component_spec in pipeline_spec.components.items():
-            if not component_spec.dag:
-                continue
-            for _, task_spec in component_spec.dag.tasks.items():
-                if task_spec.component_ref.name == old_component_ref:
-                    task_spec.component_ref.name = new_component_ref
-
-        for _, task_spec in pipeline_spec.root.dag.tasks.items():
-            if task_spec.component_ref.name == old_component_ref:
-                task_spec.component_ref.name = new_component_ref
-
-    old_name_to_new_name = {}
-    existing_main_comp_names = list(main_pipeline_spec.components.keys())
-    for component_name, _ in sub_pipeline_spec.components.items():
-        old_component_name = component_name
-        current_comp_name_collection = [
-            key for pair in old_name_to_new_name.items() for key in pair
-        ]
-        new_component_name = utils.make_name_unique_by_adding_index(
-            name=component_name,
-            collection=existing_main_comp_names + current_comp_name_collection,
-            delimiter='-')
-        old_name_to_new_name[old_component_name] = new_component_name
-
-    ordered_names = enumerate(old_name_to_new_name.items())
-    lifo_ordered_names = sorted(ordered_names, key=lambda x: x[0], reverse=True)
-    for _, (old_component_name, new_component_name) in lifo_ordered_names:
-        if new_component_name != old_component_name:
-            _rename_component_refs(
-                pipeline_spec=sub_pipeline_spec,
-                old_component_ref=old_component_name,
-                new_component_ref=new_component_name)
+    new_component_names = _make_names_unique(
+        names=sub_pipeline_spec.components.keys(),
+        collection=main_pipeline_spec.components,
+        delimiter='-')
+
+    dag_specs = [sub_pipeline_spec.root.dag] + [
+        component_spec.dag
+        for component_spec in sub_pipeline_spec.components.values()
+        if component_spec.HasField('dag')
+    ]
+    for dag_spec in dag_specs:
+        for task_spec in dag_spec.tasks.values():
+            component_name = new_component_names.get(
+                task_spec.component_ref.name)
+            if component_name is not None:
+                task_spec.component_ref.name = component_name
 
     for old_component_name, component_spec in sub_pipeline_spec.components.items(
     ):
         main_pipeline_spec.components[
-            old_name_to_new_name[old_component_name]].CopyFrom(component_spec)
+            new_component_names[old_component_name]].CopyFrom(component_spec)
+
+
+def deduplicate_component_specs(
+    pipeline_spec: pipeline_spec_pb2.PipelineSpec,
+    platform_spec: pipeline_spec_pb2.PlatformSpec,
+) -> None:
+    """Collapses identical executors and components into a single entry.
+
+    A component used by many tasks, or a sub-pipeline nested many times, is
+    compiled into one ``comp-foo``, ``comp-foo-2``, ... per use, each with
+    its own executor and its own copy of the command and embedded source.
+    Executors whose ExecutorSpec and platform-specific configuration are
+    identical are replaced by the one with the shortest label, then
+    components whose ComponentSpecs are identical, until no duplicates are
+    left (components of a nested DAG only become identical once the
+    components their tasks reference have been collapsed). References to
+    the removed entries are rewritten.
+
+    Args:
+        pipeline_spec: The PipelineSpec to update in place.
+        platform_spec: The PlatformSpec to update in place.
+    """
+    executors = pipeline_spec.deployment_spec.fields.get('executors')
+    if executors is not None:
+        executor_fields = executors.struct_value.fields
+        platform_executors = [
+            platform_spec.platforms[platform_key].deployment_spec.executors
+            for platform_key in sorted(platform_spec.platforms)
+        ]
+
+        def executor_key(executor_label: str) -> Tuple[bytes, ...]:
+            key = [
+                executor_fields[executor_label].SerializeToString(
+                    deterministic=True)
+            ]
+            for platform_executor_configs in platform_executors:
+                config = platform_executor_configs.get(executor_label)
+                key.append(b'' if config is None else config.SerializeToString(
+                    deterministic=True))
+            return tuple(key)
+
+        new_executor_labels = _find_duplicates(executor_fields.keys(),
+                                               executor_key)
+        for executor_label in new_executor_labels:
+            del executor_fields[executor_label]
+            for platform_executor_configs in platform_executors:
+                if executor_label in platform_executor_configs:
+                    del platform_executor_configs[executor_label]
+        for component_spec in pipeline_spec.components.values():
+            # executor_label shares a oneof with dag, so it is only assigned
+            # to components that already have one
+            executor_label = new_executor_labels.get(
+                component_spec.executor_label)
+            if executor_label is not None:
+                component_spec.executor_label = executor_label
+
+    def component_key(component_name: str) -> bytes:
+        return pipeline_spec.components[component_name].SerializeToString(
+            deterministic=True)
+
+    while True:
+        new_component_names = _find_duplicates(pipeline_spec.components.keys(),
+                                               component_key)
+        if not new_component_names:
+            return
+        for component_name in new_component_names:
+            del pipeline_spec.components[component_name]
+        dag_specs = [pipeline_spec.root.dag] + [
+            component_spec.dag
+            for component_spec in pipeline_spec.components.values()
+            if component_spec.HasField('dag')
+        ]
+        for dag_spec in dag_specs:
+            for task_spec in dag_spec.tasks.values():
+                component_name = new_component_names.get(
+                    task_spec.component_ref.name)
+                if component_name is not None:
+                    task_spec.component_ref.name = component_name
+
+
+def _find_duplicates(
+    names: Iterable[str],
+    key: Callable[[str], Any],
+) -> Dict[str, str]:
+    """Maps every name whose key equals the key of a shorter (or, at equal
+    length, alphabetically smaller) name to the smallest such name."""
+    kept_names = {}
+    duplicates = {}
+    for name in sorted(names, key=lambda name: (len(name), name)):
+        kept_name = kept_names.setdefault(key(name), name)
+        if kept_name != name:
+            duplicates[name] = kept_name
+    return duplicates
 
 
 def validate_pipeline_outputs_dict(
@@ -2306,7 +2506,7 @@ def write_pipeline_spec_to_file(
             documents = [pipeline_spec_dict]
             if has_platform_specific_features:
                 documents.append(json_format.MessageToDict(platform_spec))
-            yaml.dump_all(documents, yaml_file, sort_keys=True)
+            yaml_emitter.dump_all(documents, yaml_file)
 
     else:
         raise ValueError(
@@ -2372,11 +2572,7 @@ def _write_kubernetes_manifest_to_file(
     documents.append(pipeline_version_manifest)
 
     with open(package_path, 'w') as yaml_file:
-        yaml.dump_all(
-            documents=documents,
-            stream=yaml_file,
-            sort_keys=True,
-        )
+        yaml_emitter.dump_all(documents, yaml_file)
 
 
 def _merge_pipeline_config(pipelineConfig: pipeline_config.PipelineConfig,
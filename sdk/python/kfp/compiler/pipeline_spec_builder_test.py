@@ -15,6 +15,7 @@
 
 import os
 import tempfile
+from typing import Tuple
 import unittest
 
 from absl.testing import parameterized
@@ -27,6 +28,7 @@ from kfp.compiler import compiler
 from kfp.compiler import compiler_utils
 from kfp.compiler import pipeline_spec_builder
 from kfp.dsl import TaskConfigField
+from kfp.dsl import utils
 from kfp.pipeline_spec import pipeline_spec_pb2
 import yaml
 
@@ -226,6 +228,194 @@ class PipelineSpecBuilderTest(parameterized.TestCase):
         self.assertEqual(sub_pipeline_spec_copy.root,
                          expected_sub_pipeline_spec_root)
 
+    def test_merge_deployment_spec_and_component_spec_chained_renames(self):
+        # exec-1 of the sub pipeline is renamed to exec-1-2, which is also
+        # the label of another of its executors
+        main_deployment_config = pipeline_spec_pb2.PipelineDeploymentConfig()
+        main_deployment_config.executors['exec-1'].container.image = 'img-1'
+        main_pipeline_spec = pipeline_spec_pb2.PipelineSpec()
+        main_pipeline_spec.components['comp-1'].executor_label = 'exec-1'
+        main_platform_spec = pipeline_spec_pb2.PlatformSpec()
+        main_platform_spec.platforms['kubernetes'].deployment_spec.executors[
+            'exec-1'].update({'main': True})
+
+        sub_deployment_config = pipeline_spec_pb2.PipelineDeploymentConfig()
+        sub_deployment_config.executors['exec-1'].container.image = 'img-a'
+        sub_deployment_config.executors['exec-1-2'].container.image = 'img-b'
+        sub_pipeline_spec = pipeline_spec_pb2.PipelineSpec()
+        sub_pipeline_spec.deployment_spec.update(
+            json_format.MessageToDict(sub_deployment_config))
+        sub_pipeline_spec.components['comp-1'].executor_label = 'exec-1'
+        sub_pipeline_spec.components['comp-1-2'].executor_label = 'exec-1-2'
+        sub_pipeline_spec.components['comp-dag'].dag.tasks[
+            'task-2'].component_ref.name = 'comp-1-2'
+        sub_pipeline_spec.root.dag.tasks['task-1'].component_ref.name = 'comp-1'
+        sub_pipeline_spec.root.dag.tasks[
+            'task-dag'].component_ref.name = 'comp-dag'
+        sub_platform_spec = pipeline_spec_pb2.PlatformSpec()
+        sub_executors = sub_platform_spec.platforms[
+            'kubernetes'].deployment_spec.executors
+        sub_executors['exec-1'].update({'sub': 'a'})
+        sub_executors['exec-1-2'].update({'sub': 'b'})
+        expected_sub_platform_spec = pipeline_spec_pb2.PlatformSpec()
+        expected_sub_platform_spec.CopyFrom(sub_platform_spec)
+
+        sub_pipeline_spec_copy, platform_spec = pipeline_spec_builder.merge_deployment_spec_and_component_spec(
+            main_pipeline_spec=main_pipeline_spec,
+            main_deployment_config=main_deployment_config,
+            sub_pipeline_spec=sub_pipeline_spec,
+            main_platform_spec=main_platform_spec,
+            sub_platform_spec=sub_platform_spec,
+        )
+
+        # whichever label each executor gets, every reference follows it
+        main_components = main_pipeline_spec.components
+        self.assertLen(main_components, 4)
+        self.assertLen(main_deployment_config.executors, 3)
+        self.assertEqual(main_components['comp-1'].executor_label, 'exec-1')
+        self.assertEqual(
+            main_deployment_config.executors['exec-1'].container.image, 'img-1')
+        platform_executors = platform_spec.platforms[
+            'kubernetes'].deployment_spec.executors
+        self.assertEqual(dict(platform_executors['exec-1']), {'main': True})
+
+        root_tasks = sub_pipeline_spec_copy.root.dag.tasks
+        dag_component = main_components[
+            root_tasks['task-dag'].component_ref.name]
+        for component_name, image, platform_config in [
+            (root_tasks['task-1'].component_ref.name, 'img-a', {
+                'sub': 'a'
+            }),
+            (dag_component.dag.tasks['task-2'].component_ref.name, 'img-b', {
+                'sub': 'b'
+            }),
+        ]:
+            self.assertNotEqual(component_name, 'comp-1')
+            executor_label = main_components[component_name].executor_label
+            self.assertEqual(
+                main_deployment_config.executors[executor_label].container
+                .image, image)
+            self.assertEqual(
+                dict(platform_executors[executor_label]), platform_config)
+        self.assertEqual(sub_platform_spec, expected_sub_platform_spec)
+
+    @parameterized.parameters(
+        ([], ['a', 'b']),
+        (['a'], ['a', 'b']),
+        (['a', 'a-2', 'a-4'], ['a', 'a-2', 'a-3']),
+        (['a', 'a-2'], ['a-2', 'a', 'a-2-2']),
+    )
+    def test_make_names_unique(self, collection, names):
+        expected = {}
+        taken = list(collection)
+        for name in names:
+            expected[name] = utils.make_name_unique_by_adding_index(
+                name, taken, '-')
+            taken.append(expected[name])
+        self.assertEqual(
+            pipeline_spec_builder._make_names_unique(
+                names=names, collection=set(collection), delimiter='-'),
+            expected)
+
+
+class TestStructToMessage(parameterized.TestCase):
+
+    @parameterized.named_parameters(
+        ('container', {
+            'container': {
+                'image': 'python:3.11',
+                'command': ['sh', '-c'],
+                'args': ['--executor_input', '{{$}}'],
+                'env': [{
+                    'name': 'A',
+                    'value': '1'
+                }],
+                'resources': {
+                    'cpuLimit': 2.0,
+                    'resourceMemoryLimit': '1G',
+                    'accelerator': {
+                        'type': 'nvidia.com/gpu',
+                        'count': '1'
+                    },
+                },
+                'lifecycle': {
+                    'preCacheCheck': {}
+                },
+            }
+        }),
+        ('importer', {
+            'importer': {
+                'artifactUri': {
+                    'constant': 'gs://bucket/file',
+                },
+                'typeSchema': {
+                    'schemaTitle': 'system.Dataset',
+                },
+                'properties': {
+                    'a': {
+                        'runtimeParameter': 'uri'
+                    },
+                    'b': {
+                        'constantValue': {
+                            'intValue': '3'
+                        }
+                    },
+                },
+                'metadata': {
+                    'key': [1, 'a', None, {
+                        'nested': True
+                    }]
+                },
+                'reimport': True,
+            }
+        }),
+        ('resolver', {
+            'resolver': {
+                'outputArtifactQueries': {
+                    'x': {
+                        'filter': 'f',
+                        'limit': 2
+                    }
+                }
+            }
+        }),
+        ('proto_field_names', {
+            'custom_job': {
+                'custom_job': {
+                    'displayName': 'job'
+                }
+            }
+        }),
+        ('null_fields', {
+            'container': {
+                'image': None,
+                'resources': None,
+            }
+        }),
+    )
+    def test_same_as_json_round_trip(self, executor):
+        struct = struct_pb2.Struct()
+        struct.update(executor)
+        expected = pipeline_spec_pb2.PipelineDeploymentConfig.ExecutorSpec()
+        json_format.ParseDict(json_format.MessageToDict(struct), expected)
+
+        actual = pipeline_spec_pb2.PipelineDeploymentConfig.ExecutorSpec()
+        pipeline_spec_builder._struct_to_message(struct, actual)
+
+        # also compares which empty messages are set
+        self.assertEqual(
+            actual.SerializeToString(deterministic=True),
+            expected.SerializeToString(deterministic=True))
+
+    def test_unknown_field(self):
+        struct = struct_pb2.Struct()
+        struct.update({'container': {'image_name': 'python:3.11'}})
+        with self.assertRaisesRegex(json_format.ParseError,
+                                    r'has no field named "image_name"'):
+            pipeline_spec_builder._struct_to_message(
+                struct,
+                pipeline_spec_pb2.PipelineDeploymentConfig.ExecutorSpec())
+
 
 class TestPlatformConfigToPlatformSpec(unittest.TestCase):
 
@@ -979,6 +1169,112 @@ class TestRewritePlatformConfigInputReferences(unittest.TestCase):
             )
 
 
+class TestDeduplicateComponentSpecs(parameterized.TestCase):
+
+    def compile(
+        self, pipeline
+    ) -> Tuple[pipeline_spec_pb2.PipelineSpec, pipeline_spec_pb2.PlatformSpec]:
+        pipeline_spec = pipeline_spec_pb2.PipelineSpec()
+        pipeline_spec.CopyFrom(pipeline.pipeline_spec)
+        platform_spec = pipeline_spec_pb2.PlatformSpec()
+        platform_spec.CopyFrom(pipeline.platform_spec)
+        pipeline_spec_builder.deduplicate_component_specs(
+            pipeline_spec, platform_spec)
+        return pipeline_spec, platform_spec
+
+    def test_collapses_reused_components_and_sub_pipelines(self):
+
+        @dsl.component(base_image='python:3.11')
+        def print_op(message: str):
+            print(message)
+
+        @dsl.pipeline
+        def inner(message: str):
+            print_op(message=message)
+            print_op(message=message)
+
+        @dsl.pipeline
+        def outer(message: str = 'hello'):
+            inner(message=message)
+            with dsl.ParallelFor(['a', 'b']) as item:
+                inner(message=item)
+
+        self.assertLen(outer.pipeline_spec.components, 7)
+
+        pipeline_spec, _ = self.compile(outer)
+
+        self.assertEqual(
+            sorted(pipeline_spec.components),
+            ['comp-for-loop-2', 'comp-inner', 'comp-print-op'])
+        self.assertEqual(
+            list(pipeline_spec.deployment_spec['executors']), ['exec-print-op'])
+        self.assertEqual(
+            pipeline_spec.components['comp-print-op'].executor_label,
+            'exec-print-op')
+        # components that share the oneof of executor_label keep their dag
+        inner_tasks = pipeline_spec.components['comp-inner'].dag.tasks
+        self.assertEqual(
+            {
+                name: task.component_ref.name
+                for name, task in inner_tasks.items()
+            }, {
+                'print-op': 'comp-print-op',
+                'print-op-2': 'comp-print-op'
+            })
+        loop_tasks = pipeline_spec.components['comp-for-loop-2'].dag.tasks
+        self.assertEqual(loop_tasks['inner-2'].component_ref.name, 'comp-inner')
+        self.assertEqual(
+            pipeline_spec.root.dag.tasks['inner'].component_ref.name,
+            'comp-inner')
+
+    def test_keeps_executors_with_different_platform_config(self):
+
+        @dsl.component(base_image='python:3.11')
+        def print_op(message: str):
+            print(message)
+
+        @dsl.pipeline
+        def my_pipeline():
+            print_op(message='a')
+            kubernetes.add_toleration(
+                print_op(message='a'), key='k', operator='Exists')
+            kubernetes.add_toleration(
+                print_op(message='a'), key='k', operator='Exists')
+
+        pipeline_spec, platform_spec = self.compile(my_pipeline)
+
+        self.assertEqual(
+            sorted(pipeline_spec.deployment_spec['executors']),
+            ['exec-print-op', 'exec-print-op-2'])
+        self.assertEqual(
+            list(platform_spec.platforms['kubernetes'].deployment_spec.executors
+                ), ['exec-print-op-2'])
+        self.assertEqual(
+            {
+                name: task.component_ref.name
+                for name, task in pipeline_spec.root.dag.tasks.items()
+            }, {
+                'print-op': 'comp-print-op',
+                'print-op-2': 'comp-print-op-2',
+                'print-op-3': 'comp-print-op-2',
+            })
+
+    def test_without_duplicates_is_unchanged(self):
+
+        @dsl.component(base_image='python:3.11')
+        def print_op(message: str):
+            print(message)
+
+        @dsl.pipeline
+        def my_pipeline():
+            print_op(message='a')
+
+        pipeline_spec, platform_spec = self.compile(my_pipeline)
+
+        self.assertEqual(pipeline_spec, my_pipeline.pipeline_spec)
+        self.assertEqual(platform_spec, my_pipeline.platform_spec)
+
+
 def pipeline_spec_from_file(filepath: str) -> str:
     with open(filepath, 'r') as f:
         dictionary = yaml.safe_load(f)
@@ -0,0 +1,176 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""YAML emission of compiled pipelines using libyaml where it is safe.
+
+The output is byte-identical to ``yaml.dump_all(documents, stream,
+sort_keys=True)``. libyaml's emitter (``yaml.CDumper``) is much faster
+than PyYAML's pure-Python one, but the two fold long quoted scalars at
+different places, so libyaml cannot emit a whole pipeline. Instead, each
+document is split into block-style entries: entries whose scalars all
+fit on their line are emitted by libyaml, and only the entries that may
+be folded (typically the commands that embed component sources) are
+emitted by PyYAML. Each piece is written to the stream as soon as it is
+emitted.
+
+An entry is emitted on its own by dumping it nested under the keys of
+its path, so it lands in the same column as in the whole document, and
+dropping the lines of those keys.
+"""
+
+import functools
+from typing import Any, Dict, Iterable, Iterator, TextIO, Tuple
+
+import yaml
+
+try:
+    from yaml import CDumper as _FastDumper
+except ImportError:
+    _FastDumper = None
+
+# scalars that end before this column are never folded by either emitter
+# (both fold at PyYAML's default width of 80)
+_SAFE_WIDTH = 78
+
+_Path = Tuple[str, ...]
+
+
+def dump_all(documents: Iterable[Any], stream: TextIO) -> None:
+    """Writes documents to stream as ``yaml.dump_all(documents, stream,
+    sort_keys=True)`` would.
+
+    Args:
+        documents: The documents to write.
+        stream: The text stream to write to.
+    """
+    documents = list(documents)
+    if _FastDumper is None or not all(
+            isinstance(document, dict) and document for document in documents):
+        yaml.dump_all(documents, stream, sort_keys=True)
+        return
+
+    # strings emitted by PyYAML, keyed by indentation, so that the commands
+    # that every component shares are only emitted once
+    emitted_items: Dict[Tuple[int, str], str] = {}
+    for index, document in enumerate(documents):
+        if index:
+            stream.write('---\n')
+        for text in _emit_mapping(document, (), emitted_items):
+            stream.write(text)
+
+
+def _emit_mapping(
+    mapping: Dict[Any, Any],
+    path: _Path,
+    emitted_items: Dict[Tuple[int, str], str],
+) -> Iterator[str]:
+    """Yields the YAML of the entries of the mapping at path, in order."""
+    column = 2 * len(path)
+    if _fits(mapping, column):
+        yield _dump_at(path, mapping, _FastDumper)
+        return
+    if not all(isinstance(key, str) for key in mapping):
+        # PyYAML does not sort keys of mixed types
+        yield _dump_at(path, mapping, yaml.Dumper)
+        return
+
+    # consecutive entries that fit are emitted by a single libyaml call
+    fitting = {}
+    for key in sorted(mapping):
+        value = mapping[key]
+        if _fits({key: value}, column):
+            fitting[key] = value
+            continue
+        if fitting:
+            yield _dump_at(path, fitting, _FastDumper)
+            fitting = {}
+
+        if isinstance(value, (dict, list)) and value and _fits_key(key, column):
+            yield _key_line(column, key)
+            if isinstance(value, dict):
+                yield from _emit_mapping(value, path + (key,), emitted_items)
+            else:
+                for item in value:
+                    yield _emit_item(path + (key,), item, emitted_items)
+        else:
+            yield _dump_at(path, {key: value}, yaml.Dumper)
+    if fitting:
+        yield _dump_at(path, fitting, _FastDumper)
+
+
+def _emit_item(
+    path: _Path,
+    item: Any,
+    emitted_items: Dict[Tuple[int, str], str],
+) -> str:
+    """Returns the YAML of an item of the sequence at path."""
+    # the sequence is not indented relative to its key, so items start two
+    # columns to the right of it
+    column = 2 * len(path)
+    memo_key = (column, item) if isinstance(item, str) else None
+    if memo_key in emitted_items:
+        return emitted_items[memo_key]
+    dumper = _FastDumper if _fits(item, column) else yaml.Dumper
+    text = _dump_at(path, [item], dumper)
+    if memo_key is not None:
+        emitted_items[memo_key] = text
+    return text
+
+
+@functools.lru_cache(maxsize=1024)
+def _key_line(column: int, key: str) -> str:
+    """Returns the line that opens the block value of key at column."""
+    text = yaml.dump({key: {'': None}}, Dumper=_FastDumper)
+    return ' ' * column + text[:text.index('\n') + 1]
+
+
+def _dump_at(path: _Path, node: Any, dumper: type) -> str:
+    """Returns the YAML of node as emitted at path in the whole document."""
+    for key in reversed(path):
+        node = {key: node}
+    text = yaml.dump(node, Dumper=dumper, sort_keys=True)
+    start = 0
+    for _ in path:
+        start = text.index('\n', start) + 1
+    return text[start:]
+
+
+def _fits_key(key: Any, column: int) -> bool:
+    """Returns whether both emitters write key at column identically."""
+    # libyaml writes an empty key as '': where PyYAML writes an explicit
+    # ? '' key
+    return isinstance(key, str) and key != '' and _fits(key, column)
+
+
+def _fits(node: Any, column: int) -> bool:
+    """Returns whether both emitters emit node, starting at column, without
+    folding or quoting it differently."""
+    if isinstance(node, str):
+        return (node.isascii() and node.isprintable() and
+                column + len(node) + 2 <= _SAFE_WIDTH)
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if not _fits_key(key, column):
+                return False
+            if isinstance(value, dict):
+                if not _fits(value, column + 2):
+                    return False
+            elif isinstance(value, list):
+                if not _fits(value, column):
+                    return False
+            elif not _fits(value, column + len(key) + 4):
+                return False
+        return True
+    if isinstance(node, list):
+        return all(_fits(item, column + 2) for item in node)
+    return node is None or isinstance(node, (bool, int, float))
@@ -0,0 +1,204 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for yaml_emitter.py."""
+
+import glob
+import io
+import os
+import unittest
+from unittest import mock
+
+from absl.testing import parameterized
+from kfp.compiler import yaml_emitter
+import yaml
+
+_PROJECT_ROOT = os.path.abspath(os.path.join(__file__, *([os.path.pardir] * 5)))
+_GOLDEN_FILES = sorted(
+    glob.glob(
+        os.path.join(_PROJECT_ROOT, 'test_data', 'sdk_compiled_pipelines',
+                     'valid', '**', '*.yaml'),
+        recursive=True))
+
+_LONG_LINE = ' '.join(['word'] * 40)
+_SOURCE = ('\nimport json\n\ndef main(a):\n    print(json.dumps({"a": a}))'
+           '  \n\n\n    return a  # ' + 'x' * 90 + '\n')
+
+
+def dump_all(documents) -> str:
+    stream = io.StringIO()
+    yaml_emitter.dump_all(documents, stream)
+    return stream.getvalue()
+
+
+def pyyaml_dump_all(documents) -> str:
+    stream = io.StringIO()
+    yaml.dump_all(documents, stream, sort_keys=True)
+    return stream.getvalue()
+
+
+class TestDumpAll(parameterized.TestCase):
+
+    @parameterized.named_parameters(
+        ('short_scalars', [{
+            'b': 1,
+            'a': 'x',
+            'c': [True, None, 1.5]
+        }]),
+        ('long_plain_scalar', [{
+            'a': {
+                'b': _LONG_LINE
+            }
+        }]),
+        ('long_quoted_scalar', [{
+            'a': {
+                'b': ['sh', '-c', "'" + _LONG_LINE + "'"]
+            }
+        }]),
+        ('multi_line_source', [{
+            'executors': {
+                'exec-a': {
+                    'container': {
+                        'command': ['sh', '-ec', _SOURCE],
+                        'image': 'python:3.11',
+                    }
+                }
+            }
+        }]),
+        ('shared_commands', [{
+            'executors': {
+                f'exec-{i}': {
+                    'command': [_SOURCE, _LONG_LINE]
+                } for i in range(3)
+            },
+            'other': {
+                'command': [_SOURCE]
+            },
+        }]),
+        ('non_ascii', [{
+            'a': 'café',
+            'b': ['é' * 100]
+        }]),
+        ('control_characters', [{
+            'a': 'tab\there',
+            'b': 'bell\x07'
+        }]),
+        ('long_key', [{
+            'k' * 200: {
+                'a': 1
+            }
+        }]),
+        ('non_string_keys', [{
+            'a': {
+                1: _LONG_LINE,
+                'b': 2
+            }
+        }]),
+        ('empty_collections', [{
+            'a': {},
+            'b': [],
+            'c': {
+                'd': {},
+                'e': _LONG_LINE
+            }
+        }]),
+        ('nested_sequences', [{
+            'a': [[_LONG_LINE, 'x'], {
+                'b': _LONG_LINE,
+                'c': [1, 2]
+            }]
+        }]),
+        ('special_strings', [{
+            'a': ['', 'null', 'true', '1.0', '- x', 'a: b', '#c', "'q'"]
+        }]),
+        ('two_documents', [{
+            'a': _SOURCE
+        }, {
+            'platforms': {
+                'kubernetes': {
+                    'b': 1
+                }
+            }
+        }]),
+        ('empty_keys', [{
+            '': 1.0,
+            'a': {
+                '': 1,
+                'b': 2
+            },
+            'c': [{
+                '': None
+            }],
+            'd': {
+                'e': {
+                    '': 'x'
+                }
+            },
+        }]),
+        ('empty_keys_of_collections', [{
+            '': [1.5, {
+                'a': _LONG_LINE
+            }],
+            'b': {
+                '': {
+                    'c': _LONG_LINE
+                }
+            },
+        }]),
+        ('empty_document', [{}]),
+        ('non_mapping_document', [{
+            'a': 1
+        }, ['b']]),
+    )
+    def test_identical_to_pyyaml(self, documents):
+        self.assertEqual(dump_all(documents), pyyaml_dump_all(documents))
+
+    def test_without_libyaml(self):
+        documents = [{'a': {'b': _SOURCE, 'c': 1}}]
+        with mock.patch.object(yaml_emitter, '_FastDumper', None):
+            self.assertEqual(dump_all(documents), pyyaml_dump_all(documents))
+
+    def test_fitting_entries_use_libyaml(self):
+        documents = [{
+            'a': {
+                'b': 1,
+                'c': 'x'
+            },
+            'd': [_LONG_LINE],
+            'e': 'y',
+        }]
+        with mock.patch.object(
+                yaml_emitter.yaml, 'dump', wraps=yaml.dump) as mock_dump:
+            dump_all(documents)
+        dumpers = [call.kwargs['Dumper'] for call in mock_dump.call_args_list]
+        self.assertEqual(dumpers.count(yaml.Dumper), 1)
+
+    def test_accepts_iterables(self):
+        documents = [{'a': 1}, {'b': 2}]
+        self.assertEqual(dump_all(iter(documents)), pyyaml_dump_all(documents))
+
+
+class TestGoldenPipelines(parameterized.TestCase):
+
+    def test_golden_files_found(self):
+        self.assertNotEmpty(_GOLDEN_FILES)
+
+    @parameterized.parameters(*_GOLDEN_FILES)
+    def test_identical_to_pyyaml(self, path: str):
+        with open(path) as f:
+            documents = list(yaml.safe_load_all(f))
+        self.assertEqual(dump_all(documents), pyyaml_dump_all(documents))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,6 +17,7 @@ compiled YAML."""
 __all__ = [
     'load_component_from_file',
     'load_component_from_url',
+    'load_components_from_urls',
     'load_component_from_text',
     'PythonComponent',
     'BaseComponent',
@@ -27,6 +28,7 @@ __all__ = [
 from kfp.components.load_yaml_utilities import load_component_from_file
 from kfp.components.load_yaml_utilities import load_component_from_text
 from kfp.components.load_yaml_utilities import load_component_from_url
+from kfp.components.load_yaml_utilities import load_components_from_urls
 # keep this for backward compatibility with user code "from kfp.components import placholders" and similar
 from kfp.dsl import base_component  # noqa: keep unused import
 from kfp.dsl import placeholders  # noqa: keep unused import
@@ -0,0 +1,325 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""On-disk cache of component YAML downloaded from URLs.
+
+Entries are keyed by URL and credentials and store the ETag and
+Last-Modified headers of the response, so later loads of the same URL
+with the same credentials send a conditional GET and reuse the cached
+YAML when the server answers 304 Not Modified. Content downloaded with
+one set of credentials is never served to loads with other (or no)
+credentials; credentials are only stored as part of a hashed key. Loads
+that pin the sha256 of the content (for example of a URL that contains a
+commit SHA) are served from the cache without contacting the server, and
+in offline mode every load is served from the cache. All requests of a
+cache go through one pooled ``requests.Session``.
+"""
+
+import concurrent.futures
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import List, Mapping, Optional, Sequence, Tuple
+
+import requests
+from requests import adapters
+
+# environment variable that enables the on-disk tier of the default cache
+CACHE_DIR_ENV_VAR = 'KFP_COMPONENT_CACHE_DIR'
+# environment variable that puts the default cache in offline mode
+OFFLINE_ENV_VAR = 'KFP_COMPONENT_CACHE_OFFLINE'
+
+DEFAULT_MAX_WORKERS = 8
+
+
+def normalize_url(url: str) -> str:
+    """Returns the HTTP(S) URL a component URL is downloaded from."""
+    if url.startswith('gs://'):
+        #Replacing the gs:// URI with https:// URI (works for public objects)
+        url = 'https://storage.googleapis.com/' + url[len('gs://'):]
+    return url
+
+
+def content_sha256(content: bytes) -> str:
+    """Returns the hex sha256 digest that pins the content of a URL."""
+    return hashlib.sha256(content).hexdigest()
+
+
+@dataclasses.dataclass
+class _Entry:
+    content: bytes
+    sha256: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class ComponentCache:
+    """Thread-safe cache of component YAML downloaded from URLs.
+
+    Args:
+        cache_dir: Directory of the on-disk cache. If ``None``, nothing is
+            cached and every load downloads the URL.
+        offline: Serve every load from the cache and never contact the
+            server. Loads of URLs that are not cached raise an error.
+        max_workers: Number of URLs downloaded concurrently by
+            :meth:`fetch_many`, which is also the size of the connection
+            pool.
+        timeout: Timeout in seconds of each request. ``None`` waits
+            indefinitely.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        offline: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: Optional[float] = None,
+    ) -> None:
+        if offline and cache_dir is None:
+            raise ValueError('offline mode requires a cache_dir.')
+        if max_workers < 1:
+            raise ValueError(f'max_workers must be >= 1, got {max_workers!r}.')
+        self.cache_dir = cache_dir
+        self.offline = offline
+        self.max_workers = max_workers
+        self.timeout = timeout
+        # loads served from the cache without a request
+        self.hits = 0
+        # loads served from the cache after a 304 response
+        self.revalidations = 0
+        # loads that downloaded the content
+        self.downloads = 0
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+
+    def fetch(
+        self,
+        url: str,
+        auth: Optional[Tuple[str, str]] = None,
+        sha256: Optional[str] = None,
+    ) -> str:
+        """Returns the text of the component at url.
+
+        Args:
+            url: URL of the component YAML. ``gs://`` URLs are downloaded
+                from the public storage.googleapis.com endpoint.
+            auth: A ``('<username>', '<password>')`` tuple of credentials.
+            sha256: The hex sha256 digest of the content. If given, a
+                cached entry with this digest is returned without a request
+                and downloaded content with a different digest is rejected.
+
+        Returns:
+            The component YAML.
+        """
+        url = normalize_url(url)
+        entry = self._read(url, auth)
+
+        if sha256 is not None:
+            sha256 = sha256.lower()
+            if entry is not None and entry.sha256 == sha256:
+                self._count('hits')
+                return entry.content.decode('utf-8')
+
+        if self.offline:
+            if entry is None:
+                raise ValueError(
+                    f'Component {url!r} is not in the component cache at '
+                    f'{self.cache_dir!r} and the cache is in offline mode.')
+            if sha256 is not None:
+                raise ValueError(
+                    f'Cached component {url!r} has sha256 {entry.sha256}, '
+                    f'expected {sha256}, and the cache is in offline mode.')
+            self._count('hits')
+            return entry.content.decode('utf-8')
+
+        headers = {}
+        if entry is not None and sha256 is None:
+            if entry.etag is not None:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified is not None:
+                headers['If-Modified-Since'] = entry.last_modified
+
+        resp = self._get_session().get(
+            url, auth=auth, headers=headers, timeout=self.timeout)
+        if resp.status_code == 304 and entry is not None:
+            self._count('revalidations')
+            return entry.content.decode('utf-8')
+        resp.raise_for_status()
+
+        entry = _Entry(
+            content=resp.content,
+            sha256=content_sha256(resp.content),
+            etag=resp.headers.get('ETag'),
+            last_modified=resp.headers.get('Last-Modified'),
+        )
+        if sha256 is not None and entry.sha256 != sha256:
+            raise ValueError(f'Component {url!r} has sha256 {entry.sha256}, '
+                             f'expected {sha256}.')
+        self._write(url, auth, entry)
+        self._count('downloads')
+        return entry.content.decode('utf-8')
+
+    def fetch_many(
+        self,
+        urls: Sequence[str],
+        auth: Optional[Tuple[str, str]] = None,
+        sha256: Optional[Mapping[str, str]] = None,
+    ) -> List[str]:
+        """Returns the text of the components at urls, fetched concurrently.
+
+        Args:
+            urls: URLs of the component YAMLs.
+            auth: A ``('<username>', '<password>')`` tuple of credentials
+                used for every URL.
+            sha256: Maps URLs to the hex sha256 digest of their content. See
+                :meth:`fetch`.
+
+        Returns:
+            The component YAMLs, in the order of urls.
+        """
+        sha256 = sha256 or {}
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self.fetch, url, auth, sha256.get(url))
+                for url in urls
+            ]
+            return [future.result() for future in futures]
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _get_session(self) -> requests.Session:
+        with self._lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = adapters.HTTPAdapter(
+                    pool_connections=self.max_workers,
+                    pool_maxsize=self.max_workers)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._session = session
+            return self._session
+
+    def _paths(
+        self,
+        url: str,
+        auth: Optional[Tuple[str, str]],
+    ) -> Tuple[str, str]:
+        key = hashlib.sha256(json.dumps([url, auth]).encode()).hexdigest()
+        return (os.path.join(self.cache_dir, f'{key}.yaml'),
+                os.path.join(self.cache_dir, f'{key}.json'))
+
+    def _read(
+        self,
+        url: str,
+        auth: Optional[Tuple[str, str]],
+    ) -> Optional[_Entry]:
+        if self.cache_dir is None:
+            return None
+        content_path, metadata_path = self._paths(url, auth)
+        try:
+            with open(metadata_path) as f:
+                metadata = json.load(f)
+            with open(content_path, 'rb') as f:
+                content = f.read()
+        except (OSError, ValueError):
+            return None
+        # the content and metadata are replaced separately, so a concurrent
+        # write can pair the metadata of one response with the content of
+        # another; such entries are treated as missing
+        if metadata.get('url') != url or metadata.get(
+                'sha256') != content_sha256(content):
+            return None
+        return _Entry(
+            content=content,
+            sha256=metadata['sha256'],
+            etag=metadata.get('etag'),
+            last_modified=metadata.get('last_modified'),
+        )
+
+    def _write(
+        self,
+        url: str,
+        auth: Optional[Tuple[str, str]],
+        entry: _Entry,
+    ) -> None:
+        if self.cache_dir is None:
+            return
+        content_path, metadata_path = self._paths(url, auth)
+        metadata = {
+            'url': url,
+            'sha256': entry.sha256,
+            'etag': entry.etag,
+            'last_modified': entry.last_modified,
+        }
+        # the on-disk cache is best effort: a read-only or full cache_dir
+        # must not fail the load of a downloaded component
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            _write_atomically(content_path, entry.content)
+            _write_atomically(metadata_path, json.dumps(metadata).encode())
+        except OSError as e:
+            logging.warning(f'Could not write to the component cache at '
+                            f'{self.cache_dir!r}, skipping it: {e}')
+
+
+def _write_atomically(path: str, data: bytes) -> None:
+    # write to a temporary file and rename it so that concurrent loads
+    # never read a partially written file
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+_default_cache: Optional[ComponentCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> ComponentCache:
+    """Returns the cache used by load_component_from_url.
+
+    The on-disk cache is enabled by setting the ``KFP_COMPONENT_CACHE_DIR``
+    environment variable, and offline mode by also setting
+    ``KFP_COMPONENT_CACHE_OFFLINE=true``, before the first load.
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ComponentCache(
+                cache_dir=os.environ.get(CACHE_DIR_ENV_VAR) or None,
+                offline=os.environ.get(OFFLINE_ENV_VAR,
+                                       'false').lower() == 'true')
+        return _default_cache
+
+
+def set_default_cache(cache: Optional[ComponentCache]) -> None:
+    """Replaces the cache used by load_component_from_url.
+
+    Args:
+        cache: The new cache. ``None`` recreates the default cache from the
+            environment on the next load.
+    """
+    global _default_cache
+    with _default_cache_lock:
+        _default_cache = cache
@@ -0,0 +1,207 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for kfp.components.component_cache."""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from kfp.components import component_cache
+from kfp.components import testing_utilities
+import requests
+
+
+class ComponentCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.server = testing_utilities.ComponentServer().__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+        self.server.components['/a.yaml'] = b'name: a\n'
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.cache_dir = tmpdir.name
+        self.cache = component_cache.ComponentCache(cache_dir=self.cache_dir)
+
+    def test_revalidates_with_etag(self):
+        url = self.server.url('/a.yaml')
+        self.assertEqual(self.cache.fetch(url), 'name: a\n')
+        self.assertEqual(self.cache.fetch(url), 'name: a\n')
+
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertNotIn('If-None-Match', self.server.requests[0])
+        self.assertIn('If-None-Match', self.server.requests[1])
+        self.assertEqual(self.cache.downloads, 1)
+        self.assertEqual(self.cache.revalidations, 1)
+
+    def test_revalidates_with_last_modified(self):
+        self.server.use_etag = False
+        url = self.server.url('/a.yaml')
+        self.cache.fetch(url)
+        self.cache.fetch(url)
+
+        self.assertEqual(self.server.requests[1]['If-Modified-Since'],
+                         testing_utilities.LAST_MODIFIED)
+        self.assertEqual(self.cache.revalidations, 1)
+
+    def test_downloads_changed_content(self):
+        url = self.server.url('/a.yaml')
+        self.cache.fetch(url)
+        self.server.components['/a.yaml'] = b'name: b\n'
+        self.assertEqual(self.cache.fetch(url), 'name: b\n')
+        self.assertEqual(self.cache.downloads, 2)
+
+    def test_shared_across_instances(self):
+        url = self.server.url('/a.yaml')
+        self.cache.fetch(url)
+        other = component_cache.ComponentCache(cache_dir=self.cache_dir)
+        self.assertEqual(other.fetch(url), 'name: a\n')
+        self.assertEqual(other.revalidations, 1)
+
+    def test_entries_are_keyed_by_credentials(self):
+        url = self.server.url('/a.yaml')
+        self.cache.fetch(url)
+        self.cache.fetch(url, auth=('user', 'password'))
+        self.cache.fetch(url, auth=('user', 'password'))
+
+        self.assertEqual(self.cache.downloads, 2)
+        self.assertEqual(self.cache.revalidations, 1)
+        self.assertNotIn('If-None-Match', self.server.requests[1])
+        self.assertIn('Authorization', self.server.requests[1])
+        self.assertIn('If-None-Match', self.server.requests[2])
+        self.assertEqual(len(os.listdir(self.cache_dir)), 4)
+        for name in os.listdir(self.cache_dir):
+            with open(os.path.join(self.cache_dir, name), 'rb') as f:
+                self.assertNotIn(b'password', f.read())
+
+    def test_write_failure_returns_downloaded_content(self):
+        # a file where the cache directory should be
+        cache_dir = os.path.join(self.cache_dir, 'cache')
+        open(cache_dir, 'w').close()
+        cache = component_cache.ComponentCache(cache_dir=cache_dir)
+        with self.assertLogs(level='WARNING') as logs:
+            content = cache.fetch(self.server.url('/a.yaml'))
+        self.assertEqual(content, 'name: a\n')
+        self.assertIn('Could not write to the component cache', logs.output[0])
+
+    def test_without_cache_dir(self):
+        cache = component_cache.ComponentCache()
+        url = self.server.url('/a.yaml')
+        cache.fetch(url)
+        cache.fetch(url)
+        self.assertEqual(cache.downloads, 2)
+        self.assertNotIn('If-None-Match', self.server.requests[1])
+
+    def test_pinned_sha256_skips_request(self):
+        url = self.server.url('/a.yaml')
+        sha256 = component_cache.content_sha256(b'name: a\n')
+        self.cache.fetch(url, sha256=sha256)
+        self.assertEqual(self.cache.fetch(url, sha256=sha256), 'name: a\n')
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_pinned_sha256_mismatch(self):
+        url = self.server.url('/a.yaml')
+        with self.assertRaisesRegex(ValueError, r'expected 0+\.'):
+            self.cache.fetch(url, sha256='0' * 64)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_pinned_sha256_refetches_changed_entry(self):
+        url = self.server.url('/a.yaml')
+        self.cache.fetch(url)
+        self.server.components['/a.yaml'] = b'name: b\n'
+        sha256 = component_cache.content_sha256(b'name: b\n')
+        self.assertEqual(self.cache.fetch(url, sha256=sha256), 'name: b\n')
+        self.assertNotIn('If-None-Match', self.server.requests[1])
+
+    def test_offline(self):
+        url = self.server.url('/a.yaml')
+        self.cache.fetch(url)
+        offline = component_cache.ComponentCache(
+            cache_dir=self.cache_dir, offline=True)
+        self.assertEqual(offline.fetch(url), 'name: a\n')
+        self.assertEqual(len(self.server.requests), 1)
+
+        with self.assertRaisesRegex(ValueError, r'offline mode'):
+            offline.fetch(self.server.url('/b.yaml'))
+        with self.assertRaisesRegex(ValueError, r'offline mode'):
+            offline.fetch(url, sha256='0' * 64)
+
+    def test_offline_requires_cache_dir(self):
+        with self.assertRaisesRegex(ValueError, r'requires a cache_dir'):
+            component_cache.ComponentCache(offline=True)
+
+    def test_http_error(self):
+        with self.assertRaises(requests.HTTPError):
+            self.cache.fetch(self.server.url('/missing.yaml'))
+
+    def test_corrupt_entry_is_refetched(self):
+        url = self.server.url('/a.yaml')
+        self.cache.fetch(url)
+        content_path, _ = self.cache._paths(url, None)
+        with open(content_path, 'wb') as f:
+            f.write(b'name: corrupt\n')
+        self.assertEqual(self.cache.fetch(url), 'name: a\n')
+        self.assertEqual(self.cache.downloads, 2)
+
+    def test_fetch_many(self):
+        for i in range(20):
+            self.server.components[f'/{i}.yaml'] = f'name: c{i}\n'.encode()
+        urls = [self.server.url(f'/{i}.yaml') for i in range(20)]
+        cache = component_cache.ComponentCache(
+            cache_dir=self.cache_dir, max_workers=4)
+        self.assertEqual(
+            cache.fetch_many(urls), [f'name: c{i}\n' for i in range(20)])
+        self.assertEqual(cache.downloads, 20)
+
+        cache.fetch_many(
+            urls[:2],
+            sha256={urls[0]: component_cache.content_sha256(b'name: c0\n')})
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.revalidations, 1)
+
+    def test_gs_url(self):
+        self.assertEqual(
+            component_cache.normalize_url('gs://bucket/path/component.yaml'),
+            'https://storage.googleapis.com/bucket/path/component.yaml')
+
+
+class DefaultCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        component_cache.set_default_cache(None)
+        self.addCleanup(component_cache.set_default_cache, None)
+
+    def test_from_environment(self):
+        with mock.patch.dict(
+                os.environ, {
+                    component_cache.CACHE_DIR_ENV_VAR: '/tmp/components',
+                    component_cache.OFFLINE_ENV_VAR: 'true',
+                }):
+            cache = component_cache.get_default_cache()
+        self.assertEqual(cache.cache_dir, '/tmp/components')
+        self.assertTrue(cache.offline)
+        self.assertIs(component_cache.get_default_cache(), cache)
+
+    def test_disabled_by_default(self):
+        with mock.patch.dict(os.environ, clear=True):
+            cache = component_cache.get_default_cache()
+        self.assertIsNone(cache.cache_dir)
+        self.assertFalse(cache.offline)
+
+
+if __name__ == '__main__':
+    unittest.main()
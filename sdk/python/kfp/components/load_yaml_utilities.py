@@ -13,11 +13,11 @@
 # limitations under the License.
 """Functions for loading components from compiled YAML."""
 
-from typing import Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
+from kfp.components import component_cache
 from kfp.dsl import structures
 from kfp.dsl import yaml_component
-import requests
 
 
 def load_component_from_text(text: str) -> yaml_component.YamlComponent:
@@ -56,12 +56,20 @@ def load_component_from_file(file_path: str) -> yaml_component.YamlComponent:
 
 def load_component_from_url(
         url: str,
-        auth: Optional[Tuple[str, str]] = None) -> yaml_component.YamlComponent:
+        auth: Optional[Tuple[str, str]] = None,
+        sha256: Optional[str] = None) -> yaml_component.YamlComponent:
     """Loads a component from a URL.
 
+    If the ``KFP_COMPONENT_CACHE_DIR`` environment variable is set, the
+    component is cached in that directory and later loads only download it
+    again if the server reports that it changed. Setting
+    ``KFP_COMPONENT_CACHE_OFFLINE=true`` loads components from the cache
+    without contacting the server.
+
     Args:
         url (str): URL to a YAML component.
         auth (Tuple[str, str], optional): A ``('<username>', '<password>')`` tuple of authentication credentials necessary for URL access. See `Requests Authorization <https://requests.readthedocs.io/en/latest/user/authentication/#authentication>`_ for more information.
+        sha256 (str, optional): The hex sha256 digest of the component YAML. If the component is cached with this digest, it is loaded without contacting the server, and downloaded content with a different digest raises an error. Useful for immutable URLs, such as URLs that contain a commit SHA.
 
     Returns:
         Component loaded from YAML.
@@ -78,11 +86,30 @@ def load_component_from_url(
     if url is None:
         raise ValueError('url must be a string.')
 
-    if url.startswith('gs://'):
-        #Replacing the gs:// URI with https:// URI (works for public objects)
-        url = 'https://storage.googleapis.com/' + url[len('gs://'):]
+    return load_component_from_text(component_cache.get_default_cache().fetch(
+        url, auth=auth, sha256=sha256))
+
+
+def load_components_from_urls(
+    urls: Sequence[str],
+    auth: Optional[Tuple[str, str]] = None,
+) -> List[yaml_component.YamlComponent]:
+    """Loads components from URLs, downloading them concurrently.
 
-    resp = requests.get(url, auth=auth)
-    resp.raise_for_status()
+    Components are cached as described in :func:`load_component_from_url`.
+
+    Args:
+        urls (Sequence[str]): URLs to YAML components.
+        auth (Tuple[str, str], optional): A ``('<username>', '<password>')`` tuple of authentication credentials used for every URL.
+
+    Returns:
+        Components loaded from YAML, in the order of ``urls``.
+    """
+    if any(url is None for url in urls):
+        raise ValueError('url must be a string.')
 
-    return load_component_from_text(resp.content.decode('utf-8'))
+    return [
+        load_component_from_text(text)
+        for text in component_cache.get_default_cache().fetch_many(
+            urls, auth=auth)
+    ]
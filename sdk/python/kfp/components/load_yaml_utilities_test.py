@@ -19,6 +19,8 @@ import textwrap
 import unittest
 
 from kfp import components
+from kfp.components import component_cache
+from kfp.components import testing_utilities
 from kfp.dsl import structures
 
 SAMPLE_YAML = textwrap.dedent("""\
@@ -124,6 +126,33 @@ class LoadYamlTests(unittest.TestCase):
         #     component.component_spec.implementation.container.image,
         #     'python:3.11')
 
+    def test_load_components_from_urls(self):
+        component_cache.set_default_cache(None)
+        self.addCleanup(component_cache.set_default_cache, None)
+        with testing_utilities.ComponentServer() as server:
+            server.components['/a.yaml'] = SAMPLE_YAML.encode()
+            server.components['/b.yaml'] = SAMPLE_YAML.replace(
+                'component-1', 'component-2').encode()
+            loaded = components.load_components_from_urls(
+                [server.url('/a.yaml'),
+                 server.url('/b.yaml')])
+            pinned = components.load_component_from_url(
+                server.url('/a.yaml'),
+                sha256=component_cache.content_sha256(SAMPLE_YAML.encode()))
+
+        self.assertEqual([component.name for component in loaded],
+                         ['component-1', 'component-2'])
+        self.assertEqual(pinned.name, 'component-1')
+
+    def test_load_component_from_url_sha256_mismatch(self):
+        component_cache.set_default_cache(None)
+        self.addCleanup(component_cache.set_default_cache, None)
+        with testing_utilities.ComponentServer() as server:
+            server.components['/a.yaml'] = SAMPLE_YAML.encode()
+            with self.assertRaisesRegex(ValueError, r'has sha256'):
+                components.load_component_from_url(
+                    server.url('/a.yaml'), sha256='0' * 64)
+
 
 if __name__ == '__main__':
     unittest.main()
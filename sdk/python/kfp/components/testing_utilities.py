@@ -0,0 +1,83 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Utilities for testing kfp.components."""
+
+import http.server
+import threading
+from typing import Dict, List
+
+from kfp.components import component_cache
+
+LAST_MODIFIED = 'Wed, 21 Oct 2015 07:28:00 GMT'
+
+
+class ComponentServer:
+    """Serves components from a dict on localhost and records requests.
+
+    Responses carry an ETag and a Last-Modified header, and conditional
+    requests whose ETag matches get a 304.
+    """
+
+    def __init__(self) -> None:
+        self.components: Dict[str, bytes] = {}
+        self.requests: List[Dict[str, str]] = []
+        self.use_etag = True
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                server.requests.append({'path': self.path, **self.headers})
+                content = server.components.get(self.path)
+                if content is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                etag = f'"{component_cache.content_sha256(content)}"'
+                if server.use_etag and self.headers.get(
+                        'If-None-Match') == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                if not server.use_etag and self.headers.get(
+                        'If-Modified-Since') == LAST_MODIFIED:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                if server.use_etag:
+                    self.send_header('ETag', etag)
+                self.send_header('Last-Modified', LAST_MODIFIED)
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = http.server.ThreadingHTTPServer(('127.0.0.1', 0),
+                                                       Handler)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True)
+
+    def url(self, path: str) -> str:
+        return f'http://127.0.0.1:{self._server.server_port}{path}'
+
+    def __enter__(self) -> 'ComponentServer':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._server.shutdown()
+        self._server.server_close()
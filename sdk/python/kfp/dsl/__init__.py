@@ -45,7 +45,9 @@ __all__ = [
     'run_notebook',
 ]
 import os
+from typing import Dict, TYPE_CHECKING
 
+from kfp import lazy_import
 from kfp.dsl.notebook_helpers import run_notebook
 from kfp.dsl.task_config import TaskConfig
 from kfp.dsl.task_final_status import PipelineTaskFinalStatus
@@ -287,13 +289,49 @@ Example:
         artifact_consumer(model=producer_task.output)
 """
 
-# compile-time only dependencies
+# compile-time only dependencies, imported on first use (PEP 562) so
+# that `import kfp.dsl` stays cheap
+_LAZY_ATTRIBUTES: Dict[str, str] = {}
 if os.environ.get('_KFP_RUNTIME', 'false') != 'true':
+    _LAZY_ATTRIBUTES.update({
+        'component': 'kfp.dsl.component_decorator',
+        'TaskConfigField': 'kfp.dsl.component_task_config',
+        'TaskConfigPassthrough': 'kfp.dsl.component_task_config',
+        'container_component': 'kfp.dsl.container_component_decorator',
+        # TODO: Collected should be moved to pipeline_channel.py, consistent with OneOf
+        'Collected': 'kfp.dsl.for_loop',
+        'importer': 'kfp.dsl.importer_node',
+        'notebook_component': 'kfp.dsl.notebook_component_decorator',
+        'OneOf': 'kfp.dsl.pipeline_channel',
+        'KubernetesWorkspaceConfig': 'kfp.dsl.pipeline_config',
+        'PipelineConfig': 'kfp.dsl.pipeline_config',
+        'WorkspaceConfig': 'kfp.dsl.pipeline_config',
+        'pipeline': 'kfp.dsl.pipeline_context',
+        'PipelineTask': 'kfp.dsl.pipeline_task',
+        'ConcatPlaceholder': 'kfp.dsl.placeholders',
+        'IfPresentPlaceholder': 'kfp.dsl.placeholders',
+        'ContainerSpec': 'kfp.dsl.structures',
+        'Condition': 'kfp.dsl.tasks_group',
+        'Elif': 'kfp.dsl.tasks_group',
+        'Else': 'kfp.dsl.tasks_group',
+        'ExitHandler': 'kfp.dsl.tasks_group',
+        'If': 'kfp.dsl.tasks_group',
+        'ParallelFor': 'kfp.dsl.tasks_group',
+    })
+    __all__.extend([
+        'component', 'container_component', 'pipeline', 'importer',
+        'ContainerSpec', 'Condition', 'If', 'Elif', 'Else', 'OneOf',
+        'ExitHandler', 'ParallelFor', 'Collected', 'IfPresentPlaceholder',
+        'ConcatPlaceholder', 'PipelineTask', 'PipelineConfig',
+        'WorkspaceConfig', 'KubernetesWorkspaceConfig', 'TaskConfigField',
+        'TaskConfigPassthrough', 'notebook_component'
+    ])
+
+if TYPE_CHECKING:
     from kfp.dsl.component_decorator import component
     from kfp.dsl.component_task_config import TaskConfigField
     from kfp.dsl.component_task_config import TaskConfigPassthrough
     from kfp.dsl.container_component_decorator import container_component
-    # TODO: Collected should be moved to pipeline_channel.py, consistent with OneOf
     from kfp.dsl.for_loop import Collected
     from kfp.dsl.importer_node import importer
     from kfp.dsl.notebook_component_decorator import notebook_component
@@ -312,11 +350,5 @@ if os.environ.get('_KFP_RUNTIME', 'false') != 'true':
     from kfp.dsl.tasks_group import ExitHandler
     from kfp.dsl.tasks_group import If
     from kfp.dsl.tasks_group import ParallelFor
-    __all__.extend([
-        'component', 'container_component', 'pipeline', 'importer',
-        'ContainerSpec', 'Condition', 'If', 'Elif', 'Else', 'OneOf',
-        'ExitHandler', 'ParallelFor', 'Collected', 'IfPresentPlaceholder',
-        'ConcatPlaceholder', 'PipelineTask', 'PipelineConfig',
-        'WorkspaceConfig', 'KubernetesWorkspaceConfig', 'TaskConfigField',
-        'TaskConfigPassthrough', 'notebook_component'
-    ])
+
+__getattr__, __dir__ = lazy_import.lazy_attributes(globals(), _LAZY_ATTRIBUTES)
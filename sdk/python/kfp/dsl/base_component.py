@@ -14,7 +14,7 @@
 """Base class for KFP components."""
 
 import abc
-from typing import List
+from typing import List, Optional
 
 from kfp.dsl import pipeline_context
 from kfp.dsl import pipeline_task
@@ -107,11 +107,31 @@ class BaseComponent(abc.ABC):
             .get_execution_caching_default(),
         )
 
+    @property
+    def component_spec(self) -> structures.ComponentSpec:
+        return self._component_spec
+
+    @component_spec.setter
+    def component_spec(self, component_spec: structures.ComponentSpec) -> None:
+        self._component_spec = component_spec
+        # the pipeline spec last built from the component spec
+        self._pipeline_spec_cache: Optional[
+            pipeline_spec_pb2.PipelineSpec] = None
+
     @property
     def pipeline_spec(self) -> pipeline_spec_pb2.PipelineSpec:
-        """Returns the pipeline spec of the component."""
-        with BlockPipelineTaskRegistration():
-            return self.component_spec.to_pipeline_spec()
+        """Returns the pipeline spec of the component.
+
+        The spec is built once and rebuilt after component_spec or
+        platform_spec is set. Changes made to the component spec in
+        place are not picked up until then. Each access returns a new
+        copy that the caller is free to modify.
+        """
+        if self._pipeline_spec_cache is None:
+            with BlockPipelineTaskRegistration():
+                self._pipeline_spec_cache = (
+                    self.component_spec.to_pipeline_spec())
+        return _copy_pipeline_spec(self._pipeline_spec_cache)
 
     @property
     def platform_spec(self) -> pipeline_spec_pb2.PlatformSpec:
@@ -122,6 +142,12 @@ class BaseComponent(abc.ABC):
         """
         return self.component_spec.platform_spec
 
+    @platform_spec.setter
+    def platform_spec(self,
+                      platform_spec: pipeline_spec_pb2.PlatformSpec) -> None:
+        self.component_spec.platform_spec = platform_spec
+        self._pipeline_spec_cache = None
+
     @abc.abstractmethod
     def execute(self, **kwargs):
         """Executes the component locally if implemented by the inheriting
@@ -136,6 +162,14 @@ class BaseComponent(abc.ABC):
         ]
 
 
+def _copy_pipeline_spec(
+    pipeline_spec: pipeline_spec_pb2.PipelineSpec
+) -> pipeline_spec_pb2.PipelineSpec:
+    pipeline_spec_copy = pipeline_spec_pb2.PipelineSpec()
+    pipeline_spec_copy.CopyFrom(pipeline_spec)
+    return pipeline_spec_copy
+
+
 class BlockPipelineTaskRegistration:
     """Temporarily stop registering tasks to the default pipeline.
 
@@ -13,12 +13,15 @@
 # limitations under the License.
 """Tests for kfp.dsl.base_component."""
 
+import copy
 import unittest
+from unittest import mock
 
 from kfp import dsl
 from kfp.dsl import placeholders
 from kfp.dsl import python_component
 from kfp.dsl import structures
+from kfp.pipeline_spec import pipeline_spec_pb2
 
 component_op = python_component.PythonComponent(
     # dummy python_func not used in behavior that is being tested
@@ -85,6 +88,56 @@ class BaseComponentTest(unittest.TestCase):
             component_op()
 
 
+class PipelineSpecTest(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        @dsl.container_component
+        def component_1(input1: str, output1: dsl.OutputPath(str)):
+            return dsl.ContainerSpec(
+                image='alpine', command=['echo', input1, output1])
+
+        self.component = component_1
+
+    def test_built_once(self):
+        component_spec = self.component.component_spec
+        with mock.patch.object(
+                component_spec,
+                'to_pipeline_spec',
+                wraps=component_spec.to_pipeline_spec) as mock_to_pipeline_spec:
+            first = self.component.pipeline_spec
+            second = self.component.pipeline_spec
+        mock_to_pipeline_spec.assert_called_once()
+        self.assertEqual(first, second)
+
+    def test_returns_copies(self):
+        first = self.component.pipeline_spec
+        first.pipeline_info.name = 'changed'
+        second = self.component.pipeline_spec
+        self.assertIsNot(first, second)
+        self.assertEqual(second.pipeline_info.name, 'component-1')
+
+    def test_rebuilt_when_platform_spec_is_set(self):
+        component_spec = self.component.component_spec
+        self.component.pipeline_spec
+        with mock.patch.object(
+                component_spec,
+                'to_pipeline_spec',
+                wraps=component_spec.to_pipeline_spec) as mock_to_pipeline_spec:
+            self.component.platform_spec = pipeline_spec_pb2.PlatformSpec()
+            self.component.pipeline_spec
+        mock_to_pipeline_spec.assert_called_once()
+
+    def test_rebuilt_when_component_spec_is_replaced(self):
+        self.component.pipeline_spec
+        component_spec = copy.deepcopy(self.component.component_spec)
+        component_spec.name = 'component-2'
+        self.component.component_spec = component_spec
+        self.assertEqual(self.component.pipeline_spec.pipeline_info.name,
+                         'component-2')
+
+
 class BlockPipelineTaskRegistration(unittest.TestCase):
 
     def test_mutating_decorator(self):
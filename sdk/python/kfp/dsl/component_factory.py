@@ -900,7 +900,7 @@ def create_graph_component_from_func(
     description: Optional[str] = None,
     display_name: Optional[str] = None,
     pipeline_config: pipeline_config.PipelineConfig = None,
-) -> graph_component.GraphComponent:
+) -> 'graph_component.GraphComponent':
     """Implementation for the @pipeline decorator.
 
     The decorator is defined under pipeline_context.py. See the
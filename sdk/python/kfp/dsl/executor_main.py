@@ -50,6 +50,13 @@ def executor_main():
         help='JSON-serialized ExecutorInput from the orchestrator. '
         'This should contain inputs and placeholders for outputs.')
 
+    parser.add_argument(
+        '--executor_input_file',
+        type=str,
+        help='Path to a file containing the JSON-serialized ExecutorInput. '
+        'Used instead of --executor_input for inputs too large to pass on '
+        'the command line.')
+
     args, _ = parser.parse_known_args()
 
     func_name = args.function_to_execute
@@ -90,7 +97,14 @@ def executor_main():
     module = utils.load_module(
         module_name=module_name, module_directory=module_directory)
 
-    executor_input = json.loads(args.executor_input)
+    if args.executor_input_file is not None:
+        with open(args.executor_input_file) as f:
+            executor_input = json.load(f)
+    elif args.executor_input is not None:
+        executor_input = json.loads(args.executor_input)
+    else:
+        raise RuntimeError(
+            'One of --executor_input or --executor_input_file is required.')
     function_to_execute = getattr(module, func_name)
 
     logging.info(f'Got executor_input:\n{json.dumps(executor_input, indent=4)}')
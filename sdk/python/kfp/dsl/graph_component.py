@@ -90,7 +90,8 @@ class GraphComponent(base_component.BaseComponent):
             pipeline_spec.pipeline_info.description = component_spec.description
 
         self.component_spec.implementation.graph = pipeline_spec
-        self.component_spec.platform_spec = platform_spec
+        # also drops any pipeline spec built from the incomplete spec
+        self.platform_spec = platform_spec
 
     def _detect_workspace_usage_in_tasks(
             self, tasks: List[pipeline_task.PipelineTask]) -> bool:
@@ -17,7 +17,6 @@ import functools
 import os
 from typing import Callable, Optional
 
-from kfp.dsl import component_factory
 from kfp.dsl import pipeline_config
 from kfp.dsl import pipeline_task
 from kfp.dsl import tasks_group
@@ -68,6 +67,9 @@ def pipeline(
     if pipeline_root:
         func.pipeline_root = pipeline_root
 
+    # imported here to avoid a circular import: component_factory imports
+    # the component classes, which import this module
+    from kfp.dsl import component_factory
     return component_factory.create_graph_component_from_func(
         func,
         name=name,
@@ -183,10 +185,10 @@ class Pipeline:
         task_name = utils.maybe_rename_for_k8s(task.component_spec.name)
         #If there is an existing task with this name then generate a new name.
         task_name = utils.make_name_unique_by_adding_index(
-            task_name, list(self.tasks.keys()), '-')
+            task_name, self.tasks, '-')
         if task_name == '':
             task_name = utils.make_name_unique_by_adding_index(
-                'task', list(self.tasks.keys()), '-')
+                'task', self.tasks, '-')
 
         self.tasks[task_name] = task
         if add_to_group:
@@ -18,7 +18,7 @@ import os
 import re
 import sys
 import types
-from typing import List
+from typing import Container
 
 COMPONENT_NAME_PREFIX = 'comp-'
 _EXECUTOR_LABEL_PREFIX = 'exec-'
@@ -84,7 +84,7 @@ def sanitize_executor_label(label: str) -> str:
 
 def make_name_unique_by_adding_index(
     name: str,
-    collection: List[str],
+    collection: Container[str],
     delimiter: str,
 ) -> str:
     """Makes a unique name by adding index.
@@ -93,7 +93,8 @@ def make_name_unique_by_adding_index(
 
     Args:
         name: The original name.
-        collection: The collection of existing names.
+        collection: The collection of existing names. Prefer a set or a
+            mapping, which are searched in constant time.
         delimiter: The delimiter to connect the original name and an index.
 
     Returns:
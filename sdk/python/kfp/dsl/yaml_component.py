@@ -13,6 +13,8 @@
 # limitations under the License.
 """Component loaded from YAML."""
 
+from typing import Optional, Tuple
+
 from google.protobuf import json_format
 from kfp.dsl import base_component
 from kfp.dsl import structures
@@ -36,18 +38,31 @@ class YamlComponent(base_component.BaseComponent):
     ):
         super().__init__(component_spec=component_spec)
         self.component_yaml = component_yaml
+        # the pipeline spec parsed from the component yaml, keyed by the yaml;
+        # None in place of the spec for v1 components, which are built from
+        # the component spec instead
+        self._yaml_pipeline_spec_cache: Optional[Tuple[
+            str, Optional[pipeline_spec_pb2.PipelineSpec]]] = None
 
     @property
     def pipeline_spec(self) -> pipeline_spec_pb2.PipelineSpec:
-        """Returns the pipeline spec of the component."""
-        component_dict = structures.load_documents_from_yaml(
-            self.component_yaml)[0]
-        is_v1 = 'implementation' in set(component_dict.keys())
-        if is_v1:
-            return self.component_spec.to_pipeline_spec()
-        else:
-            return json_format.ParseDict(component_dict,
-                                         pipeline_spec_pb2.PipelineSpec())
+        """Returns the pipeline spec of the component.
+
+        The component yaml is only parsed again when it changes. Each
+        access returns a new copy that the caller is free to modify.
+        """
+        cache = self._yaml_pipeline_spec_cache
+        if cache is None or cache[0] != self.component_yaml:
+            component_dict = structures.load_documents_from_yaml(
+                self.component_yaml)[0]
+            is_v1 = 'implementation' in set(component_dict.keys())
+            pipeline_spec = None if is_v1 else json_format.ParseDict(
+                component_dict, pipeline_spec_pb2.PipelineSpec())
+            cache = self._yaml_pipeline_spec_cache = (self.component_yaml,
+                                                      pipeline_spec)
+        if cache[1] is None:
+            return super().pipeline_spec
+        return base_component._copy_pipeline_spec(cache[1])
 
     def execute(self, *args, **kwargs):
         """Not implemented."""
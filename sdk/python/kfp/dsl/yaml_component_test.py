@@ -0,0 +1,98 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for kfp.dsl.yaml_component."""
+
+import copy
+import os
+import tempfile
+import textwrap
+import unittest
+from unittest import mock
+
+from kfp import compiler
+from kfp import components
+from kfp import dsl
+from kfp.dsl import structures
+
+V1_COMPONENT_YAML = textwrap.dedent("""\
+    name: Print message
+    inputs:
+    - {name: message, type: String}
+    implementation:
+      container:
+        image: alpine
+        command: [echo, {inputValue: message}]
+    """)
+
+
+@dsl.container_component
+def print_message(message: str):
+    return dsl.ContainerSpec(image='alpine', command=['echo', message])
+
+
+def compile_to_yaml(component: dsl.base_component.BaseComponent) -> str:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        package_path = os.path.join(tmpdir, 'component.yaml')
+        compiler.Compiler().compile(component, package_path)
+        with open(package_path) as f:
+            return f.read()
+
+
+class PipelineSpecTest(unittest.TestCase):
+
+    def test_yaml_is_parsed_once(self):
+        component = components.load_component_from_text(
+            compile_to_yaml(print_message))
+        with mock.patch.object(
+                structures,
+                'load_documents_from_yaml',
+                wraps=structures.load_documents_from_yaml) as mock_load:
+            first = component.pipeline_spec
+            second = component.pipeline_spec
+        mock_load.assert_called_once()
+        self.assertEqual(first, second)
+        self.assertEqual(first, print_message.pipeline_spec)
+
+    def test_returns_copies(self):
+        component = components.load_component_from_text(
+            compile_to_yaml(print_message))
+        component.pipeline_spec.pipeline_info.name = 'changed'
+        self.assertEqual(component.pipeline_spec.pipeline_info.name,
+                         'print-message')
+
+    def test_reparsed_when_yaml_changes(self):
+        component = components.load_component_from_text(
+            compile_to_yaml(print_message))
+        component.pipeline_spec
+        component.component_yaml = component.component_yaml.replace(
+            'image: alpine', 'image: busybox')
+        self.assertEqual(
+            component.pipeline_spec.deployment_spec['executors']
+            ['exec-print-message']['container']['image'], 'busybox')
+
+    def test_v1_yaml_is_built_from_component_spec(self):
+        component = components.load_component_from_text(V1_COMPONENT_YAML)
+        self.assertEqual(component.pipeline_spec,
+                         component.component_spec.to_pipeline_spec())
+
+        component_spec = copy.deepcopy(component.component_spec)
+        component_spec.implementation.container.image = 'busybox'
+        component.component_spec = component_spec
+        self.assertEqual(
+            component.pipeline_spec.deployment_spec['executors']
+            ['exec-print-message']['container']['image'], 'busybox')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,10 +13,37 @@
 # limitations under the License.
 
 import importlib
+import os
+import re
+import subprocess
 import sys
 import unittest
 from unittest import mock
 
+import kfp
+
+# cold `import kfp.dsl` takes around a tenth of a second with its
+# compile-time dependencies imported lazily, and seconds when they are not.
+# The budget is loose so that loaded machines do not fail the test.
+_IMPORT_TIME_BUDGET_SECONDS = 1.0
+
+
+def _run_python(code: str, *args: str) -> subprocess.CompletedProcess:
+    """Runs code in a fresh interpreter that imports this checkout's kfp."""
+    env = {
+        name: value
+        for name, value in os.environ.items()
+        if name != '_KFP_RUNTIME'
+    }
+    sdk_dir = os.path.dirname(os.path.dirname(os.path.abspath(kfp.__file__)))
+    env['PYTHONPATH'] = os.pathsep.join(
+        [sdk_dir, *filter(None, [env.get('PYTHONPATH')])])
+    return subprocess.run([sys.executable, *args, '-c', code],
+                          capture_output=True,
+                          text=True,
+                          check=True,
+                          env=env)
+
 
 @mock.patch.object(sys, 'version_info', new=(3, 7, 12, 'final', 0))
 class TestPythonEOLWarning(unittest.TestCase):
@@ -32,5 +59,65 @@ class TestPythonEOLWarning(unittest.TestCase):
             importlib.reload(mod)
 
 
+class TestLazyImports(unittest.TestCase):
+
+    def test_import_kfp_dsl_skips_compile_time_dependencies(self):
+        result = _run_python('import sys\n'
+                             'import kfp.dsl\n'
+                             'import kfp.local\n'
+                             'print(*sorted(sys.modules))')
+        modules = set(result.stdout.split())
+        for module in [
+                'kfp.client',
+                'kfp.compiler',
+                'kfp.dsl.component_factory',
+                'kfp_server_api',
+                'google.auth',
+                'google.protobuf',
+                'requests',
+                'yaml',
+        ]:
+            self.assertNotIn(module, modules)
+
+    def test_attributes_resolve_on_first_use(self):
+        result = _run_python('import kfp\n'
+                             'print(kfp.Client.__module__)\n'
+                             'print(kfp.dsl.component.__module__)\n'
+                             'print(kfp.local.init.__module__)\n'
+                             'print(kfp.compiler.Compiler.__module__)')
+        self.assertEqual(result.stdout.split(), [
+            'kfp.client.client',
+            'kfp.dsl.component_decorator',
+            'kfp.local.config',
+            'kfp.compiler.compiler',
+        ])
+
+    def test_star_import_and_dir(self):
+        from kfp import dsl
+        namespace = {}
+        exec('from kfp.dsl import *', namespace)
+        self.assertIs(namespace['pipeline'], dsl.pipeline)
+        self.assertIn('ParallelFor', dir(dsl))
+        self.assertIn('Client', dir(kfp))
+
+    def test_unknown_attribute(self):
+        from kfp import dsl
+        with self.assertRaisesRegex(AttributeError,
+                                    r"module 'kfp.dsl' has no attribute 'foo'"):
+            dsl.foo
+
+    def test_cold_import_time(self):
+        # -X importtime reports the cumulative import time of kfp.dsl in
+        # microseconds, excluding interpreter startup; the fastest of a
+        # few runs is the least noisy
+        import_times = []
+        for _ in range(3):
+            result = _run_python('import kfp.dsl', '-X', 'importtime')
+            match = re.search(r'\|\s*(\d+) \| kfp\.dsl$', result.stderr,
+                              re.MULTILINE)
+            import_times.append(int(match.group(1)) / 1e6)
+        self.assertLess(min(import_times), _IMPORT_TIME_BUDGET_SECONDS)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -21,6 +21,8 @@ PipelinesClient`` or through the Kubeflow SDK re-export at
 from kfp.kubeflow_client import constants
 from kfp.kubeflow_client.api.pipelines_client import PipelinesClient
 from kfp.kubeflow_client.backends.kubernetes import KubernetesBackendConfig
+from kfp.kubeflow_client.backends.kubernetes import NameCacheStats
+from kfp.kubeflow_client.backends.kubernetes import RunResult
 from kfp.kubeflow_client.types import Experiment
 from kfp.kubeflow_client.types import ListExperimentsResponse
 from kfp.kubeflow_client.types import ListPipelinesResponse
@@ -38,8 +40,10 @@ __all__ = [
     'ListPipelinesResponse',
     'ListPipelineVersionsResponse',
     'ListRunsResponse',
+    'NameCacheStats',
     'Pipeline',
     'PipelinesClient',
     'PipelineVersion',
     'Run',
+    'RunResult',
 ]
@@ -20,6 +20,9 @@ designed for re-export by the Kubeflow SDK at ``kubeflow.pipelines``.
 from __future__ import annotations
 
 from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
 from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -27,6 +30,8 @@ if TYPE_CHECKING:
 
 from kfp.kubeflow_client.backends.kubernetes import KubernetesBackend
 from kfp.kubeflow_client.backends.kubernetes import KubernetesBackendConfig
+from kfp.kubeflow_client.backends.kubernetes import NameCacheStats
+from kfp.kubeflow_client.backends.kubernetes import RunResult
 from kfp.kubeflow_client.types import Experiment
 from kfp.kubeflow_client.types import ListExperimentsResponse
 from kfp.kubeflow_client.types import ListPipelinesResponse
@@ -249,6 +254,54 @@ class PipelinesClient:
             version=version,
         )
 
+    def run_many(
+        self,
+        pipeline: str | Callable | Pipeline | PipelineVersion,
+        params_list: Sequence[dict[str, Any] | None],
+        *,
+        name: str | None = None,
+        experiment: str | None = None,
+        version: str | None = None,
+        max_workers: int = 8,
+        max_runs_per_second: float | None = None,
+    ) -> list[RunResult]:
+        """Submit one run of a pipeline per parameter set, concurrently.
+
+        Accepts the same pipeline inputs as ``run``. The pipeline is
+        compiled or parsed, and the experiment and version are resolved,
+        once; the runs are then created concurrently.
+
+        Args:
+            pipeline: Pipeline to run (see ``run``).
+            params_list: Pipeline parameters of each run.
+            name: Base run display name; run ``i`` is named
+                ``"<name> #<i>"``. Auto-generated if omitted.
+            experiment: Experiment name. If ``None``, the server's default
+                experiment is used.
+            version: Pipeline version name (see ``run``).
+            max_workers: Maximum number of concurrent submissions.
+            max_runs_per_second: Maximum submission rate. Unlimited if
+                omitted.
+
+        Returns:
+            One ``RunResult`` per entry of ``params_list``, in the same
+            order, holding the created ``Run`` or the error its
+            submission raised.
+
+        Raises:
+            ValueError: If the pipeline, version or experiment cannot be
+                resolved, in which case no run is submitted.
+        """
+        return self._backend.run_many(
+            pipeline,
+            params_list,
+            name=name,
+            experiment=experiment,
+            version=version,
+            max_workers=max_workers,
+            max_runs_per_second=max_runs_per_second,
+        )
+
     def get_run(self, run_id: str) -> Run:
         """Get a run by ID.
 
@@ -336,6 +389,57 @@ class PipelinesClient:
             callbacks=callbacks,
         )
 
+    def wait_for_runs(
+        self,
+        runs: Iterable[str | Run],
+        *,
+        status: set[str] | None = None,
+        timeout: int | None = 600,
+        polling_interval: float = 5,
+        max_polling_interval: float = 60,
+        callbacks: list[Callable[[Run], None]] | None = None,
+    ) -> Iterator[Run]:
+        """Wait for many runs, yielding each one as soon as it finishes.
+
+        Pending runs are polled together with batched list calls, so
+        waiting on many runs costs about one request per poll. The
+        interval between polls backs off from ``polling_interval`` while
+        no run finishes, and with the age of the youngest pending run,
+        up to ``max_polling_interval``.
+
+        Example::
+
+            runs = client.run_many('my-pipeline', params_list)
+            for run in client.wait_for_runs(r.run for r in runs if r.run):
+                print(run.display_name, run.state)
+
+        Args:
+            runs: ``Run`` objects or run ID strings.
+            status: Set of states to wait for. Defaults to
+                ``{constants.RUN_COMPLETE}`` (``"succeeded"``). A run is
+                also yielded when it reaches any terminal state.
+            timeout: Maximum seconds to wait for all runs. Defaults to
+                600 (10 minutes). Pass ``None`` to wait indefinitely.
+            polling_interval: Initial seconds between status checks.
+            max_polling_interval: Maximum seconds between status checks.
+            callbacks: Called with each ``Run`` as it is yielded.
+
+        Yields:
+            Each ``Run`` object, in the order the runs finish.
+
+        Raises:
+            TimeoutError: If ``timeout`` expires before every run
+                reaches a stop condition.
+        """
+        return self._backend.wait_for_runs(
+            runs,
+            status=status,
+            timeout=timeout,
+            polling_interval=polling_interval,
+            max_polling_interval=max_polling_interval,
+            callbacks=callbacks,
+        )
+
     # ------------------------------------------------------------------
     # Experiment operations
     # ------------------------------------------------------------------
@@ -403,6 +507,26 @@ class PipelinesClient:
         """
         self._backend.delete_experiment(name)
 
+    # ------------------------------------------------------------------
+    # Name resolution cache
+    # ------------------------------------------------------------------
+
+    def get_name_cache_stats(self) -> NameCacheStats:
+        """Get statistics of the name-to-ID resolution cache.
+
+        Pipeline, version and experiment names are resolved to IDs with
+        list calls whose results are cached for
+        ``KubernetesBackendConfig.name_cache_ttl`` seconds.
+
+        Returns:
+            The hits, misses and number of cached entries.
+        """
+        return self._backend.get_name_cache_stats()
+
+    def clear_name_cache(self) -> None:
+        """Drop all cached name-to-ID resolutions and reset the counters."""
+        self._backend.clear_name_cache()
+
     # ------------------------------------------------------------------
     # Escape hatch
     # ------------------------------------------------------------------
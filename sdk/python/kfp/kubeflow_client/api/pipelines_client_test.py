@@ -25,6 +25,7 @@ from kfp.kubeflow_client import constants
 from kfp.kubeflow_client.api.pipelines_client import PipelinesClient
 from kfp.kubeflow_client.backends.kubernetes.types import \
     KubernetesBackendConfig
+from kfp.kubeflow_client.backends.kubernetes.types import NameCacheStats
 import kfp_server_api
 import pytest
 
@@ -273,6 +274,44 @@ def test_run(client, test_case):
         assert result.run_id == test_case.expected_output['run_id']
 
 
+# ------------------------------------------------------------------
+# test_run_many
+# ------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    'test_case', [
+        TestCase(
+            name='delegates to backend run_many',
+            config={
+                'params_list': [{
+                    'x': 1
+                }, {
+                    'x': 2
+                }],
+                'kwargs': {
+                    'name': 'sweep',
+                    'experiment': 'exp',
+                    'max_workers': 2,
+                    'max_runs_per_second': 5.0,
+                },
+            },
+        ),
+    ],
+    ids=lambda tc: tc.name)
+def test_run_many(client, test_case):
+    with patch.object(
+            client._backend, 'run_many', return_value=[]) as mock_run_many:
+        client.run_many('my-pipe', test_case.config['params_list'],
+                        **test_case.config['kwargs'])
+        mock_run_many.assert_called_once_with(
+            'my-pipe',
+            test_case.config['params_list'],
+            version=None,
+            **test_case.config['kwargs'],
+        )
+
+
 # ------------------------------------------------------------------
 # test_get_run
 # ------------------------------------------------------------------
@@ -355,6 +394,38 @@ def test_wait_for_run_status(client, test_case):
         assert result.state == test_case.expected_output['state']
 
 
+# ------------------------------------------------------------------
+# test_wait_for_runs
+# ------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    'test_case', [
+        TestCase(
+            name='delegates to backend wait_for_runs',
+            config={
+                'kwargs': {
+                    'timeout': 60,
+                    'polling_interval': 1,
+                    'max_polling_interval': 10,
+                }
+            },
+        ),
+    ],
+    ids=lambda tc: tc.name)
+def test_wait_for_runs(client, test_case):
+    runs = [Mock(run_id='r-1')]
+    with patch.object(
+            client._backend, 'wait_for_runs',
+            return_value=iter(runs)) as mock_wait:
+        assert list(
+            client.wait_for_runs(['r-1'], **test_case.config['kwargs'])) == runs
+        mock_wait.assert_called_once_with(['r-1'],
+                                          status=None,
+                                          callbacks=None,
+                                          **test_case.config['kwargs'])
+
+
 # ------------------------------------------------------------------
 # test_create_experiment
 # ------------------------------------------------------------------
@@ -444,6 +515,30 @@ def test_delete_experiment(client, test_case):
         mock_del.assert_called_once_with('my-exp')
 
 
+# ------------------------------------------------------------------
+# test_name_cache
+# ------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    'test_case', [
+        TestCase(
+            name='delegates to backend',
+            expected_output=NameCacheStats(hits=3, misses=1, entries=1),
+        ),
+    ],
+    ids=lambda tc: tc.name)
+def test_name_cache(client, test_case):
+    with patch.object(
+            client._backend,
+            'get_name_cache_stats',
+            return_value=test_case.expected_output):
+        assert client.get_name_cache_stats() == test_case.expected_output
+    with patch.object(client._backend, 'clear_name_cache') as mock_clear:
+        client.clear_name_cache()
+        mock_clear.assert_called_once_with()
+
+
 # ------------------------------------------------------------------
 # test_kfp_client
 # ------------------------------------------------------------------
@@ -16,5 +16,12 @@
 from kfp.kubeflow_client.backends.kubernetes.backend import KubernetesBackend
 from kfp.kubeflow_client.backends.kubernetes.types import \
     KubernetesBackendConfig
+from kfp.kubeflow_client.backends.kubernetes.types import NameCacheStats
+from kfp.kubeflow_client.backends.kubernetes.types import RunResult
 
-__all__ = ['KubernetesBackend', 'KubernetesBackendConfig']
+__all__ = [
+    'KubernetesBackend',
+    'KubernetesBackendConfig',
+    'NameCacheStats',
+    'RunResult',
+]
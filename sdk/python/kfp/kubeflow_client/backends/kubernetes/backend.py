@@ -16,6 +16,10 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+import concurrent.futures
 import datetime
 import json
 import logging
@@ -33,8 +37,11 @@ from kfp.kubeflow_client.backends.kubernetes import auth
 from kfp.kubeflow_client.backends.kubernetes import \
     constants as backend_constants
 from kfp.kubeflow_client.backends.kubernetes import utils
+from kfp.kubeflow_client.backends.kubernetes.name_cache import NameCache
 from kfp.kubeflow_client.backends.kubernetes.types import \
     KubernetesBackendConfig
+from kfp.kubeflow_client.backends.kubernetes.types import NameCacheStats
+from kfp.kubeflow_client.backends.kubernetes.types import RunResult
 from kfp.kubeflow_client.types import Experiment
 from kfp.kubeflow_client.types import ListExperimentsResponse
 from kfp.kubeflow_client.types import ListPipelinesResponse
@@ -50,6 +57,7 @@ import yaml
 logger = logging.getLogger(__name__)
 
 _VALID_UPLOAD_EXTENSIONS = ('.yaml', '.yml', '.tar.gz', '.tgz', '.zip')
+_MAX_AUTH_RETRIES = 2
 
 
 class KubernetesBackend:
@@ -58,6 +66,12 @@ class KubernetesBackend:
     Manages the ``kfp_server_api`` configuration, service API instances,
     namespace resolution, and credential lifecycle.
 
+    Pipeline, version and experiment names are resolved to IDs through a
+    per-namespace cache whose entries expire after
+    ``config.name_cache_ttl`` seconds. Creates, uploads and deletes made
+    through this backend invalidate the entries they affect. The latest
+    version of a pipeline is looked up on every call.
+
     Args:
         config: Connection parameters for the KFP API server.
     """
@@ -65,6 +79,8 @@ class KubernetesBackend:
     def __init__(self, config: KubernetesBackendConfig) -> None:
         self._config = config
         self._namespace: str | None = None
+        self._name_cache = NameCache(ttl=config.name_cache_ttl)
+        self._list_runs_by_id_supported = True
 
         self._api_config = self._build_api_configuration(config)
         api_client = kfp_server_api.ApiClient(self._api_config)
@@ -118,6 +134,14 @@ class KubernetesBackend:
         """Refresh the API token using the configured refresh hook."""
         auth.refresh_credentials(self._api_config)
 
+    def get_name_cache_stats(self) -> NameCacheStats:
+        """Return hit, miss and entry counts of the name-to-ID cache."""
+        return self._name_cache.stats()
+
+    def clear_name_cache(self) -> None:
+        """Drop all cached name-to-ID resolutions and reset the counters."""
+        self._name_cache.clear()
+
     def verify_backend(self) -> None:
         """Verify that the KFP API server is reachable.
 
@@ -215,6 +239,7 @@ class KubernetesBackend:
                 pipeline_id=pipeline_id,
                 pipeline_version_id=version_id,
             )
+            self._invalidate_versions(pipeline_id)
             return
 
         if not force:
@@ -232,6 +257,8 @@ class KubernetesBackend:
 
         self._pipelines_api.pipeline_service_delete_pipeline(
             pipeline_id=pipeline_id, cascade=True)
+        self._name_cache.invalidate(self.namespace, 'pipeline', name)
+        self._invalidate_versions(pipeline_id)
 
     def upload_pipeline(
         self,
@@ -252,12 +279,14 @@ class KubernetesBackend:
             existing_pipeline_id = self._get_pipeline_id_by_name(name)
 
             if existing_pipeline_id is not None:
-                return self._upload_version(
+                pipeline_version = self._upload_version(
                     package_path,
                     pipeline_id=existing_pipeline_id,
                     version_name=version_name,
                     description=description,
                 )
+                self._invalidate_versions(existing_pipeline_id)
+                return pipeline_version
             else:
                 return self._upload_new_pipeline(
                     package_path,
@@ -284,69 +313,61 @@ class KubernetesBackend:
     ) -> Run:
         """Run a pipeline with full dispatch logic."""
         run_name = name or self._generate_run_name(pipeline)
+        self._warn_if_version_ignored(pipeline, version)
+        experiment_id = self._resolve_experiment_id(experiment)
+        run_source = self._prepare_run_source(pipeline, version)
+        return self._run_api.run_service_create_run(
+            run=self._build_run(run_name, experiment_id, params, run_source))
 
-        version_is_usable = (
-            isinstance(pipeline, Pipeline) or
-            (isinstance(pipeline, str) and not self._is_yaml_path(pipeline) and
-             not self._is_archive_path(pipeline)))
-        if version is not None and not version_is_usable:
-            logger.warning(
-                'The version parameter is ignored when pipeline is not a '
-                'name string (got %s).',
-                type(pipeline).__name__
-                if not isinstance(pipeline, str) else repr(pipeline))
-
-        if isinstance(pipeline, PipelineVersion):
-            return self.run_from_version(
-                pipeline_id=pipeline.pipeline_id,
-                version_id=pipeline.pipeline_version_id,
-                params=params,
-                run_name=run_name,
-                experiment=experiment,
-            )
-
-        if isinstance(pipeline, Pipeline):
-            return self.run_pipeline(
-                pipeline=pipeline,
-                version=version,
-                params=params,
-                run_name=run_name,
-                experiment=experiment,
-            )
-
-        if callable(pipeline):
-            return self._run_inline(
-                pipeline_callable=pipeline,
-                params=params,
-                run_name=run_name,
-                experiment=experiment,
-            )
-
-        if isinstance(pipeline, str) and self._is_yaml_path(pipeline):
-            return self.run_from_file(
-                file_path=pipeline,
-                params=params,
-                run_name=run_name,
-                experiment=experiment,
-            )
-
-        if isinstance(pipeline, str) and self._is_archive_path(pipeline):
+    def run_many(
+        self,
+        pipeline: str | Callable | Pipeline | PipelineVersion,
+        params_list: Sequence[dict[str, Any] | None],
+        *,
+        name: str | None = None,
+        experiment: str | None = None,
+        version: str | None = None,
+        max_workers: int = 8,
+        max_runs_per_second: float | None = None,
+    ) -> list[RunResult]:
+        """Submit one run per entry of params_list, concurrently.
+
+        The pipeline is compiled or parsed, and the experiment and
+        version are resolved, once for all runs. Runs are created from
+        up to max_workers threads, at most max_runs_per_second per
+        second. Results are in the order of params_list. A failed
+        submission only fails its own RunResult.
+        """
+        if max_workers < 1:
             raise ValueError(
-                f'Archive files ({pipeline!r}) cannot be used for inline '
-                'runs. Use upload_pipeline() first, then run by name.')
-
-        if isinstance(pipeline, str):
-            return self.run_by_name(
-                pipeline_name=pipeline,
-                version_name=version,
-                params=params,
-                run_name=run_name,
-                experiment=experiment,
-            )
+                f'max_workers must be at least 1, got {max_workers!r}.')
+        limiter = (
+            utils.RateLimiter(max_runs_per_second)
+            if max_runs_per_second is not None else None)
+        base_name = name or self._generate_run_name(pipeline)
+        self._warn_if_version_ignored(pipeline, version)
+        experiment_id = self._resolve_experiment_id(experiment)
+        run_source = self._prepare_run_source(pipeline, version)
 
-        raise ValueError(f'Unsupported pipeline type: {type(pipeline)!r}. '
-                         'Expected a pipeline name, file path, callable, '
-                         'Pipeline, or PipelineVersion.')
+        def submit(index: int, params: dict[str, Any] | None) -> RunResult:
+            run_body = self._build_run(f'{base_name} #{index}', experiment_id,
+                                       params, run_source)
+            try:
+                if limiter is not None:
+                    limiter.acquire()
+                run = self._run_api.run_service_create_run(run=run_body)
+            except Exception as e:
+                logger.warning('Failed to submit run %r: %s',
+                               run_body.display_name, e)
+                return RunResult(params=params, error=e)
+            return RunResult(params=params, run=run)
+
+        if not params_list:
+            return []
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(max_workers, len(params_list))) as executor:
+            return list(
+                executor.map(submit, range(len(params_list)), params_list))
 
     def get_run(self, run_id: str) -> Run:
         """Get a run by ID."""
@@ -437,7 +458,6 @@ class KubernetesBackend:
         run_id = run.run_id if isinstance(run, Run) else run
         start_time = time.monotonic()
         first_poll_succeeded = False
-        max_auth_retries = 2
         auth_retries = 0
 
         while True:
@@ -446,13 +466,10 @@ class KubernetesBackend:
                 first_poll_succeeded = True
                 auth_retries = 0
             except kfp_server_api.ApiException as api_error:
-                if (first_poll_succeeded and api_error.status == 401 and
-                        auth_retries < max_auth_retries):
+                if self._refresh_expired_credentials(api_error,
+                                                     first_poll_succeeded,
+                                                     auth_retries):
                     auth_retries += 1
-                    logger.info(
-                        'Access token expired, refreshing '
-                        '(attempt %d/%d)...', auth_retries, max_auth_retries)
-                    self.refresh_credentials()
                     continue
                 raise
 
@@ -479,6 +496,100 @@ class KubernetesBackend:
 
             time.sleep(polling_interval)
 
+    def wait_for_runs(
+        self,
+        runs: Iterable[str | Run],
+        *,
+        status: set[str] | None = None,
+        timeout: int | None = 600,
+        polling_interval: float = 5,
+        max_polling_interval: float = 60,
+        callbacks: list[Callable[[Run], None]] | None = None,
+    ) -> Iterator[Run]:
+        """Wait for many runs, yielding each as it reaches a target or terminal
+        state.
+
+        All pending runs are polled together with batched list calls.
+        While no run finishes, the interval between polls grows from
+        polling_interval by half each time, and is kept at a tenth of the
+        age of the youngest pending run, up to max_polling_interval; it
+        drops back to polling_interval when a run finishes.
+
+        Args:
+            runs: Run objects or run ID strings.
+            status: Set of states to wait for.
+            timeout: Maximum time to wait for all runs, in seconds. Pass
+                ``None`` to wait indefinitely.
+            polling_interval: Initial time between status checks, in
+                seconds.
+            max_polling_interval: Maximum time between status checks, in
+                seconds.
+            callbacks: Called with each run when it is yielded.
+        """
+        if status is None:
+            status = {constants.RUN_COMPLETE}
+        target_states = {state.lower() for state in status}
+        pending = list(
+            dict.fromkeys(
+                run.run_id if isinstance(run, Run) else run for run in runs))
+
+        start_time = time.monotonic()
+        interval = polling_interval
+        first_poll_succeeded = False
+        auth_retries = 0
+
+        while pending:
+            try:
+                run_responses = self._get_runs_by_id(pending)
+                first_poll_succeeded = True
+                auth_retries = 0
+            except kfp_server_api.ApiException as api_error:
+                if self._refresh_expired_credentials(api_error,
+                                                     first_poll_succeeded,
+                                                     auth_retries):
+                    auth_retries += 1
+                    continue
+                raise
+
+            still_pending = []
+            for run_id in pending:
+                run_response = run_responses[run_id]
+                current_state = (run_response.state or '').lower()
+                if current_state in target_states:
+                    self._invoke_callbacks(callbacks, run_response)
+                    yield run_response
+                elif current_state in constants.TERMINAL_STATES:
+                    logger.info(
+                        'Run %s reached terminal state %r before target %s.',
+                        run_id, current_state, target_states)
+                    self._invoke_callbacks(callbacks, run_response)
+                    yield run_response
+                else:
+                    still_pending.append(run_id)
+            made_progress = len(still_pending) < len(pending)
+            pending = still_pending
+            if not pending:
+                return
+
+            if made_progress:
+                interval = polling_interval
+            else:
+                interval = interval * 1.5
+            youngest_age = min(
+                self._run_age(run_responses[run_id]) for run_id in pending)
+            interval = min(max_polling_interval, max(interval,
+                                                     youngest_age / 10))
+
+            if timeout is not None:
+                remaining = timeout - (time.monotonic() - start_time)
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f'{len(pending)} run(s) did not reach state '
+                        f'{target_states} within {timeout}s: {pending}.')
+                interval = min(interval, remaining)
+
+            time.sleep(interval)
+
     def run_by_name(
         self,
         pipeline_name: str,
@@ -493,16 +604,8 @@ class KubernetesBackend:
         if pipeline_id is None:
             raise ValueError(f'Pipeline not found: {pipeline_name!r}. '
                              'Upload it first with upload_pipeline().')
-
-        if version_name:
-            version_id = self._get_version_id_by_name(pipeline_id, version_name)
-            if version_id is None:
-                raise ValueError(
-                    f'Pipeline version not found: {version_name!r} '
-                    f'for pipeline {pipeline_name!r}.')
-        else:
-            version_id = self._get_latest_version_id(pipeline_id)
-
+        version_id = self._resolve_version_id(pipeline_id, version_name,
+                                              pipeline_name)
         return self._run_from_version_reference(
             pipeline_id=pipeline_id,
             version_id=version_id,
@@ -521,14 +624,8 @@ class KubernetesBackend:
     ) -> Run:
         """Run a pipeline from a Pipeline object."""
         experiment_id = self._resolve_experiment_id(experiment)
-        if version:
-            version_id = self._get_version_id_by_name(pipeline.pipeline_id,
-                                                      version)
-            if version_id is None:
-                raise ValueError(f'Pipeline version not found: {version!r} '
-                                 f'for pipeline {pipeline.display_name!r}.')
-        else:
-            version_id = self._get_latest_version_id(pipeline.pipeline_id)
+        version_id = self._resolve_version_id(pipeline.pipeline_id, version,
+                                              pipeline.display_name)
         return self._run_from_version_reference(
             pipeline_id=pipeline.pipeline_id,
             version_id=version_id,
@@ -566,16 +663,9 @@ class KubernetesBackend:
         experiment_id = self._resolve_experiment_id(experiment)
         if not os.path.isfile(file_path):
             raise ValueError(f'Pipeline file not found: {file_path}')
-        pipeline_spec_dict = self._load_pipeline_spec(file_path)
-        runtime_config = kfp_server_api.V2beta1RuntimeConfig(
-            parameters=params or {},)
-        run_body = kfp_server_api.V2beta1Run(
-            display_name=run_name,
-            experiment_id=experiment_id,
-            pipeline_spec=pipeline_spec_dict,
-            runtime_config=runtime_config,
-        )
-        return self._run_api.run_service_create_run(run=run_body)
+        run_source = {'pipeline_spec': self._load_pipeline_spec(file_path)}
+        return self._run_api.run_service_create_run(
+            run=self._build_run(run_name, experiment_id, params, run_source))
 
     # ------------------------------------------------------------------
     # Experiment operations
@@ -605,8 +695,10 @@ class KubernetesBackend:
             description=description,
             namespace=self.namespace,
         )
-        return self._experiment_api.experiment_service_create_experiment(
+        experiment = self._experiment_api.experiment_service_create_experiment(
             experiment=experiment_body)
+        self._name_cache.invalidate(self.namespace, 'experiment', name)
+        return experiment
 
     def get_experiment(self, name: str) -> Experiment:
         """Get an experiment by name."""
@@ -637,6 +729,7 @@ class KubernetesBackend:
             raise ValueError(f'Experiment not found: {name!r}.')
         self._experiment_api.experiment_service_delete_experiment(
             experiment_id=experiment_id)
+        self._name_cache.invalidate(self.namespace, 'experiment', name)
 
     # ------------------------------------------------------------------
     # Private helpers — name resolution
@@ -653,8 +746,18 @@ class KubernetesBackend:
             }]
         })
 
+    def _invalidate_versions(self, pipeline_id: str) -> None:
+        """Drop the cached version resolutions of a pipeline."""
+        self._name_cache.invalidate(self.namespace, 'version', pipeline_id)
+
     def _get_pipeline_id_by_name(self, name: str) -> str | None:
         """Resolve a pipeline display name to its ID."""
+        return self._name_cache.get_or_resolve(
+            (self.namespace, 'pipeline', name),
+            lambda: self._lookup_pipeline_id(name))
+
+    def _lookup_pipeline_id(self, name: str) -> str | None:
+        """Query the server for the ID of a pipeline display name."""
         result = self._pipelines_api.pipeline_service_list_pipelines(
             namespace=self.namespace,
             filter=self._equals_filter('display_name', name))
@@ -674,6 +777,16 @@ class KubernetesBackend:
         version_name: str,
     ) -> str | None:
         """Resolve a version display name to its ID within a pipeline."""
+        return self._name_cache.get_or_resolve(
+            (self.namespace, 'version', pipeline_id, version_name),
+            lambda: self._lookup_version_id(pipeline_id, version_name))
+
+    def _lookup_version_id(
+        self,
+        pipeline_id: str,
+        version_name: str,
+    ) -> str | None:
+        """Query the server for the ID of a version display name."""
         result = self._pipelines_api.pipeline_service_list_pipeline_versions(
             pipeline_id=pipeline_id,
             filter=self._equals_filter('display_name', version_name),
@@ -688,7 +801,11 @@ class KubernetesBackend:
                          f'{version_ids}.')
 
     def _get_latest_version_id(self, pipeline_id: str) -> str:
-        """Get the latest (most recently created) version ID for a pipeline."""
+        """Get the latest (most recently created) version ID for a pipeline.
+
+        Not cached: versions uploaded by other clients change the latest
+        version without changing any name.
+        """
         result = self._pipelines_api.pipeline_service_list_pipeline_versions(
             pipeline_id=pipeline_id,
             page_size=1,
@@ -701,6 +818,12 @@ class KubernetesBackend:
 
     def _get_experiment_id_by_name(self, name: str) -> str | None:
         """Resolve an experiment display name to its ID."""
+        return self._name_cache.get_or_resolve(
+            (self.namespace, 'experiment', name),
+            lambda: self._lookup_experiment_id(name))
+
+    def _lookup_experiment_id(self, name: str) -> str | None:
+        """Query the server for the ID of an experiment display name."""
         result = self._experiment_api.experiment_service_list_experiments(
             namespace=self.namespace,
             filter=self._equals_filter('display_name', name),
@@ -829,6 +952,89 @@ class KubernetesBackend:
                              'Use create_experiment() first.')
         return experiment_id
 
+    def _resolve_version_id(
+        self,
+        pipeline_id: str,
+        version_name: str | None,
+        pipeline_name: str,
+    ) -> str:
+        """Resolve a version name, or the latest version if None, to its ID."""
+        if not version_name:
+            return self._get_latest_version_id(pipeline_id)
+        version_id = self._get_version_id_by_name(pipeline_id, version_name)
+        if version_id is None:
+            raise ValueError(f'Pipeline version not found: {version_name!r} '
+                             f'for pipeline {pipeline_name!r}.')
+        return version_id
+
+    def _warn_if_version_ignored(
+        self,
+        pipeline: str | Callable | Pipeline | PipelineVersion,
+        version: str | None,
+    ) -> None:
+        """Warn when a version is given for a pipeline that has none."""
+        version_is_usable = (
+            isinstance(pipeline, Pipeline) or
+            (isinstance(pipeline, str) and not self._is_yaml_path(pipeline) and
+             not self._is_archive_path(pipeline)))
+        if version is not None and not version_is_usable:
+            logger.warning(
+                'The version parameter is ignored when pipeline is not a '
+                'name string (got %s).',
+                type(pipeline).__name__
+                if not isinstance(pipeline, str) else repr(pipeline))
+
+    def _prepare_run_source(
+        self,
+        pipeline: str | Callable | Pipeline | PipelineVersion,
+        version: str | None,
+    ) -> dict[str, Any]:
+        """Resolve what runs of a pipeline execute.
+
+        Called once by run() and once for all runs by run_many().
+
+        Returns:
+            The ``pipeline_version_reference`` or ``pipeline_spec``
+            keyword argument of ``V2beta1Run``.
+        """
+        if isinstance(pipeline, PipelineVersion):
+            pipeline_id = pipeline.pipeline_id
+            version_id = pipeline.pipeline_version_id
+        elif isinstance(pipeline, Pipeline):
+            pipeline_id = pipeline.pipeline_id
+            version_id = self._resolve_version_id(pipeline_id, version,
+                                                  pipeline.display_name)
+        elif isinstance(pipeline, str) and self._is_archive_path(pipeline):
+            raise ValueError(
+                f'Archive files ({pipeline!r}) cannot be used for inline '
+                'runs. Use upload_pipeline() first, then run by name.')
+        elif callable(pipeline) or (isinstance(pipeline, str) and
+                                    self._is_yaml_path(pipeline)):
+            package_path, temp_dir = self._resolve_pipeline_to_file(pipeline)
+            try:
+                return {'pipeline_spec': self._load_pipeline_spec(package_path)}
+            finally:
+                if temp_dir is not None:
+                    shutil.rmtree(temp_dir, ignore_errors=True)
+        elif isinstance(pipeline, str):
+            pipeline_id = self._get_pipeline_id_by_name(pipeline)
+            if pipeline_id is None:
+                raise ValueError(f'Pipeline not found: {pipeline!r}. '
+                                 'Upload it first with upload_pipeline().')
+            version_id = self._resolve_version_id(pipeline_id, version,
+                                                  pipeline)
+        else:
+            raise ValueError(f'Unsupported pipeline type: {type(pipeline)!r}. '
+                             'Expected a pipeline name, file path, callable, '
+                             'Pipeline, or PipelineVersion.')
+        return {
+            'pipeline_version_reference':
+                kfp_server_api.V2beta1PipelineVersionReference(
+                    pipeline_id=pipeline_id,
+                    pipeline_version_id=version_id,
+                )
+        }
+
     def _run_from_version_reference(
         self,
         pipeline_id: str,
@@ -838,20 +1044,31 @@ class KubernetesBackend:
         experiment_id: str | None,
     ) -> Run:
         """Create a run from a pipeline version reference (ID-based)."""
-        runtime_config = kfp_server_api.V2beta1RuntimeConfig(
-            parameters=params or {},)
-        pipeline_version_reference = (
-            kfp_server_api.V2beta1PipelineVersionReference(
-                pipeline_id=pipeline_id,
-                pipeline_version_id=version_id,
-            ))
-        run_body = kfp_server_api.V2beta1Run(
+        run_source = {
+            'pipeline_version_reference':
+                kfp_server_api.V2beta1PipelineVersionReference(
+                    pipeline_id=pipeline_id,
+                    pipeline_version_id=version_id,
+                )
+        }
+        return self._run_api.run_service_create_run(
+            run=self._build_run(run_name, experiment_id, params, run_source))
+
+    @staticmethod
+    def _build_run(
+        run_name: str,
+        experiment_id: str | None,
+        params: dict[str, Any] | None,
+        run_source: dict[str, Any],
+    ) -> kfp_server_api.V2beta1Run:
+        """Build the body of a run of the source from _prepare_run_source."""
+        return kfp_server_api.V2beta1Run(
             display_name=run_name,
             experiment_id=experiment_id,
-            pipeline_version_reference=pipeline_version_reference,
-            runtime_config=runtime_config,
+            runtime_config=kfp_server_api.V2beta1RuntimeConfig(
+                parameters=params or {}),
+            **run_source,
         )
-        return self._run_api.run_service_create_run(run=run_body)
 
     def _load_pipeline_spec(self, file_path: str) -> dict:
         """Load a pipeline spec from a YAML file and return as dict."""
@@ -890,6 +1107,91 @@ class KubernetesBackend:
             'platform_spec': json_format.MessageToDict(platform_spec),
         }
 
+    def _refresh_expired_credentials(
+        self,
+        api_error: kfp_server_api.ApiException,
+        first_poll_succeeded: bool,
+        auth_retries: int,
+    ) -> bool:
+        """Refresh credentials if a poll failed because the token expired.
+
+        A 401 on the first poll means the credentials are wrong rather
+        than expired, so they are only refreshed after a successful poll.
+
+        Returns:
+            Whether the credentials were refreshed and the poll should be
+            retried.
+        """
+        if (not first_poll_succeeded or api_error.status != 401 or
+                auth_retries >= _MAX_AUTH_RETRIES):
+            return False
+        logger.info('Access token expired, refreshing '
+                    '(attempt %d/%d)...', auth_retries + 1, _MAX_AUTH_RETRIES)
+        self.refresh_credentials()
+        return True
+
+    def _get_runs_by_id(self, run_ids: list[str]) -> dict[str, Run]:
+        """Fetch runs with batched list calls.
+
+        Runs the list calls do not return (for example because the
+        server does not support filtering by run ID) are fetched one by
+        one.
+        """
+        run_responses: dict[str, Run] = {}
+        if self._list_runs_by_id_supported:
+            batch_size = backend_constants.LIST_RUNS_BY_ID_BATCH_SIZE
+            wanted = set(run_ids)
+            try:
+                for start in range(0, len(run_ids), batch_size):
+                    batch = run_ids[start:start + batch_size]
+                    filter_str = json.dumps({
+                        'predicates': [{
+                            'operation': 'IN',
+                            'key': 'run_id',
+                            'stringValues': {
+                                'values': batch
+                            },
+                        }]
+                    })
+                    page_token = ''
+                    while True:
+                        response = self._run_api.run_service_list_runs(
+                            namespace=self.namespace,
+                            page_token=page_token,
+                            page_size=len(batch),
+                            filter=filter_str,
+                        )
+                        for run in response.runs or []:
+                            if run.run_id in wanted:
+                                run_responses[run.run_id] = run
+                        page_token = response.next_page_token
+                        if not page_token:
+                            break
+            except kfp_server_api.ApiException as api_error:
+                if api_error.status != 400:
+                    raise
+                logger.info(
+                    'Listing runs by ID is not supported by the server '
+                    '(%s); polling runs one by one.', api_error.reason)
+                self._list_runs_by_id_supported = False
+
+        for run_id in run_ids:
+            if run_id not in run_responses:
+                run_responses[run_id] = self._run_api.run_service_get_run(
+                    run_id=run_id)
+        return run_responses
+
+    @staticmethod
+    def _run_age(run: Run) -> float:
+        """Seconds since a run was created, or 0 if unknown."""
+        created_at = getattr(run, 'created_at', None)
+        if not isinstance(created_at, datetime.datetime):
+            return 0.0
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=datetime.timezone.utc)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return max(0.0, (now - created_at).total_seconds())
+
     @staticmethod
     def _invoke_callbacks(
         callbacks: list[Callable[[Run], None]] | None,
@@ -906,27 +1208,6 @@ class KubernetesBackend:
                     f'Callback {callback!r} raised an exception: '
                     f'{error}') from error
 
-    def _run_inline(
-        self,
-        pipeline_callable: Callable,
-        params: dict[str, Any] | None,
-        run_name: str,
-        experiment: str | None,
-    ) -> Run:
-        """Compile a callable and submit inline (no upload)."""
-        package_path, temp_dir = self._resolve_pipeline_to_file(
-            pipeline_callable)
-        try:
-            return self.run_from_file(
-                file_path=package_path,
-                params=params,
-                run_name=run_name,
-                experiment=experiment,
-            )
-        finally:
-            if temp_dir is not None:
-                shutil.rmtree(temp_dir, ignore_errors=True)
-
     # ------------------------------------------------------------------
     # Private helpers — SDK-level preprocessing
     # ------------------------------------------------------------------
@@ -1096,6 +1377,10 @@ class KubernetesBackend:
         elif api_config.host:
             api_config.verify_ssl = api_config.host.startswith('https')
 
+        api_config.connection_pool_maxsize = max(
+            api_config.connection_pool_maxsize or 0,
+            backend_constants.CONNECTION_POOL_MAXSIZE)
+
         if config.user_token:
             api_config.api_key['authorization'] = config.user_token
             api_config.api_key_prefix['authorization'] = 'Bearer'
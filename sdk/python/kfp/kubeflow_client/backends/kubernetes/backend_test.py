@@ -17,6 +17,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from dataclasses import field
+import datetime
 import json
 import logging
 import os
@@ -32,8 +33,10 @@ from kfp.kubeflow_client import constants
 from kfp.kubeflow_client.backends.kubernetes import auth
 from kfp.kubeflow_client.backends.kubernetes import utils
 from kfp.kubeflow_client.backends.kubernetes.backend import KubernetesBackend
+from kfp.kubeflow_client.backends.kubernetes.name_cache import NameCache
 from kfp.kubeflow_client.backends.kubernetes.types import \
     KubernetesBackendConfig
+from kfp.kubeflow_client.backends.kubernetes.types import NameCacheStats
 import kfp_server_api
 import pytest
 
@@ -945,7 +948,7 @@ def test_upload_pipeline(backend, test_case):
 @pytest.mark.parametrize(
     'test_case', [
         TestCase(
-            name='callable dispatches to _run_inline',
+            name='callable runs compiled spec',
             config={
                 'input_type': 'callable',
                 'kwargs': {
@@ -958,7 +961,7 @@ def test_upload_pipeline(backend, test_case):
             expected_output={'run_id': 'r-1'},
         ),
         TestCase(
-            name='string name delegates to run_by_name',
+            name='string name runs resolved version',
             config={
                 'input_type': 'string',
                 'input_value': 'my-pipe',
@@ -1024,7 +1027,7 @@ def test_upload_pipeline(backend, test_case):
             expected_output={'run_id': 'r-5'},
         ),
         TestCase(
-            name='yaml path dispatches to run_from_file',
+            name='yaml path runs loaded spec',
             config={
                 'input_type': 'yaml_path',
                 'input_value': '/tmp/my-pipeline.yaml',
@@ -1072,7 +1075,7 @@ def test_upload_pipeline(backend, test_case):
             expected_output={'run_id': 'r-warn-3'},
         ),
         TestCase(
-            name='pipeline obj with version delegates to run_pipeline',
+            name='pipeline obj with version resolves version',
             config={
                 'input_type': 'pipeline_obj_with_version',
                 'kwargs': {
@@ -1094,18 +1097,31 @@ def test_upload_pipeline(backend, test_case):
 def test_run(backend, test_case, caplog):
     input_type = test_case.config['input_type']
     kwargs = test_case.config.get('kwargs', {})
+    spec = {'pipelineInfo': {'name': 'test-pipe'}}
+
+    def create_run(run_id):
+        return patch.object(
+            backend.run_api,
+            'run_service_create_run',
+            return_value=Mock(run_id=run_id))
 
     if input_type == 'callable':
-        mock_run = Mock(run_id='r-1', state='PENDING')
 
         def fake_pipeline():
             pass
 
         fake_pipeline.name = 'test-pipe'
-        with patch.object(
-                backend, '_run_inline', return_value=mock_run) as mock_inline:
+        with patch.object(backend, '_resolve_pipeline_to_file',
+                          return_value=('/tmp/pipeline.yaml', None)) as mock_resolve, \
+             patch.object(backend, '_load_pipeline_spec',
+                          return_value=spec), \
+             create_run('r-1') as mock_create:
             result = backend.run(fake_pipeline, **kwargs)
-            mock_inline.assert_called_once()
+            mock_resolve.assert_called_once_with(fake_pipeline)
+            run_body = mock_create.call_args.kwargs['run']
+            assert run_body.pipeline_spec == spec
+            assert run_body.display_name == 'my-run'
+            assert run_body.runtime_config.parameters == {'x': '1'}
             assert result.run_id == test_case.expected_output['run_id']
 
     elif input_type == 'string':
@@ -1113,29 +1129,33 @@ def test_run(backend, test_case, caplog):
         version = kwargs.get('version')
         run_name = kwargs['name']
         run_id = test_case.expected_output['run_id']
-        mock_run = Mock(run_id=run_id)
-        with patch.object(
-                backend, 'run_by_name',
-                return_value=mock_run) as mock_run_by_name:
+        with patch.object(backend, '_get_pipeline_id_by_name',
+                          return_value='pid-1'), \
+             patch.object(backend, '_resolve_version_id',
+                          return_value='vid-1') as mock_version, \
+             create_run(run_id) as mock_create:
             result = backend.run(input_value, **kwargs)
-            mock_run_by_name.assert_called_once_with(
-                pipeline_name=input_value,
-                version_name=version,
-                params=None,
-                run_name=run_name,
-                experiment=None,
-            )
+            mock_version.assert_called_once_with('pid-1', version, input_value)
+            run_body = mock_create.call_args.kwargs['run']
+            assert run_body.display_name == run_name
+            assert run_body.experiment_id is None
+            assert run_body.pipeline_version_reference.pipeline_id == 'pid-1'
+            assert (run_body.pipeline_version_reference.pipeline_version_id ==
+                    'vid-1')
             assert result.run_id == run_id
 
     elif input_type == 'string_version_not_found':
         input_value = test_case.config['input_value']
-        with patch.object(
-                backend, 'run_by_name',
-                side_effect=ValueError('version not found')):
+        with patch.object(backend, '_get_pipeline_id_by_name',
+                          return_value='pid-1'), \
+             patch.object(backend, '_resolve_version_id',
+                          side_effect=ValueError('version not found')), \
+             create_run('r-unused') as mock_create:
             with pytest.raises(
                     test_case.expected_error,
                     match=test_case.expected_error_match):
                 backend.run(input_value, **kwargs)
+            mock_create.assert_not_called()
 
     elif input_type == 'archive_path':
         input_value = test_case.config['input_value']
@@ -1149,54 +1169,50 @@ def test_run(backend, test_case, caplog):
             pipeline_id='pid-1',
             pipeline_version_id='vid-1',
         )
-        mock_run = Mock(run_id='r-4')
-        with patch.object(
-                backend, 'run_from_version', return_value=mock_run) as mock_ref:
+        with create_run('r-4') as mock_create:
             result = backend.run(pv, **kwargs)
-            mock_ref.assert_called_once_with(
-                pipeline_id='pid-1',
-                version_id='vid-1',
-                params=None,
-                run_name='run-pv',
-                experiment=None,
-            )
+            run_body = mock_create.call_args.kwargs['run']
+            assert run_body.display_name == 'run-pv'
+            assert run_body.pipeline_version_reference.pipeline_id == 'pid-1'
+            assert (run_body.pipeline_version_reference.pipeline_version_id ==
+                    'vid-1')
             assert result.run_id == test_case.expected_output['run_id']
 
     elif input_type == 'pipeline_obj':
         pipeline_obj = Mock(
             spec=kfp_server_api.V2beta1Pipeline, pipeline_id='pid-1')
-        mock_run = Mock(run_id='r-5')
-        with patch.object(
-                backend, 'run_pipeline',
-                return_value=mock_run) as mock_run_pipeline:
+        with patch.object(backend, '_resolve_version_id',
+                          return_value='vid-1') as mock_version, \
+             create_run('r-5') as mock_create:
             result = backend.run(pipeline_obj, **kwargs)
-            mock_run_pipeline.assert_called_once_with(
-                pipeline=pipeline_obj,
-                version=None,
-                params=None,
-                run_name='run-pipe',
-                experiment=None,
-            )
+            mock_version.assert_called_once_with('pid-1', None,
+                                                 pipeline_obj.display_name)
+            run_body = mock_create.call_args.kwargs['run']
+            assert run_body.display_name == 'run-pipe'
+            assert (run_body.pipeline_version_reference.pipeline_version_id ==
+                    'vid-1')
             assert result.run_id == test_case.expected_output['run_id']
 
     elif input_type == 'yaml_path':
         input_value = test_case.config['input_value']
-        mock_run = Mock(run_id='r-6')
-        with patch.object(
-                backend, 'run_from_file', return_value=mock_run) as mock_file:
+        with patch(f'{_BACKEND_MODULE}.os.path.isfile', return_value=True), \
+             patch.object(backend, '_load_pipeline_spec',
+                          return_value=spec) as mock_load, \
+             create_run('r-6') as mock_create:
             result = backend.run(input_value, **kwargs)
-            mock_file.assert_called_once_with(
-                file_path=input_value,
-                params=None,
-                run_name='yaml-run',
-                experiment=None,
-            )
+            mock_load.assert_called_once_with(input_value)
+            run_body = mock_create.call_args.kwargs['run']
+            assert run_body.display_name == 'yaml-run'
+            assert run_body.pipeline_spec == spec
             assert result.run_id == test_case.expected_output['run_id']
 
     elif input_type == 'callable_with_version':
-        mock_run = Mock(run_id='r-warn-1')
         pipeline_fn = Mock(__name__='my_pipe')
-        with patch.object(backend, '_run_inline', return_value=mock_run):
+        with patch.object(backend, '_resolve_pipeline_to_file',
+                          return_value=('/tmp/pipeline.yaml', None)), \
+             patch.object(backend, '_load_pipeline_spec',
+                          return_value=spec), \
+             create_run('r-warn-1'):
             with caplog.at_level(
                     logging.WARNING,
                     logger='kfp.kubeflow_client.backends.kubernetes.backend'):
@@ -1205,8 +1221,10 @@ def test_run(backend, test_case, caplog):
 
     elif input_type == 'yaml_with_version':
         input_value = test_case.config['input_value']
-        mock_run = Mock(run_id='r-warn-2')
-        with patch.object(backend, 'run_from_file', return_value=mock_run):
+        with patch(f'{_BACKEND_MODULE}.os.path.isfile', return_value=True), \
+             patch.object(backend, '_load_pipeline_spec',
+                          return_value=spec), \
+             create_run('r-warn-2'):
             with caplog.at_level(
                     logging.WARNING,
                     logger='kfp.kubeflow_client.backends.kubernetes.backend'):
@@ -1214,13 +1232,12 @@ def test_run(backend, test_case, caplog):
         assert test_case.config['expected_warning'] in caplog.text
 
     elif input_type == 'pv_obj_with_version':
-        mock_run = Mock(run_id='r-warn-3')
         pv_obj = Mock(
             spec=kfp_server_api.V2beta1PipelineVersion,
             pipeline_id='pid-1',
             pipeline_version_id='vid-1',
         )
-        with patch.object(backend, 'run_from_version', return_value=mock_run):
+        with create_run('r-warn-3'):
             with caplog.at_level(
                     logging.WARNING,
                     logger='kfp.kubeflow_client.backends.kubernetes.backend'):
@@ -1233,18 +1250,15 @@ def test_run(backend, test_case, caplog):
             pipeline_id='pid-1',
             display_name='my-pipe',
         )
-        mock_run = Mock(run_id='r-ver')
-        with patch.object(
-                backend, 'run_pipeline',
-                return_value=mock_run) as mock_run_pipeline:
+        with patch.object(backend, '_resolve_version_id',
+                          return_value='vid-2') as mock_version, \
+             create_run('r-ver') as mock_create:
             result = backend.run(pipeline_obj, **kwargs)
-            mock_run_pipeline.assert_called_once_with(
-                pipeline=pipeline_obj,
-                version='v2',
-                params=None,
-                run_name='run-ver',
-                experiment=None,
-            )
+            mock_version.assert_called_once_with('pid-1', 'v2', 'my-pipe')
+            run_body = mock_create.call_args.kwargs['run']
+            assert run_body.display_name == 'run-ver'
+            assert (run_body.pipeline_version_reference.pipeline_version_id ==
+                    'vid-2')
             assert result.run_id == test_case.expected_output['run_id']
 
     elif input_type == 'unsupported':
@@ -1253,6 +1267,202 @@ def test_run(backend, test_case, caplog):
             backend.run(12345)
 
 
+# ------------------------------------------------------------------
+# test_run_many
+# ------------------------------------------------------------------
+
+
+def _create_run_echo(run):
+    return Mock(
+        run_id=f'r-{run.display_name.rsplit("#", 1)[1]}',
+        display_name=run.display_name)
+
+
+def test_run_many_resolves_pipeline_once(backend):
+    with patch.object(
+            backend.pipelines_api,
+            'pipeline_service_list_pipelines',
+            return_value=Mock(pipelines=[Mock(pipeline_id='pid-1')
+                                        ])) as mock_list, \
+         patch.object(
+            backend.pipelines_api,
+            'pipeline_service_list_pipeline_versions',
+            return_value=Mock(pipeline_versions=[
+                Mock(pipeline_version_id='vid-1')
+            ])) as mock_versions, \
+         patch.object(
+            backend.run_api,
+            'run_service_create_run',
+            side_effect=_create_run_echo) as mock_create:
+        results = backend.run_many(
+            'my-pipe', [{
+                'lr': i
+            } for i in range(20)],
+            name='sweep',
+            max_workers=4)
+
+    mock_list.assert_called_once()
+    mock_versions.assert_called_once()
+    assert mock_create.call_count == 20
+    assert [r.run.run_id for r in results] == [f'r-{i}' for i in range(20)]
+    assert [r.params for r in results] == [{'lr': i} for i in range(20)]
+    assert all(r.succeeded for r in results)
+    run_body = mock_create.call_args_list[0].kwargs['run']
+    assert run_body.pipeline_version_reference.pipeline_version_id == 'vid-1'
+
+
+def test_run_many_loads_pipeline_file_once(backend):
+    with patch.object(
+            backend, '_load_pipeline_spec',
+            return_value={'pipelineInfo': {
+                'name': 'p'
+            }}) as mock_load, \
+         patch(f'{_BACKEND_MODULE}.os.path.isfile', return_value=True), \
+         patch.object(
+            backend.run_api,
+            'run_service_create_run',
+            side_effect=_create_run_echo) as mock_create:
+        results = backend.run_many('/tmp/pipeline.yaml', [None, {'x': 1}])
+
+    mock_load.assert_called_once_with('/tmp/pipeline.yaml')
+    assert len(results) == 2
+    run_bodies = [call.kwargs['run'] for call in mock_create.call_args_list]
+    assert all(body.pipeline_spec == {'pipelineInfo': {
+        'name': 'p'
+    }} for body in run_bodies)
+    parameters = {
+        body.display_name: body.runtime_config.parameters for body in run_bodies
+    }
+    assert parameters == {
+        results[0].run.display_name: {},
+        results[1].run.display_name: {
+            'x': 1
+        },
+    }
+
+
+def test_run_many_captures_errors_per_run(backend):
+
+    def create_run(run):
+        if run.display_name.endswith('#1'):
+            raise kfp_server_api.ApiException(status=500)
+        return _create_run_echo(run)
+
+    with patch.object(
+            backend.run_api, 'run_service_create_run', side_effect=create_run):
+        results = backend.run_many(
+            kfp_server_api.V2beta1PipelineVersion(
+                pipeline_id='pid-1', pipeline_version_id='vid-1'), [{
+                    'i': 0
+                }, {
+                    'i': 1
+                }, {
+                    'i': 2
+                }],
+            name='sweep')
+
+    assert [r.succeeded for r in results] == [True, False, True]
+    assert isinstance(results[1].error, kfp_server_api.ApiException)
+    assert results[1].run is None
+    assert results[2].run.run_id == 'r-2'
+
+
+@pytest.mark.parametrize(
+    'test_case', [
+        TestCase(
+            name='experiment not found raises before submitting',
+            config={
+                'pipeline': 'my-pipe',
+                'kwargs': {
+                    'experiment': 'missing'
+                }
+            },
+            expected_status=FAILED,
+            expected_error=ValueError,
+            expected_error_match='Experiment not found',
+        ),
+        TestCase(
+            name='archive file raises',
+            config={
+                'pipeline': '/path/to/file.tar.gz',
+                'kwargs': {}
+            },
+            expected_status=FAILED,
+            expected_error=ValueError,
+            expected_error_match='Archive files',
+        ),
+        TestCase(
+            name='invalid max_workers raises',
+            config={
+                'pipeline': 'my-pipe',
+                'kwargs': {
+                    'max_workers': 0
+                }
+            },
+            expected_status=FAILED,
+            expected_error=ValueError,
+            expected_error_match='max_workers must be at least 1',
+        ),
+    ],
+    ids=lambda tc: tc.name)
+def test_run_many_validation(backend, test_case):
+    with patch.object(
+            backend, '_get_experiment_id_by_name', return_value=None), \
+         patch.object(backend.run_api,
+                      'run_service_create_run') as mock_create:
+        with pytest.raises(
+                test_case.expected_error, match=test_case.expected_error_match):
+            backend.run_many(test_case.config['pipeline'], [{}],
+                             **test_case.config['kwargs'])
+    mock_create.assert_not_called()
+
+
+def test_run_many_empty_params_list(backend):
+    version = kfp_server_api.V2beta1PipelineVersion(
+        pipeline_id='pid-1', pipeline_version_id='vid-1')
+    with patch.object(backend.run_api, 'run_service_create_run') as mock_create:
+        assert backend.run_many(version, []) == []
+    mock_create.assert_not_called()
+
+
+def test_run_many_rate_limited(backend):
+    version = kfp_server_api.V2beta1PipelineVersion(
+        pipeline_id='pid-1', pipeline_version_id='vid-1')
+    with patch.object(utils.RateLimiter, 'acquire') as mock_acquire, \
+         patch.object(backend.run_api, 'run_service_create_run',
+                      side_effect=_create_run_echo):
+        backend.run_many(version, [{}] * 5, max_runs_per_second=100)
+    assert mock_acquire.call_count == 5
+
+
+def test_rate_limiter_spaces_calls():
+    now = 0.0
+    sleeps = []
+
+    def sleep(seconds):
+        nonlocal now
+        sleeps.append(seconds)
+        now += seconds
+
+    limiter = utils.RateLimiter(4, clock=lambda: now, sleep=sleep)
+    for _ in range(3):
+        limiter.acquire()
+    assert sleeps == [0.25, 0.25]
+
+    now += 10
+    limiter.acquire()
+    assert sleeps == [0.25, 0.25]
+
+
+def test_rate_limiter_rejects_non_positive_rate():
+    with pytest.raises(ValueError, match='Rate must be positive'):
+        utils.RateLimiter(0)
+
+
+def test_connection_pool_sized_for_concurrent_submission(backend):
+    assert backend.api_config.connection_pool_maxsize >= 16
+
+
 # ------------------------------------------------------------------
 # test_list_runs
 # ------------------------------------------------------------------
@@ -1629,6 +1839,151 @@ def test_wait_for_run_status(backend, test_case):
                     callback.assert_called_once_with(side_effects[0])
 
 
+# ------------------------------------------------------------------
+# test_wait_for_runs
+# ------------------------------------------------------------------
+
+
+def _runs_page(*states):
+    return Mock(
+        runs=[
+            Mock(run_id=run_id, state=state, created_at=None)
+            for run_id, state in states
+        ],
+        next_page_token='')
+
+
+def test_wait_for_runs_yields_runs_as_they_finish(backend):
+    pages = [
+        _runs_page(('r-1', 'SUCCEEDED'), ('r-2', 'RUNNING'),
+                   ('r-3', 'RUNNING')),
+        _runs_page(('r-2', 'RUNNING'), ('r-3', 'FAILED')),
+        _runs_page(('r-2', 'SUCCEEDED')),
+    ]
+    callback = Mock()
+    with patch.object(
+            backend.run_api, 'run_service_list_runs',
+            side_effect=pages) as mock_list, \
+         patch.object(backend.run_api, 'run_service_get_run') as mock_get, \
+         patch(f'{_BACKEND_MODULE}.time.sleep'):
+        finished = [
+            run.run_id for run in backend.wait_for_runs([
+                'r-1', 'r-2',
+                Mock(spec=kfp_server_api.V2beta1Run, run_id='r-3')
+            ],
+                                                        callbacks=[callback])
+        ]
+
+    assert finished == ['r-1', 'r-3', 'r-2']
+    assert callback.call_count == 3
+    assert mock_list.call_count == 3
+    mock_get.assert_not_called()
+    predicate = json.loads(
+        mock_list.call_args_list[0].kwargs['filter'])['predicates'][0]
+    assert predicate['operation'] == 'IN'
+    assert predicate['key'] == 'run_id'
+    assert predicate['stringValues']['values'] == ['r-1', 'r-2', 'r-3']
+
+
+def test_wait_for_runs_fetches_unlisted_runs_individually(backend):
+    with patch.object(
+            backend.run_api,
+            'run_service_list_runs',
+            return_value=_runs_page(('r-1', 'SUCCEEDED'))), \
+         patch.object(
+            backend.run_api,
+            'run_service_get_run',
+            return_value=Mock(run_id='r-2', state='SUCCEEDED')) as mock_get:
+        finished = [run.run_id for run in backend.wait_for_runs(['r-1', 'r-2'])]
+
+    assert finished == ['r-1', 'r-2']
+    mock_get.assert_called_once_with(run_id='r-2')
+
+
+def test_wait_for_runs_falls_back_when_filter_unsupported(backend):
+    get_responses = [
+        Mock(run_id='r-1', state='RUNNING', created_at=None),
+        Mock(run_id='r-1', state='SUCCEEDED', created_at=None),
+    ]
+    with patch.object(
+            backend.run_api,
+            'run_service_list_runs',
+            side_effect=kfp_server_api.ApiException(status=400)) as mock_list, \
+         patch.object(backend.run_api, 'run_service_get_run',
+                      side_effect=get_responses), \
+         patch(f'{_BACKEND_MODULE}.time.sleep'):
+        finished = list(backend.wait_for_runs(['r-1']))
+
+    assert [run.state for run in finished] == ['SUCCEEDED']
+    mock_list.assert_called_once()
+
+
+def test_wait_for_runs_backs_off_while_no_run_finishes(backend):
+    pages = [_runs_page(('r-1', 'RUNNING'), ('r-2', 'RUNNING'))] * 5 + [
+        _runs_page(('r-1', 'SUCCEEDED'), ('r-2', 'RUNNING')),
+        _runs_page(('r-2', 'SUCCEEDED')),
+    ]
+    with patch.object(
+            backend.run_api, 'run_service_list_runs', side_effect=pages), \
+         patch(f'{_BACKEND_MODULE}.time.sleep') as mock_sleep:
+        list(
+            backend.wait_for_runs(['r-1', 'r-2'],
+                                  polling_interval=2,
+                                  max_polling_interval=5))
+
+    intervals = [call.args[0] for call in mock_sleep.call_args_list]
+    assert intervals == pytest.approx([3, 4.5, 5, 5, 5, 2])
+
+
+def test_wait_for_runs_polls_old_runs_less_often(backend):
+    created_at = (
+        datetime.datetime.now(datetime.timezone.utc) -
+        datetime.timedelta(minutes=10))
+    pages = [
+        Mock(
+            runs=[Mock(run_id='r-1', state='RUNNING', created_at=created_at)],
+            next_page_token=''),
+        _runs_page(('r-1', 'SUCCEEDED')),
+    ]
+    with patch.object(
+            backend.run_api, 'run_service_list_runs', side_effect=pages), \
+         patch(f'{_BACKEND_MODULE}.time.sleep') as mock_sleep:
+        list(
+            backend.wait_for_runs(['r-1'],
+                                  polling_interval=1,
+                                  max_polling_interval=45))
+
+    mock_sleep.assert_called_once_with(45)
+
+
+def test_wait_for_runs_timeout(backend):
+    with patch.object(
+            backend.run_api,
+            'run_service_list_runs',
+            return_value=_runs_page(('r-1', 'SUCCEEDED'), ('r-2', 'RUNNING'))):
+        runs = backend.wait_for_runs(['r-1', 'r-2'], timeout=0)
+        assert next(runs).run_id == 'r-1'
+        with pytest.raises(TimeoutError, match=r"\['r-2'\]"):
+            next(runs)
+
+
+def test_wait_for_runs_refreshes_expired_credentials(backend):
+    side_effects = [
+        _runs_page(('r-1', 'RUNNING')),
+        kfp_server_api.ApiException(status=401),
+        _runs_page(('r-1', 'SUCCEEDED')),
+    ]
+    with patch.object(
+            backend.run_api, 'run_service_list_runs',
+            side_effect=side_effects), \
+         patch.object(backend, 'refresh_credentials') as mock_refresh, \
+         patch(f'{_BACKEND_MODULE}.time.sleep'):
+        finished = list(backend.wait_for_runs(['r-1']))
+
+    mock_refresh.assert_called_once()
+    assert [run.state for run in finished] == ['SUCCEEDED']
+
+
 # ------------------------------------------------------------------
 # test_create_experiment
 # ------------------------------------------------------------------
@@ -2546,3 +2901,191 @@ def test__resolve_experiment_id(backend, test_case):
                     test_case.expected_error,
                     match=test_case.expected_error_match):
                 backend._resolve_experiment_id(experiment)
+
+
+# ------------------------------------------------------------------
+# test_name_cache
+# ------------------------------------------------------------------
+
+
+def test_name_cache_serves_repeated_resolutions(backend):
+    with patch.object(
+            backend.pipelines_api,
+            'pipeline_service_list_pipelines',
+            return_value=Mock(pipelines=[Mock(
+                pipeline_id='pid-1')])) as mock_list:
+        for _ in range(3):
+            assert backend._get_pipeline_id_by_name('my-pipeline') == 'pid-1'
+
+    mock_list.assert_called_once()
+    assert backend.get_name_cache_stats() == NameCacheStats(
+        hits=2, misses=1, entries=1)
+
+
+def test_name_cache_does_not_cache_missing_names(backend):
+    with patch.object(
+            backend.experiment_api,
+            'experiment_service_list_experiments',
+            return_value=Mock(experiments=[])) as mock_list:
+        assert backend._get_experiment_id_by_name('my-exp') is None
+        assert backend._get_experiment_id_by_name('my-exp') is None
+
+    assert mock_list.call_count == 2
+    assert backend.get_name_cache_stats() == NameCacheStats(
+        hits=0, misses=2, entries=0)
+
+
+def test_name_cache_disabled_with_zero_ttl(make_backend):
+    backend = make_backend(name_cache_ttl=0)
+    with patch.object(
+            backend.pipelines_api,
+            'pipeline_service_list_pipelines',
+            return_value=Mock(pipelines=[Mock(
+                pipeline_id='pid-1')])) as mock_list:
+        backend._get_pipeline_id_by_name('my-pipeline')
+        backend._get_pipeline_id_by_name('my-pipeline')
+
+    assert mock_list.call_count == 2
+
+
+def test_latest_version_not_cached(backend):
+    versions = [
+        Mock(pipeline_versions=[Mock(pipeline_version_id='vid-1')]),
+        Mock(pipeline_versions=[Mock(pipeline_version_id='vid-2')]),
+    ]
+    with patch.object(
+            backend.pipelines_api,
+            'pipeline_service_list_pipeline_versions',
+            side_effect=versions):
+        assert backend._get_latest_version_id('pid-1') == 'vid-1'
+        # uploaded by another client
+        assert backend._get_latest_version_id('pid-1') == 'vid-2'
+
+    assert backend.get_name_cache_stats().entries == 0
+
+
+def test_name_cache_expires_entries():
+    now = 0.0
+    cache = NameCache(ttl=10, clock=lambda: now)
+    resolve = Mock(return_value='pid-1')
+    key = ('ns', 'pipeline', 'my-pipeline')
+
+    cache.get_or_resolve(key, resolve)
+    now = 9.0
+    cache.get_or_resolve(key, resolve)
+    assert resolve.call_count == 1
+
+    now = 10.0
+    assert cache.stats().entries == 0
+    cache.get_or_resolve(key, resolve)
+    assert resolve.call_count == 2
+    assert cache.stats() == NameCacheStats(hits=1, misses=2, entries=1)
+
+
+def test_name_cache_invalidation_is_namespace_scoped():
+    cache = NameCache(ttl=60)
+    cache.get_or_resolve(('ns-a', 'version', 'pid-1', 'v1'), lambda: 'vid-1')
+    cache.get_or_resolve(('ns-a', 'version', 'pid-2', 'v1'), lambda: 'vid-2')
+    cache.get_or_resolve(('ns-b', 'version', 'pid-1', 'v1'), lambda: 'vid-3')
+
+    cache.invalidate('ns-a', 'version', 'pid-1')
+
+    assert cache.stats().entries == 2
+    resolve = Mock(return_value='vid-4')
+    cache.get_or_resolve(('ns-a', 'version', 'pid-1', 'v1'), resolve)
+    cache.get_or_resolve(('ns-b', 'version', 'pid-1', 'v1'), resolve)
+    resolve.assert_called_once()
+
+
+def test_name_cache_rejects_negative_ttl():
+    with pytest.raises(ValueError, match='name_cache_ttl must be >= 0'):
+        NameCache(ttl=-1)
+
+
+def test_clear_name_cache(backend):
+    with patch.object(
+            backend.experiment_api,
+            'experiment_service_list_experiments',
+            return_value=Mock(experiments=[Mock(experiment_id='exp-1')])):
+        backend._get_experiment_id_by_name('my-exp')
+        backend._get_experiment_id_by_name('my-exp')
+
+    backend.clear_name_cache()
+    assert backend.get_name_cache_stats() == NameCacheStats()
+
+
+def _delete_pipeline(backend):
+    with patch.object(backend.pipelines_api,
+                      'pipeline_service_delete_pipeline'):
+        backend.delete_pipeline('my-pipeline', force=True)
+
+
+def _delete_pipeline_version(backend):
+    with patch.object(backend.pipelines_api,
+                      'pipeline_service_delete_pipeline_version'):
+        backend.delete_pipeline('my-pipeline', version='v1')
+
+
+def _upload_pipeline_version(backend):
+    with patch.object(backend, '_resolve_pipeline_to_file', return_value=(
+            '/tmp/p.yaml', None)), \
+         patch.object(backend.upload_api, 'upload_pipeline_version'):
+        backend.upload_pipeline('/tmp/p.yaml', name='my-pipeline')
+
+
+def _create_experiment(backend):
+    with patch.object(backend.experiment_api,
+                      'experiment_service_list_experiments',
+                      return_value=Mock(experiments=[])), \
+         patch.object(backend.experiment_api,
+                      'experiment_service_create_experiment'):
+        backend.create_experiment('new-exp')
+
+
+def _delete_experiment(backend):
+    with patch.object(backend.experiment_api,
+                      'experiment_service_delete_experiment'):
+        backend.delete_experiment('my-exp')
+
+
+@pytest.mark.parametrize(
+    'test_case', [
+        TestCase(
+            name='delete pipeline drops pipeline and versions',
+            config={'operation': _delete_pipeline},
+            expected_output={'pipeline', 'version'},
+        ),
+        TestCase(
+            name='delete version drops versions',
+            config={'operation': _delete_pipeline_version},
+            expected_output={'version'},
+        ),
+        TestCase(
+            name='upload version drops versions',
+            config={'operation': _upload_pipeline_version},
+            expected_output={'version'},
+        ),
+        TestCase(
+            name='create experiment keeps other names',
+            config={'operation': _create_experiment},
+            expected_output=set(),
+        ),
+        TestCase(
+            name='delete experiment drops experiment',
+            config={'operation': _delete_experiment},
+            expected_output={'experiment'},
+        ),
+    ],
+    ids=lambda tc: tc.name)
+def test_name_cache_invalidated_by_mutations(backend, test_case):
+    cache = backend._name_cache
+    cache.get_or_resolve(('test-ns', 'pipeline', 'my-pipeline'),
+                         lambda: 'pid-1')
+    cache.get_or_resolve(('test-ns', 'version', 'pid-1', 'v1'), lambda: 'vid-1')
+    cache.get_or_resolve(('test-ns', 'experiment', 'my-exp'), lambda: 'exp-1')
+
+    test_case.config['operation'](backend)
+
+    remaining = {key[1] for key in cache._entries}
+    expected = {'pipeline', 'version', 'experiment'}
+    assert remaining == expected - test_case.expected_output
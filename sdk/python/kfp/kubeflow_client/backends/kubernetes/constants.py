@@ -22,3 +22,10 @@ KFP_SA_TOKEN_PATH = '/var/run/secrets/kubeflow/pipelines/token'
 K8S_SA_TOKEN_PATH = '/var/run/secrets/kubernetes.io/serviceaccount/token'
 TOKEN_PATH_ENV = 'KF_PIPELINES_SA_TOKEN_PATH'
 ENDPOINT_ENV = 'KF_PIPELINES_ENDPOINT'
+
+# Pooled HTTP connections to the API server. Sized for run_many(), which
+# submits runs from up to this many threads.
+CONNECTION_POOL_MAXSIZE = 16
+
+# Run IDs per list call when polling many runs in wait_for_runs().
+LIST_RUNS_BY_ID_BATCH_SIZE = 100
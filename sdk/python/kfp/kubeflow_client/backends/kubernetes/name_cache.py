@@ -0,0 +1,102 @@
+# Copyright The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""TTL cache for name-to-ID resolutions of the Kubernetes backend."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import threading
+import time
+
+from kfp.kubeflow_client.backends.kubernetes.types import NameCacheStats
+
+NameCacheKey = tuple[str, ...]
+
+
+class NameCache:
+    """Thread-safe cache of resolved IDs that expire after a TTL.
+
+    Keys are tuples that start with the namespace and the kind of the
+    resolved name (for example ``(namespace, 'pipeline', name)``), so
+    entries of different namespaces never collide. Only successful
+    resolutions are cached: a name that did not resolve is looked up
+    again on the next call, so objects created by other clients are
+    found immediately. IDs of objects deleted by other clients may be
+    served until their entry expires.
+
+    Args:
+        ttl: Seconds an entry is served for. ``0`` disables the cache.
+        clock: Monotonic clock used to expire entries.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl < 0:
+            raise ValueError(f'name_cache_ttl must be >= 0, got {ttl!r}.')
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: dict[NameCacheKey, tuple[str, float]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get_or_resolve(
+        self,
+        key: NameCacheKey,
+        resolve: Callable[[], str | None],
+    ) -> str | None:
+        """Return the cached ID for key, or call resolve and cache its
+        result."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                self._hits += 1
+                return entry[0]
+            self._entries.pop(key, None)
+            self._misses += 1
+
+        # resolve outside the lock so that slow API calls do not serialize
+        # lookups of unrelated names
+        value = resolve()
+        if value is not None and self._ttl > 0:
+            with self._lock:
+                self._entries[key] = (value, self._clock() + self._ttl)
+        return value
+
+    def invalidate(self, *prefix: str) -> None:
+        """Drop every entry whose key starts with prefix."""
+        length = len(prefix)
+        with self._lock:
+            for key in [k for k in self._entries if k[:length] == prefix]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> NameCacheStats:
+        """Return a snapshot of the cache counters."""
+        now = self._clock()
+        with self._lock:
+            entries = sum(
+                1 for _, expiry in self._entries.values() if expiry > now)
+            return NameCacheStats(
+                hits=self._hits, misses=self._misses, entries=entries)
@@ -16,6 +16,9 @@
 from __future__ import annotations
 
 import dataclasses
+from typing import Any
+
+from kfp.kubeflow_client.types import Run
 
 
 @dataclasses.dataclass
@@ -35,6 +38,8 @@ class KubernetesBackendConfig:
             ``False`` for http).
         custom_ca: Path to PEM-encoded root certificates.
         namespace: Kubernetes namespace. If omitted, auto-detected.
+        name_cache_ttl: Seconds for which pipeline, version and experiment
+            name-to-ID resolutions are cached. ``0`` disables the cache.
     """
 
     base_url: str | None = None
@@ -42,6 +47,7 @@ class KubernetesBackendConfig:
     is_secure: bool | None = None
     custom_ca: str | None = None
     namespace: str | None = None
+    name_cache_ttl: float = 60.0
 
     def __repr__(self) -> str:
         token_display = '***' if self.user_token else None
@@ -50,4 +56,40 @@ class KubernetesBackendConfig:
                 f'user_token={token_display!r}, '
                 f'is_secure={self.is_secure!r}, '
                 f'custom_ca={self.custom_ca!r}, '
-                f'namespace={self.namespace!r})')
+                f'namespace={self.namespace!r}, '
+                f'name_cache_ttl={self.name_cache_ttl!r})')
+
+
+@dataclasses.dataclass(frozen=True)
+class NameCacheStats:
+    """Statistics of a backend's name-to-ID resolution cache.
+
+    Attributes:
+        hits: Number of resolutions served from the cache.
+        misses: Number of resolutions that queried the API server.
+        entries: Number of resolutions currently cached.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    entries: int = 0
+
+
+@dataclasses.dataclass
+class RunResult:
+    """Outcome of one run submitted by ``run_many``.
+
+    Attributes:
+        params: Pipeline parameters the run was submitted with.
+        run: The created run, or ``None`` if the submission failed.
+        error: The exception the submission raised, if any.
+    """
+
+    params: dict[str, Any] | None
+    run: Run | None = None
+    error: Exception | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the run was created."""
+        return self.error is None
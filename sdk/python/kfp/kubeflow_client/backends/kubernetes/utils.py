@@ -15,9 +15,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 import logging
 import os
 import ssl
+import threading
+import time
 
 from kfp.kubeflow_client.backends.kubernetes import constants
 
@@ -157,3 +160,36 @@ def resolve_namespace(configured_namespace: str | None) -> str:
         'Namespace not resolved from cluster or kubeconfig; '
         'using default %r.', constants.DEFAULT_NAMESPACE)
     return constants.DEFAULT_NAMESPACE
+
+
+class RateLimiter:
+    """Spaces calls out to at most ``rate`` per second across threads.
+
+    Args:
+        rate: Maximum number of acquisitions per second.
+        clock: Monotonic clock.
+        sleep: Function used to wait for the next slot.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError(f'Rate must be positive, got {rate!r}.')
+        self._interval = 1.0 / rate
+        self._clock = clock
+        self._sleep = sleep
+        self._next_slot = float('-inf')
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the caller may make its call."""
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            self._sleep(slot - now)
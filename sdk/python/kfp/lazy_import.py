@@ -0,0 +1,64 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Module attributes that are imported on first use (PEP 562)."""
+
+import importlib
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+
+def lazy_attributes(
+    module_globals: Dict[str, Any],
+    attributes: Mapping[str, str],
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Returns the module-level __getattr__ and __dir__ of a package whose
+    attributes are imported on first use.
+
+    Usage in a package's __init__.py::
+
+        __getattr__, __dir__ = lazy_import.lazy_attributes(
+            globals(), {'Client': 'kfp.client'})
+
+    Submodules of the package also resolve as attributes without being
+    imported explicitly, as they did when the package imported them
+    eagerly.
+
+    Args:
+        module_globals: The globals() of the package. Resolved attributes
+            are cached in it, so __getattr__ runs once per attribute.
+        attributes: Maps attribute names to the module they are imported
+            from.
+
+    Returns:
+        A tuple of (__getattr__, __dir__).
+    """
+    module_name = module_globals['__name__']
+
+    def __getattr__(name: str) -> Any:
+        if name in attributes:
+            value = getattr(importlib.import_module(attributes[name]), name)
+            module_globals[name] = value
+            return value
+        if not name.startswith('__'):
+            try:
+                return importlib.import_module(f'{module_name}.{name}')
+            except ModuleNotFoundError as e:
+                if e.name != f'{module_name}.{name}':
+                    raise
+        raise AttributeError(
+            f'module {module_name!r} has no attribute {name!r}')
+
+    def __dir__() -> List[str]:
+        return sorted([*module_globals, *attributes])
+
+    return __getattr__, __dir__
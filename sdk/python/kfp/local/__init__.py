@@ -14,12 +14,33 @@
 """The `kfp.local` module contains objects for running KFP components
 locally."""
 
-from kfp.local.config import DockerRunner
-from kfp.local.config import init
-from kfp.local.config import SubprocessRunner
+from typing import Dict, TYPE_CHECKING
+
+from kfp import lazy_import
 
 __all__ = [
     'init',
     'SubprocessRunner',
     'DockerRunner',
+    'get_cache_stats',
+    'CacheStats',
 ]
+
+# imported on first use (PEP 562) so that `import kfp.local` does not
+# import the local runner's dependencies
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    'init': 'kfp.local.config',
+    'SubprocessRunner': 'kfp.local.config',
+    'DockerRunner': 'kfp.local.config',
+    'get_cache_stats': 'kfp.local.cache',
+    'CacheStats': 'kfp.local.cache',
+}
+
+if TYPE_CHECKING:
+    from kfp.local.cache import CacheStats
+    from kfp.local.cache import get_cache_stats
+    from kfp.local.config import DockerRunner
+    from kfp.local.config import init
+    from kfp.local.config import SubprocessRunner
+
+__getattr__, __dir__ = lazy_import.lazy_attributes(globals(), _LAZY_ATTRIBUTES)
@@ -12,13 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """File-based local task output cache for kfp.local."""
+import contextlib
+import dataclasses
 import hashlib
 import json
 import logging
 import os
+import re
+import sqlite3
 import tempfile
 import threading
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, Iterator, List, Optional
 
 from kfp import dsl
 from kfp.dsl import executor
@@ -26,45 +31,197 @@ from kfp.dsl import executor
 _ARTIFACT_MARKER = '__kfp_artifact__'
 _ARTIFACT_LIST_MARKER = '__kfp_artifact_list__'
 
+_INDEX_FILE_NAME = 'index.sqlite'
+_INDEX_TIMEOUT_SECONDS = 60
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    component_name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    output_size INTEGER NOT NULL,
+    last_access REAL NOT NULL,
+    artifact_paths TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_by_last_access ON entries (last_access);
+CREATE TABLE IF NOT EXISTS fingerprints (
+    path TEXT PRIMARY KEY,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS stats (
+    component_name TEXT PRIMARY KEY,
+    hits INTEGER NOT NULL,
+    misses INTEGER NOT NULL,
+    bytes_saved INTEGER NOT NULL
+);
+"""
+_FINGERPRINT_CHUNK_SIZE = 1024 * 1024
+_HEX_KEY_PATTERN = re.compile('[0-9a-f]{4,}')
+
+
+@dataclasses.dataclass
+class ComponentCacheStats:
+    """Cache statistics of one component.
+
+    Attributes:
+        hits: Number of cache lookups that returned outputs.
+        misses: Number of cache lookups that did not return outputs.
+        bytes_saved: Total size of the outputs served from the cache.
+    """
+    hits: int = 0
+    misses: int = 0
+    bytes_saved: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups that were cache hits, or 0.0 if there were no
+        lookups."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclasses.dataclass
+class CacheStats(ComponentCacheStats):
+    """Statistics of a local cache, accumulated across runs and processes.
+
+    Attributes:
+        hits: Number of cache lookups that returned outputs.
+        misses: Number of cache lookups that did not return outputs.
+        bytes_saved: Total size of the outputs served from the cache.
+        entries: Number of entries in the cache.
+        entry_bytes: Total size of the cache's entry files.
+        max_entry_bytes: Byte budget of the cache's entry files, or None if unbounded.
+        per_component: Statistics keyed by component name.
+    """
+    entries: int = 0
+    entry_bytes: int = 0
+    max_entry_bytes: Optional[int] = None
+    per_component: Dict[str, ComponentCacheStats] = dataclasses.field(
+        default_factory=dict)
+
 
 class LocalCache:
-    """Thread-safe, file-backed cache for local task outputs.
+    """Process- and thread-safe, file-backed cache for local task outputs.
 
     Cache entries are keyed by a SHA256 of (component_name, image,
-    full_command, arguments). Each entry is a small JSON file on disk.
-    Artifact outputs are referenced by URI — on retrieval, if the
-    referenced file no longer exists, the entry is treated as a cache
-    miss.
+    full_command, arguments). Each entry is a small JSON file, stored
+    under two levels of key prefix directories (``ab/cd/abcd....json``)
+    so that no directory grows unboundedly. A SQLite index next to the
+    entries records each entry's size, last access time and local
+    artifact files, along with hit/miss statistics.
+
+    Artifact arguments participate in the key by URI, or, if
+    fingerprint_artifacts is set, by a SHA256 of their contents, so that
+    identical inputs stored at different paths share cache entries and
+    inputs rewritten in place do not. Artifact outputs are referenced by
+    URI — on retrieval, if a
+    referenced local file no longer exists, the entry is removed and
+    treated as a cache miss.
+
+    If max_entry_bytes is set, least recently used entries are removed
+    once the total size of the entry files exceeds it. It bounds the
+    entries only: the artifact files an entry references belong to the
+    run that produced them and are neither counted nor deleted by the
+    cache.
     """
 
-    def __init__(self, cache_root: str) -> None:
+    def __init__(
+        self,
+        cache_root: str,
+        max_entry_bytes: Optional[int] = None,
+        fingerprint_artifacts: bool = False,
+    ) -> None:
+        if max_entry_bytes is not None and max_entry_bytes < 1:
+            raise ValueError(
+                f'max_entry_bytes must be at least 1. Got: {max_entry_bytes}.')
         self.cache_root = cache_root
+        self.max_entry_bytes = max_entry_bytes
+        self.fingerprint_artifacts = fingerprint_artifacts
         os.makedirs(self.cache_root, exist_ok=True)
-        self._lock = threading.Lock()
+        self._index_path = os.path.join(self.cache_root, _INDEX_FILE_NAME)
+        with self._connect() as conn:
+            conn.executescript(_INDEX_SCHEMA)
+        self._migrate_flat_entries()
 
     # ----- key computation -----
 
-    @staticmethod
-    def _serialize_value_for_key(value: Any) -> Any:
+    def _serialize_value_for_key(self, value: Any) -> Any:
         """Serializes a Python value to a JSON-friendly form for key
         computation."""
         if isinstance(value, dsl.Artifact):
-            return {
+            serialized = {
                 _ARTIFACT_MARKER: True,
                 'schema_title': type(value).schema_title,
                 'name': value.name,
                 'uri': value.uri,
                 'metadata': value.metadata,
             }
+            if (self.fingerprint_artifacts and value.uri and
+                    not _is_remote_uri(value.uri) and
+                    os.path.exists(value.uri)):
+                # the content identifies the artifact, wherever it is stored
+                del serialized['name']
+                del serialized['uri']
+                serialized['fingerprint'] = self.fingerprint(value.uri)
+            return serialized
         if isinstance(value, list):
-            return [LocalCache._serialize_value_for_key(v) for v in value]
+            return [self._serialize_value_for_key(v) for v in value]
         if isinstance(value, dict):
             return {
-                k: LocalCache._serialize_value_for_key(v)
-                for k, v in value.items()
+                k: self._serialize_value_for_key(v) for k, v in value.items()
             }
         return value
 
+    def fingerprint(self, path: str) -> str:
+        """Returns a SHA256 fingerprint of the contents of a file or directory
+        tree.
+
+        Files are read in chunks, so they need not fit in memory. The
+        digest of each file is memoized in the index by (inode, size,
+        mtime), so unchanged files are only read once.
+        """
+        path = os.path.abspath(path)
+        with self._connect() as conn:
+            if not os.path.isdir(path):
+                return self._file_fingerprint(conn, path)
+            h = hashlib.sha256()
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    file_path = os.path.join(dirpath, filename)
+                    h.update(os.path.relpath(file_path, path).encode('utf-8'))
+                    h.update(b'\0')
+                    h.update(
+                        self._file_fingerprint(conn, file_path).encode('utf-8'))
+                    h.update(b'\0')
+            return h.hexdigest()
+
+    @staticmethod
+    def _file_fingerprint(conn: sqlite3.Connection, path: str) -> str:
+        stat = os.stat(path)
+        file_version = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        row = conn.execute(
+            'SELECT digest FROM fingerprints WHERE path = ? AND inode = ? AND '
+            'size = ? AND mtime_ns = ?', (path,) + file_version).fetchone()
+        if row is not None:
+            return row[0]
+
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_FINGERPRINT_CHUNK_SIZE), b''):
+                h.update(chunk)
+        digest = h.hexdigest()
+        # don't memoize a digest of a file that changed while it was read
+        stat = os.stat(path)
+        if (stat.st_ino, stat.st_size, stat.st_mtime_ns) == file_version:
+            conn.execute(
+                'INSERT OR REPLACE INTO fingerprints '
+                '(path, inode, size, mtime_ns, digest) VALUES (?, ?, ?, ?, ?)',
+                (path,) + file_version + (digest,))
+        return digest
+
     def compute_key(
         self,
         component_name: str,
@@ -106,52 +263,262 @@ class LocalCache:
             json.dumps(dict(env_vars or {}), sort_keys=True).encode('utf-8'))
         return h.hexdigest()
 
+    # ----- index -----
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # a connection per operation keeps the cache usable from any thread
+        # and process; SQLite's file locking serializes the writers
+        conn = sqlite3.connect(
+            self._index_path,
+            timeout=_INDEX_TIMEOUT_SECONDS,
+            isolation_level=None,
+        )
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield conn
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            conn.execute('COMMIT')
+
+    @staticmethod
+    def _record_lookup(
+        conn: sqlite3.Connection,
+        component_name: str,
+        hit: bool,
+        bytes_saved: int = 0,
+    ) -> None:
+        conn.execute(
+            'INSERT INTO stats (component_name, hits, misses, bytes_saved) '
+            'VALUES (?, ?, ?, ?) ON CONFLICT (component_name) DO UPDATE SET '
+            'hits = hits + excluded.hits, '
+            'misses = misses + excluded.misses, '
+            'bytes_saved = bytes_saved + excluded.bytes_saved',
+            (component_name, int(hit), int(not hit), bytes_saved),
+        )
+
+    def _evict(self, conn: sqlite3.Connection) -> List[str]:
+        """Removes least recently used entries from the index until the entries
+        fit max_entry_bytes.
+
+        Returns:
+            The keys of the removed entries.
+        """
+        if self.max_entry_bytes is None:
+            return []
+        (entry_bytes,) = conn.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()
+        evicted = []
+        if entry_bytes > self.max_entry_bytes:
+            cursor = conn.execute(
+                'SELECT key, size FROM entries ORDER BY last_access, rowid')
+            for key, size in cursor:
+                if entry_bytes <= self.max_entry_bytes:
+                    break
+                evicted.append(key)
+                entry_bytes -= size
+            cursor.close()
+            conn.executemany('DELETE FROM entries WHERE key = ?',
+                             [(key,) for key in evicted])
+        return evicted
+
     # ----- read/write -----
 
     def _entry_path(self, key: str) -> str:
-        return os.path.join(self.cache_root, f'{key}.json')
+        shard = key if _HEX_KEY_PATTERN.fullmatch(key) else hashlib.sha256(
+            key.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_root, shard[:2], shard[2:4],
+                            f'{key}.json')
 
-    def get(self, key: str) -> Optional[Dict[str, Any]]:
+    def _remove(self, key: str) -> None:
+        with self._connect() as conn:
+            conn.execute('DELETE FROM entries WHERE key = ?', (key,))
+        _remove_file(self._entry_path(key))
+
+    def get(
+        self,
+        key: str,
+        component_name: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
         """Retrieves cached outputs for `key`, or None on cache miss.
 
         Returns None if the cache entry references an artifact file that
         no longer exists on disk (to avoid returning stale/broken URIs).
+
+        Args:
+            key: The cache key.
+            component_name: Component to attribute the lookup to in the cache statistics.
         """
-        entry_path = self._entry_path(key)
-        with self._lock:
-            if not os.path.exists(entry_path):
+        component_name = component_name or ''
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT output_size, artifact_paths FROM entries WHERE key = ?',
+                (key,)).fetchone()
+            if row is None:
+                self._record_lookup(conn, component_name, hit=False)
                 return None
+        output_size, artifact_paths = row
+
+        outputs = None
+        missing_paths = [
+            path for path in json.loads(artifact_paths)
+            if not os.path.exists(path)
+        ]
+        if missing_paths:
+            logging.info(
+                f'Cache entry for key {key} references missing artifact '
+                f'{missing_paths[0]}. Treating as cache miss.')
+        else:
+            entry_path = self._entry_path(key)
             try:
                 with open(entry_path) as f:
-                    serialized = json.load(f)
+                    outputs = self._deserialize_outputs(json.load(f))
+            except FileNotFoundError:
+                # evicted by another process since the index lookup
+                pass
             except (OSError, json.JSONDecodeError) as e:
                 logging.warning(f'Failed to read cache entry {entry_path}: {e}')
-                return None
 
-        try:
-            return self._deserialize_outputs(serialized)
-        except _MissingArtifactError as e:
-            logging.info(
-                f'Cache entry for key {key} references missing artifact '
-                f'{e.uri}. Treating as cache miss.')
+        if outputs is None:
+            self._remove(key)
+            with self._connect() as conn:
+                self._record_lookup(conn, component_name, hit=False)
             return None
 
-    def put(self, key: str, outputs: Dict[str, Any]) -> None:
-        """Persists `outputs` under `key`, atomically."""
+        with self._connect() as conn:
+            conn.execute('UPDATE entries SET last_access = ? WHERE key = ?',
+                         (time.time(), key))
+            self._record_lookup(
+                conn, component_name, hit=True, bytes_saved=output_size)
+        return outputs
+
+    def put(
+        self,
+        key: str,
+        outputs: Dict[str, Any],
+        component_name: Optional[str] = None,
+    ) -> None:
+        """Persists `outputs` under `key`, atomically.
+
+        If the entries then exceed max_entry_bytes, least recently used
+        entries are evicted.
+
+        Args:
+            key: The cache key.
+            outputs: The task outputs.
+            component_name: Component that produced the outputs.
+        """
+        self._store(key, self._serialize_outputs(outputs), component_name or '')
+
+    def _store(
+        self,
+        key: str,
+        serialized: Dict[str, Any],
+        component_name: str,
+    ) -> None:
+        data = json.dumps(serialized).encode('utf-8')
+        artifact_paths = local_artifact_paths(serialized)
+        output_size = len(data) + sum(
+            _disk_usage(path) for path in artifact_paths)
+
         entry_path = self._entry_path(key)
-        serialized = self._serialize_outputs(outputs)
-        with self._lock:
-            # Atomic write: write to a tempfile in the same directory, rename.
-            fd, tmp_path = tempfile.mkstemp(
-                prefix='.kfp_cache_', suffix='.tmp', dir=self.cache_root)
+        entry_dir = os.path.dirname(entry_path)
+        os.makedirs(entry_dir, exist_ok=True)
+        # Atomic write: write to a tempfile in the same directory, rename.
+        fd, tmp_path = tempfile.mkstemp(
+            prefix='.kfp_cache_', suffix='.tmp', dir=entry_dir)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, entry_path)
+        except BaseException:
+            _remove_file(tmp_path)
+            raise
+
+        with self._transaction() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO entries '
+                '(key, component_name, size, output_size, last_access, '
+                'artifact_paths) VALUES (?, ?, ?, ?, ?, ?)',
+                (key, component_name, len(data), output_size, time.time(),
+                 json.dumps(artifact_paths)),
+            )
+            evicted = self._evict(conn)
+        for evicted_key in evicted:
+            _remove_file(self._entry_path(evicted_key))
+
+    def _migrate_flat_entries(self) -> None:
+        """Moves entries written in the flat layout of earlier versions
+        (``<cache_root>/<key>.json``) into the sharded layout."""
+        with os.scandir(self.cache_root) as dir_entries:
+            flat_entry_paths = [
+                dir_entry.path
+                for dir_entry in dir_entries
+                if dir_entry.name.endswith('.json') and
+                not dir_entry.name.startswith('.') and dir_entry.is_file()
+            ]
+        for path in flat_entry_paths:
             try:
-                with os.fdopen(fd, 'w') as f:
-                    json.dump(serialized, f)
-                os.replace(tmp_path, entry_path)
-            except Exception:
-                if os.path.exists(tmp_path):
-                    os.remove(tmp_path)
-                raise
+                with open(path) as f:
+                    serialized = json.load(f)
+            except FileNotFoundError:
+                # migrated by another process
+                continue
+            except (OSError, json.JSONDecodeError) as e:
+                logging.warning(
+                    f'Discarding unreadable cache entry {path}: {e}')
+            else:
+                self._store(
+                    os.path.basename(path)[:-len('.json')],
+                    serialized,
+                    component_name='',
+                )
+            _remove_file(path)
+
+    # ----- statistics -----
+
+    def stats(self) -> CacheStats:
+        """Returns the cache statistics, accumulated across runs and processes.
+
+        Lookups that were not attributed to a component count towards
+        the totals, but are not listed in per_component.
+        """
+        with self._connect() as conn:
+            entries, entry_bytes = conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries'
+            ).fetchone()
+            rows = conn.execute('SELECT component_name, hits, misses, '
+                                'bytes_saved FROM stats').fetchall()
+        per_component = {
+            component_name:
+                ComponentCacheStats(
+                    hits=hits, misses=misses, bytes_saved=bytes_saved)
+            for component_name, hits, misses, bytes_saved in rows
+            if component_name
+        }
+        return CacheStats(
+            hits=sum(row[1] for row in rows),
+            misses=sum(row[2] for row in rows),
+            bytes_saved=sum(row[3] for row in rows),
+            entries=entries,
+            entry_bytes=entry_bytes,
+            max_entry_bytes=self.max_entry_bytes,
+            per_component=per_component,
+        )
+
+    def reset_stats(self) -> None:
+        """Clears the hit/miss statistics, keeping the cache entries."""
+        with self._connect() as conn:
+            conn.execute('DELETE FROM stats')
 
     # ----- (de)serialization of outputs -----
 
@@ -201,14 +568,9 @@ class LocalCache:
 
     @staticmethod
     def _deserialize_artifact(data: Dict[str, Any]) -> dsl.Artifact:
-        uri = data.get('uri', '')
-        # Treat missing local-file artifacts as a cache miss. Remote
-        # artifacts (gs://, s3://, etc.) we have to trust.
-        if uri and not _is_remote_uri(uri) and not os.path.exists(uri):
-            raise _MissingArtifactError(uri)
         runtime_artifact = {
             'name': data.get('name', ''),
-            'uri': uri,
+            'uri': data.get('uri', ''),
             'metadata': data.get('metadata', {}) or {},
             'type': {
                 'schemaTitle': data.get('schema_title', 'system.Artifact'),
@@ -217,13 +579,6 @@ class LocalCache:
         return executor.create_artifact_instance(runtime_artifact)
 
 
-class _MissingArtifactError(Exception):
-
-    def __init__(self, uri: str) -> None:
-        super().__init__(f'Artifact file missing: {uri}')
-        self.uri = uri
-
-
 _REMOTE_URI_PREFIXES = ('gs://', 's3://', 'minio://', 'oci://', 'http://',
                         'https://')
 
@@ -232,6 +587,63 @@ def _is_remote_uri(uri: str) -> bool:
     return uri.startswith(_REMOTE_URI_PREFIXES)
 
 
+def serialize_outputs(outputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns a JSON-serializable form of task outputs.
+
+    Artifacts are serialized by reference (name, URI and metadata);
+    their files are not copied.
+    """
+    return LocalCache._serialize_outputs(outputs)
+
+
+def deserialize_outputs(serialized: Dict[str, Any]) -> Dict[str, Any]:
+    """Restores task outputs serialized by serialize_outputs."""
+    return LocalCache._deserialize_outputs(serialized)
+
+
+def local_artifact_paths(serialized: Dict[str, Any]) -> List[str]:
+    """Returns the local files referenced by serialized outputs.
+
+    Remote artifacts (gs://, s3://, etc.) are not included; we have to
+    trust that they still exist.
+    """
+    paths = []
+    for value in serialized.values():
+        if isinstance(value, dict) and value.get(_ARTIFACT_LIST_MARKER):
+            artifacts = value.get('artifacts', [])
+        elif isinstance(value, dict) and value.get(_ARTIFACT_MARKER):
+            artifacts = [value]
+        else:
+            continue
+        paths.extend(
+            artifact['uri']
+            for artifact in artifacts
+            if artifact.get('uri') and not _is_remote_uri(artifact['uri']))
+    return paths
+
+
+def _disk_usage(path: str) -> int:
+    """Returns the size of a file or directory tree, or 0 if it does not
+    exist."""
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    size = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                size += os.path.getsize(os.path.join(dirpath, filename))
+            except OSError:
+                pass
+    return size
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
 # ----- config helpers -----
 
 _cache_singleton_lock = threading.Lock()
@@ -254,14 +666,48 @@ def get_local_cache() -> Optional[LocalCache]:
     cache_root = getattr(cfg, 'cache_root', None) or os.path.join(
         cfg.pipeline_root, '.kfp_cache')
 
+    max_entry_bytes = getattr(cfg, 'cache_max_entry_bytes', None)
+    fingerprint_artifacts = getattr(cfg, 'cache_fingerprint_artifacts', False)
+
     global _cache_singleton, _cache_singleton_root
     with _cache_singleton_lock:
-        if (_cache_singleton is None or _cache_singleton_root != cache_root):
-            _cache_singleton = LocalCache(cache_root=cache_root)
+        if (_cache_singleton is None or _cache_singleton_root != cache_root or
+                _cache_singleton.max_entry_bytes != max_entry_bytes or
+                _cache_singleton.fingerprint_artifacts
+                != fingerprint_artifacts):
+            _cache_singleton = LocalCache(
+                cache_root=cache_root,
+                max_entry_bytes=max_entry_bytes,
+                fingerprint_artifacts=fingerprint_artifacts,
+            )
             _cache_singleton_root = cache_root
     return _cache_singleton
 
 
+def get_cache_stats() -> CacheStats:
+    """Returns statistics of the local task output cache.
+
+    Statistics are stored with the cache, so they accumulate across runs
+    and processes that share a cache root.
+
+    Returns:
+        The hits, misses, hit ratio, bytes saved and per-component statistics of the cache, along with its number of entries and total size.
+
+    Raises:
+        RuntimeError: If local execution is not initialized, or caching is not enabled.
+    """
+    # Lazy import to avoid circular import at module load time.
+    from kfp.local import config
+
+    config.LocalExecutionConfig.validate()
+    local_cache = get_local_cache()
+    if local_cache is None:
+        raise RuntimeError(
+            'Local caching is not enabled. Run '
+            "'kfp.local.init(..., enable_caching=True)' to enable it.")
+    return local_cache.stats()
+
+
 def reset_local_cache_singleton() -> None:
     """Test hook: clears the module-level cache singleton."""
     global _cache_singleton, _cache_singleton_root
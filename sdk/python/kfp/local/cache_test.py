@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests for kfp.local.cache."""
+from concurrent import futures
+import hashlib
+import json
 import os
 import tempfile
 import threading
@@ -220,6 +223,272 @@ class LocalCachePutGetTest(unittest.TestCase):
             self.assertEqual(self.cache.get(f'k{i}'), {'i': i})
 
 
+class LocalCacheFingerprintTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp(prefix='kfp-cache-test-')
+        self.addCleanup(self._rmtree)
+        self.cache = cache.LocalCache(
+            cache_root=os.path.join(self.tmpdir, 'cache'),
+            fingerprint_artifacts=True)
+
+    def _rmtree(self):
+        import shutil
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _write(self, relpath: str, content: str) -> str:
+        path = os.path.join(self.tmpdir, relpath)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def _key(self, uri: str) -> str:
+        return self.cache.compute_key(
+            component_name='c',
+            image='img',
+            full_command=[],
+            arguments={'art': dsl.Dataset(name='data', uri=uri)},
+        )
+
+    def test_same_content_different_uri_same_key(self):
+        k1 = self._key(self._write('run1/data', 'rows'))
+        k2 = self._key(self._write('run2/data', 'rows'))
+        self.assertEqual(k1, k2)
+
+    def test_rewritten_in_place_different_key(self):
+        path = self._write('data', 'rows')
+        k1 = self._key(path)
+        self._write('data', 'other rows')
+        self.assertNotEqual(k1, self._key(path))
+
+    def test_directory_fingerprint(self):
+        self._write('run1/data/a.csv', 'a')
+        self._write('run1/data/sub/b.csv', 'b')
+        self._write('run2/data/a.csv', 'a')
+        self._write('run2/data/sub/b.csv', 'b')
+        k1 = self._key(os.path.join(self.tmpdir, 'run1/data'))
+        k2 = self._key(os.path.join(self.tmpdir, 'run2/data'))
+        self.assertEqual(k1, k2)
+
+        os.rename(
+            os.path.join(self.tmpdir, 'run2/data/sub/b.csv'),
+            os.path.join(self.tmpdir, 'run2/data/sub/c.csv'))
+        self.assertNotEqual(k1,
+                            self._key(os.path.join(self.tmpdir, 'run2/data')))
+
+    def test_fingerprint_memoized_by_file_version(self):
+        path = self._write('data', 'rows')
+        digest = self.cache.fingerprint(path)
+        stat = os.stat(path)
+        # same inode, size and mtime: the memoized digest is returned
+        with open(path, 'w') as f:
+            f.write('ROWS')
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(self.cache.fingerprint(path), digest)
+        # memo is shared through the index
+        other = cache.LocalCache(cache_root=self.cache.cache_root)
+        self.assertEqual(other.fingerprint(path), digest)
+
+    def test_large_file(self):
+        path = os.path.join(self.tmpdir, 'large')
+        with open(path, 'wb') as f:
+            f.write(b'x' * (3 * 1024 * 1024 + 7))
+        with open(path, 'rb') as f:
+            expected = hashlib.sha256(f.read()).hexdigest()
+        self.assertEqual(self.cache.fingerprint(path), expected)
+
+    def test_remote_uri_keyed_by_uri(self):
+        self.assertNotEqual(
+            self._key('gs://bucket/run1/data'),
+            self._key('gs://bucket/run2/data'))
+
+    def test_disabled_by_default(self):
+        c = cache.LocalCache(cache_root=os.path.join(self.tmpdir, 'cache'))
+        self.assertFalse(c.fingerprint_artifacts)
+        k1 = c.compute_key(
+            component_name='c',
+            image='img',
+            full_command=[],
+            arguments={
+                'art': dsl.Dataset(uri=self._write('run1/data', 'rows'))
+            },
+        )
+        k2 = c.compute_key(
+            component_name='c',
+            image='img',
+            full_command=[],
+            arguments={
+                'art': dsl.Dataset(uri=self._write('run2/data', 'rows'))
+            },
+        )
+        self.assertNotEqual(k1, k2)
+
+
+def _put_from_process(cache_root: str, i: int) -> None:
+    cache.LocalCache(cache_root=cache_root).put(f'k{i}', {'i': i})
+
+
+class LocalCacheStorageTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp(prefix='kfp-cache-test-')
+        self.addCleanup(self._rmtree)
+        self.cache_root = os.path.join(self.tmpdir, 'cache')
+
+    def _rmtree(self):
+        import shutil
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _write_artifact(self, name: str, size: int) -> dsl.Artifact:
+        path = os.path.join(self.tmpdir, name)
+        with open(path, 'w') as f:
+            f.write('x' * size)
+        return dsl.Artifact(name=name, uri=path)
+
+    def test_entries_are_sharded_by_key_prefix(self):
+        c = cache.LocalCache(cache_root=self.cache_root)
+        key = c.compute_key(
+            component_name='c',
+            image='python:3.11',
+            full_command=['python'],
+            arguments={},
+        )
+        c.put(key, {'out': 1})
+        self.assertTrue(
+            os.path.isfile(
+                os.path.join(self.cache_root, key[:2], key[2:4],
+                             f'{key}.json')))
+        self.assertEqual(c.get(key), {'out': 1})
+
+    def test_flat_entries_are_migrated(self):
+        os.makedirs(self.cache_root)
+        key = 'ab' * 32
+        with open(os.path.join(self.cache_root, f'{key}.json'), 'w') as f:
+            json.dump({'out': 'legacy'}, f)
+
+        c = cache.LocalCache(cache_root=self.cache_root)
+        self.assertFalse(
+            os.path.exists(os.path.join(self.cache_root, f'{key}.json')))
+        self.assertEqual(c.get(key), {'out': 'legacy'})
+        self.assertEqual(c.stats().entries, 1)
+
+    def test_evicts_least_recently_used(self):
+        c = cache.LocalCache(cache_root=self.cache_root, max_entry_bytes=2500)
+        c.put('a', {'out': 'x' * 1000})
+        c.put('b', {'out': 'x' * 1000})
+        self.assertIsNotNone(c.get('a'))
+        c.put('c', {'out': 'x' * 1000})
+
+        self.assertIsNotNone(c.get('a'))
+        self.assertIsNone(c.get('b'))
+        self.assertIsNotNone(c.get('c'))
+        self.assertFalse(os.path.exists(c._entry_path('b')))
+        stats = c.stats()
+        self.assertEqual(stats.entries, 2)
+        self.assertLessEqual(stats.entry_bytes, 2500)
+        self.assertEqual(stats.max_entry_bytes, 2500)
+
+    def test_artifact_files_do_not_count_towards_max_entry_bytes(self):
+        c = cache.LocalCache(cache_root=self.cache_root, max_entry_bytes=2500)
+        c.put('a', {'out': self._write_artifact('a', 2000)})
+        c.put('b', {'out': self._write_artifact('b', 2000)})
+
+        # artifact files belong to the run, not the cache
+        self.assertIsNotNone(c.get('a'))
+        self.assertIsNotNone(c.get('b'))
+        stats = c.stats()
+        self.assertEqual(stats.entries, 2)
+        self.assertLess(stats.entry_bytes, 2500)
+
+    def test_missing_artifact_removes_entry(self):
+        artifact = self._write_artifact('gone', 10)
+        c = cache.LocalCache(cache_root=self.cache_root)
+        c.put('k', {'out': artifact})
+        os.remove(artifact.uri)
+        self.assertIsNone(c.get('k'))
+        self.assertEqual(c.stats().entries, 0)
+        self.assertFalse(os.path.exists(c._entry_path('k')))
+
+    def test_invalid_max_entry_bytes(self):
+        with self.assertRaisesRegex(
+                ValueError, r'max_entry_bytes must be at least 1\. Got: 0\.'):
+            cache.LocalCache(cache_root=self.cache_root, max_entry_bytes=0)
+
+    def test_writes_from_multiple_processes(self):
+        cache.LocalCache(cache_root=self.cache_root)
+        with futures.ProcessPoolExecutor(max_workers=4) as executor:
+            list(
+                executor.map(_put_from_process, [self.cache_root] * 20,
+                             range(20)))
+        c = cache.LocalCache(cache_root=self.cache_root)
+        for i in range(20):
+            self.assertEqual(c.get(f'k{i}'), {'i': i})
+        self.assertEqual(c.stats().entries, 20)
+
+
+class LocalCacheStatsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp(prefix='kfp-cache-test-')
+        self.addCleanup(self._rmtree)
+        self.cache = cache.LocalCache(cache_root=self.tmpdir)
+
+    def _rmtree(self):
+        import shutil
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_empty(self):
+        stats = self.cache.stats()
+        self.assertEqual(stats.hits, 0)
+        self.assertEqual(stats.misses, 0)
+        self.assertEqual(stats.hit_ratio, 0.0)
+        self.assertEqual(stats.entries, 0)
+        self.assertEqual(stats.per_component, {})
+
+    def test_hits_misses_and_bytes_saved(self):
+        artifact_path = os.path.join(self.tmpdir, 'art.txt')
+        with open(artifact_path, 'w') as f:
+            f.write('x' * 100)
+        self.cache.put(
+            'k', {'out': dsl.Artifact(name='out', uri=artifact_path)},
+            component_name='comp-a')
+        self.assertIsNone(self.cache.get('other', component_name='comp-a'))
+        self.assertIsNotNone(self.cache.get('k', component_name='comp-a'))
+        self.assertIsNotNone(self.cache.get('k', component_name='comp-a'))
+        self.assertIsNone(self.cache.get('other', component_name='comp-b'))
+
+        stats = self.cache.stats()
+        self.assertEqual(stats.hits, 2)
+        self.assertEqual(stats.misses, 2)
+        self.assertEqual(stats.hit_ratio, 0.5)
+        self.assertEqual(stats.entries, 1)
+        self.assertEqual(stats.entry_bytes,
+                         os.path.getsize(self.cache._entry_path('k')))
+        self.assertEqual(stats.bytes_saved, 2 * (stats.entry_bytes + 100))
+        self.assertEqual(
+            stats.per_component['comp-a'],
+            cache.ComponentCacheStats(
+                hits=2, misses=1, bytes_saved=stats.bytes_saved))
+        self.assertEqual(stats.per_component['comp-b'].hit_ratio, 0.0)
+
+    def test_stats_persist_across_instances(self):
+        self.cache.put('k', {'out': 1})
+        self.cache.get('k', component_name='comp-a')
+        stats = cache.LocalCache(cache_root=self.tmpdir).stats()
+        self.assertEqual(stats.hits, 1)
+        self.assertEqual(stats.entries, 1)
+
+    def test_reset_stats(self):
+        self.cache.put('k', {'out': 1})
+        self.cache.get('k', component_name='comp-a')
+        self.cache.reset_stats()
+        stats = self.cache.stats()
+        self.assertEqual(stats.hits, 0)
+        self.assertEqual(stats.per_component, {})
+        self.assertEqual(stats.entries, 1)
+
+
 class LocalCacheSingletonTest(unittest.TestCase):
     """Tests for the module-level singleton helpers that gate caching behind
     the LocalExecutionConfig."""
@@ -278,6 +547,48 @@ class LocalCacheSingletonTest(unittest.TestCase):
         self.assertIsNotNone(c)
         self.assertEqual(c.cache_root, custom)
 
+    def test_cache_max_entry_bytes_respected(self):
+        from kfp.local import config as local_config
+        local_config.init(
+            runner=local_config.SubprocessRunner(use_venv=False),
+            pipeline_root=self.tmpdir,
+            enable_caching=True,
+            cache_max_entry_bytes=1024,
+        )
+        self.assertEqual(cache.get_local_cache().max_entry_bytes, 1024)
+
+    def test_cache_fingerprint_artifacts_respected(self):
+        from kfp.local import config as local_config
+        local_config.init(
+            runner=local_config.SubprocessRunner(use_venv=False),
+            pipeline_root=self.tmpdir,
+            enable_caching=True,
+            cache_fingerprint_artifacts=True,
+        )
+        self.assertTrue(cache.get_local_cache().fingerprint_artifacts)
+
+    def test_get_cache_stats(self):
+        from kfp.local import config as local_config
+        local_config.init(
+            runner=local_config.SubprocessRunner(use_venv=False),
+            pipeline_root=self.tmpdir,
+            enable_caching=True,
+        )
+        cache.get_local_cache().get('k', component_name='comp-a')
+        stats = cache.get_cache_stats()
+        self.assertEqual(stats.misses, 1)
+        self.assertIn('comp-a', stats.per_component)
+
+    def test_get_cache_stats_when_caching_disabled(self):
+        from kfp.local import config as local_config
+        local_config.init(
+            runner=local_config.SubprocessRunner(use_venv=False),
+            pipeline_root=self.tmpdir,
+        )
+        with self.assertRaisesRegex(RuntimeError,
+                                    r'Local caching is not enabled'):
+            cache.get_cache_stats()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,232 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Cooperative cancellation of running local tasks.
+
+Work started within a cancellation_scope (for example, the iterations of
+a dsl.ParallelFor) can be cancelled as a whole. Task handlers register
+how to stop what they are running with on_cancel; cancelling the scope
+stops every registered process or container, and tasks that have not
+started yet check is_cancelled before starting.
+
+Scopes are carried in a ContextVar. The shared executor runs submitted
+work in a copy of the submitter's context, so scopes reach the worker
+threads that run a scope's tasks, and scopes nest: cancelling a scope
+cancels the scopes opened within it.
+"""
+import contextlib
+import contextvars
+import logging
+import os
+import signal
+import subprocess
+import threading
+import time
+from typing import Callable, Iterator, List, Optional
+
+# time a terminated process or container gets to exit before it is killed
+TERMINATE_GRACE_PERIOD_SECONDS = 10.0
+# how often a terminated process is checked for having exited
+_EXIT_POLL_INTERVAL_SECONDS = 0.1
+
+
+class CancellationScope:
+    """A group of work that is cancelled together."""
+
+    def __init__(self, parent: Optional['CancellationScope'] = None) -> None:
+        self._parent = parent
+        self._cancelled = False
+        self._callbacks: List[Callable[[], None]] = []
+        self._children: List['CancellationScope'] = []
+        self._lock = threading.Lock()
+        if parent is not None:
+            parent._add_child(self)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Cancels the scope and the scopes within it, calling every registered
+        callback once."""
+        with self._lock:
+            if self._cancelled:
+                return
+            self._cancelled = True
+            callbacks, self._callbacks = self._callbacks, []
+            children = list(self._children)
+        for callback in callbacks:
+            _call_safely(callback)
+        for child in children:
+            child.cancel()
+
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        """Calls callback when the scope is cancelled, or right away if it
+        already is."""
+        with self._lock:
+            if not self._cancelled:
+                self._callbacks.append(callback)
+                return
+        _call_safely(callback)
+
+    def remove_callback(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def _add_child(self, child: 'CancellationScope') -> None:
+        with self._lock:
+            self._children.append(child)
+            cancelled = self._cancelled
+        if cancelled:
+            child.cancel()
+
+    def _remove_child(self, child: 'CancellationScope') -> None:
+        with self._lock:
+            if child in self._children:
+                self._children.remove(child)
+
+    def close(self) -> None:
+        """Detaches the scope from its parent once its work is done."""
+        if self._parent is not None:
+            self._parent._remove_child(self)
+
+
+def _call_safely(callback: Callable[[], None]) -> None:
+    try:
+        callback()
+    except Exception as e:
+        logging.warning(f'Failed to cancel a running task: {e}')
+
+
+_current_scope: contextvars.ContextVar[
+    Optional[CancellationScope]] = contextvars.ContextVar(
+        'kfp_local_cancellation_scope', default=None)
+
+
+@contextlib.contextmanager
+def cancellation_scope() -> Iterator[CancellationScope]:
+    """Context manager that opens a new scope within the current one."""
+    scope = CancellationScope(parent=_current_scope.get())
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+        scope.close()
+
+
+def is_cancelled() -> bool:
+    """Returns whether the current scope has been cancelled."""
+    scope = _current_scope.get()
+    return scope is not None and scope.cancelled
+
+
+@contextlib.contextmanager
+def on_cancel(callback: Callable[[], None]) -> Iterator[None]:
+    """Context manager that calls callback if the current scope is cancelled
+    while in its scope, including if it already was."""
+    scope = _current_scope.get()
+    if scope is None:
+        yield
+        return
+    scope.add_callback(callback)
+    try:
+        yield
+    finally:
+        scope.remove_callback(callback)
+
+
+def terminate_process(
+    process: subprocess.Popen,
+    grace_period: Optional[float] = None,
+) -> None:
+    """Sends SIGTERM to a process, and SIGKILL if it is still running after the
+    grace period.
+
+    If the process leads its own process group, as processes started
+    with start_new_session=True do, the whole group is signalled so that
+    the processes it started are stopped too. Does not block; the
+    process and its group are watched until they have exited or the
+    grace period is over.
+    """
+    if process.poll() is not None:
+        return
+    process_group = _get_process_group(process)
+    _send_signal(process, process_group, signal.SIGTERM)
+    watcher = threading.Thread(
+        target=_kill_after_grace_period,
+        args=(process, process_group, TERMINATE_GRACE_PERIOD_SECONDS
+              if grace_period is None else grace_period),
+        name=f'kfp-terminate-{process.pid}',
+        daemon=True,
+    )
+    watcher.start()
+
+
+def _get_process_group(process: subprocess.Popen) -> Optional[int]:
+    if not hasattr(os, 'killpg'):
+        return None
+    try:
+        process_group = os.getpgid(process.pid)
+    except ProcessLookupError:
+        return None
+    return process_group if process_group == process.pid else None
+
+
+def _send_signal(
+    process: subprocess.Popen,
+    process_group: Optional[int],
+    sig: int,
+) -> None:
+    try:
+        if process_group is None:
+            process.send_signal(sig)
+        else:
+            os.killpg(process_group, sig)
+    except ProcessLookupError:
+        pass
+
+
+def _kill_after_grace_period(
+    process: subprocess.Popen,
+    process_group: Optional[int],
+    grace_period: float,
+) -> None:
+    deadline = time.monotonic() + grace_period
+    while not _has_exited(process, process_group):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            _send_signal(process, process_group, signal.SIGKILL)
+            return
+        time.sleep(min(remaining, _EXIT_POLL_INTERVAL_SECONDS))
+
+
+def _has_exited(process: subprocess.Popen,
+                process_group: Optional[int]) -> bool:
+    if process.poll() is None:
+        return False
+    if process_group is None:
+        return True
+    # the group can outlive its leader, e.g. if the leader was a shell that
+    # exited on SIGTERM while its children ignore it. The group ID cannot be
+    # reused as a process ID while any member remains, and it is no longer
+    # signalled once the group is seen empty.
+    try:
+        os.killpg(process_group, 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        # the ID now belongs to a group of another user
+        return True
+    return False
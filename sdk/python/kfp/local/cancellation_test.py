@@ -0,0 +1,158 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for cancellation.py."""
+import shlex
+import signal
+import subprocess
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+from kfp.local import cancellation
+
+
+class TestCancellationScope(unittest.TestCase):
+
+    def test_not_cancelled_outside_scope(self):
+        self.assertFalse(cancellation.is_cancelled())
+        with cancellation.on_cancel(self.fail):
+            pass
+
+    def test_cancel_calls_callbacks_once(self):
+        calls = []
+        with cancellation.cancellation_scope() as scope:
+            with cancellation.on_cancel(lambda: calls.append('registered')):
+                scope.cancel()
+                scope.cancel()
+            self.assertTrue(cancellation.is_cancelled())
+            # registered after cancellation: called right away
+            with cancellation.on_cancel(lambda: calls.append('late')):
+                pass
+        self.assertEqual(calls, ['registered', 'late'])
+        self.assertFalse(cancellation.is_cancelled())
+
+    def test_callback_not_called_after_exit(self):
+        with cancellation.cancellation_scope() as scope:
+            with cancellation.on_cancel(self.fail):
+                pass
+            scope.cancel()
+
+    def test_cancel_reaches_nested_scopes(self):
+        with cancellation.cancellation_scope() as outer:
+            with cancellation.cancellation_scope() as inner:
+                outer.cancel()
+                self.assertTrue(inner.cancelled)
+
+    def test_nested_cancel_does_not_reach_outer_scope(self):
+        with cancellation.cancellation_scope() as outer:
+            with cancellation.cancellation_scope() as inner:
+                inner.cancel()
+            self.assertFalse(outer.cancelled)
+            self.assertFalse(cancellation.is_cancelled())
+
+    def test_failing_callback_does_not_stop_others(self):
+        calls = []
+
+        def fail() -> None:
+            raise RuntimeError('boom')
+
+        with cancellation.cancellation_scope() as scope:
+            with cancellation.on_cancel(fail), cancellation.on_cancel(
+                    lambda: calls.append('called')):
+                with self.assertLogs(level='WARNING') as logs:
+                    scope.cancel()
+        self.assertEqual(calls, ['called'])
+        self.assertIn('boom', logs.output[0])
+
+
+class TestTerminateProcess(unittest.TestCase):
+
+    def start_process(self, code: str, shell: bool = False) -> subprocess.Popen:
+        command = [sys.executable, '-c', code]
+        if shell:
+            # the shell runs python as a child rather than exec'ing it
+            command = ['sh', '-c', f'{shlex.join(command)}; echo done']
+        process = subprocess.Popen(
+            command, stdout=subprocess.PIPE, text=True, start_new_session=shell)
+        self.addCleanup(process.wait)
+        self.addCleanup(process.kill)
+        self.addCleanup(process.stdout.close)
+        # wait until the process is running its code
+        process.stdout.readline()
+        return process
+
+    def test_terminates(self):
+        process = self.start_process(
+            'import time; print(flush=True); time.sleep(60)')
+        cancellation.terminate_process(process, grace_period=30)
+        self.assertEqual(process.wait(timeout=10), -signal.SIGTERM)
+
+    def test_kills_after_grace_period(self):
+        process = self.start_process(
+            'import signal, time; '
+            'signal.signal(signal.SIGTERM, signal.SIG_IGN); '
+            'print(flush=True); time.sleep(60)')
+        start_time = time.monotonic()
+        cancellation.terminate_process(process, grace_period=0.5)
+        self.assertEqual(process.wait(timeout=10), -signal.SIGKILL)
+        self.assertGreaterEqual(time.monotonic() - start_time, 0.5)
+
+    def test_terminates_process_group(self):
+        process = self.start_process(
+            'import time; print(flush=True); time.sleep(60)', shell=True)
+        cancellation.terminate_process(process, grace_period=30)
+        self.assertEqual(process.wait(timeout=10), -signal.SIGTERM)
+        # reaches EOF once the python child has exited as well
+        self.assertEqual(process.stdout.read(), '')
+
+    def test_kills_process_group_after_leader_exits(self):
+        # the shell exits on SIGTERM but its python child ignores it
+        process = self.start_process(
+            'import signal, time; '
+            'signal.signal(signal.SIGTERM, signal.SIG_IGN); '
+            'print(flush=True); time.sleep(60)',
+            shell=True)
+        cancellation.terminate_process(process, grace_period=0.5)
+        self.assertEqual(process.wait(timeout=10), -signal.SIGTERM)
+        # reaches EOF once the python child has been killed as well
+        self.assertEqual(process.stdout.read(), '')
+
+    def test_stops_watching_once_process_group_exits(self):
+        process = self.start_process(
+            'import time; print(flush=True); time.sleep(60)', shell=True)
+        with mock.patch.object(
+                cancellation, '_send_signal',
+                wraps=cancellation._send_signal) as send_signal:
+            cancellation.terminate_process(process, grace_period=30)
+            process.wait(timeout=10)
+            # members that exited are only gone once they are reaped
+            deadline = time.monotonic() + 10
+            while any(thread.name == f'kfp-terminate-{process.pid}'
+                      for thread in threading.enumerate()):
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.05)
+        self.assertEqual([call.args[2] for call in send_signal.call_args_list],
+                         [signal.SIGTERM])
+
+    def test_exited_process(self):
+        process = self.start_process('print(flush=True)')
+        process.wait(timeout=10)
+        cancellation.terminate_process(process)
+        self.assertEqual(process.returncode, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,6 +19,7 @@ import tempfile
 from typing import Optional, Union
 
 from kfp import local
+from kfp.local import log_multiplexer
 
 
 class LocalRunnerType(abc.ABC):
@@ -44,13 +45,37 @@ class SubprocessRunner:
         use_venv: Whether to run the subprocess in a virtual environment. If True, dependencies will be installed in the virtual environment. If False, dependencies will be installed in the current environment. Using a virtual environment is recommended.
         serialize_pip_installs: Whether to serialize pip installations across parallel tasks to avoid race conditions. Only applies when use_venv=True. Default is True for safety.
         max_concurrent_pip_installs: Maximum number of concurrent pip installations when serialize_pip_installs=False. Default is 1.
+        reuse_venv: Whether to reuse virtual environments across tasks and runs. If True, each distinct set of packages to install is installed once into a persistent virtual environment under venv_cache_root, keyed by the Python interpreter, the packages and the pip index URLs. Only applies when use_venv=True.
+        venv_cache_root: Directory for reusable virtual environments. If None, defaults to `$XDG_CACHE_HOME/kfp/local_venvs` (or `~/.cache/kfp/local_venvs`).
+        max_cached_venvs: Maximum number of reusable virtual environments to keep. Least recently used environments are removed first. Default is 10.
+        use_worker_pool: Whether to run Lightweight Python Components on a pool of warm worker interpreters that already have the KFP executor imported, instead of starting a new interpreter per task. Requires use_venv=False or reuse_venv=True.
+        worker_recycle_after: Number of tasks after which a warm worker interpreter is replaced by a fresh one. Only applies when use_worker_pool=True. Default is 50.
     """
     use_venv: bool = True
     serialize_pip_installs: bool = True
     max_concurrent_pip_installs: int = 1
+    reuse_venv: bool = False
+    venv_cache_root: Optional[str] = None
+    max_cached_venvs: int = 10
+    use_worker_pool: bool = False
+    worker_recycle_after: int = 50
 
     def __post_init__(self):
         """Configure the pip install manager when the runner is created."""
+        if self.max_cached_venvs < 1:
+            raise ValueError(
+                f'max_cached_venvs must be at least 1. Got: {self.max_cached_venvs}.'
+            )
+        if self.worker_recycle_after < 1:
+            raise ValueError(
+                f'worker_recycle_after must be at least 1. Got: {self.worker_recycle_after}.'
+            )
+        if self.use_worker_pool and self.use_venv and not self.reuse_venv:
+            raise ValueError(
+                'use_worker_pool=True requires use_venv=False or reuse_venv=True, since a warm worker must outlive a single task\'s virtual environment.'
+            )
+        if self.venv_cache_root is not None:
+            self.venv_cache_root = os.path.abspath(self.venv_cache_root)
         if self.use_venv:
             # Lazy import to avoid circular imports
             from kfp.local.pip_install_manager import pip_install_manager
@@ -218,6 +243,12 @@ class LocalExecutionConfig:
         raise_on_error: bool,
         enable_caching: bool = False,
         cache_root: Optional[str] = None,
+        max_parallelism: int = 1,
+        cache_max_entry_bytes: Optional[int] = None,
+        cache_fingerprint_artifacts: bool = False,
+        console_logs: str = 'stream',
+        resume_run_id: Optional[str] = None,
+        continue_on_failure: bool = False,
     ) -> 'LocalExecutionConfig':
         # singleton pattern
         cls.instance = super(LocalExecutionConfig, cls).__new__(cls)
@@ -231,6 +262,12 @@ class LocalExecutionConfig:
         raise_on_error: bool,
         enable_caching: bool = False,
         cache_root: Optional[str] = None,
+        max_parallelism: int = 1,
+        cache_max_entry_bytes: Optional[int] = None,
+        cache_fingerprint_artifacts: bool = False,
+        console_logs: str = 'stream',
+        resume_run_id: Optional[str] = None,
+        continue_on_failure: bool = False,
     ) -> None:
         permitted_runners = (SubprocessRunner, DockerRunner)
         if not isinstance(runner, permitted_runners):
@@ -247,6 +284,23 @@ class LocalExecutionConfig:
         self.raise_on_error = raise_on_error
         self.enable_caching = enable_caching
         self.cache_root = cache_root
+        if max_parallelism < 1:
+            raise ValueError(
+                f'max_parallelism must be at least 1. Got: {max_parallelism}.')
+        self.max_parallelism = max_parallelism
+        if cache_max_entry_bytes is not None and cache_max_entry_bytes < 1:
+            raise ValueError(
+                f'cache_max_entry_bytes must be at least 1. Got: {cache_max_entry_bytes}.'
+            )
+        self.cache_max_entry_bytes = cache_max_entry_bytes
+        self.cache_fingerprint_artifacts = cache_fingerprint_artifacts
+        if console_logs not in log_multiplexer.CONSOLE_LOG_MODES:
+            raise ValueError(
+                f'Got unknown console_logs {console_logs!r}. Must be one of: '
+                f"{', '.join(log_multiplexer.CONSOLE_LOG_MODES)}.")
+        self.console_logs = console_logs
+        self.resume_run_id = resume_run_id
+        self.continue_on_failure = continue_on_failure
 
     @classmethod
     def validate(cls):
@@ -264,6 +318,12 @@ def init(
     raise_on_error: bool = True,
     enable_caching: bool = False,
     cache_root: Optional[str] = None,
+    max_parallelism: int = 1,
+    cache_max_entry_bytes: Optional[int] = None,
+    cache_fingerprint_artifacts: bool = False,
+    console_logs: str = 'stream',
+    resume_run_id: Optional[str] = None,
+    continue_on_failure: bool = False,
 ) -> None:
     """Initializes a local execution session.
 
@@ -276,6 +336,12 @@ def init(
         raise_on_error: If True, raises an exception when a local task execution fails. If False, fails gracefully and does not terminate the current program.
         enable_caching: If True, enables local task output caching (off by default). Tasks with `set_caching_options(enable_caching=False)` still bypass the cache.
         cache_root: Directory used to store cache entries. If None, defaults to `{pipeline_root}/.kfp_cache`.
+        max_parallelism: Maximum number of tasks to execute at once across the whole pipeline, outside of dsl.ParallelFor iterations. Defaults to 1, which runs tasks one at a time in topological order. If greater than 1, independent tasks whose upstream tasks have finished run concurrently up to this limit. Concurrent tasks must not share state outside their declared inputs and outputs, and their console output is interleaved. dsl.ParallelFor iterations are bounded by the loop's parallelism, or the number of CPUs if it sets none, regardless of this limit.
+        cache_max_entry_bytes: Byte budget of the local cache's entries, the files in cache_root that record the outputs of cached tasks. Once they exceed the budget, least recently used entries are evicted. This does not bound the disk usage of task outputs: the artifact files in pipeline_root that entries reference do not count towards the budget and are never deleted by the cache. If None, the number of entries is unbounded.
+        cache_fingerprint_artifacts: If True, input artifacts participate in cache keys by a SHA256 of their contents instead of their URI, so identical artifacts produced by different runs or pipeline roots result in cache hits, and artifacts rewritten in place do not. Each file is hashed once and memoized by inode, size and modification time.
+        console_logs: How task logs are shown while tasks run. Task logs are always written to `task.log` in each task's output directory. 'stream' prints each log line as it arrives, prefixed with the task name while several tasks run at once. 'compact' prints a periodic summary of the running tasks and, for failed tasks, the last lines of their logs.
+        resume_run_id: ID of an earlier local pipeline run to resume, as shown in the logs when a run fails. The run's directory in pipeline_root holds a journal of its task results. The next pipeline run after init reuses the results of tasks that succeeded in that run, and only run the tasks that failed or did not run, along with the tasks downstream of them. The pipeline and its arguments must be the same as in the original run. Later pipeline runs start new runs.
+        continue_on_failure: If False, the first failed iteration of a dsl.ParallelFor fails the loop at once: queued iterations are cancelled and running ones are terminated (their processes or containers get SIGTERM, then SIGKILL after a grace period). If True, every iteration runs to completion and all failed iterations are reported.
     """
     # updates a global config
     pipeline_root = os.path.abspath(pipeline_root)
@@ -291,6 +357,12 @@ def init(
         raise_on_error=raise_on_error,
         enable_caching=enable_caching,
         cache_root=cache_root,
+        max_parallelism=max_parallelism,
+        cache_max_entry_bytes=cache_max_entry_bytes,
+        cache_fingerprint_artifacts=cache_fingerprint_artifacts,
+        console_logs=console_logs,
+        resume_run_id=resume_run_id,
+        continue_on_failure=continue_on_failure,
     )
 
     # Reset the local cache singleton so a new LocalCache is created against
@@ -73,6 +73,81 @@ class LocalRunnerConfigTest(unittest.TestCase):
         )
         config.LocalExecutionConfig.validate()
 
+    def test_max_parallelism(self):
+        config.LocalExecutionConfig(
+            pipeline_root='my/local/root',
+            workspace_root='/tmp/test-workspace',
+            runner=local.SubprocessRunner(),
+            raise_on_error=True,
+        )
+        self.assertEqual(config.LocalExecutionConfig.instance.max_parallelism,
+                         1)
+
+        config.LocalExecutionConfig(
+            pipeline_root='my/local/root',
+            workspace_root='/tmp/test-workspace',
+            runner=local.SubprocessRunner(),
+            raise_on_error=True,
+            max_parallelism=4,
+        )
+        self.assertEqual(config.LocalExecutionConfig.instance.max_parallelism,
+                         4)
+
+    def test_continue_on_failure(self):
+        config.LocalExecutionConfig(
+            pipeline_root='my/local/root',
+            workspace_root='/tmp/test-workspace',
+            runner=local.SubprocessRunner(),
+            raise_on_error=True,
+        )
+        self.assertFalse(
+            config.LocalExecutionConfig.instance.continue_on_failure)
+
+        config.LocalExecutionConfig(
+            pipeline_root='my/local/root',
+            workspace_root='/tmp/test-workspace',
+            runner=local.SubprocessRunner(),
+            raise_on_error=True,
+            continue_on_failure=True,
+        )
+        self.assertTrue(
+            config.LocalExecutionConfig.instance.continue_on_failure)
+
+    def test_invalid_max_parallelism(self):
+        with self.assertRaisesRegex(ValueError,
+                                    r'max_parallelism must be at least 1'):
+            config.LocalExecutionConfig(
+                pipeline_root='my/local/root',
+                workspace_root='/tmp/test-workspace',
+                runner=local.SubprocessRunner(),
+                raise_on_error=True,
+                max_parallelism=0,
+            )
+
+    def test_invalid_cache_max_entry_bytes(self):
+        with self.assertRaisesRegex(
+                ValueError, r'cache_max_entry_bytes must be at least 1'):
+            config.LocalExecutionConfig(
+                pipeline_root='my/local/root',
+                workspace_root='/tmp/test-workspace',
+                runner=local.SubprocessRunner(),
+                raise_on_error=True,
+                cache_max_entry_bytes=0,
+            )
+
+    def test_invalid_console_logs(self):
+        with self.assertRaisesRegex(
+                ValueError,
+                r"Got unknown console_logs 'verbose'\. Must be one of: stream, compact\."
+        ):
+            config.LocalExecutionConfig(
+                pipeline_root='my/local/root',
+                workspace_root='/tmp/test-workspace',
+                runner=local.SubprocessRunner(),
+                raise_on_error=True,
+                console_logs='verbose',
+            )
+
     def test_validate_fail(self):
         with self.assertRaisesRegex(
                 RuntimeError,
@@ -127,6 +202,24 @@ class TestInitCalls(unittest.TestCase):
             local.init(runner='foo')
 
 
+class TestSubprocessRunner(unittest.TestCase):
+
+    def test_worker_pool_requires_shared_environment(self):
+        with self.assertRaisesRegex(
+                ValueError,
+                r'use_worker_pool=True requires use_venv=False or reuse_venv=True'
+        ):
+            local.SubprocessRunner(use_venv=True, use_worker_pool=True)
+        local.SubprocessRunner(use_venv=False, use_worker_pool=True)
+        local.SubprocessRunner(
+            use_venv=True, reuse_venv=True, use_worker_pool=True)
+
+    def test_invalid_worker_recycle_after(self):
+        with self.assertRaisesRegex(ValueError,
+                                    r'worker_recycle_after must be at least 1'):
+            local.SubprocessRunner(use_worker_pool=True, worker_recycle_after=0)
+
+
 class TestDockerRunner(unittest.TestCase):
 
     def test_import_error(self):
@@ -11,12 +11,19 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import collections
+import concurrent.futures
+import contextlib
+import contextvars
 import os
-from typing import Any, Dict, List, Optional
+import threading
+from typing import Any, Dict, Generator, Iterable, List, Optional
 
 import docker
 from kfp.dsl import constants as dsl_constants
+from kfp.local import cancellation
 from kfp.local import config
+from kfp.local import log_multiplexer
 from kfp.local import status
 from kfp.local import task_handler_interface
 
@@ -79,7 +86,15 @@ class DockerTaskHandler(task_handler_interface.ITaskHandler):
         # nest docker import in case not available in user env so that
         # this module is runnable, even if not using DockerRunner
         import docker
-        client = docker.from_env()
+
+        # reuse the client and image inventory of the current pipeline run
+        run_context = _active_run_context.get()
+        if run_context is None:
+            client = docker.from_env()
+            image_inventory = ImageInventory()
+        else:
+            client = run_context.client
+            image_inventory = run_context.image_inventory
         try:
             volumes = self.get_volumes_to_mount(client)
 
@@ -101,6 +116,7 @@ class DockerTaskHandler(task_handler_interface.ITaskHandler):
                         image=self.image,
                         command=self.full_command,
                         volumes=volumes,
+                        image_inventory=image_inventory,
                         **container_run_args)
             else:
                 return_code = run_docker_container(
@@ -108,9 +124,11 @@ class DockerTaskHandler(task_handler_interface.ITaskHandler):
                     image=self.image,
                     command=self.full_command,
                     volumes=volumes,
+                    image_inventory=image_inventory,
                     **container_run_args)
         finally:
-            client.close()
+            if run_context is None:
+                client.close()
         return status.Status.SUCCESS if return_code == 0 else status.Status.FAILURE
 
 
@@ -120,19 +138,123 @@ def add_latest_tag_if_not_present(image: str) -> str:
     return image
 
 
-def run_docker_container(client: 'docker.DockerClient', image: str,
-                         command: List[str], volumes: Dict[str, Any],
+class ImageInventory:
+    """Cache of which Docker images are present locally.
+
+    Each image is looked up with a direct images.get call at most once,
+    instead of listing every local image per task. An entry is
+    invalidated when the image is pulled. Concurrent tasks that need the
+    same missing image wait for a single pull.
+    """
+
+    def __init__(self) -> None:
+        self._present: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+        self._image_locks: Dict[str, threading.Lock] = collections.defaultdict(
+            threading.Lock)
+
+    def has_image(self, client: 'docker.DockerClient', image: str) -> bool:
+        """Whether image is present locally."""
+        with self._lock:
+            if image in self._present:
+                return self._present[image]
+        try:
+            client.images.get(image)
+            present = True
+        except docker.errors.ImageNotFound:
+            present = False
+        with self._lock:
+            self._present[image] = present
+        return present
+
+    def invalidate(self, image: str) -> None:
+        with self._lock:
+            self._present.pop(image, None)
+
+    def ensure_image(self, client: 'docker.DockerClient', image: str) -> None:
+        """Pulls image unless it is present locally."""
+        with self._lock:
+            image_lock = self._image_locks[image]
+        with image_lock:
+            if self.has_image(client, image):
+                print(f'Found image {image!r}\n')
+                return
+            print(f'Pulling image {image!r}')
+            try:
+                client.images.pull(image)
+            finally:
+                self.invalidate(image)
+            print('Image pull complete\n')
+
+
+class DockerRunContext:
+    """Docker state shared by all tasks of one pipeline run: a single
+    client and a single image inventory."""
+
+    def __init__(self) -> None:
+        self.client = docker.from_env()
+        self.image_inventory = ImageInventory()
+
+    def prepull(self, images: Iterable[str], max_workers: int = 4) -> None:
+        """Pulls all missing images concurrently.
+
+        Failures are reported and otherwise ignored; the task that needs
+        the image retries the pull and fails with the Docker error.
+
+        Args:
+            images: Images to pull.
+            max_workers: Maximum number of concurrent pulls.
+        """
+        images = sorted(
+            {add_latest_tag_if_not_present(image) for image in images})
+        if not images:
+            return
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.image_inventory.ensure_image, self.client,
+                                image):
+                    image for image in images
+            }
+            for future in concurrent.futures.as_completed(futures):
+                exc = future.exception()
+                if exc is not None:
+                    print(f'Could not pull image {futures[future]!r}: {exc}\n')
+
+    def close(self) -> None:
+        self.client.close()
+
+
+# Carried in a ContextVar so that pipeline runs in different threads each
+# see their own context; the scheduler runs tasks in the context of the
+# thread that submitted them.
+_active_run_context: contextvars.ContextVar[
+    Optional[DockerRunContext]] = contextvars.ContextVar(
+        'kfp_local_docker_run_context', default=None)
+
+
+@contextlib.contextmanager
+def docker_run_context() -> Generator[DockerRunContext, None, None]:
+    """Context manager that shares one DockerRunContext with every
+    DockerTaskHandler run inside it."""
+    run_context = DockerRunContext()
+    token = _active_run_context.set(run_context)
+    try:
+        yield run_context
+    finally:
+        _active_run_context.reset(token)
+        run_context.close()
+
+
+def run_docker_container(client: 'docker.DockerClient',
+                         image: str,
+                         command: List[str],
+                         volumes: Dict[str, Any],
+                         image_inventory: Optional[ImageInventory] = None,
                          **container_run_args) -> int:
     image = add_latest_tag_if_not_present(image=image)
-    image_exists = any(
-        image in (existing_image.tags + existing_image.attrs['RepoDigests'])
-        for existing_image in client.images.list())
-    if image_exists:
-        print(f'Found image {image!r}\n')
-    else:
-        print(f'Pulling image {image!r}')
-        client.images.pull(image)
-        print('Image pull complete\n')
+    image_inventory = image_inventory or ImageInventory()
+    image_inventory.ensure_image(client, image)
     container = client.containers.run(
         image=image,
         command=command,
@@ -142,19 +264,37 @@ def run_docker_container(client: 'docker.DockerClient', image: str,
         volumes=volumes,
         auto_remove=True,
         **container_run_args)
-    try:
-        for line in container.logs(stream=True):
-            # the inner logs should already have trailing \n
-            # we do not need to add another
-            print(line.decode(), end='')
-    except docker.errors.NotFound:
-        # Container was auto-removed before we could stream logs
-        # This can happen if the container exits very quickly
-        pass
-    try:
-        return container.wait()['StatusCode']
-    except docker.errors.NotFound:
-        # Container was auto-removed after logs completed
-        # This means the container exited successfully (logs streaming completed)
-        # We assume success since we couldn't get the actual status code
-        return 0
+    # the Docker log stream is an HTTP response rather than a pipe, so it
+    # is passed to the task log from this thread
+    task_log = log_multiplexer.current_task_log()
+    with cancellation.on_cancel(lambda: stop_container(container)):
+        try:
+            for chunk in container.logs(stream=True):
+                task_log.write(chunk)
+        except docker.errors.NotFound:
+            # Container was auto-removed before we could stream logs
+            # This can happen if the container exits very quickly
+            pass
+        task_log.end_stream()
+        try:
+            return container.wait()['StatusCode']
+        except docker.errors.NotFound:
+            # Container was auto-removed after logs completed
+            # This means the container exited successfully (logs streaming completed)
+            # We assume success since we couldn't get the actual status code
+            return 0
+
+
+def stop_container(container: 'docker.models.containers.Container') -> None:
+    """Stops a container in the background: Docker sends SIGTERM, and
+    SIGKILL if the container is still running after the grace period."""
+
+    def stop() -> None:
+        try:
+            container.stop(
+                timeout=int(cancellation.TERMINATE_GRACE_PERIOD_SECONDS))
+        except docker.errors.NotFound:
+            # the container exited and was auto-removed
+            pass
+
+    threading.Thread(target=stop, daemon=True).start()
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+import threading
 from typing import Optional
 import unittest
 from unittest import mock
@@ -313,6 +314,104 @@ class TestDockerTaskHandler(DockerMockTestCase):
                 ).run()
 
 
+class TestImageInventory(DockerMockTestCase):
+
+    def test_lookup_is_cached(self):
+        inventory = docker_task_handler.ImageInventory()
+        client = docker.from_env()
+
+        self.assertTrue(inventory.has_image(client, 'alpine:latest'))
+        self.assertTrue(inventory.has_image(client, 'alpine:latest'))
+
+        self.mocked_docker_client.images.get.assert_called_once_with(
+            'alpine:latest')
+        self.mocked_docker_client.images.list.assert_not_called()
+
+    def test_missing_image_pulled_once(self):
+        self.mocked_docker_client.images.get.side_effect = [
+            docker.errors.ImageNotFound('not found'),
+            mock.Mock(),
+        ]
+        inventory = docker_task_handler.ImageInventory()
+        client = docker.from_env()
+
+        inventory.ensure_image(client, 'alpine:latest')
+        inventory.ensure_image(client, 'alpine:latest')
+
+        self.mocked_docker_client.images.pull.assert_called_once_with(
+            'alpine:latest')
+        # the pull invalidated the cached lookup
+        self.assertEqual(self.mocked_docker_client.images.get.call_count, 2)
+
+    def test_run_docker_container_uses_inventory(self):
+        inventory = docker_task_handler.ImageInventory()
+        for _ in range(2):
+            docker_task_handler.run_docker_container(
+                docker.from_env(),
+                image='alpine',
+                command=['echo', 'foo'],
+                volumes={},
+                image_inventory=inventory,
+            )
+        self.mocked_docker_client.images.get.assert_called_once_with(
+            'alpine:latest')
+        self.mocked_docker_client.images.pull.assert_not_called()
+
+
+class TestDockerRunContext(DockerMockTestCase):
+
+    def test_handlers_share_client(self):
+        with mock.patch('kfp.local.config.LocalExecutionConfig.instance', None):
+            with docker_task_handler.docker_run_context():
+                for _ in range(2):
+                    docker_task_handler.DockerTaskHandler(
+                        image='alpine',
+                        full_command=['echo', 'foo'],
+                        pipeline_root=os.path.abspath('my_root'),
+                        runner=local.DockerRunner(),
+                    ).run()
+                self.mocked_docker_client.close.assert_not_called()
+
+        self.assertEqual(docker.from_env.call_count, 1)
+        self.mocked_docker_client.close.assert_called_once()
+        self.mocked_docker_client.images.get.assert_called_once_with(
+            'alpine:latest')
+
+    def test_not_shared_with_other_threads(self):
+        run_handler = docker_task_handler.DockerTaskHandler(
+            image='alpine',
+            full_command=['echo', 'foo'],
+            pipeline_root=os.path.abspath('my_root'),
+            runner=local.DockerRunner(),
+        ).run
+        with mock.patch('kfp.local.config.LocalExecutionConfig.instance', None):
+            with docker_task_handler.docker_run_context():
+                # a thread of another pipeline run, which does not run in
+                # the context of this one
+                thread = threading.Thread(target=run_handler)
+                thread.start()
+                thread.join()
+                self.assertEqual(docker.from_env.call_count, 2)
+                self.mocked_docker_client.close.assert_called_once()
+
+    def test_prepull(self):
+        self.mocked_docker_client.images.get.side_effect = docker.errors.ImageNotFound(
+            'not found')
+        self.mocked_docker_client.images.pull.side_effect = [
+            None, docker.errors.APIError('pull failed')
+        ]
+        with docker_task_handler.docker_run_context() as run_context:
+            run_context.prepull(['alpine', 'alpine:latest', 'python:3.11'])
+
+        self.assertCountEqual(
+            [
+                call.args[0]
+                for call in self.mocked_docker_client.images.pull.call_args_list
+            ],
+            ['alpine:latest', 'python:3.11'],
+        )
+
+
 class TestAddLatestTagIfNotPresent(unittest.TestCase):
 
     def test_no_tag(self):
@@ -361,8 +460,15 @@ class TestE2E(DockerMockTestCase,
             kwargs['image'],
             'python:3.11',
         )
-        self.assertTrue(
-            any('def artifact_maker' in c for c in kwargs['command']))
+        # the component source is passed in a file in the task root, which
+        # is in the mounted pipeline root
+        source_paths = [
+            c for c in kwargs['command']
+            if os.path.basename(c).startswith('ephemeral_component-')
+        ]
+        self.assertEqual(len(source_paths), 1)
+        with open(source_paths[0]) as f:
+            self.assertIn('def artifact_maker', f.read())
         self.assertTrue(kwargs['detach'])
         self.assertTrue(kwargs['stdout'])
         self.assertTrue(kwargs['stderr'])
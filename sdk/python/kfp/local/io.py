@@ -14,7 +14,29 @@
 """Object for storing task outputs in-memory during local execution."""
 
 import collections
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
+
+
+class LazyValue:
+    """A task output that is only loaded when it is read from an IOStore, such
+    as the collected outputs of a large ParallelFor kept in a file.
+
+    Attributes:
+        reference: A JSON-serializable description of where the value is kept, which the run journal records instead of the value, or None.
+    """
+
+    def __init__(self,
+                 load: Callable[[], Any],
+                 reference: Optional[Dict[str, Any]] = None) -> None:
+        self._load = load
+        self.reference = reference
+
+    def load(self) -> Any:
+        return self._load()
+
+
+def _load(value: Any) -> Any:
+    return value.load() if isinstance(value, LazyValue) else value
 
 
 class IOStore:
@@ -71,7 +93,10 @@ class IOStore:
         key: str,
         value: Any,
     ) -> None:
-        """Persist the value of an upstream task output."""
+        """Persist the value of an upstream task output.
+
+        value may be a LazyValue, which is loaded each time it is read.
+        """
         self._task_output_data[task_name][key] = value
 
     def get_task_output(
@@ -93,7 +118,7 @@ class IOStore:
         if task_name in self._task_output_data:
             outputs = self._task_output_data[task_name]
             if key in outputs:
-                return outputs[key]
+                return _load(outputs[key])
             if self._parent is not None:
                 try:
                     return self._parent.get_task_output(task_name, key)
@@ -111,6 +136,22 @@ class IOStore:
         raise ValueError(
             f"{common_exception_string}, but task '{task_name}' not found.")
 
+    def get_task_outputs(
+        self,
+        task_name: str,
+        load_lazy_values: bool = True,
+    ) -> Dict[str, Any]:
+        """Get all outputs of a task in this DAG.
+
+        Unlike get_task_output, does not walk up the enclosing DAG
+        chain. If load_lazy_values is False, LazyValue outputs are
+        returned without loading them.
+        """
+        return {
+            key: _load(value) if load_lazy_values else value
+            for key, value in self._task_output_data.get(task_name, {}).items()
+        }
+
     def put_task_status(
         self,
         task_name: str,
@@ -0,0 +1,370 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Multiplexes the log output of concurrently running local tasks.
+
+A single reader thread reads the output pipes of all running task
+subprocesses with selectors, rather than each task holding a thread in
+a readline loop. Output is split into lines per task; each line is
+appended to the task's log file under its task root and passed to a
+console view:
+
+* stream: prints each line as it arrives, tagged with the task name
+  while several tasks are running at once.
+* compact: prints a periodic one-line summary of the running tasks, and
+  the tail of a task's log if it fails.
+
+Lines reach the console whole and under one lock, so the output of
+parallel tasks never interleaves mid-line.
+"""
+import collections
+import contextlib
+import contextvars
+import logging
+import os
+import selectors
+import sys
+import threading
+import time
+from typing import Deque, Dict, IO, Iterator, List, Optional, Set, Tuple, Union
+
+STREAM = 'stream'
+COMPACT = 'compact'
+CONSOLE_LOG_MODES = (STREAM, COMPACT)
+
+LOG_FILE_NAME = 'task.log'
+
+_INDENT = ' ' * 4
+_READ_SIZE = 64 * 1024
+_STATUS_INTERVAL_SECONDS = 5.0
+_FAILURE_TAIL_LINES = 20
+
+_console_lock = threading.Lock()
+
+
+def _write_console(text: str) -> None:
+    with _console_lock:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+
+class TaskLog:
+    """Log of one task.
+
+    Collects the task's output, splits it into lines, appends them to
+    the task's log file and passes them to the console view.
+
+    Attributes:
+        task_name: Name of the task, or None for output that does not belong to a task.
+        log_path: Path of the log file, or None to only write to the console.
+        num_lines: Number of lines written so far.
+        tail: The last lines written.
+        succeeded: Whether the task succeeded. Set by the caller before the log is closed.
+    """
+
+    def __init__(
+        self,
+        task_name: Optional[str],
+        log_path: Optional[str],
+        view: '_View',
+    ) -> None:
+        self.task_name = task_name
+        self.log_path = log_path
+        self.num_lines = 0
+        self.tail: Deque[str] = collections.deque(maxlen=_FAILURE_TAIL_LINES)
+        self.succeeded = False
+        self._view = view
+        self._partial_line = b''
+        self._lock = threading.Lock()
+        self._file = None
+        if log_path is not None:
+            os.makedirs(os.path.dirname(log_path), exist_ok=True)
+            # line buffered, so the file can be followed while the task runs
+            self._file = open(log_path, 'a', encoding='utf-8', buffering=1)
+
+    def write(self, data: Union[bytes, str]) -> None:
+        """Writes output of the task.
+
+        Incomplete lines are held back until the rest of the line, or
+        the end of the stream, arrives.
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        with self._lock:
+            lines = (self._partial_line + data).split(b'\n')
+            self._partial_line = lines.pop()
+            for line in lines:
+                self._emit(line)
+
+    def end_stream(self) -> None:
+        """Marks the end of the output of one process of the task."""
+        with self._lock:
+            if self._partial_line:
+                self._emit(self._partial_line)
+                self._partial_line = b''
+        self._view.stream_ended(self)
+
+    def _emit(self, line: bytes) -> None:
+        if line.endswith(b'\r'):
+            line = line[:-1]
+        text = line.decode('utf-8', errors='replace') + '\n'
+        self.num_lines += 1
+        self.tail.append(text)
+        if self._file is not None:
+            self._file.write(text)
+        self._view.line(self, text)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._partial_line:
+                self._emit(self._partial_line)
+                self._partial_line = b''
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        self._view.task_finished(self)
+
+
+class _View:
+    """Console view of task logs."""
+
+    def task_started(self, task_log: TaskLog) -> None:
+        pass
+
+    def line(self, task_log: TaskLog, line: str) -> None:
+        pass
+
+    def stream_ended(self, task_log: TaskLog) -> None:
+        pass
+
+    def task_finished(self, task_log: TaskLog) -> None:
+        pass
+
+
+class _StreamView(_View):
+    """Prints every line, tagged with the task name while more than one task is
+    running."""
+
+    def __init__(self) -> None:
+        self._running: Set[int] = set()
+        self._lock = threading.Lock()
+
+    def task_started(self, task_log: TaskLog) -> None:
+        with self._lock:
+            self._running.add(id(task_log))
+
+    def task_finished(self, task_log: TaskLog) -> None:
+        with self._lock:
+            self._running.discard(id(task_log))
+
+    def line(self, task_log: TaskLog, line: str) -> None:
+        tag = f'[{task_log.task_name}] ' if (task_log.task_name and
+                                             len(self._running) > 1) else ''
+        _write_console(f'{_INDENT}{tag}{line}')
+
+    def stream_ended(self, task_log: TaskLog) -> None:
+        # help with visual separation to show termination of task logs
+        _write_console(f'{_INDENT}\n\n')
+
+
+class _CompactView(_View):
+    """Prints a summary of the running tasks at most every few seconds, and
+    where each task's log was written when it finishes."""
+
+    def __init__(self) -> None:
+        self._running: Dict[int, TaskLog] = {}
+        self._last_status = 0.0
+        self._lock = threading.Lock()
+
+    def task_started(self, task_log: TaskLog) -> None:
+        with self._lock:
+            self._running[id(task_log)] = task_log
+
+    def line(self, task_log: TaskLog, line: str) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_status < _STATUS_INTERVAL_SECONDS:
+                return
+            self._last_status = now
+            running = list(self._running.values())
+        if running:
+            summary = ', '.join(
+                f'{log.task_name!r} ({log.num_lines} lines)' for log in running)
+            _write_console(
+                f'{_INDENT}Running {len(running)} task(s): {summary}\n')
+
+    def task_finished(self, task_log: TaskLog) -> None:
+        with self._lock:
+            self._running.pop(id(task_log), None)
+        lines = [
+            f'Task {task_log.task_name!r} wrote {task_log.num_lines} log '
+            f'lines to {task_log.log_path}\n'
+        ]
+        if not task_log.succeeded and task_log.tail:
+            lines.append(f'Last {len(task_log.tail)} log lines:\n')
+            lines.extend(_INDENT + line for line in task_log.tail)
+        _write_console(''.join(_INDENT + line for line in lines) + '\n')
+
+
+_views: Dict[str, _View] = {STREAM: _StreamView(), COMPACT: _CompactView()}
+
+_current_task_log: contextvars.ContextVar[
+    Optional[TaskLog]] = contextvars.ContextVar(
+        'kfp_local_task_log', default=None)
+
+
+@contextlib.contextmanager
+def task_log_context(
+    task_name: str,
+    log_path: str,
+    console_logs: str = STREAM,
+) -> Iterator[TaskLog]:
+    """Context manager that collects the output of tasks run in its scope on
+    the current thread into a TaskLog.
+
+    Args:
+        task_name: Name of the task.
+        log_path: Path of the task's log file.
+        console_logs: Console view, one of CONSOLE_LOG_MODES.
+    """
+    view = _views[console_logs]
+    task_log = TaskLog(task_name=task_name, log_path=log_path, view=view)
+    view.task_started(task_log)
+    token = _current_task_log.set(task_log)
+    try:
+        yield task_log
+    finally:
+        _current_task_log.reset(token)
+        task_log.close()
+
+
+def current_task_log() -> TaskLog:
+    """Returns the log of the task running on the current thread, or a log that
+    only streams to the console if there is none."""
+    task_log = _current_task_log.get()
+    if task_log is None:
+        task_log = TaskLog(task_name=None, log_path=None, view=_views[STREAM])
+    return task_log
+
+
+class LogMultiplexer:
+    """Reads the output streams of all running tasks on one thread."""
+
+    def __init__(self) -> None:
+        self._pending: List[Tuple[IO[bytes], TaskLog, threading.Event]] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        if os.name == 'nt':
+            # selectors only support sockets on Windows, so each stream is
+            # read on a thread of its own instead (see attach)
+            return
+        self._selector = selectors.DefaultSelector()
+        self._wakeup_read, self._wakeup_write = os.pipe()
+        os.set_blocking(self._wakeup_read, False)
+        self._selector.register(self._wakeup_read, selectors.EVENT_READ)
+
+    def attach(self, stream: IO[bytes], task_log: TaskLog) -> threading.Event:
+        """Reads a stream until EOF and writes its output to a TaskLog.
+
+        Args:
+            stream: Binary stream backed by a pipe, such as the stdout of a subprocess.
+            task_log: Log to write the output to.
+
+        Returns:
+            An event that is set once all output of the stream is written to the TaskLog.
+        """
+        done = threading.Event()
+        if os.name == 'nt':
+            threading.Thread(
+                target=self._read_blocking,
+                args=(stream, task_log, done),
+                daemon=True).start()
+            return done
+
+        os.set_blocking(stream.fileno(), False)
+        with self._lock:
+            self._pending.append((stream, task_log, done))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name='kfp-local-log-multiplexer',
+                    daemon=True)
+                self._thread.start()
+        # the selector is only modified on the reader thread; wake it up
+        os.write(self._wakeup_write, b'\0')
+        return done
+
+    def _run(self) -> None:
+        while True:
+            for key, _ in self._selector.select():
+                if key.fd == self._wakeup_read:
+                    self._register_pending()
+                else:
+                    self._read(key)
+
+    def _register_pending(self) -> None:
+        try:
+            os.read(self._wakeup_read, _READ_SIZE)
+        except BlockingIOError:
+            pass
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for stream, task_log, done in pending:
+            self._selector.register(stream, selectors.EVENT_READ,
+                                    (task_log, done))
+
+    def _read(self, key: selectors.SelectorKey) -> None:
+        task_log, done = key.data
+        try:
+            data = os.read(key.fd, _READ_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b''
+        if data:
+            _write_safely(task_log, data)
+            return
+        self._selector.unregister(key.fileobj)
+        done.set()
+
+    @staticmethod
+    def _read_blocking(
+        stream: IO[bytes],
+        task_log: TaskLog,
+        done: threading.Event,
+    ) -> None:
+        for data in iter(lambda: stream.read1(_READ_SIZE), b''):
+            _write_safely(task_log, data)
+        done.set()
+
+
+def _write_safely(task_log: TaskLog, data: bytes) -> None:
+    # the reader thread serves every task; one broken log must not stop it
+    try:
+        task_log.write(data)
+    except Exception as e:
+        logging.warning(
+            f'Failed to write logs of task {task_log.task_name!r}: {e}')
+
+
+_multiplexer: Optional[LogMultiplexer] = None
+_multiplexer_lock = threading.Lock()
+
+
+def get_log_multiplexer() -> LogMultiplexer:
+    """Returns the process-wide LogMultiplexer."""
+    global _multiplexer
+    with _multiplexer_lock:
+        if _multiplexer is None:
+            _multiplexer = LogMultiplexer()
+        return _multiplexer
@@ -0,0 +1,195 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for log_multiplexer.py."""
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from kfp.local import log_multiplexer
+
+
+class LogMultiplexerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        stdout_patcher = mock.patch('sys.stdout', new_callable=io.StringIO)
+        self.mock_stdout = stdout_patcher.start()
+        self.addCleanup(stdout_patcher.stop)
+
+    def log_path(self, task_name: str) -> str:
+        return os.path.join(self.temp_dir.name, task_name,
+                            log_multiplexer.LOG_FILE_NAME)
+
+    def read_log(self, task_name: str) -> str:
+        with open(self.log_path(task_name)) as f:
+            return f.read()
+
+
+class TestTaskLog(LogMultiplexerTestCase):
+
+    def test_splits_lines_across_writes(self):
+        with log_multiplexer.task_log_context('task', self.log_path('task')):
+            task_log = log_multiplexer.current_task_log()
+            task_log.write(b'hel')
+            task_log.write(b'lo\r\nwor')
+            task_log.write('ld\n')
+            task_log.write(b'no newline')
+            task_log.end_stream()
+
+        self.assertEqual(self.read_log('task'), 'hello\nworld\nno newline\n')
+        self.assertEqual(task_log.num_lines, 3)
+        self.assertEqual(
+            self.mock_stdout.getvalue(),
+            '    hello\n    world\n    no newline\n    \n\n',
+        )
+
+    def test_without_task_streams_to_console(self):
+        task_log = log_multiplexer.current_task_log()
+        self.assertIsNone(task_log.log_path)
+        task_log.write(b'foo\n')
+        self.assertEqual(self.mock_stdout.getvalue(), '    foo\n')
+
+    def test_invalid_utf8_is_replaced(self):
+        with log_multiplexer.task_log_context('task', self.log_path('task')):
+            log_multiplexer.current_task_log().write(b'\xff\n')
+        self.assertEqual(self.read_log('task'), '�\n')
+
+
+class TestStreamView(LogMultiplexerTestCase):
+
+    def test_tags_lines_of_concurrent_tasks(self):
+        with log_multiplexer.task_log_context('a', self.log_path('a')) as a:
+            a.write(b'alone\n')
+            with log_multiplexer.task_log_context('b', self.log_path('b')) as b:
+                a.write(b'from a\n')
+                b.write(b'from b\n')
+
+        self.assertEqual(
+            self.mock_stdout.getvalue(),
+            '    alone\n    [a] from a\n    [b] from b\n',
+        )
+        # log files are not tagged
+        self.assertEqual(self.read_log('a'), 'alone\nfrom a\n')
+        self.assertEqual(self.read_log('b'), 'from b\n')
+
+
+class TestCompactView(LogMultiplexerTestCase):
+
+    def test_summary_on_success(self):
+        with log_multiplexer.task_log_context(
+                'task', self.log_path('task'),
+                console_logs=log_multiplexer.COMPACT) as task_log:
+            task_log.write(b'line 1\nline 2\n')
+            task_log.end_stream()
+            task_log.succeeded = True
+
+        output = self.mock_stdout.getvalue()
+        self.assertNotIn('line 1', output)
+        self.assertIn(
+            f"Task 'task' wrote 2 log lines to {self.log_path('task')}", output)
+        self.assertEqual(self.read_log('task'), 'line 1\nline 2\n')
+
+    def test_tail_on_failure(self):
+        with log_multiplexer.task_log_context(
+                'task', self.log_path('task'),
+                console_logs=log_multiplexer.COMPACT) as task_log:
+            task_log.write(''.join(f'line {i}\n' for i in range(30)))
+
+        output = self.mock_stdout.getvalue()
+        self.assertIn('Last 20 log lines:\n        line 10\n', output)
+        self.assertIn('        line 29\n', output)
+        self.assertNotIn('line 9\n', output)
+
+    @mock.patch.object(log_multiplexer, '_STATUS_INTERVAL_SECONDS', 0)
+    def test_status_of_running_tasks(self):
+        with log_multiplexer.task_log_context(
+                'a', self.log_path('a'),
+                console_logs=log_multiplexer.COMPACT) as a:
+            with log_multiplexer.task_log_context(
+                    'b', self.log_path('b'),
+                    console_logs=log_multiplexer.COMPACT):
+                a.write(b'line\n')
+                self.assertIn("Running 2 task(s): 'a' (1 lines), 'b' (0 lines)",
+                              self.mock_stdout.getvalue())
+
+
+class TestLogMultiplexer(LogMultiplexerTestCase):
+
+    def test_reads_concurrent_processes(self):
+        program = ('import sys, time\n'
+                   'for i in range(50):\n'
+                   '    print(sys.argv[1], i, flush=True)\n'
+                   '    time.sleep(0.001)\n')
+        multiplexer = log_multiplexer.get_log_multiplexer()
+        task_names = [f'task-{i}' for i in range(4)]
+        processes = []
+        for task_name in task_names:
+            process = subprocess.Popen(
+                [sys.executable, '-c', program, task_name],
+                stdout=subprocess.PIPE)
+            self.addCleanup(process.stdout.close)
+            processes.append(process)
+
+        task_logs = []
+        done_events = []
+        for task_name, process in zip(task_names, processes):
+            task_log = log_multiplexer.TaskLog(
+                task_name=task_name,
+                log_path=self.log_path(task_name),
+                view=log_multiplexer._views[log_multiplexer.STREAM])
+            task_logs.append(task_log)
+            done_events.append(multiplexer.attach(process.stdout, task_log))
+        for process, done, task_log in zip(processes, done_events, task_logs):
+            process.wait()
+            self.assertTrue(done.wait(timeout=30))
+            task_log.close()
+
+        for task_name in task_names:
+            self.assertEqual(
+                self.read_log(task_name),
+                ''.join(f'{task_name} {i}\n' for i in range(50)))
+        console_lines = self.mock_stdout.getvalue().splitlines()
+        self.assertEqual(len(console_lines), 200)
+        for task_name in task_names:
+            self.assertEqual(
+                [line for line in console_lines if task_name in line],
+                [f'    {task_name} {i}' for i in range(50)],
+            )
+
+    @mock.patch.object(os, 'name', 'nt')
+    @mock.patch.object(os, 'pipe')
+    @mock.patch.object(log_multiplexer.selectors, 'DefaultSelector')
+    def test_windows_reads_without_selector(self, mock_selector, mock_pipe):
+        # selectors do not accept pipes on Windows
+        multiplexer = log_multiplexer.LogMultiplexer()
+        mock_selector.assert_not_called()
+        mock_pipe.assert_not_called()
+
+        task_log = log_multiplexer.TaskLog(
+            task_name='task',
+            log_path=self.log_path('task'),
+            view=log_multiplexer._views[log_multiplexer.STREAM])
+        done = multiplexer.attach(io.BytesIO(b'hello\n'), task_log)
+        self.assertTrue(done.wait(timeout=30))
+        task_log.close()
+        self.assertEqual(self.read_log('task'), 'hello\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
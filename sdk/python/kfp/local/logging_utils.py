@@ -18,7 +18,8 @@ import datetime
 import logging
 import shutil
 import sys
-from typing import Any, Dict, Generator, List
+import threading
+from typing import Any, Dict, Generator, List, Optional, Tuple
 
 from kfp import dsl
 from kfp.local import status
@@ -49,34 +50,53 @@ class MillisecondFormatter(logging.Formatter):
         return s[:-3]
 
 
+# local execution may run tasks on several threads at once. The logger and
+# print patches below are process-wide, so they are installed by the first
+# thread to enter and restored by the last thread to leave; otherwise
+# overlapping enter/exit pairs would restore each other's patches.
+_patch_lock = threading.Lock()
+_logger_context_depth = 0
+_original_logger_state: Optional[Tuple[int, List[logging.Handler]]] = None
+_indented_print_depth = 0
+_original_print = builtins.print
+
+
 @contextlib.contextmanager
 def local_logger_context() -> Generator[None, None, None]:
     """Context manager for creating and reseting the local execution logger."""
+    global _logger_context_depth, _original_logger_state
 
     logger = logging.getLogger()
-    original_level = logger.level
-    original_handlers = logger.handlers[:]
-    formatter = MillisecondFormatter(
-        fmt='%(asctime)s - %(levelname)s - %(message)s',
-        datefmt='%H:%M:%S.%f',
-    )
-    # use sys.stdout so that both inner process and outer process logs
-    # go to stdout
-    # this is needed for logs to present sequentially in a colab notebook,
-    # since stderr will print above stdout
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
-    logger.handlers.clear()
-    logger.addHandler(handler)
-    logger.setLevel(logging.INFO)
+    with _patch_lock:
+        if _logger_context_depth == 0:
+            _original_logger_state = (logger.level, logger.handlers[:])
+            formatter = MillisecondFormatter(
+                fmt='%(asctime)s - %(levelname)s - %(message)s',
+                datefmt='%H:%M:%S.%f',
+            )
+            # use sys.stdout so that both inner process and outer process logs
+            # go to stdout
+            # this is needed for logs to present sequentially in a colab notebook,
+            # since stderr will print above stdout
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(formatter)
+            logger.handlers.clear()
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+        _logger_context_depth += 1
 
     try:
         yield
     finally:
-        logger.setLevel(original_level)
-        logger.handlers.clear()
-        for handler in original_handlers:
-            logger.addHandler(handler)
+        with _patch_lock:
+            _logger_context_depth -= 1
+            if _logger_context_depth == 0:
+                original_level, original_handlers = _original_logger_state
+                _original_logger_state = None
+                logger.setLevel(original_level)
+                logger.handlers.clear()
+                for handler in original_handlers:
+                    logger.addHandler(handler)
 
 
 @contextlib.contextmanager
@@ -87,17 +107,26 @@ def indented_print(num_spaces: int = 4) -> Generator[None, None, None]:
     Useful for visually separating a subprocess logs from the outer
     process logs.
     """
-    original_print = builtins.print
+    global _indented_print_depth, _original_print
+
+    with _patch_lock:
+        if _indented_print_depth == 0:
+            _original_print = builtins.print
+            original_print = _original_print
 
-    def indented_print_function(*args, **kwargs):
-        original_print(' ' * num_spaces, end='')
-        return original_print(*args, **kwargs)
+            def indented_print_function(*args, **kwargs):
+                original_print(' ' * num_spaces, end='')
+                return original_print(*args, **kwargs)
 
-    builtins.print = indented_print_function
+            builtins.print = indented_print_function
+        _indented_print_depth += 1
     try:
         yield
     finally:
-        builtins.print = original_print
+        with _patch_lock:
+            _indented_print_depth -= 1
+            if _indented_print_depth == 0:
+                builtins.print = _original_print
 
 
 def color_text(text: str, color: Color) -> str:
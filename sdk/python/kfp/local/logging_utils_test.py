@@ -13,7 +13,9 @@
 # limitations under the License.
 """Tests for logging_utils.py."""
 
+import builtins
 import io
+import logging
 import unittest
 from unittest import mock
 
@@ -35,6 +37,32 @@ class TestIndentedPrint(unittest.TestCase):
             expected,
         )
 
+    def test_overlapping_contexts_restore_print(self):
+        # tasks on different threads enter and exit in interleaved order
+        original_print = builtins.print
+        first = logging_utils.indented_print()
+        second = logging_utils.indented_print()
+        first.__enter__()
+        second.__enter__()
+        first.__exit__(None, None, None)
+        self.assertIsNot(builtins.print, original_print)
+        second.__exit__(None, None, None)
+        self.assertIs(builtins.print, original_print)
+
+
+class TestLocalLoggerContext(unittest.TestCase):
+
+    def test_overlapping_contexts_restore_handlers(self):
+        logger = logging.getLogger()
+        original_handlers = logger.handlers[:]
+        first = logging_utils.local_logger_context()
+        second = logging_utils.local_logger_context()
+        first.__enter__()
+        second.__enter__()
+        first.__exit__(None, None, None)
+        second.__exit__(None, None, None)
+        self.assertEqual(logger.handlers, original_handlers)
+
 
 class TestColorText(unittest.TestCase):
 
@@ -0,0 +1,148 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Index-addressed store of the outputs of ParallelFor iterations."""
+import functools
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+from kfp.local import cache
+from kfp.local import io
+
+# number of iteration output values held in memory before a ParallelFor's
+# outputs are spilled to a file
+SPILL_THRESHOLD = 10_000
+
+
+def _read_spilled_output(spill_path: str, num_iterations: int,
+                         output_key: str) -> List[Any]:
+    values = [None] * num_iterations
+    with open(spill_path, encoding='utf-8') as f:
+        for line in f:
+            record = json.loads(line)
+            if output_key in record['outputs']:
+                values[record['index']] = cache.deserialize_outputs(
+                    {output_key: record['outputs'][output_key]})[output_key]
+    return values
+
+
+def load_spilled_output(reference: Dict[str, Any]) -> io.LazyValue:
+    """Returns a spilled output from the reference of its LazyValue, e.g. as
+    recorded in a run journal."""
+    return io.LazyValue(
+        functools.partial(_read_spilled_output, reference['spill_path'],
+                          reference['num_iterations'], reference['output_key']),
+        reference=reference)
+
+
+class CollectedOutputs:
+    """Outputs of the iterations of one ParallelFor, by iteration index.
+
+    Values are written into lists preallocated to the number of
+    iterations, so they are in iteration order no matter in which order
+    the iterations finish. Once more than spill_threshold values are
+    held, all outputs are moved to a JSON lines file in spill_dir and
+    later iterations append to it; get() then reads the file back.
+
+    Not thread-safe: outputs are put by the thread collecting the
+    iteration results.
+    """
+
+    def __init__(
+        self,
+        num_iterations: int,
+        spill_dir: str,
+        spill_threshold: Optional[int] = None,
+    ) -> None:
+        self.num_iterations = num_iterations
+        self._spill_dir = spill_dir
+        self._spill_threshold = (
+            SPILL_THRESHOLD if spill_threshold is None else spill_threshold)
+        self._values: Dict[str, List[Any]] = {}
+        self._num_values = 0
+        self._spill_path: Optional[str] = None
+        self._output_keys: List[str] = []
+
+    @property
+    def spilled(self) -> bool:
+        return self._spill_path is not None
+
+    @property
+    def output_keys(self) -> List[str]:
+        return list(self._output_keys)
+
+    def put(self, index: int, outputs: Dict[str, Any]) -> None:
+        """Stores the outputs of the iteration with the given index."""
+        for key in outputs:
+            if key not in self._output_keys:
+                self._output_keys.append(key)
+        if self.spilled:
+            self._append([(index, outputs)])
+            return
+        for key, value in outputs.items():
+            values = self._values.get(key)
+            if values is None:
+                values = self._values[key] = [None] * self.num_iterations
+            values[index] = value
+        self._num_values += len(outputs)
+        if self._num_values > self._spill_threshold:
+            self._spill()
+
+    def get(self, output_key: str) -> List[Any]:
+        """Returns the values of an output of all iterations, in iteration
+        order, with None for iterations that did not produce it."""
+        if not self.spilled:
+            return self._values.get(output_key, [None] * self.num_iterations)
+        return _read_spilled_output(self._spill_path, self.num_iterations,
+                                    output_key)
+
+    def lazy_output(self, output_key: str) -> io.LazyValue:
+        """Returns a LazyValue that reads the values of a spilled output from
+        the spill file when it is loaded.
+
+        Its reference records the spill file, so that the output is
+        journaled by reference rather than by value.
+        """
+        return load_spilled_output({
+            'spill_path': self._spill_path,
+            'num_iterations': self.num_iterations,
+            'output_key': output_key,
+        })
+
+    def _spill(self) -> None:
+        os.makedirs(self._spill_dir, exist_ok=True)
+        fd, self._spill_path = tempfile.mkstemp(
+            dir=self._spill_dir, prefix='collected-outputs-', suffix='.jsonl')
+        os.close(fd)
+        values, self._values = self._values, {}
+        records = []
+        for index in range(self.num_iterations):
+            outputs = {
+                key: key_values[index]
+                for key, key_values in values.items()
+                if key_values[index] is not None
+            }
+            if outputs:
+                records.append((index, outputs))
+        self._append(records)
+
+    def _append(self, records: List[Tuple[int, Dict[str, Any]]]) -> None:
+        with open(self._spill_path, 'a', encoding='utf-8') as f:
+            for index, outputs in records:
+                f.write(
+                    json.dumps({
+                        'index': index,
+                        'outputs': cache.serialize_outputs(outputs),
+                    }) + '\n')
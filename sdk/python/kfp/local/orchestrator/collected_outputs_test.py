@@ -0,0 +1,63 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for collected_outputs.py."""
+import os
+import tempfile
+import unittest
+
+from kfp import dsl
+from kfp.local.orchestrator import collected_outputs
+
+
+class TestCollectedOutputs(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.spill_dir = os.path.join(self.temp_dir.name, 'for-loop-2')
+
+    def test_in_iteration_order(self):
+        collected = collected_outputs.CollectedOutputs(
+            num_iterations=3, spill_dir=self.spill_dir)
+        collected.put(2, {'Output': 'c'})
+        collected.put(0, {'Output': 'a'})
+        collected.put(1, {'Output': 'b', 'other': 1})
+
+        self.assertFalse(collected.spilled)
+        self.assertEqual(collected.output_keys, ['Output', 'other'])
+        self.assertEqual(collected.get('Output'), ['a', 'b', 'c'])
+        self.assertEqual(collected.get('other'), [None, 1, None])
+        self.assertFalse(os.path.exists(self.spill_dir))
+
+    def test_spills_past_threshold(self):
+        collected = collected_outputs.CollectedOutputs(
+            num_iterations=5, spill_dir=self.spill_dir, spill_threshold=2)
+        model = dsl.Model(
+            name='model', uri='/tmp/model', metadata={'accuracy': 0.9})
+        collected.put(4, {'Output': 4, 'model': model})
+        self.assertFalse(collected.spilled)
+        collected.put(0, {'Output': 0})
+        self.assertTrue(collected.spilled)
+        collected.put(2, {'Output': 2})
+
+        self.assertEqual(len(os.listdir(self.spill_dir)), 1)
+        self.assertEqual(collected.get('Output'), [0, None, 2, None, 4])
+        [*missing, restored_model] = collected.get('model')
+        self.assertEqual(missing, [None] * 4)
+        self.assertEqual(restored_model.uri, '/tmp/model')
+        self.assertEqual(restored_model.metadata, {'accuracy': 0.9})
+
+
+if __name__ == '__main__':
+    unittest.main()
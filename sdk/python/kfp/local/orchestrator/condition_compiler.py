@@ -0,0 +1,432 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compiles dsl.If/Elif/Else trigger policy conditions for local runs.
+
+Conditions are written in the subset of CEL that the compiler emits,
+for example::
+
+    int(inputs.parameter_values['pipelinechannel--count']) > 5 &&
+    !(inputs.parameter_values['pipelinechannel--flip-coin-Output'] == 'heads')
+
+A condition is parsed once into a tree of closures and cached by its
+string. Each parameter it references is assigned a slot; binding the
+compiled condition to a task's inputs resolves every slot to an accessor
+of the task input that feeds it, so evaluating the condition reads each
+value once from the IOStore without reparsing anything.
+
+Supported are string, number, boolean and null literals, parameter
+references, the operators ``! - * / % + == != < <= > >= && ||``,
+parentheses, and the functions ``int``, ``double``, ``string``,
+``bool`` and ``size`` (with the aliases ``float``, ``str`` and ``len``)
+as well as ``min`` and ``max``.
+"""
+import functools
+import operator
+import re
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from kfp.local import io
+from kfp.pipeline_spec import pipeline_spec_pb2
+
+from .orchestrator_utils import OrchestratorUtils
+
+_CACHE_SIZE = 1024
+
+_PIPELINE_CHANNEL_PREFIX = 'pipelinechannel--'
+
+# evaluates a node of a compiled condition given the values of its slots
+_Node = Callable[[Sequence[Any]], Any]
+# reads the value of a parameter referenced by a condition
+_Accessor = Callable[[io.IOStore], Any]
+_BinaryFunction = Callable[[Any, Any], Any]
+
+_TOKEN_PATTERN = re.compile(
+    r"""
+    \s*(?:
+        (?P<parameter>
+            inputs\.parameter_values\[\s*
+            (?:'(?P<single_quoted_name>[^']*)'|"(?P<double_quoted_name>[^"]*)")
+            \s*\])
+        |(?P<channel>pipelinechannel--[a-zA-Z0-9_\-]+)
+        |(?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+        |(?P<number>(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?)
+        |(?P<name>[a-zA-Z_][a-zA-Z0-9_]*)
+        |(?P<operator>&&|\|\||==|!=|<=|>=|[!<>+\-*/%(),])
+    )""",
+    re.VERBOSE,
+)
+
+_ESCAPES = {'n': '\n', 'r': '\r', 't': '\t'}
+
+_CONSTANTS = {
+    'true': True,
+    'false': False,
+    'null': None,
+    'True': True,
+    'False': False,
+    'None': None,
+}
+
+
+def _cel_int(value: Any) -> int:
+    if isinstance(value, str):
+        return int(value.strip())
+    return int(value)
+
+
+def _cel_string(value: Any) -> str:
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
+
+def _cel_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        if value.lower() in ('true', 't', '1'):
+            return True
+        if value.lower() in ('false', 'f', '0'):
+            return False
+        raise ValueError(f'Cannot convert {value!r} to bool.')
+    return bool(value)
+
+
+def _divide(left: Any, right: Any) -> Any:
+    if isinstance(left, int) and isinstance(right, int):
+        # CEL integer division truncates towards zero
+        return int(left / right)
+    return left / right
+
+
+def _remainder(left: Any, right: Any) -> Any:
+    if isinstance(left, int) and isinstance(right, int):
+        return left - right * _divide(left, right)
+    return left % right
+
+
+_FUNCTIONS: Dict[str, Callable[..., Any]] = {
+    'int': _cel_int,
+    'double': float,
+    'float': float,
+    'string': _cel_string,
+    'str': _cel_string,
+    'bool': _cel_bool,
+    'size': len,
+    'len': len,
+    'min': min,
+    'max': max,
+}
+
+# binary operator -> (precedence, function); && and || short-circuit and
+# are handled separately
+_BINARY_OPERATORS: Dict[str, Tuple[int, Optional[_BinaryFunction]]] = {
+    '||': (1, None),
+    '&&': (2, None),
+    '==': (3, operator.eq),
+    '!=': (3, operator.ne),
+    '<': (3, operator.lt),
+    '<=': (3, operator.le),
+    '>': (3, operator.gt),
+    '>=': (3, operator.ge),
+    '+': (4, operator.add),
+    '-': (4, operator.sub),
+    '*': (5, operator.mul),
+    '/': (5, _divide),
+    '%': (5, _remainder),
+}
+
+
+def _unquote(literal: str) -> str:
+    return re.sub(r'\\(.)', lambda m: _ESCAPES.get(m.group(1), m.group(1)),
+                  literal[1:-1])
+
+
+def _tokenize(condition: str) -> List[Tuple[str, Any]]:
+    tokens = []
+    position = 0
+    end = len(condition.rstrip())
+    while position < end:
+        match = _TOKEN_PATTERN.match(condition, position)
+        if match is None:
+            raise ValueError(
+                f'Unexpected character {condition[position:].lstrip()[:1]!r} '
+                f'at position {position}.')
+        position = match.end()
+        kind = match.lastgroup
+        if kind in ('single_quoted_name', 'double_quoted_name'):
+            kind = 'parameter'
+        if kind == 'parameter':
+            value = match.group('single_quoted_name')
+            if value is None:
+                value = match.group('double_quoted_name')
+        elif kind == 'string':
+            value = _unquote(match.group(kind))
+        elif kind == 'number':
+            text = match.group(kind)
+            value = float(text) if any(c in text for c in '.eE') else int(text)
+        else:
+            value = match.group(kind)
+        tokens.append((kind, value))
+    return tokens
+
+
+class _Parser:
+    """Recursive descent parser that turns tokens into closures."""
+
+    def __init__(self, condition: str) -> None:
+        self._tokens = _tokenize(condition)
+        self._position = 0
+        # parameter name -> slot
+        self.slots: Dict[str, int] = {}
+
+    def parse(self) -> _Node:
+        if not self._tokens:
+            return lambda values: True
+        node = self._parse_binary(min_precedence=1)
+        if self._peek() is not None:
+            raise ValueError(f'Unexpected {self._peek()[1]!r}.')
+        return node
+
+    def _peek(self) -> Optional[Tuple[str, Any]]:
+        if self._position < len(self._tokens):
+            return self._tokens[self._position]
+        return None
+
+    def _next(self) -> Tuple[str, Any]:
+        token = self._peek()
+        if token is None:
+            raise ValueError('Unexpected end of condition.')
+        self._position += 1
+        return token
+
+    def _expect(self, operator_token: str) -> None:
+        token = self._next()
+        if token != ('operator', operator_token):
+            raise ValueError(f'Expected {operator_token!r}, got {token[1]!r}.')
+
+    def _parse_binary(self, min_precedence: int) -> _Node:
+        left = self._parse_unary()
+        while True:
+            token = self._peek()
+            if token is None or token[0] != 'operator' or token[
+                    1] not in _BINARY_OPERATORS:
+                return left
+            precedence, function = _BINARY_OPERATORS[token[1]]
+            if precedence < min_precedence:
+                return left
+            self._position += 1
+            right = self._parse_binary(min_precedence=precedence + 1)
+            left = self._combine(token[1], function, left, right)
+
+    @staticmethod
+    def _combine(
+        operator_token: str,
+        function: Optional[_BinaryFunction],
+        left: _Node,
+        right: _Node,
+    ) -> _Node:
+        if operator_token == '&&':
+            return lambda values: bool(left(values)) and bool(right(values))
+        if operator_token == '||':
+            return lambda values: bool(left(values)) or bool(right(values))
+        return lambda values: function(left(values), right(values))
+
+    def _parse_unary(self) -> _Node:
+        token = self._peek()
+        if token == ('operator', '!'):
+            self._position += 1
+            operand = self._parse_unary()
+            return lambda values: not operand(values)
+        if token == ('operator', '-'):
+            self._position += 1
+            operand = self._parse_unary()
+            return lambda values: -operand(values)
+        return self._parse_primary()
+
+    def _parse_primary(self) -> _Node:
+        kind, value = self._next()
+        if kind in ('parameter', 'channel'):
+            slot = self.slots.setdefault(value, len(self.slots))
+            return operator.itemgetter(slot)
+        if kind in ('string', 'number'):
+            return lambda values: value
+        if kind == 'operator' and value == '(':
+            node = self._parse_binary(min_precedence=1)
+            self._expect(')')
+            return node
+        if kind == 'name':
+            if value in _CONSTANTS:
+                constant = _CONSTANTS[value]
+                return lambda values: constant
+            if value in _FUNCTIONS:
+                return self._parse_call(_FUNCTIONS[value])
+            raise ValueError(f'Unknown name {value!r}.')
+        raise ValueError(f'Unexpected {value!r}.')
+
+    def _parse_call(self, function: Callable[..., Any]) -> _Node:
+        self._expect('(')
+        arguments: List[_Node] = []
+        if self._peek() != ('operator', ')'):
+            arguments.append(self._parse_binary(min_precedence=1))
+            while self._peek() == ('operator', ','):
+                self._position += 1
+                arguments.append(self._parse_binary(min_precedence=1))
+        self._expect(')')
+        if len(arguments) == 1:
+            [argument] = arguments
+            return lambda values: function(argument(values))
+        return lambda values: function(
+            *[argument(values) for argument in arguments])
+
+
+class CompiledCondition:
+    """A parsed condition.
+
+    Attributes:
+        condition: The condition string.
+        parameter_names: Names of the parameters the condition references, in slot order.
+    """
+
+    def __init__(self, condition: str) -> None:
+        parser = _Parser(condition)
+        self.condition = condition
+        self._evaluate = parser.parse()
+        self.parameter_names: Tuple[str, ...] = tuple(parser.slots)
+
+    def evaluate(self, values: Sequence[Any]) -> bool:
+        """Evaluates the condition.
+
+        Args:
+            values: The values of the referenced parameters, in the order of parameter_names.
+        """
+        return bool(self._evaluate(values))
+
+    def bind(
+        self,
+        task_inputs_spec: Optional[pipeline_spec_pb2.TaskInputsSpec] = None,
+    ) -> 'BoundCondition':
+        """Binds each referenced parameter to an accessor of its value.
+
+        Args:
+            task_inputs_spec: The inputs of the conditional task. Parameters it does not define are looked up by their pipeline channel name.
+        """
+        parameters = task_inputs_spec.parameters if task_inputs_spec else {}
+        accessors = []
+        for name in self.parameter_names:
+            fallback = functools.partial(_resolve_pipeline_channel, name)
+            if name in parameters:
+                accessors.append(
+                    _with_fallback(
+                        _input_accessor(name, parameters[name]), fallback))
+            else:
+                accessors.append(fallback)
+        return BoundCondition(self, accessors)
+
+
+class BoundCondition:
+    """A compiled condition bound to the inputs of a task."""
+
+    def __init__(
+        self,
+        compiled_condition: CompiledCondition,
+        accessors: List[_Accessor],
+    ) -> None:
+        self.compiled_condition = compiled_condition
+        self._accessors = accessors
+
+    def evaluate(self, io_store: io.IOStore) -> bool:
+        """Evaluates the condition with the values in an IOStore.
+
+        Raises:
+            ValueError: If a referenced parameter cannot be resolved.
+        """
+        return self.compiled_condition.evaluate(
+            [accessor(io_store) for accessor in self._accessors])
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def compile_condition(condition: str) -> CompiledCondition:
+    """Parses a condition, caching the result by condition string.
+
+    Raises:
+        ValueError: If the condition is not valid.
+    """
+    try:
+        return CompiledCondition(condition)
+    except ValueError as e:
+        raise ValueError(f'Invalid condition {condition!r}: {e}') from e
+
+
+def _input_accessor(
+    name: str,
+    input_spec: pipeline_spec_pb2.TaskInputsSpec.InputParameterSpec,
+) -> _Accessor:
+    from kfp.local import executor_output_utils
+
+    if input_spec.HasField('runtime_value'):
+        value = executor_output_utils.pb2_value_to_python(
+            input_spec.runtime_value.constant)
+        return lambda io_store: value
+    if input_spec.HasField('task_output_parameter'):
+        producer_task = input_spec.task_output_parameter.producer_task
+        output_key = input_spec.task_output_parameter.output_parameter_key
+        return lambda io_store: io_store.get_task_output(
+            producer_task, output_key)
+    if input_spec.HasField('component_input_parameter'):
+        parent_input = input_spec.component_input_parameter
+        expression_selector = input_spec.parameter_expression_selector
+        if expression_selector:
+            return lambda io_store: OrchestratorUtils._apply_expression_selector(
+                io_store.get_parent_input(parent_input), expression_selector)
+        return lambda io_store: io_store.get_parent_input(parent_input)
+    return functools.partial(_resolve_pipeline_channel, name)
+
+
+def _with_fallback(accessor: _Accessor, fallback: _Accessor) -> _Accessor:
+
+    def access(io_store: io.IOStore) -> Any:
+        try:
+            return accessor(io_store)
+        except ValueError:
+            return fallback(io_store)
+
+    return access
+
+
+def _resolve_pipeline_channel(name: str, io_store: io.IOStore) -> Any:
+    """Resolves a parameter by its pipeline channel name: a task output
+    (``pipelinechannel--<task>-<output>``) or a parent input.
+
+    Raises:
+        ValueError: If the parameter cannot be resolved.
+    """
+    for key in (name, name[len(_PIPELINE_CHANNEL_PREFIX):]
+                if name.startswith(_PIPELINE_CHANNEL_PREFIX) else
+                _PIPELINE_CHANNEL_PREFIX + name):
+        try:
+            return io_store.get_parent_input(key)
+        except ValueError:
+            pass
+
+    channel = name[len(_PIPELINE_CHANNEL_PREFIX):] if name.startswith(
+        _PIPELINE_CHANNEL_PREFIX) else name
+    if '--' in channel:
+        producer_task, output_key = channel.split('--', 1)
+    elif channel.endswith('-Output'):
+        producer_task, output_key = channel[:-len('-Output')], 'Output'
+    else:
+        raise ValueError(f'Could not resolve parameter {name!r}.')
+    try:
+        return io_store.get_task_output(producer_task, output_key)
+    except ValueError as e:
+        raise ValueError(f'Could not resolve parameter {name!r}: {e}') from e
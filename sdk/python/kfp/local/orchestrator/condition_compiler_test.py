@@ -0,0 +1,140 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for condition_compiler.py."""
+import unittest
+from unittest import mock
+
+from absl.testing import parameterized
+from google.protobuf import json_format
+from kfp.local import io
+from kfp.local.orchestrator import condition_compiler
+from kfp.pipeline_spec import pipeline_spec_pb2
+
+
+def _inputs_spec(**parameters) -> pipeline_spec_pb2.TaskInputsSpec:
+    return json_format.ParseDict({'parameters': parameters},
+                                 pipeline_spec_pb2.TaskInputsSpec())
+
+
+class TestCompileCondition(parameterized.TestCase):
+
+    @parameterized.parameters(
+        ("inputs.parameter_values['x'] == 'heads'", ['heads'], True),
+        ("inputs.parameter_values['x'] == 'heads'", ['tails'], False),
+        ("!(inputs.parameter_values['x'] == 'heads')", ['tails'], True),
+        ("int(inputs.parameter_values['x']) > 5", ['6'], True),
+        ("double(inputs.parameter_values['x']) <= 1.5", [2], False),
+        ("inputs.parameter_values['x'] == true", [True], True),
+        ("inputs.parameter_values['x']", [False], False),
+        ("inputs.parameter_values['x'] == 'it\\'s'", ["it's"], True),
+        ('1 + 2 * 3 == 7', [], True),
+        ('-7 / 2 == -3 && -7 % 2 == -1', [], True),
+        ('false || !false', [], True),
+        ("string(true) == 'true' && size('abc') == 3", [], True),
+        ('max(1, 2, 3) == 3', [], True),
+        ('', [], True),
+    )
+    def test_evaluate(self, condition, values, expected):
+        self.assertIs(
+            condition_compiler.compile_condition(condition).evaluate(values),
+            expected)
+
+    def test_and_or_precedence(self):
+        compiled = condition_compiler.compile_condition(
+            "inputs.parameter_values['a'] == 1 || "
+            "inputs.parameter_values['b'] == 1 && "
+            "inputs.parameter_values['c'] == 1")
+        self.assertTrue(compiled.evaluate([1, 0, 0]))
+        self.assertFalse(compiled.evaluate([0, 1, 0]))
+
+    def test_parameters_get_one_slot_each(self):
+        compiled = condition_compiler.compile_condition(
+            "inputs.parameter_values['a'] < inputs.parameter_values['b'] && "
+            "inputs.parameter_values['a'] > 0")
+        self.assertEqual(compiled.parameter_names, ('a', 'b'))
+
+    def test_cached_by_condition_string(self):
+        condition = "inputs.parameter_values['cached'] == 'x'"
+        with mock.patch.object(
+                condition_compiler, '_tokenize',
+                wraps=condition_compiler._tokenize) as mock_tokenize:
+            first = condition_compiler.compile_condition(condition)
+            second = condition_compiler.compile_condition(condition)
+        self.assertIs(first, second)
+        self.assertLessEqual(mock_tokenize.call_count, 1)
+
+    @parameterized.parameters(
+        "inputs.parameter_values['x'] ==",
+        '(1 == 1',
+        '1 == 1)',
+        '__import__("os")',
+        '1 == 1; 2',
+    )
+    def test_invalid(self, condition):
+        with self.assertRaisesRegex(ValueError, r'Invalid condition'):
+            condition_compiler.compile_condition(condition)
+
+
+class TestBind(unittest.TestCase):
+
+    def test_binds_task_inputs(self):
+        io_store = io.IOStore()
+        io_store.put_task_output('flip-coin', 'Output', 'heads')
+        io_store.put_parent_input('threshold', 3)
+        inputs_spec = _inputs_spec(
+            **{
+                'pipelinechannel--flip-coin-Output': {
+                    'taskOutputParameter': {
+                        'producerTask': 'flip-coin',
+                        'outputParameterKey': 'Output',
+                    }
+                },
+                'pipelinechannel--threshold': {
+                    'componentInputParameter': 'threshold'
+                },
+                'pipelinechannel--limit': {
+                    'runtimeValue': {
+                        'constant': 5
+                    }
+                },
+            })
+        bound = condition_compiler.compile_condition(
+            "inputs.parameter_values['pipelinechannel--flip-coin-Output'] == "
+            "'heads' && int(inputs.parameter_values['pipelinechannel--threshold'])"
+            " < int(inputs.parameter_values['pipelinechannel--limit'])").bind(
+                inputs_spec)
+        self.assertTrue(bound.evaluate(io_store))
+
+        io_store.put_parent_input('threshold', 7)
+        self.assertFalse(bound.evaluate(io_store))
+
+    def test_resolves_channel_names_without_task_inputs(self):
+        parent_store = io.IOStore()
+        parent_store.put_task_output('flip-coin', 'Output', 'tails')
+        io_store = io.IOStore(parent=parent_store)
+        io_store.put_parent_input('pipelinechannel--count', 2)
+        bound = condition_compiler.compile_condition(
+            "pipelinechannel--flip-coin-Output == 'tails' && "
+            "inputs.parameter_values['pipelinechannel--count'] == 2").bind()
+        self.assertTrue(bound.evaluate(io_store))
+
+    def test_unresolvable_parameter(self):
+        bound = condition_compiler.compile_condition(
+            "inputs.parameter_values['pipelinechannel--missing'] == 1").bind()
+        with self.assertRaisesRegex(ValueError, r'Could not resolve parameter'):
+            bound.evaluate(io.IOStore())
+
+
+if __name__ == '__main__':
+    unittest.main()
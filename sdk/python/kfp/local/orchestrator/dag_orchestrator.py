@@ -12,11 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Code for locally executing a DAG within a pipeline."""
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from kfp.local import config
 from kfp.local import graph_utils
 from kfp.local import io
+from kfp.local import run_journal
 from kfp.local import status
 from kfp.pipeline_spec import pipeline_spec_pb2
 
@@ -35,6 +36,7 @@ def run_dag(
     unique_pipeline_id: str,
     fail_stack: List[str],
     parent_io_store: 'io.IOStore' = None,
+    journal: Optional[run_journal.DagJournal] = None,
 ) -> Tuple[Outputs, status.Status]:
     """Runs a DAGSpec.
 
@@ -49,6 +51,7 @@ def run_dag(
         runner: The user-specified local runner.
         unique_pipeline_id: A unique identifier for the pipeline for placeholder resolution.
         fail_stack: Mutable stack of failures. If a primitive task in the DAG fails, the task name is appended. If a multitask DAG fails, the DAG name is appended. If the pipeline executes successfully, fail_stack will be empty throughout the full local execution call stack.
+        journal: The journal of the DAG, if this is the root DAG. Tasks the journal can restore are not run again, and the results of the other tasks are recorded in it.
 
     Returns:
         A two-tuple of (outputs, status). If status is FAILURE, outputs is an empty dictionary.
@@ -74,6 +77,8 @@ def run_dag(
     sorted_tasks = graph_utils.topological_sort_tasks(dag_spec.tasks)
     while sorted_tasks:
         task_name = sorted_tasks.pop()
+        if journal is not None and journal.restore_task(task_name, io_store):
+            continue
         task_spec = dag_spec.tasks[task_name]
         component_name = task_spec.component_ref.name
         component_spec = components[component_name]
@@ -109,6 +114,14 @@ def run_dag(
                 fail_stack=fail_stack,
             )
 
+        if journal is not None:
+            journal.record_task(
+                task_name,
+                run_journal.SUCCEEDED
+                if task_status == status.Status.SUCCESS else run_journal.FAILED,
+                outputs,
+            )
+
         if task_status == status.Status.FAILURE:
             fail_stack.append(task_name)
             return {}, status.Status.FAILURE
@@ -18,16 +18,22 @@ dsl.ParallelFor."""
 import concurrent.futures
 import enum
 import logging
-import re
-from typing import Any, Dict, List, Set, Tuple
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+from kfp.local import cancellation
 from kfp.local import config
+from kfp.local import executor_input_utils
 from kfp.local import graph_utils
 from kfp.local import io
+from kfp.local import run_journal
 from kfp.local import status
 from kfp.pipeline_spec import pipeline_spec_pb2
 
+from . import collected_outputs
+from . import condition_compiler
 from . import task_executor
+from . import task_scheduler
 from . import task_spec_utils
 from .orchestrator_utils import OrchestratorUtils
 
@@ -44,191 +50,123 @@ class TaskKind(str, enum.Enum):
 
 
 class ConditionEvaluator:
-    """Evaluates condition expressions for dsl.Condition support."""
+    """Evaluates condition expressions for dsl.Condition support.
 
-    @staticmethod
-    def _extract_pipeline_channels(condition: str) -> List[str]:
-        """Extract pipeline channel references from condition string.
+    The conditions of a DAG are compiled and bound to the inputs of
+    their conditional tasks the first time the DAG is run, and every
+    later run of it in the pipeline run (e.g. each iteration of a
+    ParallelFor body) reuses the bound conditions.
+    """
 
-        Args:
-            condition: The condition expression
+    def __init__(self) -> None:
+        # DAG component name -> {task name -> bound condition, or None if
+        # the condition is not valid}
+        self._dag_conditions: Dict[str, Dict[
+            str, Optional[condition_compiler.BoundCondition]]] = {}
+        self._lock = threading.Lock()
 
-        Returns:
-            List of pipeline channel references found
-        """
-        # Look for patterns like pipelinechannel--task-name-output-name
-        pattern = r'pipelinechannel--[a-zA-Z0-9_\-]+'
-        return re.findall(pattern, condition)
+    def bind_conditions(
+        self,
+        dag_name: str,
+        conditional_tasks: Dict[str, pipeline_spec_pb2.PipelineTaskSpec],
+    ) -> Dict[str, Optional[condition_compiler.BoundCondition]]:
+        """Binds the conditions of the conditional tasks of a DAG.
 
-    @staticmethod
-    def _resolve_pipeline_channel(channel_ref: str,
-                                  io_store: io.IOStore) -> Any:
-        """Resolve a pipeline channel reference to its actual value.
+        Tasks with a blank condition always run and are left out.
 
         Args:
-            channel_ref: The pipeline channel reference string
-            io_store: IOStore containing values
+            dag_name: The name of the DAG's component, which identifies the DAG within the pipeline.
+            conditional_tasks: The conditional tasks of the DAG by task name.
 
         Returns:
-            The resolved value
+            The bound conditions by task name.
         """
-        # Remove the pipelinechannel-- prefix
-        actual_ref = channel_ref.replace('pipelinechannel--', '')
-
-        # Check if this is a task output reference
-        if '-Output' in actual_ref or '--' in actual_ref:
-            # Parse task output reference: task-name-Output or task-name--output-name
-            if '--' in actual_ref:
-                parts = actual_ref.split('--')
-                output_task_name = parts[0]
-                output_key = parts[1] if len(parts) > 1 else 'Output'
-            else:
-                parts = actual_ref.split('-Output')
-                output_task_name = parts[0]
-                output_key = 'Output'
-
-            try:
-                return io_store.get_task_output(output_task_name, output_key)
-            except Exception:
-                logging.warning(
-                    f'Could not resolve task output: {output_task_name}.{output_key}'
-                )
-                return None
-        else:
-            # This is a parent input parameter
-            # Try both the stripped name and the full pipelinechannel name
-            # since IOStore keys may use either format depending on how
-            # the sub-DAG's inputs are defined
-            for key in [
-                    actual_ref, f'pipelinechannel--{actual_ref}', channel_ref
-            ]:
-                try:
-                    return io_store.get_parent_input(key)
-                except (ValueError, KeyError):
-                    continue
-            logging.warning(f'Could not resolve parent input: {actual_ref}')
+        with self._lock:
+            bound_conditions = self._dag_conditions.get(dag_name)
+            if bound_conditions is None:
+                bound_conditions = {
+                    task_name:
+                        self._bind_condition(task_spec.trigger_policy.condition,
+                                             task_spec.inputs)
+                    for task_name, task_spec in conditional_tasks.items()
+                    if task_spec.trigger_policy.condition.strip()
+                }
+                self._dag_conditions[dag_name] = bound_conditions
+            return bound_conditions
+
+    @staticmethod
+    def _bind_condition(
+        condition: str,
+        task_inputs_spec: pipeline_spec_pb2.TaskInputsSpec,
+    ) -> Optional[condition_compiler.BoundCondition]:
+        try:
+            return condition_compiler.compile_condition(condition).bind(
+                task_inputs_spec)
+        except Exception as e:
+            logging.warning(
+                f'Condition evaluation failed for "{condition}": {e}')
             return None
 
     @staticmethod
     def evaluate_condition(
-        condition: str,
+        bound_condition: Optional[condition_compiler.BoundCondition],
         io_store: io.IOStore,
     ) -> bool:
-        """Evaluates a condition string using available values from IOStore.
+        """Evaluates a bound condition using available values from IOStore.
 
-        Handles both simple pipeline channel references and CEL-style
-        expressions like inputs.parameter_values['param_name'].
+        Handles CEL-style expressions like
+        inputs.parameter_values['param_name'] as well as plain pipeline
+        channel references.
 
         Args:
-            condition: The condition expression to evaluate
+            bound_condition: The condition, as bound by bind_conditions
             io_store: IOStore containing available values
 
         Returns:
             True if condition evaluates to True, False otherwise
         """
-        if not condition or not condition.strip():
-            return True
+        if bound_condition is None:
+            return False
 
         try:
-            safe_condition = condition
-
-            # Handle CEL-style inputs.parameter_values['param_name'] references
-            cel_pattern = r"inputs\.parameter_values\['([^']+)'\]"
-            cel_matches = re.findall(cel_pattern, condition)
-            for param_name in cel_matches:
-                value = ConditionEvaluator._resolve_pipeline_channel(
-                    param_name, io_store)
-                if value is not None:
-                    if isinstance(value, str):
-                        replacement = f"'{value}'"
-                    else:
-                        replacement = str(value)
-                    safe_condition = safe_condition.replace(
-                        f"inputs.parameter_values['{param_name}']", replacement)
-                else:
-                    logging.warning(
-                        f'Could not resolve CEL parameter: {param_name}')
-                    return False
-
-            # Also handle direct pipeline channel references
-            pipeline_channels = ConditionEvaluator._extract_pipeline_channels(
-                safe_condition)
-            for channel_ref in pipeline_channels:
-                value = ConditionEvaluator._resolve_pipeline_channel(
-                    channel_ref, io_store)
-                if value is not None:
-                    if isinstance(value, str):
-                        safe_condition = safe_condition.replace(
-                            channel_ref, f"'{value}'")
-                    else:
-                        safe_condition = safe_condition.replace(
-                            channel_ref, str(value))
-                else:
-                    logging.warning(
-                        f'Could not resolve channel reference: {channel_ref}')
-                    return False
-
-            # Convert CEL syntax to Python syntax
-            safe_condition = safe_condition.replace('&&', ' and ')
-            safe_condition = safe_condition.replace('||', ' or ')
-            # Convert CEL negation !(...) to Python not (...)
-            safe_condition = re.sub(r'!\s*\(', 'not (', safe_condition)
-
-            # Use a restricted evaluation environment for safety.
-            # CEL uses lowercase `true`/`false`; expose them as aliases so
-            # evaluating a raw CEL condition doesn't NameError.
-            allowed_names = {
-                '__builtins__': {},
-                'True': True,
-                'False': False,
-                'true': True,
-                'false': False,
-                'None': None,
-                'null': None,
-                'not': lambda x: not x,
-                'int': int,
-                'float': float,
-                'str': str,
-                'bool': bool,
-                'len': len,
-                'min': min,
-                'max': max,
-            }
-
-            result = eval(safe_condition, allowed_names, {})
-            return bool(result)
-
+            return bound_condition.evaluate(io_store)
         except Exception as e:
-            logging.warning(
-                f'Condition evaluation failed for "{condition}": {e}')
+            logging.warning('Condition evaluation failed for '
+                            f'"{bound_condition.compiled_condition.condition}"'
+                            f': {e}')
             return False
 
 
 class ParallelExecutor:
     """Handles parallel execution of tasks for dsl.ParallelFor support."""
 
-    def __init__(self, max_workers: int = None):
+    def __init__(
+        self,
+        max_workers: int = None,
+        scheduler: Optional[task_scheduler.TaskScheduler] = None,
+        continue_on_failure: bool = False,
+        condition_evaluator: Optional[ConditionEvaluator] = None,
+    ):
         """Initialize parallel executor.
 
         Args:
-            max_workers: Maximum number of parallel workers. If None, uses conservative default.
+            max_workers: Maximum number of parallel workers per ParallelFor when the loop sets no parallelism. If None, uses the number of CPUs.
+            scheduler: Pipeline-wide scheduler whose shared executor and task slots iterations run under.
+            continue_on_failure: Whether to run every iteration after one fails rather than cancelling the others.
+            condition_evaluator: Pipeline-wide evaluator of the conditions of the DAGs iterations run.
         """
-        # Use conservative default to avoid thread explosion with nested ParallelFor loops
-        # Conservative max of 2 prevents exponential thread growth:
-        # - 2 levels deep: 2 × 2 = 4 threads
-        # - 3 levels deep: 2 × 2 × 2 = 8 threads
-        self.conservative_max = 2
-        # If max_workers not specified (None), use conservative default
-        # If specified, still cap it to prevent thread explosion in nested loops
-        if max_workers is None:
-            self.max_workers = self.conservative_max
-        else:
-            # Cap user-specified max_workers at conservative maximum
-            self.max_workers = min(max_workers, self.conservative_max)
+        self.scheduler = scheduler or task_scheduler.TaskScheduler()
+        # Iterations of every (nested) ParallelFor run on the scheduler's
+        # process-wide executor, so nesting no longer multiplies threads.
+        # They are bounded by their loop's parallelism, not by the
+        # pipeline-wide max_parallelism
+        self.max_workers = max_workers or 0
+        self.continue_on_failure = continue_on_failure
+        self.condition_evaluator = condition_evaluator or ConditionEvaluator()
 
     def execute_parallel_tasks(
         self,
-        tasks: List[Tuple[str, pipeline_spec_pb2.PipelineTaskSpec]],
+        tasks: Iterable[Tuple[str, pipeline_spec_pb2.PipelineTaskSpec]],
         pipeline_resource_name: str,
         components: Dict[str, pipeline_spec_pb2.ComponentSpec],
         executors: Dict[
@@ -238,12 +176,17 @@ class ParallelExecutor:
         runner: config.LocalRunnerType,
         unique_pipeline_id: str,
         fail_stack: List[str],
+        collected: collected_outputs.CollectedOutputs,
         parallelism_limit: int = 0,
-    ) -> Tuple[Dict[str, Outputs], status.Status]:
+        journal: Optional[run_journal.DagJournal] = None,
+    ) -> status.Status:
         """Execute tasks in parallel with optional parallelism limit.
 
+        Tasks are taken from the iterable only as workers free up, so
+        at most the parallelism limit of task specs exist at once.
+
         Args:
-            tasks: List of (task_name, task_spec) tuples to execute
+            tasks: (task_name, task_spec) tuples to execute; the i-th tuple is iteration i
             pipeline_resource_name: The root pipeline resource name
             components: Component specifications
             executors: Executor specifications
@@ -252,24 +195,26 @@ class ParallelExecutor:
             runner: Local runner configuration
             unique_pipeline_id: Unique pipeline identifier
             fail_stack: Mutable failure stack
-            parallelism_limit: Maximum parallel executions (0 = unlimited)
+            collected: Store the outputs of each task are put into, by iteration index
+            parallelism_limit: Maximum parallel executions (0 = up to max_workers)
+            journal: The journal of the ParallelFor, under which the iterations record their tasks, if any
 
         Returns:
-            Tuple of (all_outputs, overall_status)
+            The overall status
         """
-        # Determine max_workers: use parallelism_limit if specified, otherwise use default
-        requested_workers = parallelism_limit if parallelism_limit > 0 else self.max_workers
-        # Always cap at conservative maximum to prevent thread explosion in nested loops
-        max_workers = min(requested_workers, self.conservative_max)
-        all_outputs = {}
-
-        executor = concurrent.futures.ThreadPoolExecutor(
-            max_workers=max_workers)
-        try:
-            # Submit all tasks
-            future_to_task = {}
-            for task_name, task_spec in tasks:
-                future = executor.submit(
+        limit = parallelism_limit if parallelism_limit > 0 else self.max_workers
+        group = self.scheduler.loop_group(limit=limit)
+        indexed_tasks = enumerate(tasks)
+        # future -> (iteration index, task name) of the submitted tasks
+        running: Dict[concurrent.futures.Future, Tuple[int, str]] = {}
+
+        def submit_tasks() -> None:
+            while len(running) < group.limit:
+                next_task = next(indexed_tasks, None)
+                if next_task is None:
+                    return
+                index, (task_name, task_spec) = next_task
+                future = group.submit(
                     execute_task,
                     task_name=task_name,
                     task_spec=task_spec,
@@ -281,35 +226,61 @@ class ParallelExecutor:
                     runner=runner,
                     unique_pipeline_id=unique_pipeline_id,
                     fail_stack=fail_stack,
+                    scheduler=self.scheduler,
+                    condition_evaluator=self.condition_evaluator,
+                    journal=journal,
                 )
-                future_to_task[future] = task_name
-
-            # Collect results
-            for future in concurrent.futures.as_completed(future_to_task):
-                task_name = future_to_task[future]
-                try:
-                    outputs, task_status = future.result()
+                running[future] = (index, task_name)
+
+        # Collect results as they complete. The waiting thread runs queued
+        # iterations itself, so an outer iteration waiting here never
+        # starves the inner ones of workers. Iterations are submitted
+        # within the cancellation scope so that cancelling it reaches
+        # whichever threads run them.
+        failed_tasks: List[Tuple[int, str]] = []
+        with cancellation.cancellation_scope() as scope:
+            submit_tasks()
+            while running and not (failed_tasks and
+                                   not self.continue_on_failure):
+                done = group.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    index, task_name = running.pop(future)
+                    try:
+                        outputs, task_status = future.result()
+                    except Exception as e:
+                        logging.error(
+                            f'Task {task_name} failed with exception: {e}')
+                        task_status = status.Status.FAILURE
 
                     if task_status == status.Status.FAILURE:
-                        fail_stack.append(task_name)
-                        return {}, status.Status.FAILURE
-
-                    all_outputs[task_name] = outputs
+                        failed_tasks.append((index, task_name))
+                        if not self.continue_on_failure:
+                            break
+                    else:
+                        collected.put(index, outputs)
+                else:
+                    submit_tasks()
 
-                    # Update IO store with outputs
-                    for key, output in outputs.items():
-                        io_store.put_task_output(task_name, key, output)
+            if failed_tasks and running:
+                # Fast fail: drop the queued iterations and stop the
+                # running ones rather than waiting for them to finish
+                logging.error(f'Task {failed_tasks[0][1]} failed; cancelling '
+                              f'{len(running)} other iteration(s)')
+                for future in running:
+                    future.cancel()
+                scope.cancel()
+                group.wait(running)
 
-                except Exception as e:
-                    logging.error(
-                        f'Task {task_name} failed with exception: {e}')
-                    fail_stack.append(task_name)
-                    return {}, status.Status.FAILURE
+        if failed_tasks:
+            failed_tasks.sort()
+            if len(failed_tasks) > 1:
+                logging.error('Failed iterations: ' +
+                              ', '.join(name for _, name in failed_tasks))
+            fail_stack.append(failed_tasks[0][1])
+            return status.Status.FAILURE
 
-            return all_outputs, status.Status.SUCCESS
-        finally:
-            # Explicitly shutdown the executor and wait for threads to terminate
-            executor.shutdown(wait=True)
+        return status.Status.SUCCESS
 
 
 def _has_valid_iterator(task_spec: pipeline_spec_pb2.PipelineTaskSpec) -> bool:
@@ -369,13 +340,18 @@ def _run_parallel_for_task(
     unique_pipeline_id: str,
     fail_stack: List[str],
     parallel_executor: 'ParallelExecutor',
+    journal: Optional[run_journal.DagJournal] = None,
 ) -> bool:
     """Run all iterations of a single ParallelFor task.
 
-    Resolves the iterator's items from IOStore, materializes an
-    iteration task spec per item, executes them in parallel, and writes
-    aggregated outputs back to IOStore under the loop task name so
-    downstream Collected consumers can read them.
+    Resolves the iterator's items from IOStore, executes an iteration
+    task spec per item in parallel, building each spec only when its
+    iteration starts, and writes aggregated outputs back to IOStore
+    under the loop task name so downstream Collected consumers can read
+    them.
+
+    If the journal of the DAG the task is in is given, the tasks of the
+    iterations are restored from and recorded in it.
 
     Returns True if the parallel_for failed and the caller should
     propagate failure; False otherwise.
@@ -424,26 +400,37 @@ def _run_parallel_for_task(
             f'Unknown iterator type for task {task_name}: {iterator}')
         return False
 
-    loop_tasks = []
-    for i, item in enumerate(items):
-        iteration_task_name = f"{task_name}-iteration-{i}"
-        if iterator == 'artifact_iterator':
-            iteration_task_spec = (
-                task_spec_utils.create_artifact_loop_iteration_task_spec(
-                    task_spec, i, task_name, artifact_item_input))
-            iteration_key = f'{artifact_item_input}-iteration-{i}'
-            io_store.put_parent_input(iteration_key, item)
-        else:
-            iteration_task_spec = (
-                task_spec_utils.create_parameter_loop_iteration_task_spec(
-                    task_spec, item, task_name))
-        loop_tasks.append((iteration_task_name, iteration_task_spec))
-
-    if not loop_tasks:
+    if not items:
         return False
 
-    parallel_outputs, parallel_status = parallel_executor.execute_parallel_tasks(
-        tasks=loop_tasks,
+    def iteration_tasks(
+    ) -> Iterator[Tuple[str, pipeline_spec_pb2.PipelineTaskSpec]]:
+        # iteration task specs are built as iterations are started rather
+        # than all up front
+        for i, item in enumerate(items):
+            iteration_task_name = f"{task_name}-iteration-{i}"
+            if iterator == 'artifact_iterator':
+                iteration_task_spec = (
+                    task_spec_utils.create_artifact_loop_iteration_task_spec(
+                        task_spec, i, task_name, artifact_item_input))
+                iteration_key = f'{artifact_item_input}-iteration-{i}'
+                io_store.put_parent_input(iteration_key, item)
+            else:
+                iteration_task_spec = (
+                    task_spec_utils.create_parameter_loop_iteration_task_spec(
+                        task_spec, item, task_name))
+            yield iteration_task_name, iteration_task_spec
+
+    collected = collected_outputs.CollectedOutputs(
+        num_iterations=len(items),
+        spill_dir=executor_input_utils.construct_local_task_root(
+            pipeline_root=pipeline_root,
+            pipeline_resource_name=pipeline_resource_name,
+            task_resource_name=task_name,
+        ),
+    )
+    parallel_status = parallel_executor.execute_parallel_tasks(
+        tasks=iteration_tasks(),
         pipeline_resource_name=pipeline_resource_name,
         components=components,
         executors=executors,
@@ -452,27 +439,24 @@ def _run_parallel_for_task(
         runner=runner,
         unique_pipeline_id=unique_pipeline_id,
         fail_stack=fail_stack,
+        collected=collected,
         parallelism_limit=parallelism_limit,
+        journal=journal.nested_dag(task_name) if journal is not None else None,
     )
 
     if parallel_status == status.Status.FAILURE:
         return True
 
-    # Aggregate iteration outputs into lists keyed by output name, in
-    # iteration order, and publish under the loop task's name so that
-    # downstream dsl.Collected consumers resolve via IOStore.
-    aggregated_outputs: Dict[str, Dict[str, Any]] = {}
-    for iteration_name, outputs in parallel_outputs.items():
-        iteration_index = iteration_name.split('-iteration-')[-1]
-        for output_key, output_value in outputs.items():
-            aggregated_outputs.setdefault(output_key,
-                                          {})[iteration_index] = output_value
-
-    for output_key, iteration_outputs in aggregated_outputs.items():
-        ordered_outputs = [
-            iteration_outputs.get(str(i)) for i in range(len(items))
-        ]
-        io_store.put_task_output(task_name, output_key, ordered_outputs)
+    # Publish the iteration outputs as lists in iteration order under the
+    # loop task's name so that downstream dsl.Collected consumers resolve
+    # via IOStore. Spilled outputs are only read back from their file when
+    # a consumer reads them.
+    for output_key in collected.output_keys:
+        if collected.spilled:
+            output = collected.lazy_output(output_key)
+        else:
+            output = collected.get(output_key)
+        io_store.put_task_output(task_name, output_key, output)
 
     io_store.put_task_status(task_name, 'SUCCEEDED')
     return False
@@ -490,12 +474,27 @@ def run_enhanced_dag(
     unique_pipeline_id: str,
     fail_stack: List[str],
     parent_io_store: 'io.IOStore' = None,
+    scheduler: Optional[task_scheduler.TaskScheduler] = None,
+    journal: Optional[run_journal.DagJournal] = None,
+    condition_evaluator: Optional[ConditionEvaluator] = None,
+    dag_name: str = '',
 ) -> Tuple[Outputs, status.Status]:
     """Enhanced DAG runner with support for dsl.Condition and dsl.ParallelFor.
 
     This is an enhanced version of dag_orchestrator.run_dag that
     supports control flow features like conditions and parallel loops.
+    Body tasks run concurrently as soon as their upstream tasks have
+    finished, bounded by the pipeline-wide scheduler. If the DAG's
+    journal is given, tasks it can restore are not run again and the
+    results of the other tasks, including those of nested DAGs, are
+    recorded in it. dag_name is the name of the DAG's component, or
+    empty for the root DAG.
     """
+    if scheduler is None:
+        scheduler = task_scheduler.TaskScheduler()
+    if condition_evaluator is None:
+        condition_evaluator = ConditionEvaluator()
+
     dag_arguments_with_defaults = OrchestratorUtils.join_user_inputs_and_defaults(
         dag_arguments=dag_arguments,
         dag_inputs_spec=dag_component_spec.input_definitions,
@@ -546,120 +545,139 @@ def run_enhanced_dag(
             task_kinds[task_name] = TaskKind.REGULAR
             body_tasks[task_name] = task_spec
 
-    # Track overall body status for exit handler support, plus the set of
-    # task names that have failed (or were skipped because their upstream
-    # failed). failed_tasks feeds the dependency-failure gating below.
-    body_failed = False
+    # The set of task names that have failed (or were skipped because their
+    # upstream failed). failed_tasks feeds the dependency-failure gating
+    # below and, together with exit task outcomes, the overall DAG status.
     failed_tasks: Set[str] = set()
 
-    condition_evaluator = ConditionEvaluator()
-    parallel_executor = ParallelExecutor()
+    bound_conditions = condition_evaluator.bind_conditions(
+        dag_name, {
+            task_name: body_tasks[task_name]
+            for task_name, kind in task_kinds.items()
+            if kind == TaskKind.CONDITION
+        })
+    parallel_executor = ParallelExecutor(
+        scheduler=scheduler,
+        continue_on_failure=getattr(config.LocalExecutionConfig.instance,
+                                    'continue_on_failure', False),
+        condition_evaluator=condition_evaluator,
+    )
 
-    if body_tasks:
-        sorted_body_tasks = graph_utils.topological_sort_tasks(body_tasks)
+    def run_body_task(task_name: str) -> None:
+        """Runs one body task once all its upstream tasks have finished.
 
-        while sorted_body_tasks:
-            task_name = sorted_body_tasks.pop()
-            task_spec = body_tasks[task_name]
-            kind = task_kinds[task_name]
-
-            # Dependency-failure gating. A task whose upstream failed is
-            # skipped unless it explicitly opts in to running on completion
-            # (ignore_upstream_failure → ALL_UPSTREAM_TASKS_COMPLETED).
-            failed_deps = [
-                dep for dep in task_spec.dependent_tasks if dep in failed_tasks
-            ]
-            if failed_deps and (
-                    task_spec.trigger_policy.strategy
-                    != TRIGGER_STRATEGY.ALL_UPSTREAM_TASKS_COMPLETED):
-                logging.info(f'Skipping task {task_name}: upstream task(s) '
-                             f'{sorted(failed_deps)} failed.')
+        May run on a scheduler worker thread. Each task only writes its
+        own IOStore entries, and downstream tasks are not started until
+        this returns.
+        """
+        task_spec = body_tasks[task_name]
+        kind = task_kinds[task_name]
+
+        # Dependency-failure gating. A task whose upstream failed is
+        # skipped unless it explicitly opts in to running on completion
+        # (ignore_upstream_failure → ALL_UPSTREAM_TASKS_COMPLETED).
+        failed_deps = [
+            dep for dep in task_spec.dependent_tasks if dep in failed_tasks
+        ]
+        if failed_deps and (task_spec.trigger_policy.strategy
+                            != TRIGGER_STRATEGY.ALL_UPSTREAM_TASKS_COMPLETED):
+            logging.info(f'Skipping task {task_name}: upstream task(s) '
+                         f'{sorted(failed_deps)} failed.')
+            failed_tasks.add(task_name)
+            io_store.put_task_status(task_name, 'FAILED')
+            return
+
+        if kind == TaskKind.PARALLEL_FOR:
+            parallel_for_failed = _run_parallel_for_task(
+                task_name=task_name,
+                task_spec=task_spec,
+                pipeline_resource_name=pipeline_resource_name,
+                components=components,
+                executors=executors,
+                io_store=io_store,
+                pipeline_root=pipeline_root,
+                runner=runner,
+                unique_pipeline_id=unique_pipeline_id,
+                fail_stack=fail_stack,
+                parallel_executor=parallel_executor,
+                journal=journal,
+            )
+            if parallel_for_failed:
                 failed_tasks.add(task_name)
-                io_store.put_task_status(task_name, 'FAILED')
-                body_failed = True
-                continue
+            return
 
-            if kind == TaskKind.REGULAR:
-                outputs, task_status = execute_task(
-                    task_name=task_name,
-                    task_spec=task_spec,
-                    pipeline_resource_name=pipeline_resource_name,
-                    components=components,
-                    executors=executors,
-                    io_store=io_store,
-                    pipeline_root=pipeline_root,
-                    runner=runner,
-                    unique_pipeline_id=unique_pipeline_id,
-                    fail_stack=fail_stack,
-                )
-
-                status_str = ('SUCCEEDED' if task_status
-                              == status.Status.SUCCESS else 'FAILED')
-                io_store.put_task_status(task_name, status_str)
+        if kind == TaskKind.CONDITION and task_name in bound_conditions:
+            should_execute = condition_evaluator.evaluate_condition(
+                bound_conditions[task_name], io_store)
 
-                if task_status == status.Status.FAILURE:
-                    fail_stack.append(task_name)
-                    failed_tasks.add(task_name)
-                    body_failed = True
-                    continue
+            if not should_execute:
+                logging.info(f'Skipping conditional task {task_name} '
+                             '(condition evaluated to False)')
+                return
 
-                for key, output in outputs.items():
-                    io_store.put_task_output(task_name, key, output)
-
-            elif kind == TaskKind.CONDITION:
-                condition_expr = task_spec.trigger_policy.condition
-                should_execute = condition_evaluator.evaluate_condition(
-                    condition_expr, io_store)
-
-                if not should_execute:
-                    logging.info(f'Skipping conditional task {task_name} '
-                                 '(condition evaluated to False)')
-                    continue
+        outputs, task_status = execute_task(
+            task_name=task_name,
+            task_spec=task_spec,
+            pipeline_resource_name=pipeline_resource_name,
+            components=components,
+            executors=executors,
+            io_store=io_store,
+            pipeline_root=pipeline_root,
+            runner=runner,
+            unique_pipeline_id=unique_pipeline_id,
+            fail_stack=fail_stack,
+            scheduler=scheduler,
+            condition_evaluator=condition_evaluator,
+            journal=journal,
+        )
 
-                outputs, task_status = execute_task(
-                    task_name=task_name,
-                    task_spec=task_spec,
-                    pipeline_resource_name=pipeline_resource_name,
-                    components=components,
-                    executors=executors,
-                    io_store=io_store,
-                    pipeline_root=pipeline_root,
-                    runner=runner,
-                    unique_pipeline_id=unique_pipeline_id,
-                    fail_stack=fail_stack,
-                )
+        status_str = ('SUCCEEDED'
+                      if task_status == status.Status.SUCCESS else 'FAILED')
+        io_store.put_task_status(task_name, status_str)
 
-                status_str = ('SUCCEEDED' if task_status
-                              == status.Status.SUCCESS else 'FAILED')
-                io_store.put_task_status(task_name, status_str)
+        if task_status == status.Status.FAILURE:
+            fail_stack.append(task_name)
+            failed_tasks.add(task_name)
+            return
 
-                if task_status == status.Status.FAILURE:
-                    fail_stack.append(task_name)
-                    failed_tasks.add(task_name)
-                    body_failed = True
-                    continue
+        for key, output in outputs.items():
+            io_store.put_task_output(task_name, key, output)
 
-                for key, output in outputs.items():
-                    io_store.put_task_output(task_name, key, output)
+    def journal_status(task_name: str) -> str:
+        if task_name in failed_tasks:
+            return run_journal.FAILED
+        try:
+            io_store.get_task_status(task_name)
+        except ValueError:
+            # condition evaluated to False
+            return run_journal.SKIPPED
+        return run_journal.SUCCEEDED
+
+    def run_and_record_body_task(task_name: str) -> None:
+        if journal is not None and journal.restore_task(task_name, io_store):
+            return
+        run_body_task(task_name)
+        if journal is not None:
+            # spilled ParallelFor outputs are recorded by reference
+            journal.record_task(
+                task_name, journal_status(task_name),
+                io_store.get_task_outputs(task_name, load_lazy_values=False))
 
-            elif kind == TaskKind.PARALLEL_FOR:
-                parallel_for_failed = _run_parallel_for_task(
-                    task_name=task_name,
-                    task_spec=task_spec,
-                    pipeline_resource_name=pipeline_resource_name,
-                    components=components,
-                    executors=executors,
-                    io_store=io_store,
-                    pipeline_root=pipeline_root,
-                    runner=runner,
-                    unique_pipeline_id=unique_pipeline_id,
-                    fail_stack=fail_stack,
-                    parallel_executor=parallel_executor,
-                )
+    if body_tasks:
+        # topological_sort_tasks returns a stack to pop from the right;
+        # reversing it gives the start order used when several tasks are
+        # ready at once
+        sorted_body_tasks = graph_utils.topological_sort_tasks(body_tasks)
+        scheduler.run_ready_set(
+            ordered_tasks=sorted_body_tasks[::-1],
+            dependencies={
+                task_name: task_spec.dependent_tasks
+                for task_name, task_spec in body_tasks.items()
+            },
+            run_task=run_and_record_body_task,
+        )
 
-                if parallel_for_failed:
-                    failed_tasks.add(task_name)
-                    body_failed = True
+    body_failed = bool(failed_tasks)
 
     # If the body failed and there are no exit tasks to run afterwards, bail
     # out now. Exit tasks always run below regardless of body outcome.
@@ -672,6 +690,9 @@ def run_enhanced_dag(
     exit_failed = False
     if exit_tasks:
         for task_name, task_spec in exit_tasks:
+            if journal is not None and journal.restore_task(
+                    task_name, io_store):
+                continue
             outputs, task_status = execute_task(
                 task_name=task_name,
                 task_spec=task_spec,
@@ -683,11 +704,16 @@ def run_enhanced_dag(
                 runner=runner,
                 unique_pipeline_id=unique_pipeline_id,
                 fail_stack=fail_stack,
+                scheduler=scheduler,
+                condition_evaluator=condition_evaluator,
+                journal=journal,
             )
 
             status_str = ('SUCCEEDED'
                           if task_status == status.Status.SUCCESS else 'FAILED')
             io_store.put_task_status(task_name, status_str)
+            if journal is not None:
+                journal.record_task(task_name, status_str, outputs)
 
             if task_status == status.Status.SUCCESS:
                 for key, output in outputs.items():
@@ -720,8 +746,15 @@ def execute_task(
     runner: config.LocalRunnerType,
     unique_pipeline_id: str,
     fail_stack: List[str],
+    scheduler: task_scheduler.TaskScheduler,
+    condition_evaluator: Optional[ConditionEvaluator] = None,
+    journal: Optional[run_journal.DagJournal] = None,
 ) -> Tuple[Outputs, status.Status]:
-    """Execute a single task."""
+    """Execute a single task.
+
+    journal is the journal of the DAG the task is in, which the tasks of
+    a nested DAG are restored from and recorded in.
+    """
     component_name = task_spec.component_ref.name
     component_spec = components[component_name]
     implementation = component_spec.WhichOneof('implementation')
@@ -749,18 +782,24 @@ def execute_task(
             unique_pipeline_id=unique_pipeline_id,
             fail_stack=fail_stack,
             parent_io_store=io_store,
+            scheduler=scheduler,
+            journal=journal.nested_dag(task_name, component_spec.dag.tasks)
+            if journal is not None else None,
+            condition_evaluator=condition_evaluator,
+            dag_name=component_name,
         )
 
     else:
-        return task_executor.execute_single_task(
-            task_name=task_name,
-            task_spec=task_spec,
-            pipeline_resource_name=pipeline_resource_name,
-            components=components,
-            executors=executors,
-            io_store=io_store,
-            pipeline_root=pipeline_root,
-            runner=runner,
-            unique_pipeline_id=unique_pipeline_id,
-            fail_stack=fail_stack,
-        )
+        with scheduler.task_slot():
+            return task_executor.execute_single_task(
+                task_name=task_name,
+                task_spec=task_spec,
+                pipeline_resource_name=pipeline_resource_name,
+                components=components,
+                executors=executors,
+                io_store=io_store,
+                pipeline_root=pipeline_root,
+                runner=runner,
+                unique_pipeline_id=unique_pipeline_id,
+                fail_stack=fail_stack,
+            )
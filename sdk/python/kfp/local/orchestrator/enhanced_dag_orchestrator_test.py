@@ -0,0 +1,230 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for enhanced_dag_orchestrator.py."""
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from google.protobuf import json_format
+from kfp.local import cancellation
+from kfp.local import io
+from kfp.local import status
+from kfp.local.orchestrator import collected_outputs
+from kfp.local.orchestrator import condition_compiler
+from kfp.local.orchestrator import enhanced_dag_orchestrator
+from kfp.local.orchestrator import task_scheduler
+from kfp.pipeline_spec import pipeline_spec_pb2
+
+
+class TestParallelExecutor(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.lock = threading.Lock()
+        self.num_created = 0
+        self.num_finished = 0
+        self.max_outstanding = 0
+        # the loop budget is the number of CPUs, which may be 1
+        patcher = mock.patch.object(
+            task_scheduler, '_shared_executor',
+            task_scheduler.SharedExecutor(max_loop_tasks=4))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def iteration_tasks(self, num_iterations: int):
+        for i in range(num_iterations):
+            with self.lock:
+                self.num_created += 1
+                self.max_outstanding = max(self.max_outstanding,
+                                           self.num_created - self.num_finished)
+            task_spec = pipeline_spec_pb2.PipelineTaskSpec()
+            yield f'for-loop-2-iteration-{i}', task_spec
+
+    def execute_task(self, task_name, fail=(), **kwargs):
+        time.sleep(0.001)
+        with self.lock:
+            self.num_finished += 1
+        if task_name in fail:
+            return {}, status.Status.FAILURE
+        return {'Output': int(task_name.split('-')[-1])}, status.Status.SUCCESS
+
+    def execute_parallel_tasks(self,
+                               num_iterations,
+                               parallelism_limit,
+                               continue_on_failure=False):
+        executor = enhanced_dag_orchestrator.ParallelExecutor(
+            scheduler=task_scheduler.TaskScheduler(max_parallelism=4),
+            continue_on_failure=continue_on_failure)
+        collected = collected_outputs.CollectedOutputs(
+            num_iterations=num_iterations, spill_dir=self.temp_dir.name)
+        fail_stack = []
+        parallel_status = executor.execute_parallel_tasks(
+            tasks=self.iteration_tasks(num_iterations),
+            pipeline_resource_name='my-pipeline',
+            components={},
+            executors={},
+            io_store=io.IOStore(),
+            pipeline_root=self.temp_dir.name,
+            runner=None,
+            unique_pipeline_id='abc',
+            fail_stack=fail_stack,
+            collected=collected,
+            parallelism_limit=parallelism_limit,
+        )
+        return parallel_status, collected, fail_stack
+
+    def test_creates_task_specs_as_workers_free_up(self):
+        with mock.patch.object(enhanced_dag_orchestrator, 'execute_task',
+                               self.execute_task):
+            parallel_status, collected, _ = self.execute_parallel_tasks(
+                num_iterations=100, parallelism_limit=3)
+
+        self.assertEqual(parallel_status, status.Status.SUCCESS)
+        self.assertEqual(self.num_created, 100)
+        self.assertLessEqual(self.max_outstanding, 3)
+        self.assertEqual(collected.get('Output'), list(range(100)))
+
+    def test_stops_creating_task_specs_after_failure(self):
+
+        def execute_task(task_name, **kwargs):
+            return self.execute_task(
+                task_name, fail=('for-loop-2-iteration-5',), **kwargs)
+
+        with mock.patch.object(enhanced_dag_orchestrator, 'execute_task',
+                               execute_task):
+            parallel_status, _, fail_stack = self.execute_parallel_tasks(
+                num_iterations=100, parallelism_limit=2)
+
+        self.assertEqual(parallel_status, status.Status.FAILURE)
+        self.assertEqual(fail_stack, ['for-loop-2-iteration-5'])
+        self.assertLess(self.num_created, 10)
+
+    def test_cancels_running_tasks_after_failure(self):
+        started = threading.Event()
+        cancelled = threading.Event()
+        ran = []
+
+        def execute_task(task_name, **kwargs):
+            index = int(task_name.split('-')[-1])
+            if index == 0:
+                started.wait(timeout=5)
+                return {}, status.Status.FAILURE
+            if index == 1:
+                # stands in for a task handler stopping its process
+                with cancellation.on_cancel(cancelled.set):
+                    started.set()
+                    cancelled.wait(timeout=5)
+                return {}, status.Status.FAILURE
+            ran.append(task_name)
+            return {}, status.Status.SUCCESS
+
+        start_time = time.monotonic()
+        with mock.patch.object(enhanced_dag_orchestrator, 'execute_task',
+                               execute_task):
+            parallel_status, _, fail_stack = self.execute_parallel_tasks(
+                num_iterations=10, parallelism_limit=2)
+
+        self.assertEqual(parallel_status, status.Status.FAILURE)
+        self.assertEqual(fail_stack, ['for-loop-2-iteration-0'])
+        self.assertTrue(cancelled.is_set())
+        self.assertEqual(ran, [])
+        self.assertLess(time.monotonic() - start_time, 5)
+
+    def test_continue_on_failure_runs_every_task(self):
+        failed = ('for-loop-2-iteration-7', 'for-loop-2-iteration-2')
+
+        def execute_task(task_name, **kwargs):
+            self.assertFalse(cancellation.is_cancelled())
+            return self.execute_task(task_name, fail=failed, **kwargs)
+
+        with mock.patch.object(enhanced_dag_orchestrator, 'execute_task',
+                               execute_task):
+            parallel_status, collected, fail_stack = self.execute_parallel_tasks(
+                num_iterations=10,
+                parallelism_limit=2,
+                continue_on_failure=True)
+
+        self.assertEqual(parallel_status, status.Status.FAILURE)
+        self.assertEqual(self.num_finished, 10)
+        self.assertEqual(fail_stack, ['for-loop-2-iteration-2'])
+        self.assertEqual(
+            collected.get('Output'), [0, 1, None, 3, 4, 5, 6, None, 8, 9])
+
+
+def _conditional_task(condition: str) -> pipeline_spec_pb2.PipelineTaskSpec:
+    return json_format.ParseDict(
+        {
+            'triggerPolicy': {
+                'condition': condition
+            },
+            'inputs': {
+                'parameters': {
+                    'pipelinechannel--flip-coin-Output': {
+                        'taskOutputParameter': {
+                            'producerTask': 'flip-coin',
+                            'outputParameterKey': 'Output',
+                        }
+                    }
+                }
+            },
+        }, pipeline_spec_pb2.PipelineTaskSpec())
+
+
+class TestConditionEvaluator(unittest.TestCase):
+
+    def test_binds_conditions_once_per_dag(self):
+        evaluator = enhanced_dag_orchestrator.ConditionEvaluator()
+        tasks = {
+            'condition-1':
+                _conditional_task(
+                    "inputs.parameter_values['pipelinechannel--flip-coin-Output']"
+                    " == 'heads'")
+        }
+        with mock.patch.object(
+                condition_compiler.CompiledCondition,
+                'bind',
+                autospec=True,
+                side_effect=condition_compiler.CompiledCondition.bind) as bind:
+            bound_conditions = evaluator.bind_conditions(
+                'comp-for-loop-2', tasks)
+            self.assertIs(
+                evaluator.bind_conditions('comp-for-loop-2', tasks),
+                bound_conditions)
+        self.assertEqual(bind.call_count, 1)
+
+        for output, expected in [('heads', True), ('tails', False)]:
+            io_store = io.IOStore()
+            io_store.put_task_output('flip-coin', 'Output', output)
+            self.assertEqual(
+                evaluator.evaluate_condition(bound_conditions['condition-1'],
+                                             io_store), expected)
+
+    def test_invalid_condition_evaluates_to_false(self):
+        evaluator = enhanced_dag_orchestrator.ConditionEvaluator()
+        bound_conditions = evaluator.bind_conditions(
+            '', {
+                'condition-1': _conditional_task('=='),
+                'condition-2': _conditional_task(' '),
+            })
+        self.assertEqual(list(bound_conditions), ['condition-1'])
+        self.assertFalse(
+            evaluator.evaluate_condition(bound_conditions['condition-1'],
+                                         io.IOStore()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -115,7 +115,8 @@ def execute_single_task(
             env_vars=env_vars,
             custom_cache_key=(task_spec.caching_options.cache_key or None),
         )
-        cached_outputs = local_cache.get(cache_key)
+        cached_outputs = local_cache.get(
+            cache_key, component_name=component_name)
         if cached_outputs is not None:
             logging.info(f'Task {task_name} cache hit (key={cache_key[:12]}); '
                          'skipping execution.')
@@ -162,7 +163,8 @@ def execute_single_task(
             if (task_status == status.Status.SUCCESS and
                     local_cache is not None and cache_key is not None):
                 try:
-                    local_cache.put(cache_key, outputs)
+                    local_cache.put(
+                        cache_key, outputs, component_name=component_name)
                 except Exception as exc:  # pragma: no cover - defensive
                     logging.warning(f'Failed to write cache entry for task '
                                     f'{task_name}: {exc}')
@@ -0,0 +1,370 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Dependency-driven scheduling of local DAG tasks."""
+
+import collections
+import concurrent.futures
+import contextlib
+import contextvars
+import heapq
+import os
+import threading
+from typing import (Any, Callable, Deque, Dict, Generator, Iterable, List,
+                    Optional, Set)
+
+
+class _WorkItem:
+    """A callable submitted to a TaskGroup and the future for its result.
+
+    The callable runs in a copy of the submitting thread's context, so
+    context variables such as the cancellation scope follow the work to
+    whichever thread runs it.
+    """
+
+    def __init__(self, group: 'TaskGroup', fn: Callable[..., Any], args: tuple,
+                 kwargs: Dict[str, Any]) -> None:
+        self.group = group
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.context = contextvars.copy_context()
+        if group.loop_iterations:
+            self.context.run(_in_loop_iteration.set, True)
+        self.future = concurrent.futures.Future()
+
+    def run(self) -> None:
+        if not self.future.set_running_or_notify_cancel():
+            return
+        try:
+            result = self.context.run(self.fn, *self.args, **self.kwargs)
+        except BaseException as e:
+            self.future.set_exception(e)
+        else:
+            self.future.set_result(result)
+
+
+class SharedExecutor:
+    """Process-wide worker pool shared by every local DAG and ParallelFor.
+
+    Work is submitted through TaskGroups, each with its own concurrency
+    limit. A thread that waits on a group runs that group's queued work
+    itself instead of blocking, so an outer ParallelFor iteration
+    waiting on its inner iterations never holds a worker that the inner
+    iterations need. This makes nested groups deadlock-free with a fixed
+    number of workers.
+
+    It also holds the process-wide budget of executor-backed tasks that
+    the iterations of all ParallelFor loops, nested or not, run at once.
+    """
+
+    def __init__(self, max_loop_tasks: Optional[int] = None) -> None:
+        """SharedExecutor constructor.
+
+        Args:
+            max_loop_tasks: Maximum number of executor-backed tasks of ParallelFor iterations to run at once, across every loop of the process. Defaults to the number of CPUs.
+        """
+        self.max_loop_tasks = max_loop_tasks or _cpu_count()
+        self.loop_task_slots = threading.BoundedSemaphore(self.max_loop_tasks)
+        self._condition = threading.Condition()
+        # groups that have queued work and are below their limit
+        self._ready_groups: Deque['TaskGroup'] = collections.deque()
+        self._workers: List[threading.Thread] = []
+
+    @property
+    def num_workers(self) -> int:
+        return len(self._workers)
+
+    def ensure_workers(self, num_workers: int) -> None:
+        """Grows the pool to at least num_workers threads."""
+        with self._condition:
+            while len(self._workers) < num_workers:
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    name=f'kfp-local-worker-{len(self._workers)}',
+                    daemon=True,
+                )
+                self._workers.append(worker)
+                worker.start()
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._condition:
+                item = self._take_any()
+                while item is None:
+                    self._condition.wait()
+                    item = self._take_any()
+            self._run(item)
+
+    def _take_any(self) -> Optional[_WorkItem]:
+        """Takes the next runnable item of any group.
+
+        Must be called with the lock held.
+        """
+        while self._ready_groups:
+            group = self._ready_groups.popleft()
+            group._is_ready = False
+            item = self._take_from(group)
+            if item is not None:
+                return item
+        return None
+
+    def _take_from(self, group: 'TaskGroup') -> Optional[_WorkItem]:
+        """Takes the next queued item of group if it is below its limit.
+
+        Must be called with the lock held.
+        """
+        if not group._queue or group._running >= group.limit:
+            return None
+        item = group._queue.popleft()
+        group._running += 1
+        # round-robin between groups so a large group cannot starve others
+        self._mark_ready(group)
+        return item
+
+    def _mark_ready(self, group: 'TaskGroup') -> None:
+        """Must be called with the lock held."""
+        if (not group._is_ready and group._queue and
+                group._running < group.limit):
+            group._is_ready = True
+            self._ready_groups.append(group)
+
+    def _run(self, item: _WorkItem) -> None:
+        try:
+            item.run()
+        finally:
+            with self._condition:
+                item.group._running -= 1
+                self._mark_ready(item.group)
+                self._condition.notify_all()
+
+    def _submit(self, item: _WorkItem) -> None:
+        with self._condition:
+            item.group._queue.append(item)
+            self._mark_ready(item.group)
+            self._condition.notify_all()
+
+    def _wait(self, group: 'TaskGroup',
+              futures: Iterable[concurrent.futures.Future],
+              return_when: str) -> Set[concurrent.futures.Future]:
+        futures = set(futures)
+        while True:
+            with self._condition:
+                item = None
+                while True:
+                    done = {future for future in futures if future.done()}
+                    if (done == futures or
+                        (done and
+                         return_when == concurrent.futures.FIRST_COMPLETED)):
+                        return done
+                    # help with the group's own work rather than block
+                    item = self._take_from(group)
+                    if item is not None:
+                        break
+                    self._condition.wait()
+            self._run(item)
+
+
+def _cpu_count() -> int:
+    return os.cpu_count() or 1
+
+
+_shared_executor: Optional[SharedExecutor] = None
+_shared_executor_lock = threading.Lock()
+
+
+def get_shared_executor() -> SharedExecutor:
+    """Returns the process-wide SharedExecutor."""
+    global _shared_executor
+    with _shared_executor_lock:
+        if _shared_executor is None:
+            _shared_executor = SharedExecutor()
+        return _shared_executor
+
+
+# set in the context of work submitted as ParallelFor iterations, whose
+# tasks hold a process-wide loop slot rather than a pipeline-wide slot
+_in_loop_iteration: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    '_in_loop_iteration', default=False)
+
+
+class TaskGroup:
+    """Work submitted to the SharedExecutor under one concurrency limit."""
+
+    def __init__(self,
+                 executor: SharedExecutor,
+                 limit: int,
+                 loop_iterations: bool = False) -> None:
+        self.limit = limit
+        self.loop_iterations = loop_iterations
+        self._executor = executor
+        self._queue: Deque[_WorkItem] = collections.deque()
+        self._running = 0
+        self._is_ready = False
+
+    def submit(self, fn: Callable[..., Any], *args: Any,
+               **kwargs: Any) -> concurrent.futures.Future:
+        """Queues fn(*args, **kwargs) and returns a future for its result."""
+        item = _WorkItem(self, fn, args, kwargs)
+        self._executor._submit(item)
+        return item.future
+
+    def wait(
+        self,
+        futures: Iterable[concurrent.futures.Future],
+        return_when: str = concurrent.futures.ALL_COMPLETED,
+    ) -> Set[concurrent.futures.Future]:
+        """Waits for futures of this group, running queued work meanwhile.
+
+        Args:
+            futures: Futures returned by this group's submit.
+            return_when: concurrent.futures.FIRST_COMPLETED or concurrent.futures.ALL_COMPLETED.
+
+        Returns:
+            The futures that are done.
+        """
+        return self._executor._wait(self, futures, return_when)
+
+
+class TaskScheduler:
+    """Pipeline-wide scheduling state for local DAG execution.
+
+    One scheduler is shared by every DAG (and nested DAG) of a pipeline
+    run. It bounds the number of executor-backed tasks (containers and
+    importers) running at once across the whole pipeline, and runs each
+    DAG's tasks as soon as their upstream tasks have finished.
+
+    Only executor-backed tasks hold a slot. A nested DAG waiting on its
+    own tasks holds none, so nesting cannot exhaust the slots and
+    deadlock. The tasks of dsl.ParallelFor iterations hold a slot of the
+    SharedExecutor's process-wide loop budget instead, so nested loops
+    together run no more of them than there are CPUs.
+    """
+
+    def __init__(self, max_parallelism: int = 1) -> None:
+        """Scheduler constructor.
+
+        Args:
+            max_parallelism: Maximum number of executor-backed tasks outside of ParallelFor iterations to run at once.
+        """
+        self.max_parallelism = max_parallelism
+        self._task_slots = threading.BoundedSemaphore(self.max_parallelism)
+        self._executor = get_shared_executor()
+        self._executor.ensure_workers(self.max_parallelism)
+
+    @contextlib.contextmanager
+    def task_slot(self) -> Generator[None, None, None]:
+        """Context manager that holds one task slot.
+
+        Within a ParallelFor iteration, the slot is one of the process-
+        wide loop budget rather than a pipeline-wide slot.
+        """
+        slots = (
+            self._executor.loop_task_slots
+            if _in_loop_iteration.get() else self._task_slots)
+        with slots:
+            yield
+
+    def task_group(self, limit: int = 0) -> TaskGroup:
+        """Returns a new group of work on the shared executor.
+
+        Args:
+            limit: Maximum number of the group's items to run at once. 0 means no limit other than max_parallelism.
+        """
+        if limit <= 0 or limit > self.max_parallelism:
+            limit = self.max_parallelism
+        return TaskGroup(self._executor, limit)
+
+    def loop_group(self, limit: int = 0) -> TaskGroup:
+        """Returns a new group for the iterations of a ParallelFor.
+
+        Unlike task_group, the limit is not capped at max_parallelism
+        but at the process-wide loop budget, and the tasks of the group's
+        items hold a slot of that budget instead of a pipeline-wide slot.
+
+        Args:
+            limit: Maximum number of iterations to run at once. 0 means the size of the loop budget, which is the number of CPUs.
+        """
+        if limit <= 0 or limit > self._executor.max_loop_tasks:
+            limit = self._executor.max_loop_tasks
+        self._executor.ensure_workers(limit)
+        return TaskGroup(self._executor, limit, loop_iterations=True)
+
+    def run_ready_set(
+        self,
+        ordered_tasks: List[str],
+        dependencies: Dict[str, Iterable[str]],
+        run_task: Callable[[str], None],
+    ) -> None:
+        """Runs every task once all of its upstream tasks have finished.
+
+        Tasks are dependency-counted: a task becomes ready when its last
+        upstream task finishes, and ready tasks are started as soon as a
+        worker is free. When several tasks are ready at once, the one that
+        comes first in ordered_tasks starts first, so with
+        max_parallelism=1 tasks run exactly in ordered_tasks order.
+
+        Args:
+            ordered_tasks: All tasks to run, in preferred start order. Must be a valid topological order.
+            dependencies: Task name to upstream task names. Upstream tasks not in ordered_tasks are ignored.
+            run_task: Runs one task. Called from worker threads when max_parallelism is greater than 1. Must handle task failure itself; an exception stops scheduling and is re-raised once running tasks finish.
+        """
+        priority = {task: i for i, task in enumerate(ordered_tasks)}
+        remaining: Dict[str, int] = {}
+        downstream: Dict[str, List[str]] = {task: [] for task in ordered_tasks}
+        for task in ordered_tasks:
+            upstream = {
+                dep for dep in dependencies.get(task, ()) if dep in priority
+            }
+            remaining[task] = len(upstream)
+            for dep in upstream:
+                downstream[dep].append(task)
+
+        ready = [(priority[task], task)
+                 for task in ordered_tasks
+                 if remaining[task] == 0]
+        heapq.heapify(ready)
+
+        def mark_done(task: str) -> None:
+            for child in downstream[task]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    heapq.heappush(ready, (priority[child], child))
+
+        if self.max_parallelism == 1:
+            while ready:
+                _, task = heapq.heappop(ready)
+                run_task(task)
+                mark_done(task)
+            return
+
+        group = self.task_group()
+        running: Dict[concurrent.futures.Future, str] = {}
+        error: Optional[BaseException] = None
+        while running or (ready and error is None):
+            while ready and error is None and len(running) < group.limit:
+                _, task = heapq.heappop(ready)
+                running[group.submit(run_task, task)] = task
+
+            done = group.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                task = running.pop(future)
+                exc = future.exception()
+                if exc is not None:
+                    error = error or exc
+                    continue
+                mark_done(task)
+
+        if error is not None:
+            raise error
@@ -0,0 +1,292 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for task_scheduler.py."""
+import contextvars
+import os
+import threading
+import time
+import unittest
+from unittest import mock
+
+from kfp.local.orchestrator import task_scheduler
+
+
+class TestRunReadySet(unittest.TestCase):
+
+    def test_sequential_follows_order(self):
+        scheduler = task_scheduler.TaskScheduler(max_parallelism=1)
+        started = []
+        scheduler.run_ready_set(
+            ordered_tasks=['a', 'b', 'c', 'd'],
+            dependencies={
+                'c': ['a'],
+                'd': ['b', 'c']
+            },
+            run_task=started.append,
+        )
+        self.assertEqual(started, ['a', 'b', 'c', 'd'])
+
+    def test_dependencies_finish_before_dependents(self):
+        scheduler = task_scheduler.TaskScheduler(max_parallelism=4)
+        finished = []
+        lock = threading.Lock()
+
+        def run_task(task: str) -> None:
+            time.sleep(0.05 if task == 'a' else 0.01)
+            with lock:
+                finished.append(task)
+
+        scheduler.run_ready_set(
+            ordered_tasks=['a', 'b', 'c', 'd'],
+            dependencies={
+                'c': ['a'],
+                'd': ['b', 'c']
+            },
+            run_task=run_task,
+        )
+        self.assertCountEqual(finished, ['a', 'b', 'c', 'd'])
+        self.assertLess(finished.index('a'), finished.index('c'))
+        self.assertLess(finished.index('c'), finished.index('d'))
+        self.assertLess(finished.index('b'), finished.index('d'))
+
+    def test_independent_tasks_run_concurrently(self):
+        scheduler = task_scheduler.TaskScheduler(max_parallelism=4)
+        barrier = threading.Barrier(4, timeout=5)
+
+        # each task waits for all others to start; this only completes if
+        # the four tasks run at the same time
+        scheduler.run_ready_set(
+            ordered_tasks=['a', 'b', 'c', 'd'],
+            dependencies={},
+            run_task=lambda task: barrier.wait(),
+        )
+
+    def test_max_parallelism_respected(self):
+        scheduler = task_scheduler.TaskScheduler(max_parallelism=2)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def run_task(task: str) -> None:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+
+        scheduler.run_ready_set(
+            ordered_tasks=[str(i) for i in range(8)],
+            dependencies={},
+            run_task=run_task,
+        )
+        self.assertEqual(peak, 2)
+
+    def test_dependencies_outside_set_ignored(self):
+        scheduler = task_scheduler.TaskScheduler(max_parallelism=2)
+        started = []
+        scheduler.run_ready_set(
+            ordered_tasks=['a'],
+            dependencies={'a': ['exit-handler']},
+            run_task=started.append,
+        )
+        self.assertEqual(started, ['a'])
+
+    def test_exception_stops_scheduling_and_is_raised(self):
+        scheduler = task_scheduler.TaskScheduler(max_parallelism=2)
+        started = []
+
+        def run_task(task: str) -> None:
+            started.append(task)
+            if task == 'a':
+                raise ValueError('boom')
+
+        with self.assertRaisesRegex(ValueError, r'boom'):
+            scheduler.run_ready_set(
+                ordered_tasks=['a', 'b'],
+                dependencies={'b': ['a']},
+                run_task=run_task,
+            )
+        self.assertEqual(started, ['a'])
+
+
+class TestTaskGroup(unittest.TestCase):
+
+    def test_limit_capped_at_max_parallelism(self):
+        scheduler = task_scheduler.TaskScheduler(max_parallelism=4)
+        self.assertEqual(scheduler.task_group().limit, 4)
+        self.assertEqual(scheduler.task_group(limit=2).limit, 2)
+        self.assertEqual(scheduler.task_group(limit=200).limit, 4)
+
+    def test_limit_respected(self):
+        scheduler = task_scheduler.TaskScheduler(max_parallelism=4)
+        group = scheduler.task_group(limit=3)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work() -> None:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+
+        futures = [group.submit(work) for _ in range(12)]
+        group.wait(futures)
+        self.assertEqual(peak, 3)
+
+    def test_loop_group_limit_not_capped_at_max_parallelism(self):
+        with mock.patch.object(task_scheduler, '_shared_executor',
+                               task_scheduler.SharedExecutor(max_loop_tasks=4)):
+            scheduler = task_scheduler.TaskScheduler(max_parallelism=1)
+            self.assertEqual(scheduler.loop_group(limit=3).limit, 3)
+            self.assertGreaterEqual(scheduler._executor.num_workers, 3)
+
+    def test_loop_group_limit_capped_at_loop_budget(self):
+        with mock.patch.object(task_scheduler, '_shared_executor',
+                               task_scheduler.SharedExecutor(max_loop_tasks=4)):
+            scheduler = task_scheduler.TaskScheduler(max_parallelism=1)
+            self.assertEqual(scheduler.loop_group().limit, 4)
+            self.assertEqual(scheduler.loop_group(limit=1000).limit, 4)
+            self.assertEqual(scheduler._executor.num_workers, 4)
+
+    def test_loop_budget_defaults_to_cpu_count(self):
+        self.assertEqual(task_scheduler.SharedExecutor().max_loop_tasks,
+                         os.cpu_count() or 1)
+
+    def test_nested_loops_share_loop_budget(self):
+        with mock.patch.object(task_scheduler, '_shared_executor',
+                               task_scheduler.SharedExecutor(max_loop_tasks=3)):
+            scheduler = task_scheduler.TaskScheduler(max_parallelism=1)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def task() -> None:
+            nonlocal active, peak
+            with scheduler.task_slot():
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                time.sleep(0.02)
+                with lock:
+                    active -= 1
+
+        def outer() -> None:
+            group = scheduler.loop_group(limit=3)
+            group.wait([group.submit(task) for _ in range(3)])
+
+        def run() -> None:
+            group = scheduler.loop_group(limit=3)
+            group.wait([group.submit(outer) for _ in range(3)])
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        thread.join(timeout=10)
+        self.assertFalse(thread.is_alive())
+        self.assertLessEqual(peak, 3)
+
+    def test_loop_group_runs_iterations_concurrently(self):
+        with mock.patch.object(task_scheduler, '_shared_executor',
+                               task_scheduler.SharedExecutor(max_loop_tasks=2)):
+            scheduler = task_scheduler.TaskScheduler(max_parallelism=1)
+        group = scheduler.loop_group(limit=2)
+        barrier = threading.Barrier(2, timeout=10)
+
+        def iteration() -> None:
+            # fails with BrokenBarrierError unless both run at once
+            with scheduler.task_slot():
+                barrier.wait()
+
+        futures = [group.submit(iteration) for _ in range(2)]
+        group.wait(futures)
+        for future in futures:
+            self.assertIsNone(future.exception())
+
+    def test_results_and_exceptions(self):
+        scheduler = task_scheduler.TaskScheduler(max_parallelism=2)
+        group = scheduler.task_group()
+
+        def fail() -> None:
+            raise ValueError('boom')
+
+        ok = group.submit(lambda x: x * 2, 21)
+        bad = group.submit(fail)
+        self.assertEqual(group.wait([ok, bad]), {ok, bad})
+        self.assertEqual(ok.result(), 42)
+        self.assertIsInstance(bad.exception(), ValueError)
+
+    def test_nested_groups_do_not_deadlock(self):
+        # every outer item waits on an inner group; with more outer items
+        # than workers this deadlocks unless waiting threads run inner work
+        scheduler = task_scheduler.TaskScheduler(max_parallelism=2)
+        results = []
+        lock = threading.Lock()
+
+        def inner(i: int, j: int) -> None:
+            with lock:
+                results.append((i, j))
+
+        def outer(i: int) -> None:
+            group = scheduler.task_group()
+            group.wait([group.submit(inner, i, j) for j in range(3)])
+
+        def run() -> None:
+            group = scheduler.task_group()
+            group.wait([group.submit(outer, i) for i in range(6)])
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        thread.join(timeout=10)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(len(results), 18)
+
+    def test_runs_in_submitter_context(self):
+        scheduler = task_scheduler.TaskScheduler(max_parallelism=2)
+        group = scheduler.task_group()
+        variable = contextvars.ContextVar('variable', default='unset')
+        token = variable.set('submitter')
+        try:
+            future = group.submit(variable.get)
+        finally:
+            variable.reset(token)
+        group.wait([future])
+        self.assertEqual(future.result(), 'submitter')
+
+    def test_executor_shared_across_schedulers(self):
+        scheduler_1 = task_scheduler.TaskScheduler(max_parallelism=2)
+        scheduler_2 = task_scheduler.TaskScheduler(max_parallelism=3)
+        self.assertIs(scheduler_1._executor, scheduler_2._executor)
+        self.assertGreaterEqual(scheduler_1._executor.num_workers, 3)
+
+
+class TestTaskSlot(unittest.TestCase):
+
+    def test_default_max_parallelism(self):
+        scheduler = task_scheduler.TaskScheduler()
+        self.assertEqual(scheduler.max_parallelism, 1)
+
+    def test_slots_bound_concurrency(self):
+        scheduler = task_scheduler.TaskScheduler(max_parallelism=1)
+        with scheduler.task_slot():
+            acquired = scheduler._task_slots.acquire(blocking=False)
+        self.assertFalse(acquired)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,7 +18,7 @@ from contextlib import contextmanager
 import logging
 import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -53,9 +53,13 @@ class PipInstallManager:
                 'total_wait_time': 0.0,
                 'max_wait_time': 0.0,
                 'concurrent_peak': 0,
-                'current_active': 0
+                'current_active': 0,
+                'deduplicated_installs': 0
             }
             self._stats_lock = threading.Lock()
+            # key -> (lock, number of threads holding or waiting for it);
+            # entries are dropped once unused
+            self._key_locks: Dict[str, Tuple[threading.Lock, int]] = {}
             self._initialized = True
 
     def configure(self, serialize_installs: bool, max_concurrent: int):
@@ -126,9 +130,48 @@ class PipInstallManager:
                 'total_wait_time': 0.0,
                 'max_wait_time': 0.0,
                 'concurrent_peak': 0,
-                'current_active': 0
+                'current_active': 0,
+                'deduplicated_installs': 0
             }
 
+    @contextmanager
+    def keyed_install(self, key: str):
+        """Context manager that deduplicates concurrent installs of the same
+        environment.
+
+        Only one thread at a time may hold a given key. A thread that finds
+        the key held waits for the holder to finish instead of starting a
+        second install, and is expected to reuse the holder's result.
+        Installs for different keys do not block each other here; they are
+        still bounded by managed_install.
+
+        Args:
+            key: Content key of the environment being installed.
+        """
+        with self._lock:
+            key_lock, users = self._key_locks.get(key, (threading.Lock(), 0))
+            self._key_locks[key] = (key_lock, users + 1)
+
+        try:
+            if not key_lock.acquire(blocking=False):
+                with self._stats_lock:
+                    self._install_stats['deduplicated_installs'] += 1
+                logger.debug(
+                    f'⏳ Waiting for in-flight installation of environment {key}'
+                )
+                key_lock.acquire()
+            try:
+                yield
+            finally:
+                key_lock.release()
+        finally:
+            with self._lock:
+                key_lock, users = self._key_locks[key]
+                if users == 1:
+                    del self._key_locks[key]
+                else:
+                    self._key_locks[key] = (key_lock, users - 1)
+
     @contextmanager
     def managed_install(self,
                         runner_type: str = 'subprocess',
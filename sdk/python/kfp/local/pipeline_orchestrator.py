@@ -12,14 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Code for locally executing a compiled pipeline."""
+import contextlib
 import logging
 import os
 import shutil
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+from kfp.local import cancellation
 from kfp.local import config
 from kfp.local import logging_utils
 from kfp.local import placeholder_utils
+from kfp.local import run_journal
 from kfp.local import status
 from kfp.local import utils
 from kfp.pipeline_spec import pipeline_spec_pb2
@@ -28,12 +31,14 @@ from kfp.pipeline_spec import pipeline_spec_pb2
 def run_local_pipeline(
     pipeline_spec: pipeline_spec_pb2.PipelineSpec,
     arguments: Dict[str, Any],
+    resume_run_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     """kfp.local's entrypoint for running a local pipeline.
 
     Args:
         pipeline_spec: PipelineSpec to run.
         arguments: User-provided arguments.
+        resume_run_id: ID of an earlier run of the pipeline to resume. If None, defaults to the resume_run_id passed to kfp.local.init, if no pipeline has run since.
 
     Returns:
         The pipeline outputs.
@@ -41,12 +46,19 @@ def run_local_pipeline(
 
     # validate and access all global state in this function, not downstream
     config.LocalExecutionConfig.validate()
+    if resume_run_id is None:
+        # the run passed to kfp.local.init is resumed by the next pipeline
+        # run only; later runs start afresh
+        resume_run_id = config.LocalExecutionConfig.instance.resume_run_id
+        config.LocalExecutionConfig.instance.resume_run_id = None
     return _run_local_pipeline_implementation(
         pipeline_spec=pipeline_spec,
         arguments=arguments,
         raise_on_error=config.LocalExecutionConfig.instance.raise_on_error,
         pipeline_root=config.LocalExecutionConfig.instance.pipeline_root,
         runner=config.LocalExecutionConfig.instance.runner,
+        max_parallelism=config.LocalExecutionConfig.instance.max_parallelism,
+        resume_run_id=resume_run_id,
     )
 
 
@@ -56,6 +68,8 @@ def _run_local_pipeline_implementation(
     raise_on_error: bool,
     pipeline_root: str,
     runner: config.LocalRunnerType,
+    max_parallelism: int = 1,
+    resume_run_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Implementation of run local pipeline.
 
@@ -65,19 +79,44 @@ def _run_local_pipeline_implementation(
         raise_on_error: Whether to raise an exception if a task exits with failure.
         pipeline_root: The local pipeline root.
         runner: The user-specified local runner.
+        max_parallelism: Maximum number of tasks to execute at once. 1 runs tasks one at a time.
+        resume_run_id: ID of an earlier run of the pipeline to resume. Tasks that succeeded in that run, and whose upstream tasks did too, are restored from the run's journal instead of running again, including the tasks of nested DAGs and ParallelFor iterations.
 
     Returns:
         The pipeline outputs.
     """
     from kfp.local import executor_input_utils
+    from kfp.local.orchestrator import task_scheduler
 
     pipeline_name = pipeline_spec.pipeline_info.name
-    pipeline_resource_name = executor_input_utils.get_local_pipeline_resource_name(
-        pipeline_name)
     pipeline_name_with_color = logging_utils.format_pipeline_name(pipeline_name)
+    if resume_run_id is None:
+        pipeline_resource_name = executor_input_utils.get_local_pipeline_resource_name(
+            pipeline_name)
+        journal = run_journal.RunJournal.create(
+            pipeline_root=pipeline_root,
+            run_id=pipeline_resource_name,
+            pipeline_name=pipeline_name,
+            arguments=arguments,
+            unique_pipeline_id=placeholder_utils.make_random_id(),
+        )
+    else:
+        pipeline_resource_name = resume_run_id
+        journal = run_journal.RunJournal.resume(
+            pipeline_root=pipeline_root,
+            run_id=resume_run_id,
+            pipeline_name=pipeline_name,
+            arguments=arguments,
+        )
+    root_journal = journal.root_dag(pipeline_spec.root.dag.tasks)
 
     with logging_utils.local_logger_context():
         logging.info(f'Running pipeline: {pipeline_name_with_color}')
+        if resume_run_id is not None:
+            logging.info(
+                f'Resuming run {resume_run_id!r}: restoring '
+                f'{root_journal.num_restorable_tasks} of '
+                f'{len(pipeline_spec.root.dag.tasks)} tasks from its journal')
         logging_utils.print_horizontal_line()
 
     executors = {
@@ -87,7 +126,19 @@ def _run_local_pipeline_implementation(
     # convert to dict for consistency with executors
     components = dict(pipeline_spec.components.items())
     fail_stack: List[str] = []
+    run_resources = contextlib.ExitStack()
+    run_resources.callback(journal.close)
+    # stopping a run, e.g. with Ctrl+C, stops the tasks it is running
+    run_scope = run_resources.enter_context(cancellation.cancellation_scope())
     try:
+        if isinstance(runner, config.DockerRunner):
+            from kfp.local import docker_task_handler
+
+            # one Docker client and image inventory for the whole run, with
+            # all images pulled up front rather than just before each task
+            docker_context = run_resources.enter_context(
+                docker_task_handler.docker_run_context())
+            docker_context.prepull(get_container_images(executors))
         dag_component_spec = pipeline_spec.root
         dag_spec = dag_component_spec.dag
         has_control_flow = any(
@@ -111,7 +162,12 @@ def _run_local_pipeline_implementation(
                                pipeline_spec_pb2.PipelineTaskSpec.TriggerPolicy
                                .TriggerStrategy.ALL_UPSTREAM_TASKS_COMPLETED
                                for task_spec in dag_spec.tasks.values())
-        if has_control_flow or has_oneof_output or has_nested_dags or has_exit_handler:
+        scheduler = task_scheduler.TaskScheduler(
+            max_parallelism=max_parallelism)
+        # the enhanced orchestrator is also the one that runs independent
+        # tasks concurrently
+        if (has_control_flow or has_oneof_output or has_nested_dags or
+                has_exit_handler or scheduler.max_parallelism > 1):
             from kfp.local.orchestrator import enhanced_dag_orchestrator
             outputs, dag_status = enhanced_dag_orchestrator.run_enhanced_dag(
                 pipeline_resource_name=pipeline_resource_name,
@@ -121,8 +177,10 @@ def _run_local_pipeline_implementation(
                 dag_arguments=arguments,
                 pipeline_root=pipeline_root,
                 runner=runner,
-                unique_pipeline_id=placeholder_utils.make_random_id(),
+                unique_pipeline_id=journal.unique_pipeline_id,
                 fail_stack=fail_stack,
+                scheduler=scheduler,
+                journal=root_journal,
             )
         else:
             from kfp.local.orchestrator import dag_orchestrator
@@ -134,8 +192,9 @@ def _run_local_pipeline_implementation(
                 dag_arguments=arguments,
                 pipeline_root=pipeline_root,
                 runner=runner,
-                unique_pipeline_id=placeholder_utils.make_random_id(),
+                unique_pipeline_id=journal.unique_pipeline_id,
                 fail_stack=fail_stack,
+                journal=root_journal,
             )
         if dag_status == status.Status.SUCCESS:
             status_with_color = logging_utils.format_status(
@@ -146,6 +205,12 @@ def _run_local_pipeline_implementation(
                 )
             return outputs
         elif dag_status == status.Status.FAILURE:
+            with logging_utils.local_logger_context():
+                logging.info(
+                    'To run only the failed tasks and the tasks downstream of '
+                    'them, run kfp.local.init(..., '
+                    f'resume_run_id={pipeline_resource_name!r}) and then the '
+                    'pipeline again.')
             log_and_maybe_raise_for_failure(
                 pipeline_name=pipeline_name,
                 fail_stack=fail_stack,
@@ -154,7 +219,11 @@ def _run_local_pipeline_implementation(
             return {}
         else:
             raise ValueError(f'Got unknown task status {dag_status.name}')
+    except BaseException:
+        run_scope.cancel()
+        raise
     finally:
+        run_resources.close()
         # Clean up the workspace directory
         workspace_root = config.LocalExecutionConfig.instance.workspace_root
         if workspace_root and os.path.exists(workspace_root):
@@ -162,6 +231,29 @@ def _run_local_pipeline_implementation(
             logging.info(f'Cleaned up workspace: {workspace_root}')
 
 
+def get_container_images(
+    executors: Dict[str,
+                    pipeline_spec_pb2.PipelineDeploymentConfig.ExecutorSpec]
+) -> List[str]:
+    """Gets the distinct container images used by the executors.
+
+    Images that contain placeholders are resolved at task runtime and are
+    excluded.
+
+    Args:
+        executors: The executors of the pipeline.
+
+    Returns:
+        The sorted container images.
+    """
+    return sorted({
+        executor.container.image
+        for executor in executors.values()
+        if executor.WhichOneof('spec') == 'container' and
+        executor.container.image and '{{' not in executor.container.image
+    })
+
+
 def log_and_maybe_raise_for_failure(
     pipeline_name: str,
     raise_on_error: bool,
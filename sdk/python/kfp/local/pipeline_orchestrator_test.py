@@ -16,10 +16,13 @@ import functools
 import io as stdlib_io
 import os
 import sys
+import time
 from typing import List, NamedTuple
 import unittest
 from unittest import mock
 
+from absl.testing import parameterized
+import docker
 from kfp import dsl
 from kfp import local
 from kfp.dsl import Dataset
@@ -27,7 +30,11 @@ from kfp.dsl import Input
 from kfp.dsl import Model
 from kfp.dsl import Output
 from kfp.dsl import pipeline_task
+from kfp.local import pipeline_orchestrator
+from kfp.local import run_journal
 from kfp.local import testing_utilities
+from kfp.local.orchestrator import collected_outputs
+from kfp.local.orchestrator import task_scheduler
 import pytest
 
 ROOT_FOR_TESTING = './testing_root'
@@ -70,11 +77,13 @@ class TestRunLocalPipeline(testing_utilities.LocalRunnerEnvironmentTestCase):
         )
 
         # and check that each task has a directory
-        actual_contents_of_pipeline_dir = os.listdir(
-            os.path.join(
-                ROOT_FOR_TESTING,
-                actual_dirs_in_pipeline_root[0],
-            ))
+        actual_contents_of_pipeline_dir = [
+            name for name in os.listdir(
+                os.path.join(
+                    ROOT_FOR_TESTING,
+                    actual_dirs_in_pipeline_root[0],
+                )) if name != run_journal.JOURNAL_FILE_NAME
+        ]
         self.assertLen(
             actual_contents_of_pipeline_dir,
             expected_files_in_pipeline_dir,
@@ -711,6 +720,211 @@ class TestRunLocalPipeline(testing_utilities.LocalRunnerEnvironmentTestCase):
         self.assertLessEqual(stats['concurrent_peak'],
                              2)  # Should respect max concurrent limit
 
+    def test_independent_tasks_run_concurrently(self):
+        # a shared pooled venv lets both tasks run at once without installing
+        # into the current environment
+        local.init(
+            local.SubprocessRunner(
+                use_venv=True,
+                reuse_venv=True,
+                venv_cache_root=os.path.abspath('venvs')),
+            pipeline_root=ROOT_FOR_TESTING,
+            max_parallelism=2)
+        rendezvous_dir = os.path.abspath('rendezvous')
+        os.makedirs(rendezvous_dir)
+
+        @dsl.component
+        def rendezvous(rendezvous_dir: str, me: str, other: str) -> str:
+            import os
+            import time
+            open(os.path.join(rendezvous_dir, me), 'w').close()
+            # only succeeds if the other task is running at the same time
+            deadline = time.time() + 60
+            while not os.path.exists(os.path.join(rendezvous_dir, other)):
+                if time.time() > deadline:
+                    raise TimeoutError(f'{other} never started.')
+                time.sleep(0.1)
+            return me
+
+        @dsl.component
+        def join(a: str, b: str) -> str:
+            return a + b
+
+        @dsl.pipeline
+        def my_pipeline(rendezvous_dir: str) -> str:
+            a = rendezvous(rendezvous_dir=rendezvous_dir, me='a', other='b')
+            b = rendezvous(rendezvous_dir=rendezvous_dir, me='b', other='a')
+            return join(a=a.output, b=b.output).output
+
+        task = my_pipeline(rendezvous_dir=rendezvous_dir)
+        self.assertEqual(task.output, 'ab')
+
+    # the loop budget is the number of CPUs, which may be 1
+    @mock.patch.object(task_scheduler, '_shared_executor',
+                       task_scheduler.SharedExecutor(max_loop_tasks=3))
+    def test_parallel_for_runs_more_than_two_iterations_at_once(self):
+        local.init(
+            local.SubprocessRunner(
+                use_venv=True,
+                reuse_venv=True,
+                venv_cache_root=os.path.abspath('venvs')),
+            pipeline_root=ROOT_FOR_TESTING,
+            max_parallelism=3)
+        rendezvous_dir = os.path.abspath('rendezvous')
+        os.makedirs(rendezvous_dir)
+
+        @dsl.component
+        def rendezvous(rendezvous_dir: str, me: int, count: int) -> int:
+            import os
+            import time
+            open(os.path.join(rendezvous_dir, str(me)), 'w').close()
+            # only succeeds if all iterations are running at the same time
+            deadline = time.time() + 60
+            while len(os.listdir(rendezvous_dir)) < count:
+                if time.time() > deadline:
+                    raise TimeoutError('Not all iterations started.')
+                time.sleep(0.1)
+            return me
+
+        @dsl.pipeline
+        def my_pipeline(rendezvous_dir: str):
+            with dsl.ParallelFor([1, 2, 3], parallelism=3) as item:
+                rendezvous(rendezvous_dir=rendezvous_dir, me=item, count=3)
+
+        my_pipeline(rendezvous_dir=rendezvous_dir)
+        self.assertCountEqual(os.listdir(rendezvous_dir), ['1', '2', '3'])
+
+    # the loop budget is the number of CPUs, which may be 1
+    @mock.patch.object(task_scheduler, '_shared_executor',
+                       task_scheduler.SharedExecutor(max_loop_tasks=2))
+    def test_parallel_for_parallelism_honored_by_default(self):
+        # max_parallelism defaults to 1, which only serializes the tasks of
+        # the DAG, not the iterations of a loop
+        local.init(
+            local.SubprocessRunner(
+                use_venv=True,
+                reuse_venv=True,
+                venv_cache_root=os.path.abspath('venvs')),
+            pipeline_root=ROOT_FOR_TESTING)
+        rendezvous_dir = os.path.abspath('rendezvous')
+        os.makedirs(rendezvous_dir)
+
+        @dsl.component
+        def rendezvous(rendezvous_dir: str, me: int, count: int) -> int:
+            import os
+            import time
+            open(os.path.join(rendezvous_dir, str(me)), 'w').close()
+            # only succeeds if both iterations are running at the same time
+            deadline = time.time() + 60
+            while len(os.listdir(rendezvous_dir)) < count:
+                if time.time() > deadline:
+                    raise TimeoutError('Not all iterations started.')
+                time.sleep(0.1)
+            return me
+
+        @dsl.pipeline
+        def my_pipeline(rendezvous_dir: str):
+            with dsl.ParallelFor([1, 2], parallelism=2) as item:
+                rendezvous(rendezvous_dir=rendezvous_dir, me=item, count=2)
+
+        my_pipeline(rendezvous_dir=rendezvous_dir)
+        self.assertCountEqual(os.listdir(rendezvous_dir), ['1', '2'])
+
+    @parameterized.parameters(collected_outputs.SPILL_THRESHOLD, 0)
+    def test_parallel_for_collected_outputs(self, spill_threshold):
+        local.init(
+            local.SubprocessRunner(
+                use_venv=True,
+                reuse_venv=True,
+                venv_cache_root=os.path.abspath('venvs')),
+            pipeline_root=ROOT_FOR_TESTING)
+
+        @dsl.component
+        def make_items() -> List[int]:
+            return [3, 1, 2, 5]
+
+        @dsl.component
+        def square(x: int) -> int:
+            return x * x
+
+        @dsl.component
+        def join(values: List[int]) -> str:
+            return ','.join(str(int(value)) for value in values)
+
+        @dsl.pipeline
+        def my_pipeline() -> str:
+            items = make_items()
+            with dsl.ParallelFor(items.output, parallelism=2) as item:
+                squared = square(x=item)
+            return join(values=dsl.Collected(squared.output)).output
+
+        with mock.patch.object(collected_outputs, 'SPILL_THRESHOLD',
+                               spill_threshold):
+            task = my_pipeline()
+        self.assertEqual(task.output, '9,1,4,25')
+
+    def test_parallel_for_failure_stops_running_iterations(self):
+        local.init(
+            local.SubprocessRunner(
+                use_venv=True,
+                reuse_venv=True,
+                venv_cache_root=os.path.abspath('venvs')),
+            pipeline_root=ROOT_FOR_TESTING,
+            raise_on_error=True,
+            max_parallelism=2)
+        rendezvous_dir = os.path.abspath('rendezvous')
+        os.makedirs(rendezvous_dir)
+
+        @dsl.component
+        def fail_or_hang(rendezvous_dir: str, me: int):
+            import os
+            import time
+            if me == 1:
+                # fail once the other iteration is running
+                deadline = time.time() + 60
+                while not os.listdir(rendezvous_dir):
+                    if time.time() > deadline:
+                        raise TimeoutError('Other iteration did not start.')
+                    time.sleep(0.1)
+                raise Exception('Iteration failed!')
+            open(os.path.join(rendezvous_dir, str(me)), 'w').close()
+            time.sleep(600)
+
+        @dsl.pipeline
+        def my_pipeline(rendezvous_dir: str):
+            with dsl.ParallelFor([1, 2, 3], parallelism=2) as item:
+                fail_or_hang(rendezvous_dir=rendezvous_dir, me=item)
+
+        start_time = time.monotonic()
+        with self.assertRaisesRegex(RuntimeError, r'Inner task failed'):
+            my_pipeline(rendezvous_dir=rendezvous_dir)
+        self.assertLess(time.monotonic() - start_time, 300)
+        # the third iteration never started
+        self.assertEqual(os.listdir(rendezvous_dir), ['2'])
+
+    @mock.patch('sys.stdout', new_callable=stdlib_io.StringIO)
+    def test_single_nested_fails_with_max_parallelism(self, mock_stdout):
+        local.init(
+            local.SubprocessRunner(), raise_on_error=True, max_parallelism=4)
+
+        @dsl.component
+        def fail():
+            raise Exception('Nested failure!')
+
+        @dsl.pipeline
+        def inner_pipeline():
+            fail()
+
+        @dsl.pipeline
+        def my_pipeline():
+            inner_pipeline()
+
+        with self.assertRaisesRegex(
+                RuntimeError,
+                r"Pipeline \x1b\[95m\'my-pipeline\'\x1b\[0m finished with status \x1b\[91mFAILURE\x1b\[0m\. Inner task failed: \x1b\[96m\'fail\'\x1b\[0m inside \x1b\[96m\'inner-pipeline\'\x1b\[0m\.",
+        ):
+            my_pipeline()
+
     def test_condition_supported(self):
         local.init(local.SubprocessRunner(), pipeline_root=ROOT_FOR_TESTING)
 
@@ -729,6 +943,27 @@ class TestRunLocalPipeline(testing_utilities.LocalRunnerEnvironmentTestCase):
         # Condition detection should route to enhanced orchestrator
         # and evaluate the condition (false in this case, so task is skipped)
 
+    @parameterized.parameters((1, 'small'), (5, 'medium'), (9, 'large'))
+    def test_if_elif_else(self, x, expected):
+        local.init(local.SubprocessRunner(), pipeline_root=ROOT_FOR_TESTING)
+
+        @dsl.component
+        def identity(string: str) -> str:
+            return string
+
+        @dsl.pipeline
+        def my_pipeline(x: int) -> str:
+            with dsl.If(x < 3):
+                small = identity(string='small')
+            with dsl.Elif(x < 7):
+                medium = identity(string='medium')
+            with dsl.Else():
+                large = identity(string='large')
+            return dsl.OneOf(small.output, medium.output, large.output)
+
+        task = my_pipeline(x=x)
+        self.assertEqual(task.output, expected)
+
     @mock.patch('sys.stdout', new_callable=stdlib_io.StringIO)
     def test_fails_with_raise_on_error_true(self, mock_stdout):
         local.init(local.SubprocessRunner(), raise_on_error=True)
@@ -1006,6 +1241,199 @@ class TestRunLocalPipeline(testing_utilities.LocalRunnerEnvironmentTestCase):
                 type(local.config.LocalExecutionConfig.instance.runner),
                 local.DockerRunner)
 
+    @parameterized.parameters(1, 2)
+    def test_resume_failed_run(self, max_parallelism: int):
+        runner = local.SubprocessRunner(
+            use_venv=True,
+            reuse_venv=True,
+            venv_cache_root=os.path.abspath('venvs'))
+        local.init(
+            runner,
+            pipeline_root=ROOT_FOR_TESTING,
+            raise_on_error=False,
+            max_parallelism=max_parallelism)
+        work_dir = os.path.abspath('work')
+        os.makedirs(work_dir)
+
+        @dsl.component
+        def record_run(work_dir: str, name: str) -> str:
+            import os
+            with open(os.path.join(work_dir, name), 'a') as f:
+                f.write('ran\n')
+            return name
+
+        @dsl.component
+        def fail_until_fixed(work_dir: str, upstream: str) -> str:
+            import os
+            if not os.path.exists(os.path.join(work_dir, 'fixed')):
+                raise RuntimeError('Not fixed yet.')
+            return f'{upstream}-fixed'
+
+        @dsl.pipeline
+        def my_pipeline(work_dir: str) -> str:
+            first = record_run(work_dir=work_dir, name='first')
+            fixed = fail_until_fixed(work_dir=work_dir, upstream=first.output)
+            return record_run(work_dir=work_dir, name=fixed.output).output
+
+        my_pipeline(work_dir=work_dir)
+        [run_id] = os.listdir(ROOT_FOR_TESTING)
+        self.assertTrue(
+            os.path.exists(
+                os.path.join(ROOT_FOR_TESTING, run_id, 'run_journal.jsonl')))
+
+        open(os.path.join(work_dir, 'fixed'), 'w').close()
+        local.init(
+            runner,
+            pipeline_root=ROOT_FOR_TESTING,
+            max_parallelism=max_parallelism,
+            resume_run_id=run_id)
+        task = my_pipeline(work_dir=work_dir)
+
+        self.assertEqual(task.output, 'first-fixed')
+        # the first task is restored from the journal rather than run again
+        with open(os.path.join(work_dir, 'first')) as f:
+            self.assertEqual(f.read(), 'ran\n')
+        self.assertEqual(os.listdir(ROOT_FOR_TESTING), [run_id])
+
+        # only the next run resumes; later runs start new runs
+        my_pipeline(work_dir=work_dir)
+        self.assertEqual(len(os.listdir(ROOT_FOR_TESTING)), 2)
+        with open(os.path.join(work_dir, 'first')) as f:
+            self.assertEqual(f.read(), 'ran\nran\n')
+
+    def test_resume_failed_parallel_for_iteration(self):
+        runner = local.SubprocessRunner(
+            use_venv=True,
+            reuse_venv=True,
+            venv_cache_root=os.path.abspath('venvs'))
+        local.init(runner, pipeline_root=ROOT_FOR_TESTING, raise_on_error=False)
+        work_dir = os.path.abspath('work')
+        os.makedirs(work_dir)
+
+        @dsl.component
+        def fail_until_fixed(work_dir: str, item: int) -> int:
+            import os
+            with open(os.path.join(work_dir, str(item)), 'a') as f:
+                f.write('ran\n')
+            if item == 2 and not os.path.exists(
+                    os.path.join(work_dir, 'fixed')):
+                raise RuntimeError('Not fixed yet.')
+            return item
+
+        @dsl.pipeline
+        def my_pipeline(work_dir: str):
+            with dsl.ParallelFor([1, 2], parallelism=1) as item:
+                fail_until_fixed(work_dir=work_dir, item=item)
+
+        my_pipeline(work_dir=work_dir)
+        [run_id] = os.listdir(ROOT_FOR_TESTING)
+
+        open(os.path.join(work_dir, 'fixed'), 'w').close()
+        local.init(runner, pipeline_root=ROOT_FOR_TESTING, resume_run_id=run_id)
+        my_pipeline(work_dir=work_dir)
+
+        # only the failed iteration runs again
+        with open(os.path.join(work_dir, '1')) as f:
+            self.assertEqual(f.read(), 'ran\n')
+        with open(os.path.join(work_dir, '2')) as f:
+            self.assertEqual(f.read(), 'ran\nran\n')
+
+    def test_resume_with_other_arguments_fails(self):
+        local.init(
+            local.SubprocessRunner(
+                use_venv=True,
+                reuse_venv=True,
+                venv_cache_root=os.path.abspath('venvs')),
+            pipeline_root=ROOT_FOR_TESTING)
+
+        @dsl.component
+        def identity(x: str) -> str:
+            return x
+
+        @dsl.pipeline
+        def my_pipeline(x: str) -> str:
+            return identity(x=x).output
+
+        my_pipeline(x='a')
+        [run_id] = os.listdir(ROOT_FOR_TESTING)
+        with self.assertRaisesRegex(
+                ValueError,
+                rf"Cannot resume run '{run_id}': the pipeline arguments differ"
+        ):
+            pipeline_orchestrator.run_local_pipeline(
+                pipeline_spec=my_pipeline.pipeline_spec,
+                arguments={'x': 'b'},
+                resume_run_id=run_id,
+            )
+
+
+class TestDockerRunnerPipeline(testing_utilities.LocalRunnerEnvironmentTestCase
+                              ):
+
+    def test_images_prepulled_with_one_client(self):
+        local.init(local.DockerRunner(), pipeline_root=ROOT_FOR_TESTING)
+
+        @dsl.container_component
+        def alpine_echo():
+            return dsl.ContainerSpec(image='alpine', command=['echo', 'hi'])
+
+        @dsl.container_component
+        def busybox_echo():
+            return dsl.ContainerSpec(image='busybox', command=['echo', 'hi'])
+
+        @dsl.pipeline
+        def my_pipeline():
+            alpine_echo()
+            busybox_echo().after(alpine_echo())
+
+        with mock.patch('docker.from_env') as mock_from_env:
+            client = mock_from_env.return_value
+            pulled_images = set()
+
+            def get_image(image: str) -> mock.Mock:
+                if image not in pulled_images:
+                    raise docker.errors.ImageNotFound('not found')
+                return mock.Mock()
+
+            client.images.get.side_effect = get_image
+            client.images.pull.side_effect = pulled_images.add
+            container = client.containers.run.return_value
+            container.logs.return_value = [b'hi\n']
+            container.wait.return_value = {'StatusCode': 0}
+
+            my_pipeline()
+
+        mock_from_env.assert_called_once()
+        client.close.assert_called_once()
+        # each image is pulled once, before the first task starts
+        self.assertCountEqual(
+            [call.args[0] for call in client.images.pull.call_args_list],
+            ['alpine:latest', 'busybox:latest'])
+        method_names = [call[0] for call in client.method_calls]
+        last_pull = len(method_names) - method_names[::-1].index('images.pull')
+        self.assertNotIn('containers.run', method_names[:last_pull])
+
+    def test_docker_unavailable_cleans_up(self):
+        local.init(local.DockerRunner(), pipeline_root=ROOT_FOR_TESTING)
+        workspace_root = local.config.LocalExecutionConfig.instance.workspace_root
+
+        @dsl.container_component
+        def alpine_echo():
+            return dsl.ContainerSpec(image='alpine', command=['echo', 'hi'])
+
+        @dsl.pipeline
+        def my_pipeline():
+            alpine_echo()
+
+        with mock.patch(
+                'docker.from_env',
+                side_effect=docker.errors.DockerException('not running')):
+            with self.assertRaisesRegex(docker.errors.DockerException,
+                                        'not running'):
+                my_pipeline()
+
+        self.assertFalse(os.path.exists(workspace_root))
+
 
 class TestFstringContainerComponent(
         testing_utilities.LocalRunnerEnvironmentTestCase):
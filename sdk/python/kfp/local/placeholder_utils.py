@@ -14,6 +14,7 @@
 """Utilities for working with placeholders."""
 import functools
 import json
+import os
 import random
 import re
 from typing import Any, Dict, List, Optional, Union
@@ -22,6 +23,9 @@ from kfp import dsl
 from kfp.dsl import constants as dsl_constants
 from kfp.local import config
 
+# prefix of the files executor inputs are written to, followed by the task ID
+EXECUTOR_INPUT_FILE_PREFIX = 'executor_input-'
+
 
 def make_random_id() -> str:
     """Makes a random 8 digit integer as a string."""
@@ -35,6 +39,8 @@ def replace_placeholders(
     task_resource_name: str,
     pipeline_root: str,
     unique_pipeline_id: str,
+    executor_input_dir: Optional[str] = None,
+    inline_executor_input: bool = True,
 ) -> List[str]:
     """Iterates over each element in the command and replaces placeholders.
 
@@ -42,6 +48,14 @@ def replace_placeholders(
     random ID is created within the scope of the function. Multiple
     calls on the same task will result in multiple random IDs per single
     task.
+
+    If executor_input_dir is provided, the resolved executor input is
+    written to a file in that directory and ``--executor_input_file
+    <path>`` is added after the ``--executor_input {{$}}`` argument pair.
+    Executors that accept the flag read the file instead. If
+    inline_executor_input is False, the argument pair is removed, so
+    that the executor input is not passed on the command line; this
+    must only be used for executors that accept --executor_input_file.
     """
     unique_task_id = make_random_id()
     executor_input_dict = resolve_self_references_in_executor_input(
@@ -52,6 +66,15 @@ def replace_placeholders(
         pipeline_job_id=unique_pipeline_id,
         pipeline_task_id=unique_task_id,
     )
+    if executor_input_dir is not None:
+        full_command = use_executor_input_file(
+            full_command=full_command,
+            executor_input_dict=executor_input_dict,
+            executor_input_path=os.path.join(
+                executor_input_dir,
+                f'{EXECUTOR_INPUT_FILE_PREFIX}{unique_task_id}.json'),
+            inline_executor_input=inline_executor_input,
+        )
     provided_inputs = get_provided_inputs(executor_input_dict)
     full_command = [
         resolve_struct_placeholders(
@@ -84,6 +107,38 @@ def replace_placeholders(
     return resolved_command
 
 
+def use_executor_input_file(
+    full_command: List[str],
+    executor_input_dict: Dict[str, Any],
+    executor_input_path: str,
+    inline_executor_input: bool = True,
+) -> List[str]:
+    """Writes the executor input to executor_input_path and adds
+    ``--executor_input_file <executor_input_path>`` after the
+    ``--executor_input {{$}}`` argument pair.
+
+    If inline_executor_input is False, the argument pair is replaced
+    instead of kept.
+
+    The command is returned unchanged, and no file is written, if it
+    does not pass the executor input with ``--executor_input``.
+    """
+    for i in range(len(full_command) - 1):
+        if full_command[i:i + 2] == [
+                '--executor_input', dsl.PIPELINE_TASK_EXECUTOR_INPUT_PLACEHOLDER
+        ]:
+            break
+    else:
+        return full_command
+
+    os.makedirs(os.path.dirname(executor_input_path), exist_ok=True)
+    with open(executor_input_path, 'w') as f:
+        json.dump(executor_input_dict, f)
+    end = i + 2 if inline_executor_input else i
+    return full_command[:end] + ['--executor_input_file', executor_input_path
+                                ] + full_command[i + 2:]
+
+
 def resolve_self_references_in_executor_input(
     executor_input_dict: Dict[str, Any],
     pipeline_resource_name: str,
@@ -365,8 +420,10 @@ def resolve_individual_placeholder(
             executor_input_dict['outputs']['outputFile'],
         r'{{$.outputMetadataUri}}':
             executor_input_dict['outputs']['outputFile'],
+        # the executor input can be large, so it is only serialized for the
+        # elements that reference it
         r'{{$}}':
-            json.dumps(executor_input_dict),
+            None,
         dsl.PIPELINE_JOB_NAME_PLACEHOLDER:
             pipeline_resource_name,
         dsl.PIPELINE_JOB_ID_PLACEHOLDER:
@@ -379,7 +436,10 @@ def resolve_individual_placeholder(
             pipeline_root,
     }
     for placeholder, value in PLACEHOLDERS.items():
-        element = element.replace(placeholder, value)
+        if placeholder in element:
+            if value is None:
+                value = json.dumps(executor_input_dict)
+            element = element.replace(placeholder, value)
 
     # match non-constant placeholders (i.e., have key(s))
     return resolve_io_placeholders(executor_input_dict, element)
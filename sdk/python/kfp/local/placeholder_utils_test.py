@@ -122,6 +122,74 @@ class TestReplacePlaceholders(unittest.TestCase):
         ]
         self.assertEqual(actual, expected)
 
+    def test_executor_input_dir(self):
+        full_command = [
+            'python3',
+            '--executor_input',
+            '{{$}}',
+            '--function_to_execute',
+            'comp',
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            actual = placeholder_utils.replace_placeholders(
+                full_command=full_command,
+                executor_input_dict=EXECUTOR_INPUT_DICT,
+                pipeline_resource_name='my-pipeline-2023-10-10-13-32-59-420710',
+                task_resource_name='comp',
+                pipeline_root='/foo/bar/my-pipeline-2023-10-10-13-32-59-420710',
+                unique_pipeline_id=placeholder_utils.make_random_id(),
+                executor_input_dir=tmpdir,
+            )
+            # executors that do not accept the file still get the input
+            self.assertEqual(actual[:4], [
+                'python3', '--executor_input',
+                json.dumps(EXECUTOR_INPUT_DICT), '--executor_input_file'
+            ])
+            self.assertEqual(actual[5:], ['--function_to_execute', 'comp'])
+            self.assertEqual(os.path.dirname(actual[4]), tmpdir)
+            with open(actual[4]) as f:
+                self.assertEqual(json.load(f), EXECUTOR_INPUT_DICT)
+
+    def test_executor_input_dir_not_inline(self):
+        full_command = [
+            'python3',
+            '--executor_input',
+            '{{$}}',
+            '--function_to_execute',
+            'comp',
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            actual = placeholder_utils.replace_placeholders(
+                full_command=full_command,
+                executor_input_dict=EXECUTOR_INPUT_DICT,
+                pipeline_resource_name='my-pipeline-2023-10-10-13-32-59-420710',
+                task_resource_name='comp',
+                pipeline_root='/foo/bar/my-pipeline-2023-10-10-13-32-59-420710',
+                unique_pipeline_id=placeholder_utils.make_random_id(),
+                executor_input_dir=tmpdir,
+                inline_executor_input=False,
+            )
+            self.assertEqual(actual[:2], ['python3', '--executor_input_file'])
+            self.assertEqual(actual[3:], ['--function_to_execute', 'comp'])
+            self.assertEqual(os.path.dirname(actual[2]), tmpdir)
+            with open(actual[2]) as f:
+                self.assertEqual(json.load(f), EXECUTOR_INPUT_DICT)
+
+    def test_executor_input_dir_without_executor_input_arg(self):
+        full_command = ['echo', '{{$}}']
+        with tempfile.TemporaryDirectory() as tmpdir:
+            actual = placeholder_utils.replace_placeholders(
+                full_command=full_command,
+                executor_input_dict=EXECUTOR_INPUT_DICT,
+                pipeline_resource_name='my-pipeline-2023-10-10-13-32-59-420710',
+                task_resource_name='comp',
+                pipeline_root='/foo/bar/my-pipeline-2023-10-10-13-32-59-420710',
+                unique_pipeline_id=placeholder_utils.make_random_id(),
+                executor_input_dir=tmpdir,
+            )
+            self.assertEqual(os.listdir(tmpdir), [])
+        self.assertEqual(actual, ['echo', json.dumps(EXECUTOR_INPUT_DICT)])
+
 
 class TestResolveIndividualPlaceholder(parameterized.TestCase):
 
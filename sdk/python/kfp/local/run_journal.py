@@ -0,0 +1,392 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Journal of a local pipeline run's task results, for resuming failed runs.
+
+The journal is a JSON lines file in the run's directory,
+``<pipeline_root>/<run_id>/run_journal.jsonl``. The first line
+describes the run; every other line records the status and outputs of
+one task when it finishes. Tasks of nested DAGs and ParallelFor
+iterations are recorded under their path in the pipeline, e.g.
+``for-loop-2/for-loop-2-iteration-3/train``. When a run is resumed,
+its journal is appended to, and later records of a task supersede
+earlier ones.
+"""
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set
+
+from kfp.local import cache
+from kfp.local import io
+from kfp.local import logging_utils
+from kfp.local.orchestrator import collected_outputs
+from kfp.pipeline_spec import pipeline_spec_pb2
+
+JOURNAL_FILE_NAME = 'run_journal.jsonl'
+
+SUCCEEDED = 'SUCCEEDED'
+FAILED = 'FAILED'
+# a conditional task whose condition was False
+SKIPPED = 'SKIPPED'
+
+
+def get_journal_path(pipeline_root: str, run_id: str) -> str:
+    return os.path.join(pipeline_root, run_id, JOURNAL_FILE_NAME)
+
+
+def _serialize_arguments(arguments: Dict[str, Any]) -> str:
+    return json.dumps(arguments, sort_keys=True, default=str)
+
+
+def _parse_line(line: str) -> Optional[Dict[str, Any]]:
+    """Returns the record of a journal line, or None if it is incomplete."""
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def _ends_with_newline(path: str) -> bool:
+    with open(path, 'rb') as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b'\n'
+
+
+def _task_path(dag_path: str, task_name: str) -> str:
+    return f'{dag_path}/{task_name}' if dag_path else task_name
+
+
+def _dag_paths(task_path: str) -> Iterator[str]:
+    """Yields the paths of the nested DAGs a task path is in."""
+    parts = task_path.split('/')
+    for i in range(1, len(parts)):
+        yield '/'.join(parts[:i])
+
+
+def _load_records(
+        records: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Returns the latest record of each task path.
+
+    A reset record drops the earlier records of all tasks under its DAG.
+    """
+    latest_records: Dict[str, Dict[str, Any]] = {}
+    for record in records:
+        if 'reset' in record:
+            prefix = f"{record['reset']}/"
+            latest_records = {
+                task_path: task_record
+                for task_path, task_record in latest_records.items()
+                if not task_path.startswith(prefix)
+            }
+        else:
+            latest_records[record['task']] = record
+    return latest_records
+
+
+class RunJournal:
+    """The journal of a local run.
+
+    The records of each DAG of the run are read and written through
+    a DagJournal, starting from root_dag.
+
+    Attributes:
+        run_id: The ID of the run, which is the name of its directory in the pipeline root.
+        unique_pipeline_id: The ID used to resolve pipeline job placeholders.
+        path: Path of the journal file.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        run_id: str,
+        unique_pipeline_id: str,
+        records: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> None:
+        self.path = path
+        self.run_id = run_id
+        self.unique_pipeline_id = unique_pipeline_id
+        # task path -> latest journal record of the earlier run
+        self._records = records or {}
+        # paths of the nested DAGs that have records
+        self._recorded_dags: Set[str] = {
+            dag_path for task_path in self._records
+            for dag_path in _dag_paths(task_path)
+        }
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._file = open(path, 'a', encoding='utf-8')
+        if self._file.tell() and not _ends_with_newline(path):
+            # end a record partially written by a run that was killed, so
+            # that it does not run into the records appended after it
+            self._append_line('\n')
+
+    @classmethod
+    def create(
+        cls,
+        pipeline_root: str,
+        run_id: str,
+        pipeline_name: str,
+        arguments: Dict[str, Any],
+        unique_pipeline_id: str,
+    ) -> 'RunJournal':
+        """Starts the journal of a new run."""
+        journal = cls(
+            path=get_journal_path(pipeline_root, run_id),
+            run_id=run_id,
+            unique_pipeline_id=unique_pipeline_id,
+        )
+        journal._append({
+            'pipeline_name': pipeline_name,
+            'arguments': _serialize_arguments(arguments),
+            'unique_pipeline_id': unique_pipeline_id,
+        })
+        return journal
+
+    @classmethod
+    def resume(
+        cls,
+        pipeline_root: str,
+        run_id: str,
+        pipeline_name: str,
+        arguments: Dict[str, Any],
+    ) -> 'RunJournal':
+        """Opens the journal of an earlier run to resume it.
+
+        Args:
+            pipeline_root: The local pipeline root.
+            run_id: The ID of the run to resume.
+            pipeline_name: The name of the pipeline being run.
+            arguments: The pipeline arguments.
+
+        Raises:
+            ValueError: If the run has no journal, its journal has no complete header, or it was a run of another pipeline or with other arguments.
+        """
+        path = get_journal_path(pipeline_root, run_id)
+        if not os.path.exists(path):
+            raise ValueError(
+                f'Cannot resume run {run_id!r}: no run journal found at '
+                f'{path}.')
+        with open(path, encoding='utf-8') as f:
+            # lines that do not parse were partially written by a run that
+            # was killed
+            header, *records = [_parse_line(line) for line in f] or [None]
+        records = [record for record in records if record is not None]
+        if header is None:
+            raise ValueError(
+                f'Cannot resume run {run_id!r}: the run journal at {path} is '
+                'incomplete, as the run was stopped before it started any '
+                'task.')
+
+        if header['pipeline_name'] != pipeline_name:
+            raise ValueError(
+                f'Cannot resume run {run_id!r}: it is a run of pipeline '
+                f"{header['pipeline_name']!r}, not {pipeline_name!r}.")
+        if header['arguments'] != _serialize_arguments(arguments):
+            raise ValueError(
+                f'Cannot resume run {run_id!r}: the pipeline arguments differ '
+                f"from the run's arguments {header['arguments']}.")
+
+        return cls(
+            path=path,
+            run_id=run_id,
+            unique_pipeline_id=header['unique_pipeline_id'],
+            records=_load_records(records),
+        )
+
+    def root_dag(
+        self,
+        tasks: Mapping[str, pipeline_spec_pb2.PipelineTaskSpec],
+    ) -> 'DagJournal':
+        """Returns the journal of the pipeline's root DAG.
+
+        Args:
+            tasks: The tasks of the pipeline's root DAG.
+        """
+        return DagJournal(
+            run_journal=self, dag_path='', tasks=tasks, inputs_changed=False)
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        self._append_line(json.dumps(record) + '\n')
+
+    def _append_line(self, line: str) -> None:
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class DagJournal:
+    """The records of the tasks of one DAG of a run: the root DAG, a
+    nested DAG, such as the body of a dsl.Condition, or a ParallelFor
+    iteration.
+
+    A task is restored from the journal instead of running again if it
+    succeeded (or was skipped by its condition), its local output
+    artifacts and spilled outputs still exist, and all of its upstream
+    tasks are restored too. Every other task, including all tasks
+    downstream of a task that runs again, runs again.
+
+    A nested DAG restores its tasks only if the task that runs it in
+    the enclosing DAG has the same inputs as in the earlier run, i.e.
+    all of that task's upstream tasks were restored. Otherwise, its
+    earlier records are discarded.
+    """
+
+    def __init__(
+        self,
+        run_journal: RunJournal,
+        dag_path: str,
+        tasks: Mapping[str, pipeline_spec_pb2.PipelineTaskSpec],
+        inputs_changed: bool,
+    ) -> None:
+        self._run_journal = run_journal
+        self._dag_path = dag_path
+        self._tasks = tasks
+        self._inputs_changed = inputs_changed
+        # task name -> journal record of the tasks that need not run again
+        self._restorable_tasks: Dict[str, Dict[str, Any]] = {}
+        if inputs_changed:
+            if dag_path in run_journal._recorded_dags:
+                run_journal._append({'reset': dag_path})
+        else:
+            self._find_restorable_tasks()
+
+    def _find_restorable_tasks(self) -> None:
+        not_restorable: Set[str] = set()
+
+        def is_restorable(task_name: str) -> bool:
+            if task_name in self._restorable_tasks:
+                return True
+            if task_name in not_restorable or task_name not in self._tasks:
+                return False
+            record = self._run_journal._records.get(
+                _task_path(self._dag_path, task_name))
+            restorable = (
+                record is not None and
+                record['status'] in (SUCCEEDED, SKIPPED) and
+                not any(not os.path.exists(path)
+                        for path in _local_paths(record)) and
+                all(
+                    is_restorable(upstream_task)
+                    for upstream_task in self._tasks[task_name].dependent_tasks)
+            )
+            if restorable:
+                self._restorable_tasks[task_name] = record
+            else:
+                not_restorable.add(task_name)
+            return restorable
+
+        for task_name in self._tasks:
+            is_restorable(task_name)
+
+    @property
+    def num_restorable_tasks(self) -> int:
+        return len(self._restorable_tasks)
+
+    def nested_dag(
+        self,
+        task_name: str,
+        tasks: Optional[Mapping[str,
+                                pipeline_spec_pb2.PipelineTaskSpec]] = None,
+    ) -> 'DagJournal':
+        """Returns the journal of a DAG run by a task of this DAG.
+
+        Args:
+            task_name: The name of the task, e.g. of a nested pipeline, a ParallelFor, or a ParallelFor iteration in the journal of its ParallelFor.
+            tasks: The tasks of the nested DAG, if any.
+        """
+        task_spec = self._tasks.get(task_name)
+        upstream_tasks = task_spec.dependent_tasks if task_spec else []
+        return DagJournal(
+            run_journal=self._run_journal,
+            dag_path=_task_path(self._dag_path, task_name),
+            tasks=tasks or {},
+            inputs_changed=self._inputs_changed or
+            any(upstream_task not in self._restorable_tasks
+                for upstream_task in upstream_tasks),
+        )
+
+    def restore_task(self, task_name: str, io_store: io.IOStore) -> bool:
+        """Restores a task's status and outputs from the journal, if it need
+        not run again.
+
+        Returns:
+            Whether the task was restored.
+        """
+        record = self._restorable_tasks.get(task_name)
+        if record is None:
+            return False
+        if record['status'] == SUCCEEDED:
+            io_store.put_task_status(task_name, SUCCEEDED)
+            for key, output in cache.deserialize_outputs(
+                    record['outputs']).items():
+                io_store.put_task_output(task_name, key, output)
+            for key, reference in record.get('spilled_outputs', {}).items():
+                io_store.put_task_output(
+                    task_name, key,
+                    collected_outputs.load_spilled_output(reference))
+        task_path = _task_path(self._dag_path, task_name)
+        with logging_utils.local_logger_context():
+            logging.info(
+                f'Restored task {logging_utils.format_task_name(task_path)} '
+                f'from the journal of run {self._run_journal.run_id!r}')
+        return True
+
+    def record_task(
+        self,
+        task_name: str,
+        task_status: str,
+        outputs: Dict[str, Any],
+    ) -> None:
+        """Records the result of a task.
+
+        Outputs spilled to a file, i.e. LazyValues with a reference, are
+        recorded by reference.
+
+        Args:
+            task_name: The name of the task in this DAG.
+            task_status: One of SUCCEEDED, FAILED or SKIPPED.
+            outputs: The task outputs.
+        """
+        spilled_outputs = {
+            key: output.reference
+            for key, output in outputs.items()
+            if isinstance(output, io.LazyValue) and output.reference is not None
+        }
+        outputs = {
+            key: output.load() if isinstance(output, io.LazyValue) else output
+            for key, output in outputs.items()
+            if key not in spilled_outputs
+        }
+        record = {
+            'task': _task_path(self._dag_path, task_name),
+            'status': task_status,
+            'outputs': cache.serialize_outputs(outputs),
+        }
+        if spilled_outputs:
+            record['spilled_outputs'] = spilled_outputs
+        self._run_journal._append(record)
+
+
+def _local_paths(record: Dict[str, Any]) -> List[str]:
+    """Returns the local files a task record's outputs reference."""
+    return cache.local_artifact_paths(record['outputs']) + [
+        reference['spill_path']
+        for reference in record.get('spilled_outputs', {}).values()
+    ]
@@ -0,0 +1,279 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for run_journal.py."""
+import json
+import os
+import tempfile
+import unittest
+
+from kfp import dsl
+from kfp.local import io
+from kfp.local import run_journal
+from kfp.local.orchestrator import collected_outputs
+from kfp.pipeline_spec import pipeline_spec_pb2
+
+
+def _tasks(**dependencies) -> dict:
+    return {
+        task_name: pipeline_spec_pb2.PipelineTaskSpec(dependent_tasks=upstream)
+        for task_name, upstream in dependencies.items()
+    }
+
+
+class TestRunJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.pipeline_root = self.temp_dir.name
+
+    def create(self, arguments=None) -> run_journal.RunJournal:
+        journal = run_journal.RunJournal.create(
+            pipeline_root=self.pipeline_root,
+            run_id='my-pipeline-run',
+            pipeline_name='my-pipeline',
+            arguments=arguments or {'x': 1},
+            unique_pipeline_id='abc',
+        )
+        self.addCleanup(journal.close)
+        return journal
+
+    def resume(self, arguments=None) -> run_journal.RunJournal:
+        journal = run_journal.RunJournal.resume(
+            pipeline_root=self.pipeline_root,
+            run_id='my-pipeline-run',
+            pipeline_name='my-pipeline',
+            arguments=arguments or {'x': 1},
+        )
+        self.addCleanup(journal.close)
+        return journal
+
+    def test_restores_succeeded_tasks(self):
+        artifact_path = os.path.join(self.pipeline_root, 'model')
+        open(artifact_path, 'w').close()
+        journal = self.create()
+        root = journal.root_dag(_tasks(a=[], b=['a']))
+        root.record_task('a', run_journal.SUCCEEDED, {
+            'out': 'hello',
+            'model': dsl.Model(name='model', uri=artifact_path),
+        })
+        root.record_task('b', run_journal.FAILED, {})
+        journal.close()
+
+        resumed = self.resume()
+        self.assertEqual(resumed.unique_pipeline_id, 'abc')
+        resumed_root = resumed.root_dag(_tasks(a=[], b=['a']))
+        self.assertEqual(resumed_root.num_restorable_tasks, 1)
+        io_store = io.IOStore()
+        self.assertTrue(resumed_root.restore_task('a', io_store))
+        self.assertFalse(resumed_root.restore_task('b', io_store))
+        self.assertEqual(io_store.get_task_output('a', 'out'), 'hello')
+        self.assertEqual(
+            io_store.get_task_output('a', 'model').uri, artifact_path)
+        self.assertEqual(io_store.get_task_status('a'), 'SUCCEEDED')
+
+    def test_downstream_of_rerun_task_runs_again(self):
+        journal = self.create()
+        root = journal.root_dag({})
+        root.record_task('a', run_journal.FAILED, {})
+        # e.g. a task that ignores upstream failures
+        root.record_task('b', run_journal.SUCCEEDED, {})
+        root.record_task('c', run_journal.SUCCEEDED, {})
+        journal.close()
+
+        resumed_root = self.resume().root_dag(_tasks(a=[], b=['a'], c=[]))
+        self.assertEqual(resumed_root.num_restorable_tasks, 1)
+        self.assertTrue(resumed_root.restore_task('c', io.IOStore()))
+        self.assertFalse(resumed_root.restore_task('b', io.IOStore()))
+
+    def test_later_records_supersede_earlier_ones(self):
+        journal = self.create()
+        journal.root_dag({}).record_task('a', run_journal.FAILED, {})
+        journal.close()
+        resumed = self.resume()
+        resumed.root_dag(_tasks(a=[])).record_task('a', run_journal.SUCCEEDED,
+                                                   {'out': 1})
+        resumed.close()
+
+        self.assertEqual(
+            self.resume().root_dag(_tasks(a=[])).num_restorable_tasks, 1)
+
+    def test_skipped_task_restored_without_outputs(self):
+        journal = self.create()
+        journal.root_dag({}).record_task('a', run_journal.SKIPPED, {})
+        journal.close()
+
+        io_store = io.IOStore()
+        self.assertTrue(self.resume().root_dag(_tasks(a=[])).restore_task(
+            'a', io_store))
+        with self.assertRaises(ValueError):
+            io_store.get_task_status('a')
+
+    def test_missing_artifact_runs_again(self):
+        journal = self.create()
+        journal.root_dag({}).record_task(
+            'a', run_journal.SUCCEEDED, {
+                'model':
+                    dsl.Model(
+                        name='model',
+                        uri=os.path.join(self.pipeline_root, 'gone'))
+            })
+        journal.close()
+
+        self.assertEqual(
+            self.resume().root_dag(_tasks(a=[])).num_restorable_tasks, 0)
+
+    def test_ignores_partially_written_record(self):
+        journal = self.create()
+        journal.root_dag({}).record_task('a', run_journal.SUCCEEDED, {})
+        journal.close()
+        with open(journal.path, 'a') as f:
+            f.write('{"task": "b", "sta')
+
+        self.assertEqual(
+            self.resume().root_dag(_tasks(a=[], b=[])).num_restorable_tasks, 1)
+
+    def test_records_after_partially_written_record(self):
+        journal = self.create()
+        journal.close()
+        with open(journal.path, 'a') as f:
+            f.write('{"task": "b", "sta')
+        journal = self.resume()
+        journal.root_dag({}).record_task('a', run_journal.SUCCEEDED, {})
+        journal.close()
+
+        self.assertEqual(
+            self.resume().root_dag(_tasks(a=[])).num_restorable_tasks, 1)
+
+    def test_restores_tasks_of_nested_dags(self):
+        journal = self.create()
+        root = journal.root_dag(_tasks(loop=[]))
+        loop = root.nested_dag('loop')
+        for i, iteration_status in enumerate(
+            [run_journal.SUCCEEDED, run_journal.FAILED]):
+            iteration = loop.nested_dag(f'loop-iteration-{i}', _tasks(train=[]))
+            iteration.record_task('train', iteration_status, {'out': i})
+        root.record_task('loop', run_journal.FAILED, {})
+        journal.close()
+        with open(journal.path) as f:
+            self.assertIn('"task": "loop/loop-iteration-0/train"', f.read())
+
+        resumed_loop = self.resume().root_dag(
+            _tasks(loop=[])).nested_dag('loop')
+        io_store = io.IOStore()
+        self.assertTrue(
+            resumed_loop.nested_dag('loop-iteration-0',
+                                    _tasks(train=[])).restore_task(
+                                        'train', io_store))
+        self.assertEqual(io_store.get_task_output('train', 'out'), 0)
+        self.assertFalse(
+            resumed_loop.nested_dag('loop-iteration-1',
+                                    _tasks(train=[])).restore_task(
+                                        'train', io.IOStore()))
+
+    def test_nested_dag_of_rerun_upstream_runs_again(self):
+        journal = self.create()
+        root = journal.root_dag(_tasks(a=[], sub=['a']))
+        root.record_task('a', run_journal.FAILED, {})
+        root.nested_dag('sub',
+                        _tasks(b=[])).record_task('b', run_journal.SUCCEEDED,
+                                                  {})
+        journal.close()
+
+        resumed = self.resume()
+        sub = resumed.root_dag(_tasks(a=[],
+                                      sub=['a'
+                                          ])).nested_dag('sub', _tasks(b=[]))
+        self.assertEqual(sub.num_restorable_tasks, 0)
+        resumed.close()
+
+        # the earlier records of the nested DAG are discarded, even once
+        # its upstream task is restored
+        journal = self.resume()
+        journal.root_dag({}).record_task('a', run_journal.SUCCEEDED, {})
+        journal.close()
+        sub = self.resume().root_dag(_tasks(a=[], sub=['a'])).nested_dag(
+            'sub', _tasks(b=[]))
+        self.assertEqual(sub.num_restorable_tasks, 0)
+
+    def test_spilled_outputs_recorded_by_reference(self):
+        collected = collected_outputs.CollectedOutputs(
+            num_iterations=3, spill_dir=self.pipeline_root, spill_threshold=1)
+        for i in range(3):
+            collected.put(i, {'Output': i})
+        self.assertTrue(collected.spilled)
+        journal = self.create()
+        journal.root_dag({}).record_task(
+            'loop', run_journal.SUCCEEDED, {
+                'Output': collected.lazy_output('Output'),
+                'other': io.LazyValue(lambda: [7]),
+            })
+        journal.close()
+        with open(journal.path) as f:
+            record = json.loads(f.read().splitlines()[1])
+        self.assertEqual(record['outputs'], {'other': [7]})
+        self.assertIn('spill_path', record['spilled_outputs']['Output'])
+
+        io_store = io.IOStore()
+        resumed_root = self.resume().root_dag(_tasks(loop=[]))
+        self.assertTrue(resumed_root.restore_task('loop', io_store))
+        self.assertIsInstance(
+            io_store.get_task_outputs('loop', load_lazy_values=False)['Output'],
+            io.LazyValue)
+        self.assertEqual(io_store.get_task_output('loop', 'Output'), [0, 1, 2])
+
+        os.remove(record['spilled_outputs']['Output']['spill_path'])
+        self.assertEqual(
+            self.resume().root_dag(_tasks(loop=[])).num_restorable_tasks, 0)
+
+    def test_partially_written_header(self):
+        path = run_journal.get_journal_path(self.pipeline_root,
+                                            'my-pipeline-run')
+        os.makedirs(os.path.dirname(path))
+        for content in ['', '{"pipeline_name": "my-pipe']:
+            with open(path, 'w') as f:
+                f.write(content)
+            with self.assertRaisesRegex(
+                    ValueError,
+                    r"Cannot resume run 'my-pipeline-run': the run journal at "
+                    r'.* is incomplete'):
+                self.resume()
+
+    def test_no_journal(self):
+        with self.assertRaisesRegex(
+                ValueError,
+                r"Cannot resume run 'my-pipeline-run': no run journal found"):
+            self.resume()
+
+    def test_other_pipeline(self):
+        self.create().close()
+        with self.assertRaisesRegex(
+                ValueError,
+                r"it is a run of pipeline 'my-pipeline', not 'other'\."):
+            run_journal.RunJournal.resume(
+                pipeline_root=self.pipeline_root,
+                run_id='my-pipeline-run',
+                pipeline_name='other',
+                arguments={'x': 1},
+            )
+
+    def test_other_arguments(self):
+        self.create().close()
+        with self.assertRaisesRegex(ValueError,
+                                    r'the pipeline arguments differ'):
+            self.resume(arguments={'x': 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
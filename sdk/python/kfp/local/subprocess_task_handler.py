@@ -19,13 +19,16 @@ import subprocess
 import sys
 import tempfile
 from typing import Dict, List, Optional
-import venv
 import warnings
 
 from kfp.dsl import component_factory
+from kfp.local import cancellation
 from kfp.local import config
+from kfp.local import log_multiplexer
 from kfp.local import status
 from kfp.local import task_handler_interface
+from kfp.local import venv_pool
+from kfp.local import worker_pool
 
 
 class SubprocessTaskHandler(task_handler_interface.ITaskHandler):
@@ -62,6 +65,15 @@ class SubprocessTaskHandler(task_handler_interface.ITaskHandler):
                            'python -m pip install' in command_str or
                            '-m pip install' in command_str)
 
+        if self.runner.use_worker_pool:
+            parsed_command = worker_pool.parse_lightweight_command(
+                venv_pool.split_install_command(self.full_command)[1])
+            if parsed_command is not None:
+                return self._run_on_warm_worker(*parsed_command)
+
+        if self.runner.use_venv and self.runner.reuse_venv:
+            return self._run_in_pooled_venv()
+
         with environment(
                 use_venv=self.runner.use_venv,
                 runner_config=self.runner,
@@ -76,6 +88,109 @@ class SubprocessTaskHandler(task_handler_interface.ITaskHandler):
             )
             return status.Status.SUCCESS if return_code == 0 else status.Status.FAILURE
 
+    def _run_in_pooled_venv(self) -> status.Status:
+        """Runs the task in a reusable virtual environment from the pool.
+
+        Returns:
+            Status.
+        """
+        pool = venv_pool.get_venv_pool(
+            root=self.runner.venv_cache_root,
+            max_entries=self.runner.max_cached_venvs,
+        )
+        try:
+            with pool.acquire(
+                    full_command=self.full_command,
+                    env_vars=self.env_vars,
+            ) as (py_executable, task_command):
+                full_command = replace_python_executable(
+                    task_command,
+                    py_executable,
+                )
+                return_code = run_local_subprocess(
+                    full_command=full_command,
+                    env_vars=self.env_vars,
+                )
+        except venv_pool.VenvBuildError as e:
+            print(e)
+            return status.Status.FAILURE
+        return status.Status.SUCCESS if return_code == 0 else status.Status.FAILURE
+
+    def _run_on_warm_worker(self, source: str,
+                            args: List[str]) -> status.Status:
+        """Runs the component in-process on a warm worker interpreter.
+
+        Args:
+            source: Source of the component module.
+            args: Executor arguments of the component.
+
+        Returns:
+            Status.
+        """
+        pool = worker_pool.get_worker_pool(
+            recycle_after=self.runner.worker_recycle_after)
+        if self.runner.use_venv:
+            environment_pool = venv_pool.get_venv_pool(
+                root=self.runner.venv_cache_root,
+                max_entries=self.runner.max_cached_venvs,
+            )
+            try:
+                with environment_pool.acquire(
+                        full_command=self.full_command,
+                        env_vars=self.env_vars,
+                ) as (py_executable, _):
+                    return_code = pool.run(
+                        python_executable=py_executable,
+                        source=source,
+                        args=args,
+                        env_vars=self.env_vars,
+                        environment_pool=environment_pool,
+                    )
+            except venv_pool.VenvBuildError as e:
+                print(e)
+                return status.Status.FAILURE
+        else:
+            if not self._install_packages(sys.executable):
+                return status.Status.FAILURE
+            return_code = pool.run(
+                python_executable=sys.executable,
+                source=source,
+                args=args,
+                env_vars=self.env_vars,
+            )
+        return status.Status.SUCCESS if return_code == 0 else status.Status.FAILURE
+
+    def _install_packages(self, py_executable: str) -> bool:
+        """Runs the component's package install script, once per interpreter.
+
+        Args:
+            py_executable: The Python executable to install into.
+
+        Returns:
+            Whether the packages are installed.
+        """
+        install_script, _ = venv_pool.split_install_command(self.full_command)
+        if install_script is None:
+            return True
+        install_key = venv_pool.compute_venv_key(install_script, self.env_vars)
+        if worker_pool.is_installed(py_executable, install_key):
+            return True
+
+        from kfp.local.pip_install_manager import pip_install_manager
+        with pip_install_manager.managed_install(
+                'subprocess', track_stats=True):
+            return_code = run_local_subprocess(
+                full_command=replace_python_executable(
+                    ['sh', '-c', install_script, 'true'],
+                    py_executable,
+                ),
+                env_vars=self.env_vars,
+            )
+        if return_code != 0:
+            return False
+        worker_pool.mark_installed(py_executable, install_key)
+        return True
+
     def validate_image(self, image: str) -> None:
         if 'python' not in image:
             warnings.warn(
@@ -113,6 +228,7 @@ def run_local_subprocess(
     if env_vars:
         env = {**os.environ, **env_vars}
 
+    task_log = log_multiplexer.current_task_log()
     with subprocess.Popen(
             full_command,
             stdout=subprocess.PIPE,
@@ -121,19 +237,27 @@ def run_local_subprocess(
             # the outer process logs which, per logging module default, go to
             # stderr.
             stderr=subprocess.STDOUT,
-            text=True,
-            # buffer line-by-line
-            bufsize=1,
             env=env,
+            # in its own process group so that cancelling the task also stops
+            # the processes it starts; the group does not receive the
+            # terminal's Ctrl+C, so the process is stopped explicitly below
+            start_new_session=True,
     ) as process:
-        if process.stdout:
-            for line in iter(process.stdout.readline, ''):
-                print(line, end='')
-
-            # help with visual separation to show termination of subprocess logs
-            print('\n')
+        try:
+            with cancellation.on_cancel(
+                    lambda: cancellation.terminate_process(process)):
+                if process.stdout:
+                    multiplexer = log_multiplexer.get_log_multiplexer()
+                    output_written = multiplexer.attach(process.stdout,
+                                                        task_log)
+                    process.wait()
+                    output_written.wait()
+                    task_log.end_stream()
 
-        return process.wait()
+                return process.wait()
+        except BaseException:
+            cancellation.terminate_process(process)
+            raise
 
 
 def replace_python_executable(full_command: List[str],
@@ -186,44 +310,7 @@ def environment(use_venv: bool,
         with pip_install_manager.managed_install(
                 'subprocess', track_stats=has_pip_install):
             with tempfile.TemporaryDirectory() as tempdir:
-                # Create the virtual environment inside the temporary directory
-                venv.create(tempdir, with_pip=True)
-
-                # Install setuptools and wheel in the venv to ensure build dependencies are available
-                # This is required for Python 3.13+ where setuptools is not included by default
-                python_path = os.path.join(tempdir, 'bin', 'python')
-                try:
-                    # First upgrade pip itself to ensure we have a compatible version
-                    subprocess.run([
-                        python_path, '-m', 'pip', 'install', '--upgrade', 'pip'
-                    ],
-                                   check=True,
-                                   capture_output=True,
-                                   text=True)
-                    # Then install setuptools and wheel
-                    # For Python 3.13+, require setuptools>=70.0.0 (needed for 3.13 compatibility)
-                    # For older versions, just upgrade to latest compatible version
-                    # Check the venv Python version (venv.create uses current interpreter, so this matches)
-                    if sys.version_info >= (3, 13):
-                        setuptools_req = 'setuptools>=70.0.0'
-                    else:
-                        # For Python < 3.13, upgrade setuptools without minimum version requirement
-                        # pip will install the latest version compatible with the Python version
-                        setuptools_req = 'setuptools'
-                    subprocess.run([
-                        python_path, '-m', 'pip', 'install', '--upgrade',
-                        setuptools_req, 'wheel'
-                    ],
-                                   check=True,
-                                   capture_output=True,
-                                   text=True)
-                except subprocess.CalledProcessError as e:
-                    # Log the error but continue, as some packages might still work
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.warning(
-                        f'Failed to install setuptools and wheel in venv: {e}')
-
+                python_path = venv_pool.create_venv(tempdir)
                 yield python_path
     else:
         # When not using venv but still have pip installs, serialize to prevent concurrency issues
@@ -174,6 +174,56 @@ class TestUseVenv(testing_utilities.LocalRunnerEnvironmentTestCase):
                                     r"No module named 'cloudpickle'"):
             import cloudpickle
 
+    def test_reuse_venv(self):
+        venv_cache_root = os.path.join(self.temp_dir.name, 'venvs')
+        local.init(
+            runner=local.SubprocessRunner(
+                use_venv=True,
+                reuse_venv=True,
+                venv_cache_root=venv_cache_root,
+            ))
+
+        @dsl.component(
+            packages_to_install=[kfp_pipeline_spec_path, 'cloudpickle'])
+        def installer_component() -> str:
+            import sys
+
+            import cloudpickle
+            return sys.executable
+
+        first = installer_component()
+        second = installer_component()
+
+        # both tasks ran in the same pooled environment
+        self.assertEqual(first.output, second.output)
+        self.assertTrue(first.output.startswith(venv_cache_root))
+
+
+class TestUseWorkerPool(testing_utilities.LocalRunnerEnvironmentTestCase):
+
+    def test_tasks_share_warm_worker(self):
+        local.init(
+            runner=local.SubprocessRunner(
+                use_venv=True,
+                reuse_venv=True,
+                venv_cache_root=os.path.join(self.temp_dir.name, 'venvs'),
+                use_worker_pool=True,
+            ))
+
+        @dsl.component(packages_to_install=[kfp_pipeline_spec_path])
+        def identity(x: str) -> str:
+            import os
+            return f'{x} from {os.getpid()}'
+
+        first = identity(x='a').output
+        second = identity(x='b').output
+
+        self.assertTrue(first.startswith('a from '))
+        self.assertTrue(second.startswith('b from '))
+        # both tasks ran in the same warm interpreter
+        self.assertEqual(first.split()[-1], second.split()[-1])
+        self.assertNotEqual(first.split()[-1], str(os.getpid()))
+
 
 class TestLightweightPythonComponentLogic(
         testing_utilities.LocalRunnerEnvironmentTestCase):
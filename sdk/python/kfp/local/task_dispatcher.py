@@ -15,9 +15,12 @@
 
 import copy
 import logging
-from typing import Any, Dict, Tuple
+import os
+from typing import Any, Dict, List, Tuple
 
 from kfp import local
+from kfp.dsl import component_factory
+from kfp.local import cancellation
 from kfp.local import config
 
 # docker import fix
@@ -30,12 +33,14 @@ except ImportError:
 
 from kfp.local import executor_input_utils
 from kfp.local import executor_output_utils
+from kfp.local import log_multiplexer
 from kfp.local import logging_utils
 from kfp.local import placeholder_utils
 from kfp.local import status
 from kfp.local import subprocess_task_handler
 from kfp.local import task_handler_interface
 from kfp.local import utils
+from kfp.local import worker_pool
 from kfp.pipeline_spec import pipeline_spec_pb2
 
 
@@ -128,6 +133,34 @@ def _prepare_runner_and_env_vars(
     return runner_copy, merged_env
 
 
+def _runs_current_executor(
+    full_command: List[str],
+    runner: config.LocalRunnerType,
+) -> bool:
+    """Returns whether the task runs the executor_main of this KFP version.
+
+    This is only known when the SubprocessRunner runs the executor
+    without installing packages first. An install script may install any
+    version of KFP, including released versions whose executor does not
+    accept --executor_input_file.
+    """
+    return (isinstance(runner, local.SubprocessRunner) and
+            full_command[:2] != ['sh', '-c'] and
+            _runs_executor_main(full_command))
+
+
+def _runs_executor_main(full_command: List[str]) -> bool:
+    """Returns whether the command runs the KFP executor module, as Lightweight
+    and Containerized Python Components do."""
+    executor_module = component_factory.EXECUTOR_MODULE
+    for i, element in enumerate(full_command):
+        if f'-m {executor_module}' in element:
+            return True
+        if element == '-m' and full_command[i + 1:i + 2] == [executor_module]:
+            return True
+    return False
+
+
 def run_single_task_implementation(
     pipeline_resource_name: str,
     component_name: str,
@@ -166,6 +199,8 @@ def run_single_task_implementation(
         executor_input=executor_input,
         component_spec=component_spec,
     )
+    # large parameters and embedded files would otherwise be passed on the
+    # command line, which is limited in size (ARG_MAX)
     full_command = placeholder_utils.replace_placeholders(
         full_command=full_command,
         executor_input_dict=executor_input_dict,
@@ -173,7 +208,12 @@ def run_single_task_implementation(
         task_resource_name=task_resource_name,
         pipeline_root=pipeline_root,
         unique_pipeline_id=unique_pipeline_id,
+        executor_input_dir=task_root
+        if _runs_executor_main(full_command) else None,
+        inline_executor_input=not _runs_current_executor(full_command, runner),
     )
+    full_command = worker_pool.use_source_file(
+        full_command, source_dir=task_root)
 
     runner_type = type(runner)
 
@@ -196,6 +236,11 @@ def run_single_task_implementation(
     with logging_utils.local_logger_context():
         task_name_for_logs = logging_utils.format_task_name(task_resource_name)
 
+        # another iteration of the same dsl.ParallelFor failed first
+        if cancellation.is_cancelled():
+            logging.info(f'Task {task_name_for_logs} was cancelled')
+            return {}, status.Status.FAILURE
+
         logging.info(f'Executing task {task_name_for_logs}')
         task_handler = TaskHandler(
             image=image,
@@ -205,11 +250,22 @@ def run_single_task_implementation(
             env_vars=env_vars,
         )
 
+        log_path = os.path.join(task_root, log_multiplexer.LOG_FILE_NAME)
+        console_logs = getattr(config.LocalExecutionConfig.instance,
+                               'console_logs', log_multiplexer.STREAM)
         # separate logs visually
-        logging.info(f'Streamed logs:\n')
+        if console_logs == log_multiplexer.STREAM:
+            logging.info(f'Streamed logs:\n')
+        else:
+            logging.info(f'Writing logs to {log_path}\n')
 
-        with logging_utils.indented_print():
+        with logging_utils.indented_print(), log_multiplexer.task_log_context(
+                task_name=task_resource_name,
+                log_path=log_path,
+                console_logs=console_logs,
+        ) as task_log:
             task_status = task_handler.run()
+            task_log.succeeded = task_status == status.Status.SUCCESS
 
         if task_status == status.Status.SUCCESS:
             logging.info(
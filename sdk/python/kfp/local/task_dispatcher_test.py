@@ -20,6 +20,7 @@ irrespective of the runner. While there will inevitably some overlap, we
 should seek to minimize it.
 """
 import functools
+import glob
 import io
 import os
 import re
@@ -27,6 +28,7 @@ import unittest
 from unittest import mock
 
 from absl.testing import parameterized
+import kfp
 from kfp import dsl
 from kfp import local
 from kfp.dsl import Artifact
@@ -280,6 +282,43 @@ class TestPipelineRootPaths(testing_utilities.LocalRunnerEnvironmentTestCase):
             self.assertEqual(task.output, 'foo')
 
 
+class TestTaskLogs(testing_utilities.LocalRunnerEnvironmentTestCase):
+
+    def test_logs_written_to_task_root(self):
+        local.init(
+            runner=local.SubprocessRunner(use_venv=True),
+            pipeline_root='logs_root')
+
+        @dsl.component
+        def say_hello():
+            print('hello from say_hello')
+
+        say_hello()
+
+        [log_path
+        ] = glob.glob(os.path.join('logs_root', '*', 'say-hello', 'task.log'))
+        with open(log_path) as f:
+            self.assertIn('hello from say_hello\n', f.read())
+
+    @mock.patch('sys.stdout', new_callable=io.StringIO)
+    def test_compact_console_logs(self, mock_stdout):
+        local.init(
+            runner=local.SubprocessRunner(use_venv=True),
+            console_logs='compact',
+        )
+
+        @dsl.component
+        def say_hello():
+            print('hello from say_hello')
+
+        say_hello()
+
+        output = mock_stdout.getvalue()
+        self.assertNotIn('hello from say_hello', output)
+        self.assertRegex(
+            output, r"Task 'say-hello' wrote \d+ log lines to .*task\.log")
+
+
 class TestEnvironmentVariables(testing_utilities.LocalRunnerEnvironmentTestCase
                               ):
     """Tests for set_env_variable support in local execution."""
@@ -805,5 +844,63 @@ class TestLocalCaching(testing_utilities.LocalRunnerEnvironmentTestCase):
             self.assertEqual(len(f.read()), 2)
 
 
+class TestRunsCurrentExecutor(unittest.TestCase):
+
+    def test_installs_this_kfp_version(self):
+        # the version may resolve to a released executor that does not
+        # accept --executor_input_file
+        full_command = [
+            'sh', '-c',
+            f"python3 -m pip install 'kfp=={kfp.__version__}' && \"$0\" \"$@\"",
+            'sh', '-ec', 'python3 -m kfp.dsl.executor_main "$@"'
+        ]
+        self.assertFalse(
+            task_dispatcher._runs_current_executor(full_command,
+                                                   local.SubprocessRunner()))
+        self.assertFalse(
+            task_dispatcher._runs_current_executor(full_command,
+                                                   local.DockerRunner()))
+
+    def test_installs_kfp_from_path(self):
+        full_command = [
+            'sh', '-c',
+            "python3 -m pip install '/path/to/kfp' && \"$0\" \"$@\"", 'sh',
+            '-ec', 'python3 -m kfp.dsl.executor_main "$@"'
+        ]
+        self.assertFalse(
+            task_dispatcher._runs_current_executor(full_command,
+                                                   local.SubprocessRunner()))
+
+    def test_no_install_runs_executor_main(self):
+        full_command = [
+            'sh', '-ec',
+            '_KFP_RUNTIME=true python3 -m kfp.dsl.executor_main "$@"', 'program'
+        ]
+        self.assertTrue(
+            task_dispatcher._runs_current_executor(full_command,
+                                                   local.SubprocessRunner()))
+        self.assertFalse(
+            task_dispatcher._runs_current_executor(full_command,
+                                                   local.DockerRunner()))
+
+    def test_containerized_python_component(self):
+        full_command = [
+            'python3', '-m', 'kfp.dsl.executor_main', '--executor_input',
+            dsl.PIPELINE_TASK_EXECUTOR_INPUT_PLACEHOLDER
+        ]
+        self.assertTrue(
+            task_dispatcher._runs_current_executor(full_command,
+                                                   local.SubprocessRunner()))
+
+    def test_container_component(self):
+        full_command = [
+            'my-launcher', '--executor_input',
+            dsl.PIPELINE_TASK_EXECUTOR_INPUT_PLACEHOLDER
+        ]
+        self.assertFalse(
+            task_dispatcher._runs_current_executor(full_command,
+                                                   local.SubprocessRunner()))
+
+
 if __name__ == '__main__':
     unittest.main()
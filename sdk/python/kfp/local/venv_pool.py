@@ -0,0 +1,477 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Persistent, content-addressed pool of virtual environments for the
+SubprocessRunner."""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import sys
+import threading
+from typing import Any, Dict, Generator, List, Optional, Tuple
+import venv
+
+try:
+    import fcntl
+except ImportError:
+    # file locks are best-effort; on platforms without fcntl only
+    # in-process deduplication applies
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_READY_MARKER = '.kfp_venv_ready'
+_LAST_USED_MARKER = '.kfp_venv_last_used'
+_LOCK_SUFFIX = '.lock'
+
+# pip options that consume the following token as their value
+_PIP_OPTIONS_WITH_VALUE = frozenset({
+    '-i',
+    '--index-url',
+    '--extra-index-url',
+    '--trusted-host',
+    '-f',
+    '--find-links',
+})
+_PIP_INSTALL_PATTERN = re.compile(r'-m pip install (.*?)(?=&&|\n|$)')
+
+
+class VenvBuildError(RuntimeError):
+    """Raised when a pooled virtual environment cannot be built."""
+
+
+def default_venv_cache_root() -> str:
+    """Returns the default directory for pooled virtual environments."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'kfp', 'local_venvs')
+
+
+def create_venv(path: str) -> str:
+    """Creates a virtual environment at path with up-to-date build tooling.
+
+    Args:
+        path: Directory in which to create the virtual environment.
+
+    Returns:
+        The path to the environment's Python executable.
+    """
+    venv.create(path, with_pip=True)
+
+    # Install setuptools and wheel in the venv to ensure build dependencies are available
+    # This is required for Python 3.13+ where setuptools is not included by default
+    python_path = os.path.join(path, 'bin', 'python')
+    try:
+        # First upgrade pip itself to ensure we have a compatible version
+        subprocess.run(
+            [python_path, '-m', 'pip', 'install', '--upgrade', 'pip'],
+            check=True,
+            capture_output=True,
+            text=True)
+        # Then install setuptools and wheel
+        # For Python 3.13+, require setuptools>=70.0.0 (needed for 3.13 compatibility)
+        # For older versions, just upgrade to latest compatible version
+        # Check the venv Python version (venv.create uses current interpreter, so this matches)
+        if sys.version_info >= (3, 13):
+            setuptools_req = 'setuptools>=70.0.0'
+        else:
+            # For Python < 3.13, upgrade setuptools without minimum version requirement
+            # pip will install the latest version compatible with the Python version
+            setuptools_req = 'setuptools'
+        subprocess.run([
+            python_path, '-m', 'pip', 'install', '--upgrade', setuptools_req,
+            'wheel'
+        ],
+                       check=True,
+                       capture_output=True,
+                       text=True)
+    except subprocess.CalledProcessError as e:
+        # Log the error but continue, as some packages might still work
+        logger.warning(f'Failed to install setuptools and wheel in venv: {e}')
+    return python_path
+
+
+def split_install_command(
+        full_command: List[str]) -> Tuple[Optional[str], List[str]]:
+    """Splits the package installation prefix off a lightweight component
+    command.
+
+    Lightweight components are compiled to `sh -c <install script> sh -ec
+    <program> ...`, where the install script runs pip and then execs its
+    positional arguments. The install script is what determines the
+    contents of the environment; the remainder is the task program.
+
+    Args:
+        full_command: Commands and args for the task.
+
+    Returns:
+        A tuple of (install script, task command). The install script is None
+        if the command has no poolable install prefix, in which case the task
+        command is the full command.
+    """
+    if (len(full_command) > 3 and full_command[:2] == ['sh', '-c'] and
+            '-m pip install' in full_command[2] and
+            # a component-level venv is created per invocation and cannot
+            # be shared
+            '-m venv' not in full_command[2]):
+        return full_command[2], list(full_command[3:])
+    return None, list(full_command)
+
+
+def _normalize_install_script(install_script: str) -> Any:
+    """Returns an order-insensitive representation of the packages and pip
+    options in an install script."""
+    normalized = []
+    for match in _PIP_INSTALL_PATTERN.finditer(install_script):
+        try:
+            tokens = shlex.split(match.group(1))
+        except ValueError:
+            # unbalanced quoting; fall back to the raw text
+            normalized.append(match.group(1).strip())
+            continue
+        options = []
+        packages = []
+        tokens_iter = iter(tokens)
+        for token in tokens_iter:
+            if token in _PIP_OPTIONS_WITH_VALUE:
+                options.append([token, next(tokens_iter, '')])
+            elif token.startswith('-'):
+                options.append([token])
+            else:
+                packages.append(token)
+        normalized.append({'options': options, 'packages': sorted(packages)})
+    return normalized
+
+
+def compute_venv_key(
+    install_script: Optional[str],
+    env_vars: Optional[Dict[str, str]] = None,
+) -> str:
+    """Computes the pool key for an environment.
+
+    The key covers the interpreter, the packages to install (order
+    insensitive), the pip options (index URLs, trusted hosts) and any
+    `PIP_*` environment variables that can change what pip resolves.
+
+    Args:
+        install_script: The install script from split_install_command.
+        env_vars: Environment variables the task runs with.
+
+    Returns:
+        The hex key.
+    """
+    pip_env_vars = {
+        name: value
+        for name, value in (env_vars or {}).items()
+        if name.startswith('PIP_')
+    }
+    key_material = {
+        'python_version': sys.version,
+        'executable': os.path.realpath(sys.executable),
+        'install': _normalize_install_script(install_script or ''),
+        'pip_env_vars': pip_env_vars,
+    }
+    return hashlib.sha256(
+        json.dumps(key_material,
+                   sort_keys=True).encode('utf-8')).hexdigest()[:32]
+
+
+class _FileLock:
+    """Shared/exclusive advisory lock backed by flock.
+
+    Each instance opens its own file description, so instances in
+    different threads of the same process contend like separate
+    processes do. The lock file may be removed by a holder of the
+    exclusive lock; waiters then lock the file that replaces it.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = None
+
+    def acquire(self, exclusive: bool, blocking: bool = True) -> bool:
+        flags = 0
+        if fcntl is not None:
+            flags = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+            if not blocking:
+                flags |= fcntl.LOCK_NB
+        while True:
+            if self._file is None:
+                self._file = open(self.path, 'a')
+            if fcntl is None:
+                return True
+            try:
+                fcntl.flock(self._file.fileno(), flags)
+            except BlockingIOError:
+                return False
+            if self._is_current():
+                return True
+            # the lock file was removed while waiting for it
+            self._file.close()
+            self._file = None
+
+    def _is_current(self) -> bool:
+        try:
+            return os.path.samestat(
+                os.fstat(self._file.fileno()), os.stat(self.path))
+        except FileNotFoundError:
+            return False
+
+    def remove(self) -> None:
+        """Removes the lock file; the exclusive lock must be held."""
+        # fails where open files cannot be removed, which leaves the file
+        # to a later eviction
+        with contextlib.suppress(OSError):
+            os.remove(self.path)
+
+    def release(self) -> None:
+        if self._file is None:
+            return
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._file.close()
+        self._file = None
+
+
+class VenvPool:
+    """A directory of virtual environments keyed by their contents.
+
+    Environments are built once per key and reused across tasks and
+    runs. Building is guarded by an exclusive file lock (shared across
+    processes) and by PipInstallManager's per-key lock (shared across
+    threads), so parallel tasks that need the same environment wait for
+    a single build instead of each building their own. Environments in
+    use, or pinned by a warm worker, hold a shared lock, which protects
+    them from eviction.
+    """
+
+    def __init__(self, root: str, max_entries: int = 10) -> None:
+        if max_entries < 1:
+            raise ValueError(
+                f'max_entries must be at least 1. Got: {max_entries}.')
+        self.root = root
+        self.max_entries = max_entries
+        os.makedirs(self.root, exist_ok=True)
+
+    def _env_dir(self, key: str) -> str:
+        return os.path.join(self.root, key)
+
+    def _lock_path(self, key: str) -> str:
+        return os.path.join(self.root, f'{key}{_LOCK_SUFFIX}')
+
+    def _is_ready(self, key: str) -> bool:
+        return os.path.exists(os.path.join(self._env_dir(key), _READY_MARKER))
+
+    def _python_path(self, key: str) -> str:
+        return os.path.join(self._env_dir(key), 'bin', 'python')
+
+    def _mark_used(self, key: str) -> None:
+        marker = os.path.join(self._env_dir(key), _LAST_USED_MARKER)
+        with open(marker, 'a'):
+            pass
+        os.utime(marker)
+
+    def _build(
+        self,
+        key: str,
+        install_script: Optional[str],
+        env_vars: Optional[Dict[str, str]],
+    ) -> None:
+        # imported here since subprocess_task_handler imports this module
+        from kfp.local import subprocess_task_handler
+        from kfp.local.pip_install_manager import pip_install_manager
+
+        env_dir = self._env_dir(key)
+        # discard any partial environment left by an interrupted build
+        shutil.rmtree(env_dir, ignore_errors=True)
+        with pip_install_manager.managed_install(
+                'subprocess', track_stats=install_script is not None):
+            logger.info(f'Building pooled virtual environment {key}')
+            python_path = create_venv(env_dir)
+            if install_script is not None:
+                env = {**os.environ, **(env_vars or {})}
+                # `"$0" "$@"` at the end of the install script execs the
+                # task program; during the build there is nothing to exec
+                [install_script] = (
+                    subprocess_task_handler.replace_python_executable(
+                        [install_script], python_path))
+                result = subprocess.run(
+                    ['sh', '-c', install_script, 'true'],
+                    capture_output=True,
+                    text=True,
+                    env=env,
+                )
+                if result.returncode != 0:
+                    shutil.rmtree(env_dir, ignore_errors=True)
+                    raise VenvBuildError(
+                        'Failed to install packages into virtual environment:'
+                        f'\n{result.stdout}{result.stderr}')
+        with open(os.path.join(env_dir, _READY_MARKER), 'w'):
+            pass
+
+    @contextlib.contextmanager
+    def acquire(
+        self,
+        full_command: List[str],
+        env_vars: Optional[Dict[str, str]] = None,
+    ) -> Generator[Tuple[str, List[str]], None, None]:
+        """Context manager that provides a ready environment for a task.
+
+        Args:
+            full_command: Commands and args for the task.
+            env_vars: Environment variables the task runs with.
+
+        Returns:
+            A tuple of (Python executable, task command). The task command has
+            the package installation prefix removed, since the packages are
+            already installed in the environment.
+
+        Raises:
+            VenvBuildError: If the environment cannot be built.
+        """
+        from kfp.local.pip_install_manager import pip_install_manager
+
+        install_script, task_command = split_install_command(full_command)
+        key = compute_venv_key(install_script, env_vars)
+        lock = _FileLock(self._lock_path(key))
+        try:
+            while True:
+                if self._is_ready(key):
+                    lock.acquire(exclusive=False)
+                    # the environment may have been evicted while waiting
+                    if self._is_ready(key):
+                        break
+                    lock.release()
+                    continue
+
+                with pip_install_manager.keyed_install(key):
+                    # built by another thread while waiting; it may be in
+                    # use, so take the shared lock rather than wait for an
+                    # exclusive one
+                    if self._is_ready(key):
+                        continue
+                    lock.acquire(exclusive=True)
+                    if not self._is_ready(key):
+                        self._build(key, install_script, env_vars)
+                    # downgrade so other tasks can use the environment
+                    lock.acquire(exclusive=False)
+                break
+
+            self._mark_used(key)
+            yield self._python_path(key), task_command
+        finally:
+            lock.release()
+        self.evict()
+
+    def pin(self, python_executable: str) -> Optional[_FileLock]:
+        """Protects the environment of a Python executable from eviction until
+        the returned lock is released.
+
+        Must be called while the environment is acquired.
+
+        Args:
+            python_executable: The Python executable from acquire.
+
+        Returns:
+            The held lock, or None if the executable is not in this pool.
+        """
+        env_dir = os.path.dirname(
+            os.path.dirname(os.path.abspath(python_executable)))
+        if os.path.dirname(env_dir) != os.path.abspath(self.root):
+            return None
+        lock = _FileLock(self._lock_path(os.path.basename(env_dir)))
+        lock.acquire(exclusive=False)
+        return lock
+
+    def evict(self) -> List[str]:
+        """Removes least recently used environments until the pool holds at
+        most max_entries ready environments.
+
+        Environments that are in use, pinned or being built are never
+        removed. The lock files of removed environments, and of builds
+        that failed, are removed along with them.
+
+        Returns:
+            The keys of the removed environments.
+        """
+        entries = []
+        for name in os.listdir(self.root):
+            env_dir = self._env_dir(name)
+            if name.endswith(_LOCK_SUFFIX):
+                key = name[:-len(_LOCK_SUFFIX)]
+                if not os.path.exists(self._env_dir(key)):
+                    self._remove_lock_file(key)
+                continue
+            if not os.path.isdir(env_dir):
+                continue
+            marker = os.path.join(env_dir, _LAST_USED_MARKER)
+            try:
+                last_used = os.path.getmtime(marker)
+            except OSError:
+                last_used = os.path.getmtime(env_dir)
+            entries.append((last_used, name))
+
+        evicted = []
+        excess = len(entries) - self.max_entries
+        for _, key in sorted(entries):
+            if excess <= 0:
+                break
+            lock = _FileLock(self._lock_path(key))
+            try:
+                if not lock.acquire(exclusive=True, blocking=False):
+                    continue
+                # remove the marker first so a concurrent reader never sees
+                # a half-deleted environment as ready
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(os.path.join(self._env_dir(key), _READY_MARKER))
+                shutil.rmtree(self._env_dir(key), ignore_errors=True)
+                lock.remove()
+            finally:
+                lock.release()
+            logger.info(f'Evicted pooled virtual environment {key}')
+            evicted.append(key)
+            excess -= 1
+        return evicted
+
+    def _remove_lock_file(self, key: str) -> None:
+        """Removes the lock file of an environment that does not exist, unless
+        it is being built."""
+        lock = _FileLock(self._lock_path(key))
+        try:
+            if (lock.acquire(exclusive=True, blocking=False) and
+                    not os.path.exists(self._env_dir(key))):
+                lock.remove()
+        finally:
+            lock.release()
+
+
+_pools_lock = threading.Lock()
+_pools: Dict[str, VenvPool] = {}
+
+
+def get_venv_pool(root: Optional[str], max_entries: int) -> VenvPool:
+    """Returns the shared VenvPool for root, creating it on first use."""
+    root = os.path.abspath(root or default_venv_cache_root())
+    with _pools_lock:
+        pool = _pools.get(root)
+        if pool is None or pool.max_entries != max_entries:
+            pool = VenvPool(root=root, max_entries=max_entries)
+            _pools[root] = pool
+    return pool
@@ -0,0 +1,329 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for venv_pool.py."""
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from kfp.local import venv_pool
+from kfp.local.pip_install_manager import pip_install_manager
+
+
+def _make_command(install_script: str) -> list:
+    return [
+        'sh', '-c', install_script, 'sh', '-ec', 'program', 'source',
+        '--executor_input', '{}'
+    ]
+
+
+_INSTALL_SCRIPT = '''
+if ! [ -x "$(command -v pip)" ]; then
+    python3 -m ensurepip || python3 -m ensurepip --user || apt-get install python3-pip
+fi
+
+PIP_DISABLE_PIP_VERSION_CHECK=1 python3 -m pip install --quiet --no-warn-script-location {index}{packages} && "$0" "$@"
+'''
+
+
+def _install_script(packages: list, index: str = '') -> str:
+    return _INSTALL_SCRIPT.format(
+        index=index, packages=' '.join(repr(p) for p in packages))
+
+
+def _fake_create_venv(path: str) -> str:
+    os.makedirs(os.path.join(path, 'bin'))
+    python_path = os.path.join(path, 'bin', 'python')
+    with open(python_path, 'w'):
+        pass
+    return python_path
+
+
+class TestSplitInstallCommand(unittest.TestCase):
+
+    def test_splits_install_prefix(self):
+        script = _install_script(['pandas'])
+        install_script, task_command = venv_pool.split_install_command(
+            _make_command(script))
+        self.assertEqual(install_script, script)
+        self.assertEqual(
+            task_command,
+            ['sh', '-ec', 'program', 'source', '--executor_input', '{}'])
+
+    def test_no_install_prefix(self):
+        command = ['sh', '-ec', 'program', 'source']
+        install_script, task_command = venv_pool.split_install_command(command)
+        self.assertIsNone(install_script)
+        self.assertEqual(task_command, command)
+
+    def test_component_level_venv_not_split(self):
+        script = _install_script(['pandas']).replace(
+            'PIP_DISABLE', 'python3 -m venv "$tmp/venv"\nPIP_DISABLE')
+        command = _make_command(script)
+        install_script, task_command = venv_pool.split_install_command(command)
+        self.assertIsNone(install_script)
+        self.assertEqual(task_command, command)
+
+
+class TestComputeVenvKey(unittest.TestCase):
+
+    def test_package_order_does_not_matter(self):
+        self.assertEqual(
+            venv_pool.compute_venv_key(_install_script(['a==1', 'b==2'])),
+            venv_pool.compute_venv_key(_install_script(['b==2', 'a==1'])),
+        )
+
+    def test_different_packages_different_key(self):
+        self.assertNotEqual(
+            venv_pool.compute_venv_key(_install_script(['a==1'])),
+            venv_pool.compute_venv_key(_install_script(['a==2'])),
+        )
+
+    def test_different_index_url_different_key(self):
+        self.assertNotEqual(
+            venv_pool.compute_venv_key(_install_script(['a'])),
+            venv_pool.compute_venv_key(
+                _install_script(['a'],
+                                index='--index-url https://example.com ')),
+        )
+
+    def test_pip_env_vars_participate(self):
+        script = _install_script(['a'])
+        self.assertNotEqual(
+            venv_pool.compute_venv_key(script),
+            venv_pool.compute_venv_key(
+                script, env_vars={'PIP_INDEX_URL': 'https://example.com'}),
+        )
+        self.assertEqual(
+            venv_pool.compute_venv_key(script),
+            venv_pool.compute_venv_key(script, env_vars={'FOO': 'bar'}),
+        )
+
+
+@mock.patch.object(venv_pool, 'create_venv', side_effect=_fake_create_venv)
+@mock.patch.object(
+    venv_pool.subprocess,
+    'run',
+    return_value=subprocess.CompletedProcess(args=[], returncode=0),
+)
+class TestVenvPool(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix='kfp-venv-pool-test-')
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        pip_install_manager.reset_stats()
+
+    def test_reuses_environment(self, mock_run, mock_create_venv):
+        pool = venv_pool.VenvPool(root=self.root)
+        command = _make_command(_install_script(['pandas']))
+
+        with pool.acquire(command) as (python_path_1, task_command):
+            self.assertEqual(task_command[:2], ['sh', '-ec'])
+        with pool.acquire(command) as (python_path_2, _):
+            pass
+
+        self.assertEqual(python_path_1, python_path_2)
+        self.assertEqual(mock_create_venv.call_count, 1)
+        self.assertEqual(mock_run.call_count, 1)
+        # the packages are installed with the environment's interpreter
+        build_script = mock_run.call_args.args[0][2]
+        self.assertIn(f'{python_path_1} -m pip install', build_script)
+        self.assertNotIn('python3', build_script)
+
+    def test_concurrent_acquires_build_once(self, mock_run, mock_create_venv):
+        pool = venv_pool.VenvPool(root=self.root)
+        command = _make_command(_install_script(['pandas']))
+
+        def slow_create_venv(path: str) -> str:
+            time.sleep(0.2)
+            return _fake_create_venv(path)
+
+        mock_create_venv.side_effect = slow_create_venv
+        python_paths = []
+
+        def worker():
+            with pool.acquire(command) as (python_path, _):
+                python_paths.append(python_path)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(set(python_paths)), 1)
+        self.assertEqual(len(python_paths), 4)
+        self.assertEqual(mock_create_venv.call_count, 1)
+        self.assertGreaterEqual(
+            pip_install_manager.get_stats()['deduplicated_installs'], 1)
+        # the per-key lock is dropped once no thread uses it
+        self.assertEqual(pip_install_manager._key_locks, {})
+
+    def test_waiting_acquire_does_not_block_on_running_task(
+            self, mock_run, mock_create_venv):
+        pool = venv_pool.VenvPool(root=self.root)
+        command = _make_command(_install_script(['pandas']))
+
+        def slow_create_venv(path: str) -> str:
+            time.sleep(0.2)
+            return _fake_create_venv(path)
+
+        mock_create_venv.side_effect = slow_create_venv
+        # both tasks hold the environment at the same time; this only
+        # completes if the second acquire does not wait for the first task
+        barrier = threading.Barrier(2, timeout=5)
+
+        def worker():
+            with pool.acquire(command):
+                barrier.wait()
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertFalse(barrier.broken)
+        self.assertEqual(mock_create_venv.call_count, 1)
+
+    def test_build_failure_raises_and_cleans_up(self, mock_run,
+                                                mock_create_venv):
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=1, stdout='', stderr='No matching distribution')
+        pool = venv_pool.VenvPool(root=self.root)
+        command = _make_command(_install_script(['does-not-exist']))
+
+        with self.assertRaisesRegex(venv_pool.VenvBuildError,
+                                    r'No matching distribution'):
+            with pool.acquire(command):
+                pass
+
+        self.assertEqual(
+            [
+                name for name in os.listdir(self.root)
+                if not name.endswith('.lock')
+            ],
+            [],
+        )
+
+    def test_evicts_least_recently_used(self, mock_run, mock_create_venv):
+        pool = venv_pool.VenvPool(root=self.root, max_entries=2)
+        commands = [
+            _make_command(_install_script([f'package-{i}'])) for i in range(3)
+        ]
+        python_paths = []
+        for command in commands:
+            with pool.acquire(command) as (python_path, _):
+                python_paths.append(python_path)
+            # ensure distinct last-used times
+            time.sleep(0.01)
+
+        self.assertFalse(os.path.exists(python_paths[0]))
+        self.assertTrue(os.path.exists(python_paths[1]))
+        self.assertTrue(os.path.exists(python_paths[2]))
+
+    def test_in_use_environment_not_evicted(self, mock_run, mock_create_venv):
+        pool = venv_pool.VenvPool(root=self.root, max_entries=1)
+        first = _make_command(_install_script(['package-1']))
+        second = _make_command(_install_script(['package-2']))
+
+        with pool.acquire(first) as (first_python_path, _):
+            with pool.acquire(second) as (second_python_path, _):
+                pass
+            # the in-use environment survives even though it is the oldest
+            self.assertTrue(os.path.exists(first_python_path))
+
+        self.assertTrue(os.path.exists(first_python_path))
+        self.assertFalse(os.path.exists(second_python_path))
+
+    def test_eviction_removes_lock_files(self, mock_run, mock_create_venv):
+        pool = venv_pool.VenvPool(root=self.root, max_entries=1)
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=1, stdout='', stderr='')
+        with self.assertRaises(venv_pool.VenvBuildError):
+            with pool.acquire(
+                    _make_command(_install_script(['does-not-exist']))):
+                pass
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0)
+        for i in range(2):
+            command = _make_command(_install_script([f'package-{i}']))
+            with pool.acquire(command) as (python_path, _):
+                pass
+            time.sleep(0.01)
+
+        key = os.path.basename(os.path.dirname(os.path.dirname(python_path)))
+        self.assertCountEqual(os.listdir(self.root), [key, f'{key}.lock'])
+
+    def test_pinned_environment_not_evicted(self, mock_run, mock_create_venv):
+        pool = venv_pool.VenvPool(root=self.root, max_entries=1)
+        first = _make_command(_install_script(['package-1']))
+        second = _make_command(_install_script(['package-2']))
+
+        with pool.acquire(first) as (first_python_path, _):
+            # as a warm worker started in the environment does
+            pin = pool.pin(first_python_path)
+        time.sleep(0.01)
+        with pool.acquire(second) as (second_python_path, _):
+            pass
+        # the pinned environment survives even though it is the oldest
+        self.assertTrue(os.path.exists(first_python_path))
+        self.assertFalse(os.path.exists(second_python_path))
+
+        pin.release()
+        with pool.acquire(second):
+            pass
+        self.assertFalse(os.path.exists(first_python_path))
+
+    def test_pin_outside_pool(self, mock_run, mock_create_venv):
+        pool = venv_pool.VenvPool(root=self.root)
+        self.assertIsNone(pool.pin('/usr/bin/python3'))
+
+    def test_invalid_max_entries(self, mock_run, mock_create_venv):
+        with self.assertRaisesRegex(ValueError,
+                                    r'max_entries must be at least 1'):
+            venv_pool.VenvPool(root=self.root, max_entries=0)
+
+
+class TestFileLock(unittest.TestCase):
+
+    def test_waiter_locks_replaced_lock_file(self):
+        root = tempfile.mkdtemp(prefix='kfp-venv-pool-test-')
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        path = os.path.join(root, 'key.lock')
+        holder = venv_pool._FileLock(path)
+        holder.acquire(exclusive=True)
+        waiter = venv_pool._FileLock(path)
+        thread = threading.Thread(
+            target=waiter.acquire, kwargs={'exclusive': True})
+        thread.start()
+        # wait for the waiter to open the lock file
+        time.sleep(0.1)
+        holder.remove()
+        holder.release()
+        thread.join(timeout=5)
+
+        other = venv_pool._FileLock(path)
+        self.assertFalse(other.acquire(exclusive=True, blocking=False))
+        waiter.release()
+        self.assertTrue(other.acquire(exclusive=True, blocking=False))
+        other.release()
+
+
+if __name__ == '__main__':
+    unittest.main()
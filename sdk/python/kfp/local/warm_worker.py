@@ -0,0 +1,139 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Entrypoint of a warm worker interpreter for SubprocessRunner.
+
+The source of this module is passed to the worker interpreter with
+``python -c``, so that it also works in virtual environments whose
+installed kfp package does not contain kfp.local. It must only import
+from the standard library and kfp.dsl.
+
+Protocol: the worker reads one JSON request per line from stdin, runs
+the lightweight component in-process and then writes a line containing
+the request's marker followed by the exit code to stdout. Everything the
+component prints before the marker is the task's log output.
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import traceback
+from typing import Any, Dict, List
+
+_COMPONENT_MODULE_NAME = 'ephemeral_component'
+
+
+def _parse_args(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='KFP Component Executor.')
+    parser.add_argument('--function_to_execute', type=str, required=True)
+    parser.add_argument('--executor_input', type=str)
+    parser.add_argument('--executor_input_file', type=str)
+    parsed_args, _ = parser.parse_known_args(args)
+    return parsed_args
+
+
+def _load_executor_input(args: argparse.Namespace) -> Dict[str, Any]:
+    if args.executor_input_file is not None:
+        with open(args.executor_input_file) as f:
+            return json.load(f)
+    return json.loads(args.executor_input)
+
+
+def _is_under(path: str, directories: List[str]) -> bool:
+    return any(
+        path.startswith(os.path.join(directory, ''))
+        for directory in directories)
+
+
+def _run_task(request: Dict[str, Any]) -> int:
+    from kfp.dsl import executor as component_executor
+    from kfp.dsl import utils
+
+    saved_modules = set(sys.modules)
+    saved_path = list(sys.path)
+    saved_argv = list(sys.argv)
+    saved_environ = dict(os.environ)
+    saved_cwd = os.getcwd()
+    program_path = tempfile.mkdtemp()
+    try:
+        os.environ.update(request['env'])
+        os.chdir(request['cwd'])
+        component_path = os.path.join(program_path,
+                                      f'{_COMPONENT_MODULE_NAME}.py')
+        with open(component_path, 'w') as f:
+            f.write(request['source'])
+        args = _parse_args(request['args'])
+        sys.argv = [component_path] + request['args']
+        module = utils.load_module(
+            module_name=_COMPONENT_MODULE_NAME, module_directory=program_path)
+        executor = component_executor.Executor(
+            executor_input=_load_executor_input(args),
+            function_to_execute=getattr(module, args.function_to_execute))
+        output_file = executor.execute()
+        if output_file is None:
+            logging.info('Did not write output file.')
+        else:
+            logging.info(f'Wrote executor output file to {output_file}.')
+        return 0
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        return e.code if isinstance(e.code, int) else 1
+    except BaseException:
+        traceback.print_exc()
+        return 1
+    finally:
+        # Drop modules the task loaded from outside the worker's original
+        # import path (the component module, embedded assets, local
+        # files), but keep installed packages warm for the next task.
+        for name in set(sys.modules) - saved_modules:
+            module_file = getattr(sys.modules[name], '__file__', None)
+            if name == _COMPONENT_MODULE_NAME or (
+                    module_file and not _is_under(module_file, saved_path)):
+                del sys.modules[name]
+        sys.path[:] = saved_path
+        sys.argv = saved_argv
+        os.environ.clear()
+        os.environ.update(saved_environ)
+        os.chdir(saved_cwd)
+        shutil.rmtree(program_path, ignore_errors=True)
+
+
+def main() -> None:
+    # '' resolves against the cwd, which changes per task; pin it to the
+    # directory the worker started in, like `python -m` would
+    sys.path[:] = [path or os.getcwd() for path in sys.path]
+    logging.basicConfig(
+        stream=sys.stdout,
+        format='[KFP Executor %(asctime)s %(levelname)s]: %(message)s',
+        level=logging.INFO)
+    # import ahead of the first task; this is what keeps the worker warm
+    from kfp.dsl import executor  # noqa: F401
+
+    requests = sys.stdin
+    sys.stdin = open(os.devnull)
+    for line in requests:
+        request = json.loads(line)
+        exit_code = _run_task(request)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        sys.stdout.write(f'{request["marker"]}{exit_code}\n')
+        sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    main()
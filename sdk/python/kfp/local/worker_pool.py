@@ -0,0 +1,323 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Pool of warm worker interpreters for lightweight Python components.
+
+Starting a lightweight component normally costs a shell, a fresh
+interpreter and a cold import of kfp. The workers in this pool have
+kfp.dsl.executor imported already and run one component at a time within
+the worker process (see warm_worker.py), so each task only pays for
+loading the component source.
+"""
+
+import atexit
+import collections
+import hashlib
+import inspect
+import json
+import os
+import subprocess
+import tempfile
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+import uuid
+
+from kfp.dsl import component_factory
+from kfp.local import cancellation
+from kfp.local import log_multiplexer
+from kfp.local import venv_pool
+from kfp.local import warm_worker
+
+_COMPONENT_PATH_ARG = '"$program_path/ephemeral_component.py"'
+# how the lightweight component command writes its source, passed as $0,
+# to the component module, and how it copies it from a file passed as $0
+# instead (see use_source_file)
+_WRITE_SOURCE_FROM_ARG = f'printf "%s" "$0" > {_COMPONENT_PATH_ARG}'
+_COPY_SOURCE_FROM_FILE = f'cp "$0" {_COMPONENT_PATH_ARG}'
+
+
+def parse_lightweight_command(
+        task_command: List[str]) -> Optional[Tuple[str, List[str]]]:
+    """Extracts the component source and executor arguments.
+
+    Args:
+        task_command: Command of a lightweight Python component, without the package install prefix.
+
+    Returns:
+        A (source, args) tuple, or None if the command is not the standard lightweight Python component command.
+    """
+    if (len(task_command) < 4 or task_command[:2] != ['sh', '-ec'] or
+            _COMPONENT_PATH_ARG not in task_command[2] or
+            component_factory.EXECUTOR_MODULE not in task_command[2]):
+        return None
+    if _COPY_SOURCE_FROM_FILE in task_command[2]:
+        with open(task_command[3]) as f:
+            return f.read(), task_command[4:]
+    return task_command[3], task_command[4:]
+
+
+def use_source_file(full_command: List[str], source_dir: str) -> List[str]:
+    """Writes the source of a lightweight Python component to a file and passes
+    the path of the file instead of the source on the command line.
+
+    Args:
+        full_command: Commands and args of the task.
+        source_dir: Directory to write the source file to. Files are named
+            by a hash of the source, so tasks running the same component
+            share one file.
+
+    Returns:
+        The command that copies the source from the file, or full_command
+        unchanged if it is not the standard lightweight Python component
+        command.
+    """
+    install_script, task_command = venv_pool.split_install_command(full_command)
+    if (parse_lightweight_command(task_command) is None or
+            _WRITE_SOURCE_FROM_ARG not in task_command[2]):
+        return full_command
+
+    source = task_command[3]
+    digest = hashlib.sha256(source.encode()).hexdigest()[:16]
+    source_path = os.path.join(source_dir, f'ephemeral_component-{digest}.py')
+    if not os.path.exists(source_path):
+        os.makedirs(source_dir, exist_ok=True)
+        # write to a temporary file and rename it so that concurrent tasks
+        # never run a partially written source file
+        fd, temp_path = tempfile.mkstemp(dir=source_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(source)
+            os.replace(temp_path, source_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    task_command = [
+        'sh',
+        '-ec',
+        task_command[2].replace(_WRITE_SOURCE_FROM_ARG, _COPY_SOURCE_FROM_FILE),
+        source_path,
+    ] + task_command[4:]
+    if install_script is None:
+        return task_command
+    return ['sh', '-c', install_script] + task_command
+
+
+class _Worker:
+    """One warm worker interpreter.
+
+    If the interpreter is in a pooled virtual environment, the worker
+    pins the environment for as long as it is alive.
+    """
+
+    def __init__(
+        self,
+        python_executable: str,
+        environment_pool: Optional[venv_pool.VenvPool] = None,
+    ) -> None:
+        self.python_executable = python_executable
+        self.tasks_run = 0
+        self.process = subprocess.Popen(
+            [
+                python_executable,
+                '-u',
+                '-c',
+                inspect.getsource(warm_worker),
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            # like run_local_subprocess, component logs go to stdout
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            env={
+                **os.environ, '_KFP_RUNTIME': 'true'
+            },
+        )
+        self._pin = environment_pool.pin(
+            python_executable) if environment_pool else None
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def run_task(
+        self,
+        source: str,
+        args: List[str],
+        env_vars: Dict[str, str],
+    ) -> int:
+        """Runs one component and streams its output to stdout.
+
+        Returns:
+            The exit code of the task.
+        """
+        self.tasks_run += 1
+        task_log = log_multiplexer.current_task_log()
+        marker = f'__kfp_task_done_{uuid.uuid4().hex}__:'
+        request = {
+            'marker': marker,
+            'source': source,
+            'args': args,
+            'env': env_vars,
+            'cwd': os.getcwd(),
+        }
+        # a cancelled task takes its worker down with it; the pool replaces
+        # dead workers
+        with cancellation.on_cancel(
+                lambda: cancellation.terminate_process(self.process)):
+            try:
+                self.process.stdin.write(json.dumps(request) + '\n')
+                self.process.stdin.flush()
+            except OSError:
+                return self._died(task_log)
+
+            for line in iter(self.process.stdout.readline, ''):
+                output, found, exit_code = line.partition(marker)
+                task_log.write(output)
+                if found:
+                    task_log.end_stream()
+                    return int(exit_code)
+            return self._died(task_log)
+
+    def _died(self, task_log: log_multiplexer.TaskLog) -> int:
+        exit_code = self.process.wait()
+        task_log.write(
+            f'Worker process exited unexpectedly with code {exit_code}.\n')
+        task_log.end_stream()
+        return exit_code or 1
+
+    def close(self) -> None:
+        if self.alive:
+            self.process.stdin.close()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        self.process.stdout.close()
+        if self._pin is not None:
+            self._pin.release()
+            self._pin = None
+
+
+class WorkerPool:
+    """Warm worker interpreters, keyed by Python executable.
+
+    Idle workers are reused by later tasks. A worker is replaced after
+    running recycle_after tasks, which bounds the state that leaks
+    between tasks, such as memory and module globals.
+    """
+
+    def __init__(self, recycle_after: int = 50) -> None:
+        if recycle_after < 1:
+            raise ValueError(
+                f'recycle_after must be at least 1. Got: {recycle_after}.')
+        self.recycle_after = recycle_after
+        self.workers_started = 0
+        self._idle: Dict[str, List[_Worker]] = collections.defaultdict(list)
+        self._lock = threading.Lock()
+
+    def _acquire(
+        self,
+        python_executable: str,
+        environment_pool: Optional[venv_pool.VenvPool],
+    ) -> _Worker:
+        with self._lock:
+            idle = self._idle[python_executable]
+            while idle:
+                worker = idle.pop()
+                if worker.alive:
+                    return worker
+                worker.close()
+            self.workers_started += 1
+        return _Worker(python_executable, environment_pool)
+
+    def _release(self, worker: _Worker) -> None:
+        if not worker.alive or worker.tasks_run >= self.recycle_after:
+            worker.close()
+            return
+        with self._lock:
+            self._idle[worker.python_executable].append(worker)
+
+    def run(
+        self,
+        python_executable: str,
+        source: str,
+        args: List[str],
+        env_vars: Optional[Dict[str, str]] = None,
+        environment_pool: Optional[venv_pool.VenvPool] = None,
+    ) -> int:
+        """Runs a lightweight component on a warm worker.
+
+        Args:
+            python_executable: Interpreter to run the component with.
+            source: Source of the component module.
+            args: Executor arguments (--executor_input, --function_to_execute).
+            env_vars: Environment variables to set while the task runs.
+            environment_pool: Pool whose acquired environment python_executable is in. Workers started for it keep the environment from being evicted while they are alive.
+
+        Returns:
+            The exit code of the task.
+        """
+        worker = self._acquire(python_executable, environment_pool)
+        try:
+            return worker.run_task(
+                source=source, args=args, env_vars=env_vars or {})
+        finally:
+            self._release(worker)
+
+    def close(self) -> None:
+        """Stops all idle workers."""
+        with self._lock:
+            workers = [
+                worker for idle in self._idle.values() for worker in idle
+            ]
+            self._idle.clear()
+        for worker in workers:
+            worker.close()
+
+
+_pools: Dict[int, WorkerPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_worker_pool(recycle_after: int) -> WorkerPool:
+    """Returns the process-wide WorkerPool for a recycle policy."""
+    with _pools_lock:
+        if recycle_after not in _pools:
+            _pools[recycle_after] = WorkerPool(recycle_after=recycle_after)
+        return _pools[recycle_after]
+
+
+@atexit.register
+def _close_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close()
+
+
+_installed: Set[Tuple[str, str]] = set()
+_installed_lock = threading.Lock()
+
+
+def is_installed(python_executable: str, install_key: str) -> bool:
+    """Whether an install script already succeeded for an interpreter."""
+    with _installed_lock:
+        return (python_executable, install_key) in _installed
+
+
+def mark_installed(python_executable: str, install_key: str) -> None:
+    with _installed_lock:
+        _installed.add((python_executable, install_key))
@@ -0,0 +1,320 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for worker_pool.py."""
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from unittest import mock
+
+from kfp.local import worker_pool
+
+LIGHTWEIGHT_PROGRAM = textwrap.dedent('''\
+    program_path=$(mktemp -d)
+
+    printf "%s" "$0" > "$program_path/ephemeral_component.py"
+    _KFP_RUNTIME=true python3 -m kfp.dsl.executor_main \
+        --component_module_path \
+        "$program_path/ephemeral_component.py" \
+        "$@"
+''')
+
+
+def _source(body: str) -> str:
+    return 'from kfp import dsl\n\n' + textwrap.dedent(body)
+
+
+class TestParseLightweightCommand(unittest.TestCase):
+
+    def test_lightweight_command(self):
+        args = ['--executor_input', '{}', '--function_to_execute', 'comp']
+        self.assertEqual(
+            worker_pool.parse_lightweight_command(
+                ['sh', '-ec', LIGHTWEIGHT_PROGRAM, 'source'] + args),
+            ('source', args),
+        )
+
+    def test_other_command(self):
+        self.assertIsNone(
+            worker_pool.parse_lightweight_command(
+                ['python3', '-m', 'kfp.dsl.executor_main', '--foo']))
+
+
+class TestUseSourceFile(unittest.TestCase):
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.source_dir = temp_dir.name
+
+    def test_lightweight_command(self):
+        args = ['--executor_input', '{}', '--function_to_execute', 'comp']
+        full_command = [
+            'sh', '-c', 'python3 -m pip install kfp && "$0" "$@"', 'sh', '-ec',
+            LIGHTWEIGHT_PROGRAM, 'def comp(): pass\n'
+        ] + args
+
+        actual = worker_pool.use_source_file(full_command, self.source_dir)
+
+        self.assertEqual(actual[:5], full_command[:5])
+        self.assertIn('cp "$0" "$program_path/ephemeral_component.py"',
+                      actual[5])
+        self.assertNotIn('printf', actual[5])
+        self.assertEqual(os.path.dirname(actual[6]), self.source_dir)
+        self.assertEqual(actual[7:], args)
+        with open(actual[6]) as f:
+            self.assertEqual(f.read(), 'def comp(): pass\n')
+        self.assertEqual(
+            worker_pool.parse_lightweight_command(actual[3:]),
+            ('def comp(): pass\n', args))
+
+    def test_same_source_shares_file(self):
+        full_command = ['sh', '-ec', LIGHTWEIGHT_PROGRAM, 'def comp(): pass\n']
+        first = worker_pool.use_source_file(full_command, self.source_dir)
+        second = worker_pool.use_source_file(full_command, self.source_dir)
+        self.assertEqual(first, second)
+        self.assertEqual(len(os.listdir(self.source_dir)), 1)
+
+    def test_other_command(self):
+        full_command = ['python3', '-m', 'kfp.dsl.executor_main', '--foo']
+        self.assertEqual(
+            worker_pool.use_source_file(full_command, self.source_dir),
+            full_command)
+        self.assertEqual(os.listdir(self.source_dir), [])
+
+    def test_runs_source_from_file(self):
+        full_command = worker_pool.use_source_file(
+            ['sh', '-ec', LIGHTWEIGHT_PROGRAM, 'print("hello")\n'],
+            self.source_dir)
+        # show the program the module it would import instead of running it
+        full_command[2] = full_command[2].split('_KFP_RUNTIME')[0] + (
+            'cat "$program_path/ephemeral_component.py"\n')
+        self.assertEqual(
+            subprocess.run(full_command, capture_output=True, text=True).stdout,
+            'print("hello")\n')
+
+
+class TestWorkerPool(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.pool = worker_pool.WorkerPool(recycle_after=10)
+        self.addCleanup(self.pool.close)
+        stdout_patcher = mock.patch('sys.stdout', new_callable=io.StringIO)
+        self.mock_stdout = stdout_patcher.start()
+        self.addCleanup(stdout_patcher.stop)
+        self.num_tasks = 0
+
+    def run_component(self, source: str, function_name: str, **inputs) -> tuple:
+        self.num_tasks += 1
+        output_dir = os.path.join(self.temp_dir.name, str(self.num_tasks))
+        os.makedirs(output_dir)
+        executor_input = {
+            'inputs': {
+                'parameterValues': inputs
+            },
+            'outputs': {
+                'parameters': {
+                    'Output': {
+                        'outputFile': os.path.join(output_dir, 'Output')
+                    }
+                },
+                'outputFile': os.path.join(output_dir, 'executor_output.json'),
+            },
+        }
+        exit_code = self.pool.run(
+            python_executable=sys.executable,
+            source=source,
+            args=[
+                '--executor_input',
+                json.dumps(executor_input), '--function_to_execute',
+                function_name
+            ],
+        )
+        output = None
+        output_file = os.path.join(output_dir, 'executor_output.json')
+        if os.path.exists(output_file):
+            with open(output_file) as f:
+                output = json.load(f).get('parameterValues', {}).get('Output')
+        return exit_code, output
+
+    def test_runs_component(self):
+        exit_code, output = self.run_component(
+            _source('''
+                def identity(x: str) -> str:
+                    print('running identity')
+                    return x
+            '''),
+            'identity',
+            x='hello',
+        )
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(output, 'hello')
+        self.assertIn('running identity', self.mock_stdout.getvalue())
+
+    def test_executor_input_file(self):
+        output_file = os.path.join(self.temp_dir.name, 'executor_output.json')
+        executor_input_file = os.path.join(self.temp_dir.name,
+                                           'executor_input.json')
+        with open(executor_input_file, 'w') as f:
+            json.dump(
+                {
+                    'inputs': {
+                        'parameterValues': {
+                            'x': 'hello'
+                        }
+                    },
+                    'outputs': {
+                        'parameters': {
+                            'Output': {
+                                'outputFile':
+                                    os.path.join(self.temp_dir.name, 'Output')
+                            }
+                        },
+                        'outputFile': output_file,
+                    },
+                }, f)
+        exit_code = self.pool.run(
+            python_executable=sys.executable,
+            source=_source('''
+                def identity(x: str) -> str:
+                    return x
+            '''),
+            args=[
+                '--executor_input_file', executor_input_file,
+                '--function_to_execute', 'identity'
+            ],
+        )
+        self.assertEqual(exit_code, 0)
+        with open(output_file) as f:
+            self.assertEqual(json.load(f)['parameterValues']['Output'], 'hello')
+
+    def test_reuses_worker(self):
+        source = _source('''
+            def pid() -> int:
+                import os
+                return os.getpid()
+        ''')
+        _, first = self.run_component(source, 'pid')
+        _, second = self.run_component(source, 'pid')
+        self.assertEqual(first, second)
+        self.assertEqual(self.pool.workers_started, 1)
+
+    def test_failure_keeps_worker(self):
+        exit_code, _ = self.run_component(
+            _source('''
+                def fail():
+                    raise ValueError('boom')
+            '''), 'fail')
+        self.assertEqual(exit_code, 1)
+        self.assertIn('ValueError: boom', self.mock_stdout.getvalue())
+
+        exit_code, _ = self.run_component(
+            _source('''
+                def succeed():
+                    pass
+            '''), 'succeed')
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(self.pool.workers_started, 1)
+
+    def test_worker_crash_replaces_worker(self):
+        exit_code, _ = self.run_component(
+            _source('''
+                def crash():
+                    import os
+                    os._exit(3)
+            '''), 'crash')
+        self.assertEqual(exit_code, 3)
+
+        exit_code, _ = self.run_component(
+            _source('''
+                def succeed():
+                    pass
+            '''), 'succeed')
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(self.pool.workers_started, 2)
+
+    def test_worker_pins_environment(self):
+        environment_pool = mock.Mock()
+        source = _source('''
+            def succeed():
+                pass
+        ''')
+        for _ in range(2):
+            self.pool.run(
+                python_executable=sys.executable,
+                source=source,
+                args=['--function_to_execute', 'succeed'],
+                environment_pool=environment_pool,
+            )
+        environment_pool.pin.assert_called_once_with(sys.executable)
+        environment_pool.pin.return_value.release.assert_not_called()
+
+        self.pool.close()
+        environment_pool.pin.return_value.release.assert_called_once()
+
+    def test_recycle_after(self):
+        pool = worker_pool.WorkerPool(recycle_after=2)
+        self.addCleanup(pool.close)
+        self.pool = pool
+        source = _source('''
+            def pid() -> int:
+                import os
+                return os.getpid()
+        ''')
+        pids = [self.run_component(source, 'pid')[1] for _ in range(3)]
+        self.assertEqual(pids[0], pids[1])
+        self.assertNotEqual(pids[1], pids[2])
+        self.assertEqual(pool.workers_started, 2)
+
+    def test_tasks_are_isolated(self):
+        module_dir = os.path.join(self.temp_dir.name, 'modules')
+        os.makedirs(module_dir)
+        with open(os.path.join(module_dir, 'kfp_worker_helper.py'), 'w') as f:
+            f.write('VALUE = 1\n')
+
+        exit_code, _ = self.run_component(
+            _source(f'''
+                def pollute():
+                    import os
+                    import sys
+                    sys.path.insert(0, {module_dir!r})
+                    import kfp_worker_helper
+                    os.environ['KFP_WORKER_TEST'] = 'polluted'
+                    os.chdir({module_dir!r})
+            '''), 'pollute')
+        self.assertEqual(exit_code, 0)
+
+        _, output = self.run_component(
+            _source(f'''
+                def check() -> str:
+                    import os
+                    import sys
+                    return str([
+                        'kfp_worker_helper' in sys.modules,
+                        {module_dir!r} in sys.path,
+                        'KFP_WORKER_TEST' in os.environ,
+                        os.getcwd() == {module_dir!r},
+                    ])
+            '''), 'check')
+        self.assertEqual(output, str([False, False, False, False]))
+
+
+if __name__ == '__main__':
+    unittest.main()
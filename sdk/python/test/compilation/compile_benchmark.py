@@ -0,0 +1,151 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmarks writing the test_data pipelines with and without libyaml.
+
+Every golden pipeline under test_data/sdk_compiled_pipelines/valid is
+parsed into a PipelineSpec and written with write_pipeline_spec_to_file,
+once with the libyaml emission path and once with pure PyYAML. A
+pipeline combining the components and executors of all goldens stands in
+for pipelines with hundreds of components. The
+script fails if the outputs differ by a single byte, or if the libyaml
+path is slower than --min-speedup times the PyYAML one.
+
+Usage:
+    python test/compilation/compile_benchmark.py [--repeat 5] [--min-speedup 1.0]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import tempfile
+import time
+from typing import List, Tuple
+from unittest import mock
+
+from google.protobuf import json_format
+from kfp.compiler import pipeline_spec_builder
+from kfp.compiler import yaml_emitter
+from kfp.pipeline_spec import pipeline_spec_pb2
+import yaml
+
+_PROJECT_ROOT = os.path.abspath(os.path.join(__file__, *([os.path.pardir] * 5)))
+_PIPELINES_DIR = os.path.join(_PROJECT_ROOT, 'test_data',
+                              'sdk_compiled_pipelines', 'valid')
+
+_Pipeline = Tuple[str, pipeline_spec_pb2.PipelineSpec,
+                  pipeline_spec_pb2.PlatformSpec]
+
+
+def load_pipelines() -> List[_Pipeline]:
+    pipelines = []
+    for path in sorted(
+            glob.glob(
+                os.path.join(_PIPELINES_DIR, '**', '*.yaml'), recursive=True)):
+        with open(path) as f:
+            documents = list(yaml.safe_load_all(f))
+        pipeline_spec = pipeline_spec_pb2.PipelineSpec()
+        platform_spec = pipeline_spec_pb2.PlatformSpec()
+        try:
+            json_format.ParseDict(documents[0], pipeline_spec)
+            if len(documents) > 1:
+                json_format.ParseDict(documents[1], platform_spec)
+        except json_format.ParseError:
+            # goldens of older SDK versions may use removed fields
+            continue
+        pipelines.append(
+            (os.path.relpath(path,
+                             _PIPELINES_DIR), pipeline_spec, platform_spec))
+    return pipelines
+
+
+def combine(pipelines: List[_Pipeline]) -> _Pipeline:
+    """Returns a pipeline with the components and executors of all
+    pipelines."""
+    combined = pipeline_spec_pb2.PipelineSpec()
+    combined.CopyFrom(pipelines[0][1])
+    combined_platform_spec = pipeline_spec_pb2.PlatformSpec()
+    for index, (_, pipeline_spec, platform_spec) in enumerate(pipelines):
+        for name, platform in platform_spec.platforms.items():
+            combined_platform_spec.platforms[name].MergeFrom(platform)
+        for name, component in pipeline_spec.components.items():
+            combined.components[f'{name}-{index}'].CopyFrom(component)
+        executors = pipeline_spec.deployment_spec.fields.get('executors')
+        if executors is not None:
+            for name, executor in executors.struct_value.fields.items():
+                combined.deployment_spec.fields[
+                    'executors'].struct_value.fields[
+                        f'{name}-{index}'].CopyFrom(executor)
+    return 'combined', combined, combined_platform_spec
+
+
+def write_all(pipelines: List[_Pipeline], output_dir: str) -> float:
+    start = time.perf_counter()
+    for index, (_, pipeline_spec, platform_spec) in enumerate(pipelines):
+        pipeline_spec_builder.write_pipeline_spec_to_file(
+            pipeline_spec=pipeline_spec,
+            pipeline_description=None,
+            platform_spec=platform_spec,
+            package_path=os.path.join(output_dir, f'{index}.yaml'),
+        )
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-speedup', type=float, default=1.0)
+    args = parser.parse_args()
+
+    if yaml_emitter._FastDumper is None:
+        print('libyaml is not available; nothing to compare.')
+        return 0
+
+    pipelines = load_pipelines()
+    pipelines.append(combine(pipelines))
+    with tempfile.TemporaryDirectory() as fast_dir, \
+            tempfile.TemporaryDirectory() as pyyaml_dir:
+        fast_times, pyyaml_times = [], []
+        for _ in range(args.repeat):
+            fast_times.append(write_all(pipelines, fast_dir))
+            with mock.patch.object(yaml_emitter, '_FastDumper', None):
+                pyyaml_times.append(write_all(pipelines, pyyaml_dir))
+
+        mismatches = []
+        for index, (name, _, _) in enumerate(pipelines):
+            with open(os.path.join(fast_dir, f'{index}.yaml'), 'rb') as f:
+                fast = f.read()
+            with open(os.path.join(pyyaml_dir, f'{index}.yaml'), 'rb') as f:
+                pure = f.read()
+            if fast != pure:
+                mismatches.append(name)
+
+    fast_time, pyyaml_time = min(fast_times), min(pyyaml_times)
+    speedup = pyyaml_time / fast_time
+    print(f'pipelines: {len(pipelines)} '
+          f'({len(pipelines[-1][1].components)} components in the largest)')
+    print(f'PyYAML:    {pyyaml_time:.3f}s')
+    print(f'libyaml:   {fast_time:.3f}s ({speedup:.2f}x)')
+
+    if mismatches:
+        print('Output differs from PyYAML for:', *mismatches, sep='\n  ')
+        return 1
+    if speedup < args.min_speedup:
+        print(f'Speedup is below {args.min_speedup:.2f}x.')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,123 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmarks compiling synthetic pipelines of nested sub-pipelines.
+
+A pipeline of depth D and width W is built from a leaf pipeline of two
+components: every level is a pipeline that calls the level below it W
+times, so the outermost pipeline has 2 * W**(D - 1) leaf tasks whose
+component and executor names all collide when the levels are merged.
+For every depth and width the script reports the time spent defining
+the levels (each definition merges the level below into it) plus
+compiling the outermost pipeline, and the time per leaf task, which
+stays flat while merging is linear in the size of the pipeline, as well
+as the size of the compiled YAML, which --deduplicate-components reduces
+to a single copy of each component.
+
+Usage:
+    python test/compilation/nested_pipeline_benchmark.py \
+        [--depths 2 3 4] [--widths 2 4 8] [--max-tasks 5000] \
+        [--deduplicate-components]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import Tuple
+
+from kfp import compiler
+from kfp import dsl
+from kfp.dsl import graph_component
+import yaml
+
+
+@dsl.component(base_image='python:3.11')
+def produce(message: str) -> str:
+    return message
+
+
+@dsl.component(base_image='python:3.11')
+def consume(message: str):
+    print(message)
+
+
+@dsl.pipeline
+def leaf(message: str = 'hello'):
+    consume(message=produce(message=message).output)
+
+
+def nest(depth: int, width: int) -> graph_component.GraphComponent:
+    """Returns a pipeline that nests the leaf pipeline depth - 1 times,
+    calling each level width times."""
+    level = leaf
+    for index in range(1, depth):
+        level = _wrap(level, width, name=f'level-{index}')
+    return level
+
+
+def _wrap(inner: graph_component.GraphComponent, width: int,
+          name: str) -> graph_component.GraphComponent:
+
+    @dsl.pipeline(name=name)
+    def level():
+        for _ in range(width):
+            inner()
+
+    return level
+
+
+def benchmark(depth: int, width: int, output_dir: str,
+              deduplicate_components: bool) -> Tuple[float, int, int]:
+    package_path = os.path.join(output_dir, f'{depth}-{width}.yaml')
+    start = time.perf_counter()
+    pipeline = nest(depth, width)
+    compiler.Compiler().compile(
+        pipeline, package_path, deduplicate_components=deduplicate_components)
+    seconds = time.perf_counter() - start
+    with open(package_path) as f:
+        components = len(yaml.safe_load(f)['components'])
+    return seconds, components, os.path.getsize(package_path)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--depths', type=int, nargs='+', default=[2, 3, 4])
+    parser.add_argument('--widths', type=int, nargs='+', default=[2, 4, 8])
+    parser.add_argument(
+        '--max-tasks',
+        type=int,
+        default=5000,
+        help='Skips combinations with more leaf tasks than this.')
+    parser.add_argument('--deduplicate-components', action='store_true')
+    args = parser.parse_args()
+
+    print(f'{"depth":>5} {"width":>5} {"tasks":>7} {"components":>10} '
+          f'{"KiB":>8} {"seconds":>8} {"ms/task":>8}')
+    with tempfile.TemporaryDirectory() as output_dir:
+        for depth in args.depths:
+            for width in args.widths:
+                tasks = 2 * width**(depth - 1)
+                if tasks > args.max_tasks:
+                    continue
+                seconds, components, size = benchmark(
+                    depth, width, output_dir, args.deduplicate_components)
+                print(f'{depth:>5} {width:>5} {tasks:>7} {components:>10} '
+                      f'{size / 1024:>8.0f} {seconds:>8.2f} '
+                      f'{1000 * seconds / tasks:>8.2f}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,157 @@
+# Copyright 2026 The Kubeflow Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmarks accessing the pipeline_spec of large components.
+
+For every size N, two components are built:
+
+- yaml: a container component with N inputs, N outputs and a command
+  that embeds N lines of source, written to YAML and loaded back with
+  load_component_from_text.
+- python: a @dsl.component whose function has N lines.
+
+The script reports the size of the component (its YAML, or its
+function source), the time the first access to .pipeline_spec takes
+(which parses the YAML or builds the spec), the time of every later
+access (which copies the cached spec), and the time of parsing the YAML
+or building the spec on every access, as components did before the spec
+was cached.
+
+Usage:
+    python test/compilation/pipeline_spec_access_benchmark.py \
+        [--sizes 10 100 1000] [--repeat 20]
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, Tuple
+
+from google.protobuf import json_format
+from kfp import components
+from kfp import dsl
+from kfp.dsl import base_component
+from kfp.dsl import placeholders
+from kfp.dsl import structures
+from kfp.dsl import yaml_component
+from kfp.pipeline_spec import pipeline_spec_pb2
+
+
+def make_component_yaml(size: int) -> str:
+    source = '\n'.join(f'print("line {i}")' for i in range(size))
+    command = ['python3', '-c', source]
+    for i in range(size):
+        command += [
+            placeholders.InputValuePlaceholder(input_name=f'input_{i}'),
+            placeholders.OutputPathPlaceholder(output_name=f'output_{i}'),
+        ]
+    component_spec = structures.ComponentSpec(
+        name='large-component',
+        implementation=structures.Implementation(
+            container=structures.ContainerSpecImplementation(
+                image='python:3.11', command=command)),
+        inputs={
+            f'input_{i}': structures.InputSpec(type='String')
+            for i in range(size)
+        },
+        outputs={
+            f'output_{i}': structures.OutputSpec(type='String')
+            for i in range(size)
+        },
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'component.yaml')
+        component_spec.save_to_component_yaml(path)
+        with open(path) as f:
+            return f.read()
+
+
+def make_yaml_component(size: int) -> Tuple[yaml_component.YamlComponent, int]:
+    component_yaml = make_component_yaml(size)
+    return components.load_component_from_text(component_yaml), len(
+        component_yaml)
+
+
+def make_python_component(
+        size: int) -> Tuple[base_component.BaseComponent, int]:
+    body = '\n'.join(f'    print("line {i}")' for i in range(size))
+    source = f'def large_component(message: str) -> str:\n{body}\n' \
+             '    return message\n'
+    # the function must be in a file for its source to be inspected
+    fd, path = tempfile.mkstemp(suffix='.py')
+    with os.fdopen(fd, 'w') as f:
+        f.write(source)
+    try:
+        spec = importlib.util.spec_from_file_location('large_component', path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return dsl.component(
+            module.large_component, base_image='python:3.11'), len(source)
+    finally:
+        os.remove(path)
+
+
+def build_on_every_access(
+        component: base_component.BaseComponent
+) -> pipeline_spec_pb2.PipelineSpec:
+    if isinstance(component, yaml_component.YamlComponent):
+        component_dict = structures.load_documents_from_yaml(
+            component.component_yaml)[0]
+        return json_format.ParseDict(component_dict,
+                                     pipeline_spec_pb2.PipelineSpec())
+    with base_component.BlockPipelineTaskRegistration():
+        return component.component_spec.to_pipeline_spec()
+
+
+def time_per_call(function: Callable[[], object], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f'{"kind":>6} {"size":>6} {"KiB":>8} {"first ms":>9} '
+          f'{"cached ms":>10} {"uncached ms":>12} {"speedup":>8}')
+    for kind, make_component in [('yaml', make_yaml_component),
+                                 ('python', make_python_component)]:
+        for size in args.sizes:
+            component, num_bytes = make_component(size)
+
+            start = time.perf_counter()
+            pipeline_spec = component.pipeline_spec
+            first = time.perf_counter() - start
+            cached = time_per_call(lambda: component.pipeline_spec, args.repeat)
+            uncached = time_per_call(lambda: build_on_every_access(component),
+                                     args.repeat)
+            if build_on_every_access(component) != pipeline_spec:
+                print(f'Cached spec differs from the built spec for {kind} '
+                      f'size {size}.')
+                return 1
+
+            print(f'{kind:>6} {size:>6} {num_bytes / 1024:>8.0f} '
+                  f'{1000 * first:>9.2f} {1000 * cached:>10.3f} '
+                  f'{1000 * uncached:>12.2f} {uncached / cached:>7.0f}x')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())